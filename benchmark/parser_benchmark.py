@@ -0,0 +1,455 @@
+'''Parser performance benchmark
+
+The unittests hold thousands of real device outputs, the golden outputs.
+This script harvests them into a corpus, optionally scales some of them up
+(one interface block repeated 5000 times, N BGP prefixes), parses each
+output and reports per parser class and per OS:
+
+    * us per call
+    * lines parsed per second
+    * peak memory of one call
+    * with -compact, memory held by the parsed output, as parsed and in its
+      compact form (see genie.libs.parser.utils.compact)
+
+The report can be saved as a baseline, and later runs compared to it; a
+parser slower than the baseline by more than the tolerance is a regression
+and the script exits with 1:
+
+    ./benchmark/parser_benchmark -os iosxe -save_baseline baseline.json
+    ./benchmark/parser_benchmark -os iosxe -baseline baseline.json
+
+benchmark/baseline.json is the report of all the golden outputs with the
+default arguments, to compare to on the same kind of host; timings depend
+on the host, save a baseline of your own before changing a parser.
+
+A golden output is paired with the parser class instantiated in its test
+class. When the test class uses several parsers, the output is paired with
+the one giving the matching golden parsed output.
+'''
+
+import gc
+import os
+import re
+import ast
+import sys
+import json
+import time
+import logging
+import pathlib
+import argparse
+import ipaddress
+import tracemalloc
+import importlib.util
+from unittest.mock import Mock
+
+from genie.metaparser import MetaParser
+from genie.libs.parser.utils.compact import compact
+
+logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+log = logging.getLogger(__name__)
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parent.parent / \
+    'src' / 'genie' / 'libs' / 'parser'
+
+GOLDEN_OUTPUT = re.compile(r'^golden_output')
+
+
+class Sample(object):
+    '''One output of a parser, the unit of the benchmark'''
+
+    def __init__(self, os, parser_cls, name, output, scale=None):
+        self.os = os
+        self.parser_cls = parser_cls
+        self.name = name
+        self.output = output
+        self.scale = scale
+        self.lines = output.count('\n') + 1
+
+    @property
+    def parser(self):
+        name = '{}.{}'.format(self.parser_cls.__module__.split('.')[-1],
+                              self.parser_cls.__name__)
+        if self.scale:
+            name += ' x{}'.format(self.scale)
+        return name
+
+    def parse(self):
+        return self.instance().parse()
+
+    def instance(self):
+        device = Mock(**{'execute.return_value': self.output})
+        return self.parser_cls(device=device)
+
+
+# ==============================================================================
+# Corpus
+# ==============================================================================
+
+def _load_module(path):
+    spec = importlib.util.spec_from_file_location(
+        'benchmark_{}_{}'.format(path.parent.parent.name, path.stem), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _parser_names(class_node):
+    '''Names called with a device= keyword in the test class'''
+    names = []
+    for node in ast.walk(class_node):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+                and any(k.arg == 'device' for k in node.keywords) \
+                and node.func.id not in names:
+            names.append(node.func.id)
+    return names
+
+
+def _pair(os, test_cls, candidates):
+    '''Yield the samples of a test class'''
+    for attr, value in vars(test_cls).items():
+        if not GOLDEN_OUTPUT.match(attr) or not isinstance(value, dict):
+            continue
+        output = value.get('execute.return_value')
+        if not isinstance(output, str) or not output.strip():
+            continue
+        expected = getattr(test_cls, attr.replace('golden_output',
+                                                  'golden_parsed_output', 1),
+                           None)
+        for parser_cls in candidates:
+            sample = Sample(os, parser_cls,
+                            '{}.{}'.format(test_cls.__name__, attr), output)
+            try:
+                parsed = sample.parse()
+            except Exception:
+                continue
+            if expected is None and len(candidates) > 1:
+                continue
+            if expected is not None and parsed != expected:
+                continue
+            yield sample
+            break
+
+
+def harvest(oses=None, modules=None):
+    '''Collect the golden outputs of the unittests
+
+        Args:
+            oses (`list`): os directories to harvest, all when not given
+            modules (`list`): test module names (ex: test_show_bgp), all
+                              when not given
+
+        Returns:
+            list of Sample
+    '''
+    samples = []
+    for test_dir in sorted(PARSER_ROOT.glob('*/tests')):
+        os = test_dir.parent.name
+        if oses and os not in oses:
+            continue
+        for path in sorted(test_dir.glob('test_*.py')):
+            if modules and path.stem not in modules:
+                continue
+            try:
+                module = _load_module(path)
+                tree = ast.parse(path.read_text())
+            except Exception as e:
+                log.warning('Skipping {}: {}'.format(path, e))
+                continue
+
+            for node in tree.body:
+                if not isinstance(node, ast.ClassDef):
+                    continue
+                test_cls = getattr(module, node.name, None)
+                candidates = [getattr(module, name, None)
+                              for name in _parser_names(node)]
+                candidates = [c for c in candidates
+                              if isinstance(c, type) and
+                              issubclass(c, MetaParser)]
+                if test_cls is None or not candidates:
+                    continue
+                samples.extend(_pair(os, test_cls, candidates))
+    return samples
+
+
+# ==============================================================================
+# Synthetic scaling
+# ==============================================================================
+
+def repeat_blocks(output, start, count, rename):
+    '''Repeat the first block of the output count times
+
+        Args:
+            output (`str`): device output
+            start (`str`): regex matching the first line of a block
+            count (`int`): number of blocks in the result
+            rename (`callable`): function of (block, i) returning the i-th
+                                 copy of the block, so each copy is a new
+                                 entry of the result
+
+        Returns:
+            the scaled output, None if no block is found
+    '''
+    start = re.compile(start)
+    lines = output.splitlines()
+    starts = [i for i, line in enumerate(lines) if start.match(line)]
+    if not starts:
+        return None
+    first = starts[0]
+    end = starts[1] if len(starts) > 1 else len(lines)
+    block = '\n'.join(lines[first:end])
+    blocks = [rename(block, i) for i in range(count)]
+    return '\n'.join(lines[:first] + blocks)
+
+
+def rename_interface(block, i):
+    '''GigabitEthernet1 is up -> GigabitEthernet1.<i> is up'''
+    return re.sub(r'^( *\S+)', r'\g<1>.{}'.format(i + 1), block, count=1)
+
+
+_PREFIX = re.compile(r'\d+\.\d+\.\d+\.\d+/\d+')
+
+
+def rename_prefix(block, i):
+    '''First IPv4 prefix of the block -> the i-th /24 from 11.0.0.0'''
+    prefix = '{}/24'.format(ipaddress.IPv4Address('11.0.0.0') + (i << 8))
+    return _PREFIX.sub(prefix, block, count=1)
+
+
+# parser -> how to scale its golden outputs
+SCALERS = {
+    'show_interface.ShowInterfaces': {
+        'start': r'^ *\S+ is (administratively )?(up|down|deleted)',
+        'rename': rename_interface,
+    },
+    'show_bgp.ShowBgpAll': {
+        'start': r'^ *[\*sdhrSmbfxaicz>]+ *\d+\.\d+\.\d+\.\d+/\d+',
+        'rename': rename_prefix,
+    },
+    'show_bgp.ShowIpBgp': {
+        'start': r'^ *[\*sdhrSmbfxaicz>]+ *\d+\.\d+\.\d+\.\d+/\d+',
+        'rename': rename_prefix,
+    },
+    'show_bgp.ShowBgpAllDetail': {
+        'start': r'^ *BGP routing table entry for \d+\.\d+\.\d+\.\d+/\d+',
+        'rename': rename_prefix,
+    },
+    'show_routing.ShowIpRouteDistributor': {
+        'start': r'^ *[A-Za-z*+%]+( [A-Z0-9]+)? +\d+\.\d+\.\d+\.\d+/\d+ ',
+        'rename': rename_prefix,
+    },
+}
+
+
+def scale(samples, count):
+    '''Scaled up copies of the samples of the parsers in SCALERS, one per
+       parser and os'''
+    scaled = []
+    seen = set()
+    for sample in samples:
+        scaler = SCALERS.get(sample.parser)
+        if not scaler or (sample.os, sample.parser) in seen:
+            continue
+        output = repeat_blocks(sample.output, scaler['start'], count,
+                               scaler['rename'])
+        if output is None:
+            continue
+        big = Sample(sample.os, sample.parser_cls, sample.name, output,
+                     scale=count)
+        try:
+            big.parse()
+        except Exception as e:
+            log.warning('Scaled {} does not parse: {}'.format(big.name, e))
+            continue
+        seen.add((sample.os, sample.parser))
+        scaled.append(big)
+    return scaled
+
+
+# ==============================================================================
+# Measure
+# ==============================================================================
+
+def measure(sample, min_time=0.2):
+    '''Return (seconds per call, peak bytes of one call)'''
+    tracemalloc.start()
+    sample.parse()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        sample.parse()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / calls, peak
+
+
+def retained(sample):
+    '''Return (bytes held by the parsed output, bytes held by its compact
+       form)'''
+    # regexes and other caches of the parser are not part of the output
+    sample.parse()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        parser = sample.instance()
+        parsed = parser.parse()
+        # a distributor sets the schema of the parser it called
+        schema = getattr(parser, 'schema', None)
+        parser = None
+        gc.collect()
+        plain = tracemalloc.get_traced_memory()[0] - before
+        parsed = compact(parsed, schema)
+        gc.collect()
+        compacted = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return plain, compacted
+
+
+def run(samples, min_time=0.2, memory=False):
+    '''Benchmark the samples
+
+        Args:
+            memory (`bool`): also measure the memory held by the parsed
+                             outputs, plain and compact
+
+        Returns:
+            report dict: {'parser': {os: {parser: stats}},
+                          'os': {os: stats}}, with stats holding
+            us_per_call, lines_per_sec, peak_kb, lines and samples, and
+            result_kb and compact_kb with memory
+    '''
+    report = {'parser': {}, 'os': {}}
+    for sample in samples:
+        seconds, peak = measure(sample, min_time=min_time)
+        if memory:
+            plain, compacted = retained(sample)
+        for stats in (report['parser'].setdefault(sample.os, {})
+                      .setdefault(sample.parser, {}),
+                      report['os'].setdefault(sample.os, {})):
+            stats['seconds'] = stats.get('seconds', 0) + seconds
+            stats['lines'] = stats.get('lines', 0) + sample.lines
+            stats['samples'] = stats.get('samples', 0) + 1
+            stats['peak_kb'] = max(stats.get('peak_kb', 0), peak // 1024)
+            if memory:
+                stats['result_kb'] = stats.get('result_kb', 0) + \
+                    plain // 1024
+                stats['compact_kb'] = stats.get('compact_kb', 0) + \
+                    compacted // 1024
+
+    for stats in [s for parsers in report['parser'].values()
+                  for s in parsers.values()] + list(report['os'].values()):
+        seconds = stats.pop('seconds')
+        stats['us_per_call'] = round(seconds / stats['samples'] * 1e6, 1)
+        stats['lines_per_sec'] = int(stats['lines'] / seconds)
+    return report
+
+
+def compare(report, baseline, tolerance=0.25):
+    '''Parsers slower than in the baseline by more than tolerance
+
+        Returns:
+            list of (os, parser, baseline us_per_call, us_per_call)
+    '''
+    regressions = []
+    for os, parsers in report['parser'].items():
+        for name, stats in parsers.items():
+            try:
+                before = baseline['parser'][os][name]['us_per_call']
+            except KeyError:
+                continue
+            if stats['us_per_call'] > before * (1 + tolerance):
+                regressions.append((os, name, before, stats['us_per_call']))
+    return regressions
+
+
+def format_report(report):
+    memory = any('result_kb' in s for s in report['os'].values())
+    columns = '{:<8} {:<60} {:>8} {:>12} {:>12} {:>10}'
+    if memory:
+        columns += ' {:>12} {:>12}'
+
+    def line(os, name, s):
+        values = [os, name, s['samples'], s['us_per_call'],
+                  s['lines_per_sec'], s['peak_kb']]
+        if memory:
+            values += [s['result_kb'], s['compact_kb']]
+        return columns.format(*values)
+
+    header = ['os', 'parser', 'samples', 'us/call', 'lines/s', 'peak KiB']
+    if memory:
+        header += ['result KiB', 'compact KiB']
+    lines = [columns.format(*header)]
+    for os, parsers in sorted(report['parser'].items()):
+        for name, s in sorted(parsers.items(),
+                              key=lambda i: -i[1]['us_per_call']):
+            lines.append(line(os, name, s))
+    for os, s in sorted(report['os'].items()):
+        lines.append(line(os, '(all)', s))
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Benchmark the parsers on '
+                                                 'the golden outputs')
+    parser.add_argument('-os',
+                        nargs='*',
+                        default=None,
+                        help='OS to benchmark, all by default')
+    parser.add_argument('-module',
+                        nargs='*',
+                        default=None,
+                        help='Test modules to harvest, ex: test_show_bgp')
+    parser.add_argument('-scale',
+                        type=int,
+                        default=0,
+                        help='Also benchmark the scalable outputs repeated '
+                             'this many times')
+    parser.add_argument('-min_time',
+                        type=float,
+                        default=0.2,
+                        help='Seconds spent on each output')
+    parser.add_argument('-compact',
+                        action='store_true',
+                        help='Also report the memory held by the parsed '
+                             'outputs, as parsed and compact')
+    parser.add_argument('-baseline',
+                        metavar='FILE',
+                        default=None,
+                        help='Baseline to compare to')
+    parser.add_argument('-tolerance',
+                        type=float,
+                        default=0.25,
+                        help='Slowdown allowed over the baseline, 0.25 '
+                             'is 25%%')
+    parser.add_argument('-save_baseline',
+                        metavar='FILE',
+                        default=None,
+                        help='Save the report as the new baseline')
+    args = parser.parse_args()
+
+    samples = harvest(oses=args.os, modules=args.module)
+    if args.scale:
+        samples.extend(scale(samples, args.scale))
+    log.info('Benchmarking {} outputs'.format(len(samples)))
+
+    report = run(samples, min_time=args.min_time, memory=args.compact)
+    print(format_report(report))
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f),
+                                  tolerance=args.tolerance)
+        for os, name, before, after in regressions:
+            log.error('{} {}: {} us -> {} us'.format(os, name, before, after))
+        if regressions:
+            sys.exit(1)
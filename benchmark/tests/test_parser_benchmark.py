@@ -0,0 +1,71 @@
+# Python
+import sys
+import pathlib
+import unittest
+
+# Benchmark, a script and not a package
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from parser_benchmark import repeat_blocks, rename_interface, rename_prefix
+
+
+# ====================================
+#  Unit test for the synthetic scaling
+# ====================================
+
+class test_scaling(unittest.TestCase):
+
+    output = '\n'.join([
+        'show interfaces',
+        'GigabitEthernet1 is up, line protocol is up',
+        '  Internet address is 10.1.1.1/24',
+        'GigabitEthernet2 is down, line protocol is down',
+        '  Internet address is 10.1.2.1/24',
+    ])
+
+    start = r'^ *\S+ is (administratively )?(up|down|deleted)'
+
+    def test_repeat_blocks(self):
+        output = repeat_blocks(self.output, self.start, 3,
+                               lambda block, i: '{} {}'.format(block, i))
+        self.assertEqual(output, '\n'.join([
+            'show interfaces',
+            'GigabitEthernet1 is up, line protocol is up',
+            '  Internet address is 10.1.1.1/24 0',
+            'GigabitEthernet1 is up, line protocol is up',
+            '  Internet address is 10.1.1.1/24 1',
+            'GigabitEthernet1 is up, line protocol is up',
+            '  Internet address is 10.1.1.1/24 2',
+        ]))
+
+    def test_repeat_blocks_single(self):
+        # The only block runs to the end of the output
+        output = repeat_blocks(self.output.split('\nGigabitEthernet2')[0],
+                               self.start, 2, rename_interface)
+        self.assertEqual(output, '\n'.join([
+            'show interfaces',
+            'GigabitEthernet1.1 is up, line protocol is up',
+            '  Internet address is 10.1.1.1/24',
+            'GigabitEthernet1.2 is up, line protocol is up',
+            '  Internet address is 10.1.1.1/24',
+        ]))
+
+    def test_repeat_blocks_none(self):
+        self.assertIsNone(repeat_blocks(self.output, r'^Vlan\d+', 2,
+                                        rename_interface))
+
+    def test_rename_interface(self):
+        self.assertEqual(rename_interface('  Gi1/0/1 is up\n  MTU 1500', 4),
+                         '  Gi1/0/1.5 is up\n  MTU 1500')
+
+    def test_rename_prefix(self):
+        block = '*> 10.1.1.0/24     10.0.0.1    0 100 i\n' \
+                '   10.2.2.0/24'
+        self.assertEqual(rename_prefix(block, 0),
+                         '*> 11.0.0.0/24     10.0.0.1    0 100 i\n'
+                         '   10.2.2.0/24')
+        self.assertEqual(rename_prefix(block, 257).split()[1],
+                         '11.1.1.0/24')
+
+
+if __name__ == '__main__':
+    unittest.main()
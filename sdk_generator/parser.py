@@ -15,6 +15,8 @@ from genie.metaparser import MetaParser
 IGNORE_DIR = ['.git', '__pycache__', 'template', 'tests']
 IGNORE_FILE = ['__init__.py', 'base.py', 'utils.py']
 AVAILABLE_FUNC = ['cli', 'xml', 'yang', 'rest']
+# Keys kept in the lookup index, everything else is documentation
+INDEX_KEYS = ['module_name', 'class']
 
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 log = logging.getLogger(__name__)
@@ -40,6 +42,9 @@ class CreateApiDoc(object):
             self.datafile = yaml.safe_load(f)
         self.output = {}
         self.output['tokens'] = []
+        # Compact command -> os/platform -> module/class lookup index
+        self.index = {}
+        self.index['tokens'] = self.output['tokens']
 
     def _expand(self, name):
         if '$env(VIRTUAL_ENV)' in name:
@@ -76,17 +81,23 @@ class CreateApiDoc(object):
     def _add_parser(self, parser, cli, tokens, mod):
         if cli not in self.output:
             self.output[cli] = {}
+            self.index[cli] = {}
 
         output = self.output[cli]
+        index = self.index[cli]
         for token in tokens:
             if token not in output:
                 output[token] = {}
+                index[token] = {}
             output = output[token]
+            index = index[token]
             if token not in self.output['tokens']:
                 self.output['tokens'].append(token)
 
         output['module_name'] = mod.__name__.rsplit('.', 1)[-1]
         output['class'] = parser.__name__
+        for key in INDEX_KEYS:
+            index[key] = output[key]
         output['doc'] = parser.__doc__
         output['schema'] = format(parser.schema)
         output['uid'] = cli.replace(' ','_').replace('{', '').replace('}', '').replace('|', '_')
@@ -176,13 +187,29 @@ if __name__ == '__main__':
                         type=str,
                         default=None,
                         help='Location to save the output file')
+    parser.add_argument('-index_location',
+                        metavar='FILE',
+                        type=str,
+                        default=None,
+                        help='Location to save the lookup index file, '
+                             'defaults to <save_location>_index.json')
     custom_args = parser.parse_known_args()[0]
 
     apiDoc = CreateApiDoc(custom_args.datafile)
     apiDoc.find_all_apis()
 
     output = json.dumps(apiDoc.output)
+    index = json.dumps(apiDoc.index, separators=(',', ':'))
+
+    index_location = custom_args.index_location
+    if not index_location:
+        index_location = '{}_index.json'.format(
+            os.path.splitext(custom_args.save_location)[0])
 
     os.makedirs(os.path.dirname(custom_args.save_location), exist_ok=True)
     with open(custom_args.save_location, 'w+') as f:
         f.write(output)
+
+    os.makedirs(os.path.dirname(index_location), exist_ok=True)
+    with open(index_location, 'w+') as f:
+        f.write(index)
@@ -26,6 +26,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.rest_pages import fetch_pages
 
 logger = logging.getLogger(__name__)
 
@@ -35,8 +36,7 @@ logger = logging.getLogger(__name__)
 class InterfaceSchema(MetaParser):
     """schema for /dna/intent/api/v1/interface, /dna/intent/api/v1/interface/{interface}"""
 
-    schema = {
-               Any(): {
+    interface_schema = {
                        "adminStatus": str,
                        Optional("className"): str,
                        Optional("description"): str,
@@ -50,7 +50,7 @@ class InterfaceSchema(MetaParser):
                        Optional("ipv4Address"): str,
                        Optional("ipv4Mask"): str,
                        "isisSupport": str,
-                       "lastUpdated": str,
+                       Optional("lastUpdated"): str,
                        Optional("macAddress"): str,
                        Optional("mappedPhysicalInterfaceId"): str,
                        Optional("mappedPhysicalInterfaceName"): str,
@@ -68,6 +68,14 @@ class InterfaceSchema(MetaParser):
                        Optional("vlanId"): str,
                        Optional("voiceVlan"): str
                }
+
+    schema = {
+               # Polled with last_updated=
+               Optional("last_updated"): str,
+               Optional("interfaces"): {
+                       Any(): interface_schema
+               },
+               Any(): interface_schema
              }
 
 # ============================================
@@ -78,20 +86,50 @@ class Interface(InterfaceSchema):
 
     cli_command = ['/dna/intent/api/v1/interface', '/dna/intent/api/v1/interface/{interface}']
 
-    def cli(self,interface="", output=None):
+    def cli(self, interface="", output=None, limit=500, max_workers=4,
+            last_updated=None):
+        """
+            Args:
+                limit (`int`): interfaces per page, the list of all the
+                               interfaces is fetched page after page
+                max_workers (`int`): pages fetched at the same time
+                last_updated (`str`): only return the interfaces updated
+                                      after this lastUpdated value. The
+                                      result is then {'interfaces': {...},
+                                      'last_updated': <latest lastUpdated>},
+                                      the watermark to give to the next
+                                      poll. The API neither filters nor
+                                      sorts on lastUpdated, so every page is
+                                      still fetched; the interfaces are
+                                      filtered as their page is decoded
+        """
         if output is None:
             if interface:
                 cmd = self.cli_command[1].format(interface=interface)
+                out = self.device.get(cmd).json()['response']
             else:
-                cmd = self.cli_command[0]
-            out = self.device.get(cmd).json()['response']
+                out = fetch_pages(self.device.get, self.cli_command[0],
+                                  limit=limit, max_workers=max_workers)
 
         else:
             out = output
 
         result_dict={}
+        watermark = last_updated
         for intf_dict in out:
+            if last_updated is not None:
+                # lastUpdated is 'YYYY-MM-DD HH:MM:SS.mmm', ordered as a
+                # string, or null for an interface never updated
+                updated = intf_dict.get('lastUpdated')
+                if not isinstance(updated, str) or updated <= last_updated:
+                    continue
+                watermark = max(watermark, updated)
             # remove None values
             result_dict[intf_dict['portName']] = {k: v for k, v in intf_dict.items() if v is not None}
 
-        return result_dict
+        if last_updated is None:
+            return result_dict
+
+        # The watermark is kept apart from the interfaces, a poll where
+        # nothing was updated is not an empty output
+        return {'interfaces': result_dict, 'last_updated': watermark}
@@ -155,6 +155,57 @@ class test_interface_rest(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output)
 
+    def test_pages(self):
+        records = self.golden_response_output['response']
+        pages = {
+            '/dna/intent/api/v1/interface?offset=1&limit=1': records[:1],
+            '/dna/intent/api/v1/interface?offset=2&limit=1': records[1:],
+        }
+
+        def get(url):
+            response = Mock(spec=Response)
+            response.json.return_value = {'response': pages.get(url, [])}
+            response.status_code = 200
+            return response
+
+        self.device = Mock(get=Mock(side_effect=get))
+        obj = Interface(device=self.device)
+        parsed_output = obj.parse(limit=1, max_workers=2)
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+
+        # Only the interfaces updated since the previous poll, and the
+        # lastUpdated to give to the next one
+        obj = Interface(device=self.device)
+        parsed_output = obj.parse(limit=1,
+                                  last_updated='2019-05-31 16:17:51.000')
+        self.assertEqual(parsed_output,
+                         {'interfaces': self.golden_parsed_output,
+                          'last_updated': '2019-05-31 16:17:51.735'})
+
+        # Nothing updated since, not an empty output
+        obj = Interface(device=self.device)
+        parsed_output = obj.parse(limit=1,
+                                  last_updated='2019-05-31 16:17:51.735')
+        self.assertEqual(parsed_output,
+                         {'interfaces': {},
+                          'last_updated': '2019-05-31 16:17:51.735'})
+
+    def test_last_updated_null(self):
+        # An interface never updated has a null lastUpdated
+        record = dict(self.golden_response_output['response'][0],
+                      portName='Null0', lastUpdated=None)
+        self.device = Mock()
+        obj = Interface(device=self.device)
+        parsed_output = obj.parse(output=[record])
+        self.assertNotIn('lastUpdated', parsed_output['Null0'])
+
+        obj = Interface(device=self.device)
+        parsed_output = obj.parse(output=[record],
+                                  last_updated='2019-05-31 16:17:51.000')
+        self.assertEqual(parsed_output,
+                         {'interfaces': {},
+                          'last_updated': '2019-05-31 16:17:51.000'})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -677,8 +677,7 @@ class test_show_ip_ospf_mpls_traffic_eng_link(test_show_ip_ospf_mpls_traffic_eng
 
         self.outputs = {}
         self.outputs['show ip ospf mpls traffic-eng link'] = raw1
-        self.outputs['show running-config | section router ospf 1'] = raw2
-        self.outputs['show running-config | section router ospf 2'] = raw3
+        self.outputs['show running-config | section router ospf'] = raw2 + raw3
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
         obj = ShowIpOspfMplsTrafficEngLink(device=self.device)
@@ -22,6 +22,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import ColumnTable
 
 
 # =============================================
@@ -73,7 +74,15 @@ class ShowArp(ShowArpSchema):
     cli_command = ['show arp','show arp vrf {vrf}','show arp vrf {vrf} {intf_or_ip}','show arp {intf_or_ip}']
     exclude = ['age']
 
+    # Columns of the table returned by cli_columns
+    columns = ('protocol', 'address', 'age', 'mac', 'type', 'interface')
+
     def cli(self, vrf='', intf_or_ip='', cmd=None, output=None):
+        return self.to_dict(self.cli_columns(vrf=vrf, intf_or_ip=intf_or_ip,
+                                             cmd=cmd, output=output))
+
+    def cli_columns(self, vrf='', intf_or_ip='', cmd=None, output=None):
+        """Return the rows of the output as a ColumnTable"""
         if output is None:
             if not cmd:
                 cmd = self.cli_command[0]
@@ -92,8 +101,7 @@ class ShowArp(ShowArpSchema):
         # Internet  10.169.197.93          -   fa16.3e95.2218  ARPA
         p1 = re.compile(r'^(?P<protocol>\w+) +(?P<address>[\d\.\:]+) +(?P<age>[\d\-]+) +'
                          '(?P<mac>[\w\.]+) +(?P<type>\w+)( +(?P<interface>[\w\.\/\-]+))?$')
-        # initial variables
-        ret_dict = {}
+        table = ColumnTable(self.columns)
 
         for line in out.splitlines():
             line = line.strip()
@@ -102,31 +110,38 @@ class ShowArp(ShowArpSchema):
             # Internet  10.169.197.93          -   fa16.3e95.2218  ARPA
             m = p1.match(line)
             if m:
-                group = m.groupdict()
-                address = group['address']
-                interface = group['interface']
-                if interface:
-                    final_dict = ret_dict.setdefault('interfaces', {}).setdefault(
-                        interface, {}).setdefault('ipv4', {}).setdefault(
-                        'neighbors', {}).setdefault(address, {})
-                    
-                    final_dict['ip'] = address
-                    final_dict['link_layer_address'] = group['mac']
-                    final_dict['type'] = group['type']
-                    if group['age'] == '-':
-                        final_dict['origin'] = 'static'
-                    else:
-                        final_dict['origin'] = 'dynamic'
+                table.append(*m.group(*self.columns))
+                continue
+
+        return table
+
+    @staticmethod
+    def to_dict(table):
+        """Build the parsed output from the ColumnTable of cli_columns"""
+        ret_dict = {}
+
+        for protocol, address, age, mac, type_, interface in table:
+            if interface:
+                final_dict = ret_dict.setdefault('interfaces', {}).setdefault(
+                    interface, {}).setdefault('ipv4', {}).setdefault(
+                    'neighbors', {}).setdefault(address, {})
+
+                final_dict['ip'] = address
+                final_dict['link_layer_address'] = mac
+                final_dict['type'] = type_
+                if age == '-':
+                    final_dict['origin'] = 'static'
                 else:
-                    final_dict = ret_dict.setdefault(
-                        'global_static_table', {}).setdefault(address, {})
-                    final_dict['ip_address'] = address
-                    final_dict['mac_address'] = group['mac']
-                    final_dict['encap_type'] = group['type']
+                    final_dict['origin'] = 'dynamic'
+            else:
+                final_dict = ret_dict.setdefault(
+                    'global_static_table', {}).setdefault(address, {})
+                final_dict['ip_address'] = address
+                final_dict['mac_address'] = mac
+                final_dict['encap_type'] = type_
 
-                final_dict['age'] = group['age']
-                final_dict['protocol'] = group['protocol']
-                continue
+            final_dict['age'] = age
+            final_dict['protocol'] = protocol
 
         return ret_dict
 
@@ -138,6 +153,9 @@ class ShowIpArp(ShowArp):
     cli_command = ['show ip arp', 'show ip arp vrf {vrf}']
 
     def cli(self, vrf='', output=None):
+        return self.to_dict(self.cli_columns(vrf=vrf, output=output))
+
+    def cli_columns(self, vrf='', output=None):
         if output is None:
             if vrf:
                 cmd = self.cli_command[1].format(vrf=vrf)
@@ -146,7 +164,7 @@ class ShowIpArp(ShowArp):
             out = self.device.execute(cmd)
         else:
             out = output
-        return super().cli(output=out)
+        return super().cli_columns(output=out)
 # =====================================
 # Schema for 'show ip arp summary'
 # =====================================
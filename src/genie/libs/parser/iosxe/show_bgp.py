@@ -114,6 +114,10 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils.command_cache import CommandCache
+from genie.libs.parser.utils.stream import fold_records
+from genie.libs.parser.utils.record_filter import RecordFilter
+from genie.libs.parser.utils.parallel import RecordSplit
 
 
 # ============================================
@@ -209,9 +213,27 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
     def cli(self, address_family='', vrf='', output=None):
 
-        # Init dictionary
-        route_dict = {}
-        af_dict = {}
+        # The dict result is the fold of the route records
+        return fold_records(self.iter_routes(output.splitlines(),
+                                             address_family=address_family,
+                                             vrf=vrf))
+
+    def iter_routes(self, lines, address_family='', vrf=''):
+        '''Parse the output line by line and yield one record per path
+
+            Args:
+                lines (`iterable`): lines of the output, ex: a file object
+                address_family (`str`): address family of the command
+                vrf (`str`): vrf of the command
+
+            Yields:
+                (keys, values) records, see genie.libs.parser.utils.stream.
+                Paths are yielded as soon as their line is parsed:
+                (('vrf', vrf, 'address_family', af, 'routes', prefix,
+                  'index', index), {'next_hop': ..., ...})
+        '''
+
+        # Init vars
         if not vrf:
             vrf = 'default'
         if address_family:
@@ -286,7 +308,15 @@ class ShowBgpSuperParser(ShowBgpSchema):
                         '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
                         '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
-        for line in output.splitlines():
+        # 200 33299 51178 47751 {27016} e
+        p7 = re.compile(r'(?: *(?P<path>[0-9\{\}\s]+))?'
+                        ' +(?P<origin_codes>(i|e|\?|\|))$')
+
+        # 200 33299 51178 47751 {27016} e
+        p8 = re.compile(r'(?: *(?P<path_inner>[0-9\{\}\s]+))?'
+                        ' +(?P<origin_codes_inner>(i|e|\?|\|))$')
+
+        for line in lines:
             line = line.rstrip()
 
             # For address family: IPv4 Unicast
@@ -348,8 +378,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
                 if m.groupdict()['termination']:
                     termination = m.groupdict()['termination']
-                    m3 = re.compile(r'(?: *(?P<path>[0-9\{\}\s]+))?'
-                                    ' +(?P<origin_codes>(i|e|\?|\|))$').match(termination)
+                    m3 = p7.match(termination)
                     if m3 and m3.groupdict()['path']:
                         path_info = m3.groupdict()['path']
                     if m3 and m3.groupdict()['origin_codes']:
@@ -363,49 +392,26 @@ class ShowBgpSuperParser(ShowBgpSchema):
                     localpref = int(m.groupdict()['local_prf'])
 
                 index += 1
-                # Init dict
-                if 'vrf' not in route_dict:
-                    route_dict['vrf'] = {}
-                if vrf not in route_dict['vrf']:
-                    route_dict['vrf'][vrf] = {}
-                if 'address_family' not in route_dict['vrf'][vrf]:
-                    route_dict['vrf'][vrf]['address_family'] = {}
-
-                if address_family not in route_dict['vrf'][vrf]['address_family']:
-                    route_dict['vrf'][vrf]['address_family'][address_family] = {}
-
-                # Set af_dict
-                af_dict = route_dict['vrf'][vrf]['address_family'][address_family]
-
-                if 'routes' not in af_dict:
-                    af_dict['routes'] = {}
-                if prefix not in af_dict['routes']:
-                    af_dict['routes'][prefix] = {}
-                if 'index' not in af_dict['routes'][prefix]:
-                    af_dict['routes'][prefix]['index'] = {}
-                if index not in af_dict['routes'][prefix]['index']:
-                    af_dict['routes'][prefix]['index'][index] = {}
-                if index not in af_dict['routes'][prefix]['index']:
-                    af_dict['routes'][prefix]['index'][index] = {}
 
                 # Set keys
+                path_dict = {}
                 if status_codes:
-                    af_dict['routes'][prefix]['index'][index]['status_codes'] = status_codes
-
+                    path_dict['status_codes'] = status_codes
                 if m.groupdict()['next_hop']:
-                    af_dict['routes'][prefix]['index'][index]['next_hop'] = next_hop
+                    path_dict['next_hop'] = next_hop
                 if m.groupdict()['local_prf']:
-                    af_dict['routes'][prefix]['index'][index]['localpref'] = localpref
+                    path_dict['localpref'] = localpref
                 if m.groupdict()['weight']:
-                    af_dict['routes'][prefix]['index'][index]['weight'] = weight
+                    path_dict['weight'] = weight
                 if m.groupdict()['metric']:
-                    af_dict['routes'][prefix]['index'][index]['metric'] = metric
-
+                    path_dict['metric'] = metric
                 if path_info:
-                     af_dict['routes'][prefix]['index'][index]['path'] = path_info
+                    path_dict['path'] = path_info
                 if origin_codes_info:
-                    af_dict['routes'][prefix]['index'][index]['origin_codes'] = origin_codes_info
+                    path_dict['origin_codes'] = origin_codes_info
 
+                yield ('vrf', vrf, 'address_family', address_family,
+                       'routes', prefix, 'index', index), path_dict
                 continue
 
             # Network            Next Hop            Metric     LocPrf     Weight Path
@@ -435,8 +441,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
                 if m.groupdict()['path']:
                     path_1 = m.groupdict()['path']
-                    m3 = re.compile(r'(?: *(?P<path_inner>[0-9\{\}\s]+))?'
-                                    ' +(?P<origin_codes_inner>(i|e|\?|\|))$').match(path_1)
+                    m3 = p8.match(path_1)
                     if m3:
                         path_data = m3.groupdict()['path_inner']
                         origin_codes_data = m3.groupdict()['origin_codes_inner']
@@ -450,73 +455,35 @@ class ShowBgpSuperParser(ShowBgpSchema):
                 if m.groupdict()['local_prf']:
                     localpref = int(m.groupdict()['local_prf'])
 
-                # Init dict
-                if 'vrf' not in route_dict:
-                    route_dict['vrf'] = {}
-                if vrf not in route_dict['vrf']:
-                    route_dict['vrf'][vrf] = {}
-                if 'address_family' not in route_dict['vrf'][vrf]:
-                    route_dict['vrf'][vrf]['address_family'] = {}
-
-                if address_family not in route_dict['vrf'][vrf]['address_family']:
-                    route_dict['vrf'][vrf]['address_family'][address_family] = {}
-
-                # Set af_dict
-                af_dict = route_dict['vrf'][vrf]['address_family'][address_family]
-                if 'routes' not in af_dict:
-                    af_dict['routes'] = {}
-                if prefix not in af_dict['routes']:
-                    af_dict['routes'][prefix] = {}
-                if 'index' not in af_dict['routes'][prefix]:
-                    af_dict['routes'][prefix]['index'] = {}
-                if index not in af_dict['routes'][prefix]['index']:
-                    af_dict['routes'][prefix]['index'][index] = {}
-                if index not in af_dict['routes'][prefix]['index']:
-                    af_dict['routes'][prefix]['index'][index] = {}
-
                 # Set keys
+                path_dict = {}
                 if status_codes:
-                    af_dict['routes'][prefix]['index'][index]['status_codes'] = status_codes
+                    path_dict['status_codes'] = status_codes
                 if path_data:
-                    af_dict['routes'][prefix]['index'][index]['path'] = path_data
+                    path_dict['path'] = path_data
                 if m.groupdict()['next_hop']:
-                    af_dict['routes'][prefix]['index'][index]['next_hop'] = next_hop
+                    path_dict['next_hop'] = next_hop
                 if m.groupdict()['local_prf']:
-                    af_dict['routes'][prefix]['index'][index]['localpref'] = localpref
+                    path_dict['localpref'] = localpref
                 if m.groupdict()['weight']:
-                    af_dict['routes'][prefix]['index'][index]['weight'] = weight
+                    path_dict['weight'] = weight
                 if m.groupdict()['metric']:
-                    af_dict['routes'][prefix]['index'][index]['metric'] = metric
+                    path_dict['metric'] = metric
                 if origin_codes_data:
-                    af_dict['routes'][prefix]['index'][index]['origin_codes'] = origin_codes_data
+                    path_dict['origin_codes'] = origin_codes_data
+
+                yield ('vrf', vrf, 'address_family', address_family,
+                       'routes', prefix, 'index', index), path_dict
                 continue
 
             # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
             m = p5.match(line)
             if m:
-                af_private_import_to_address_family = m.groupdict()['af_private_import_to_address_family']
-                pfx_count = int(m.groupdict()['pfx_count'])
-                pfx_limit = int(m.groupdict()['pfx_limit'])
-
-                if 'vrf' not in route_dict:
-                    route_dict['vrf'] = {}
-                if vrf not in route_dict['vrf']:
-                    route_dict['vrf'][vrf] = {}
-
-                if 'address_family' not in route_dict['vrf'][vrf]:
-                    route_dict['vrf'][vrf]['address_family'] = {}
-                if new_address_family not in route_dict['vrf'][vrf]['address_family']:
-                    route_dict['vrf'][vrf]['address_family'][new_address_family] = {}
-
-                route_dict['vrf'][vrf]['address_family'][new_address_family] \
-                    ['af_private_import_to_address_family'] = af_private_import_to_address_family
-
-                route_dict['vrf'][vrf]['address_family'][new_address_family] \
-                    ['pfx_count'] = pfx_count
-
-                route_dict['vrf'][vrf]['address_family'][new_address_family] \
-                        ['pfx_limit'] = pfx_limit
-
+                yield ('vrf', vrf, 'address_family', new_address_family), {
+                    'af_private_import_to_address_family':
+                        m.groupdict()['af_private_import_to_address_family'],
+                    'pfx_count': int(m.groupdict()['pfx_count']),
+                    'pfx_limit': int(m.groupdict()['pfx_limit'])}
                 continue
 
             # Route Distinguisher: 200:1
@@ -526,47 +493,24 @@ class ShowBgpSuperParser(ShowBgpSchema):
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
 
-                # Init dict
                 if m.groupdict()['default_vrf']:
                     vrf = m.groupdict()['default_vrf']
 
-                if 'vrf' not in route_dict:
-                    route_dict['vrf'] = {}
-                if vrf not in route_dict['vrf']:
-                    route_dict['vrf'][vrf] = {}
-
-                if 'address_family' not in route_dict['vrf'][vrf]:
-                    route_dict['vrf'][vrf]['address_family'] = {}
-                if new_address_family not in route_dict['vrf'][vrf]['address_family']:
-                    route_dict['vrf'][vrf]['address_family'][new_address_family] = {}
-
                 # Set keys
-                route_dict['vrf'][vrf]['address_family'][new_address_family]\
-                    ['bgp_table_version'] = bgp_table_version
-                route_dict['vrf'][vrf]['address_family'][new_address_family]\
-                    ['route_identifier'] = local_router_id
-                route_dict['vrf'][vrf]['address_family'][new_address_family]\
-                    ['route_distinguisher'] = route_distinguisher
-
+                af_dict = {'bgp_table_version': bgp_table_version,
+                           'route_identifier': local_router_id,
+                           'route_distinguisher': route_distinguisher}
                 if vrf:
-                    route_dict['vrf'][vrf]['address_family'][new_address_family]['default_vrf'] = \
-                    vrf
-
+                    af_dict['default_vrf'] = vrf
                 if m.groupdict()['vrf_router_id']:
-                    route_dict['vrf'][vrf]['address_family'][new_address_family]['vrf_route_identifier'] = \
+                    af_dict['vrf_route_identifier'] = \
                         str(m.groupdict()['vrf_router_id'])
 
+                yield ('vrf', vrf, 'address_family', new_address_family), af_dict
 
-                # Reset address_family key and af_dict for use in other regex
+                # Reset address_family key for use in other regex
                 address_family = new_address_family
-                af_dict = route_dict['vrf'][vrf]['address_family'][address_family]
-
-                # Init routes dict
-                if 'routes' not in af_dict:
-                    del af_dict
-                    continue
-
-        return route_dict
+                continue
 
 
 # ===================================
@@ -1750,6 +1694,10 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         * 'show ip bgp {address_family} all summary'
     '''
 
+    auxiliary_commands = ['show vrf',
+                          'show run | sec address-family ipv4 vrf',
+                          'show run | sec address-family ipv6 vrf']
+
     def cli(self, address_family='', vrf='', rd='',  cmd='', output=None):
 
         # Init vars
@@ -1762,10 +1710,12 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         if not vrf:
             vrf ='default'
 
+        cache = CommandCache.from_device(self.device)
+
         if ('rd' in cmd and 'summary' in cmd and 
             output != '% RD does not match the default RD of any VRF'):
             obj = ShowVrf(device=self.device)
-            show_vrf_output = obj.parse()
+            show_vrf_output = obj.parse(output=cache.execute('show vrf'))
 
 
         if address_family.lower() not in ['ipv4 unicast', 'ipv6 unicast']:
@@ -1782,7 +1732,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                                      'show run | sec address-family ipv6 vrf']
                 
                 for command in commands_list:
-                    out_vrf = self.device.execute(command)
+                    out_vrf = cache.execute(command)
 
                     rc1 = re.compile(r'address\-family\s+(?P<address_family>'
                                       'ipv4|ipv6)\s+vrf\s+(?P<vrf>\S+)')
@@ -2687,7 +2637,93 @@ class ShowBgpNeighborSuperParser(MetaParser):
         * 'show ip bgp {address_family} vrf {vrf} neighbors {neighbor}'
     '''
 
-    def cli(self, neighbor='', address_family='', vrf='', output=None):
+    # For address family: IPv4 Unicast
+    # For address family: L2VPN E-VPN
+    p1 = re.compile(r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$')
+
+    # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
+    p2_1 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
+                     ' +(?P<remote_as>(\d+)), +(?P<link>[a-zA-Z]+) +link$')
+
+    # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
+    # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
+    p2_2 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
+                       ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>(\d+)),'
+                       ' +(?P<link>[a-zA-Z]+) +link$')
+
+    # IOS output
+    # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
+    # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
+    p2_3 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
+                       '(?: +vrf +(?P<vrf>(\S+)),)?'
+                       ' +remote +AS +(?P<remote_as>(\d+)),'
+                       ' +local +AS +(?P<local_as>\d+)(?P<no_prepend> no-prepend)?'
+                       '(?P<replace_as> replace-as)?, +(?P<link>(\S+)) +link$')
+
+    # Records of parse_parallel, see genie.libs.parser.utils.parallel. The
+    # address family carries over to the next neighbor
+    record_split = RecordSplit(header=(p2_1, p2_2, p2_3), context=p1)
+
+    @staticmethod
+    def prune(select, parsed):
+        """Remove the neighbors not wanted by the RecordFilter select"""
+        select.prune(parsed, ('vrf', None, 'neighbor', None))
+        names = {nbr for vrf in parsed.get('vrf', {}).values()
+                 for nbr in vrf.get('neighbor', {})}
+        if 'list_of_neighbors' in parsed:
+            parsed['list_of_neighbors'] = [
+                nbr for nbr in parsed['list_of_neighbors'] if nbr in names]
+            if not parsed['list_of_neighbors']:
+                del parsed['list_of_neighbors']
+        return parsed
+
+    def records(self, lines):
+        """Return the (path, first, last) of the neighbors in the lines.
+
+           The header line of a neighbor and the address family lines are
+           left out of the records: the address family carries over to the
+           next neighbor, and the lines in between write into the neighbor
+           of the header, dropped when pruning."""
+        header = (self.p2_1, self.p2_2, self.p2_3)
+        records = []
+        path = None
+        for i, line in enumerate(lines):
+            line = line.strip()
+
+            # For address family: IPv4 Unicast
+            # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
+            m = None
+            if line.startswith('For'):
+                m = self.p1.match(line)
+            elif line.startswith('BGP'):
+                for pattern in header:
+                    m = pattern.match(line)
+                    if m:
+                        break
+            if not m:
+                continue
+            if path and first < i:
+                records.append((path, first, i))
+            if 'neighbor' in m.groupdict():
+                path = (m.groupdict().get('vrf') or 'default',
+                        m.groupdict()['neighbor'])
+            first = i + 1
+        if path and first < len(lines):
+            records.append((path, first, len(lines)))
+        return records
+
+    def cli(self, neighbor='', address_family='', vrf='', output=None,
+            filter=None):
+
+        # Only parse the neighbors of the filter,
+        # see genie.libs.parser.utils.record_filter
+        if filter is not None:
+            select = RecordFilter.build(filter)
+            lines = output.splitlines()
+            lines = select.select(lines, self.records(lines))
+            return self.prune(select, ShowBgpNeighborSuperParser.cli(
+                self, output='\n'.join(lines), neighbor=neighbor,
+                address_family=address_family, vrf=vrf))
 
         # Init vars
         ret_dict = {}
@@ -2699,27 +2735,9 @@ class ShowBgpNeighborSuperParser(MetaParser):
         refresh_activity = False
 
         # For address family: IPv4 Unicast
-        # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$')
-
         # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
-        p2_1 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
-                         ' +(?P<remote_as>(\d+)), +(?P<link>[a-zA-Z]+) +link$')
-
-        # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
-        # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
-        p2_2 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
-                           ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>(\d+)),'
-                           ' +(?P<link>[a-zA-Z]+) +link$')
-
-        # IOS output
-        # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
-        # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
-        p2_3 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
-                           '(?: +vrf +(?P<vrf>(\S+)),)?'
-                           ' +remote +AS +(?P<remote_as>(\d+)),'
-                           ' +local +AS +(?P<local_as>\d+)(?P<no_prepend> no-prepend)?'
-                           '(?P<replace_as> replace-as)?, +(?P<link>(\S+)) +link$')
+        p1 = self.p1
+        p2_1, p2_2, p2_3 = self.p2_1, self.p2_2, self.p2_3
 
         # Description: router22222222
         p3 = re.compile(r'^Description: +(?P<description>(\S+))$')
@@ -3905,7 +3923,8 @@ class ShowBgpAllNeighbors(ShowBgpNeighborSuperParser, ShowBgpAllNeighborsSchema)
         'keepalive', 'retransmit_packet', 'max_rtt', 'mss', 'rcv_scale']
 
 
-    def cli(self, neighbor='', address_family='', output=None):
+    def cli(self, neighbor='', address_family='', output=None,
+            filter=None):
 
         # Restricted address families
         restricted_list = ['ipv4 unicast', 'ipv6 unicast']
@@ -3937,7 +3956,7 @@ class ShowBgpAllNeighbors(ShowBgpNeighborSuperParser, ShowBgpAllNeighborsSchema)
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family)
+                           address_family=address_family, filter=filter)
 
 
 # ===============================================================
@@ -3971,7 +3990,8 @@ class ShowBgpNeighbors(ShowBgpNeighborSuperParser, ShowBgpAllNeighborsSchema):
     exclude = ['current_time','last_read', 'last_write', 'up_time', 'ackhold', 'retrans',
                 'keepalives', 'total', 'total_data', 'value', 'with_data', 'delrcvwnd', 'rcvnxt',
                 'rcvwnd', 'receive_idletime' , 'sent_idletime', 'sndnxt' , 'snduna', 'uptime']
-    def cli(self, neighbor='', address_family='', vrf='', output=None):
+    def cli(self, neighbor='', address_family='', vrf='', output=None,
+            filter=None):
 
         # Restricted address families
         restricted_list = ['ipv4 unicast', 'ipv6 unicast']
@@ -4017,7 +4037,7 @@ class ShowBgpNeighbors(ShowBgpNeighborSuperParser, ShowBgpAllNeighborsSchema):
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor, vrf=vrf,
-                           address_family=address_family)
+                           address_family=address_family, filter=filter)
 
 
 # ==================================================================
@@ -4046,7 +4066,8 @@ class ShowIpBgpAllNeighbors(ShowBgpNeighborSuperParser, ShowBgpAllNeighborsSchem
                     'value', 'with_data', 'delrcvwnd', 'rcvnxt', 'rcvwnd', 'receive_idletime' , 'sent_idletime', 'sndnxt', 'snduna',
                     'uptime']
 
-    def cli(self, neighbor='', address_family='', output=None):
+    def cli(self, neighbor='', address_family='', output=None,
+            filter=None):
 
         # Restricted address families
         restricted_list = ['ipv4 unicast', 'ipv6 unicast']
@@ -4077,7 +4098,7 @@ class ShowIpBgpAllNeighbors(ShowBgpNeighborSuperParser, ShowBgpAllNeighborsSchem
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family)
+                           address_family=address_family, filter=filter)
 
 # ===================================================================
 # Parser for:
@@ -4110,7 +4131,8 @@ class ShowIpBgpNeighbors(ShowBgpNeighborSuperParser, ShowBgpAllNeighborsSchema):
                 'total', 'total_data' , 'value', 'with_data', 'delrcvwnd', 'rcvnxt', 'rcvwnd'
                 'receive_idletime', 'sent_idletime', 'sndnxt', 'snduna', 'uptime']
 
-    def cli(self, neighbor='', address_family='', vrf='', output=None):
+    def cli(self, neighbor='', address_family='', vrf='', output=None,
+            filter=None):
 
         # Restricted address families
         restricted_list = ['ipv4 unicast', 'ipv6 unicast', 'link-state link-state']
@@ -4156,7 +4178,7 @@ class ShowIpBgpNeighbors(ShowBgpNeighborSuperParser, ShowBgpAllNeighborsSchema):
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor, vrf=vrf,
-                           address_family=address_family)
+                           address_family=address_family, filter=filter)
 
 
 #-------------------------------------------------------------------------------
@@ -4250,6 +4272,8 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
         * 'show ip bgp {address_family} vrf {vrf} neighbors {neighbor} advertised-routes'
     '''
 
+    auxiliary_commands = ['show bgp all neighbors | i BGP neighbor']
+
     def cli(self, neighbor, address_family='', output=None):
 
         p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
@@ -4294,7 +4318,8 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
                             '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
-        out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
+        out_vrf = CommandCache.from_device(self.device).execute(
+            'show bgp all neighbors | i BGP neighbor')
         vrf = 'default'
         for line in out_vrf.splitlines():
             line = line.strip()
@@ -4918,6 +4943,8 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
         * 'show ip bgp {address_family} neighbors {neighbor} received-routes'
     '''
 
+    auxiliary_commands = ['show bgp all neighbors | i BGP neighbor']
+
     def cli(self, neighbor, address_family='', output=None):
         p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
                         '(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
@@ -4952,7 +4979,8 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
                             '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
-        out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
+        out_vrf = CommandCache.from_device(self.device).execute(
+            'show bgp all neighbors | i BGP neighbor')
         vrf = 'default'
         for line in out_vrf.splitlines():
             line = line.strip()
@@ -5516,11 +5544,14 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
         * 'show ip bgp {address_family} neighbors {neighbor} routes'
     '''
 
+    auxiliary_commands = ['show bgp all neighbors | i BGP neighbor']
+
     def cli(self, neighbor, address_family='', vrf='', output=None):
 
         if not vrf:
             # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
-            out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
+            out_vrf = CommandCache.from_device(self.device).execute(
+                'show bgp all neighbors | i BGP neighbor')
             vrf='default'
             p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
                             '(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
@@ -6123,11 +6154,13 @@ class ShowBgpAllClusterIds(ShowBgpAllClusterIdsSchema):
 
     cli_command = 'show bgp all cluster-ids'
 
+    auxiliary_commands = [r'show vrf detail | inc \(VRF']
+
     def cli(self, output=None):
         # find vrf names
         # show vrf detail | inc \(VRF
-        cmd_vrfs = 'show vrf detail | inc \(VRF'
-        out_vrf = self.device.execute(cmd_vrfs)
+        out_vrf = CommandCache.from_device(self.device).execute(
+            r'show vrf detail | inc \(VRF')
         vrf_dict = {'0':'default'}
         p = re.compile(r'^\s*VRF +(?P<vrf_name>[0-9a-zA-Z]+)'
                         ' +\(+VRF +Id += +(?P<vrf_id>[0-9]+)+\)+;'
@@ -6160,8 +6193,10 @@ class ShowBgpAllClusterIds(ShowBgpAllClusterIdsSchema):
 
 
         # show bgp all cluster-ids
-        cmd = self.cli_command
-        out = self.device.execute(cmd)
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
 
         # Init vars
         sum_dict = {}
@@ -19,6 +19,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import ColumnTable
 
 
 class ShowMacAddressTableSchema(MetaParser):
@@ -57,15 +58,25 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
 
     cli_command = 'show mac address-table'
 
+    # Columns of the table returned by cli_columns, one row per interface
+    # of a mac address, or per dropped mac address
+    columns = ('vlan', 'mac', 'interface', 'entry_type', 'entry', 'learn',
+               'age', 'drop')
+
     def cli(self,output=None):
+        return self.to_dict(self.cli_columns(output=output))
+
+    def cli_columns(self, output=None):
+        """Return the rows of the output as a ColumnTable"""
         if output is None:
             # get output from device
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        # initial return dictionary
-        ret_dict = mac_dict = {}
+        table = ColumnTable(self.columns)
+        append = table.append
+        vlan = mac = None
         entry_type = entry = learn = age = ''
         
         # initial regexp pattern
@@ -86,7 +97,7 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
             # Total Mac Addresses for this criterion: 93
             m = p1.match(line)
             if m:
-                ret_dict.update({'total_mac_addresses': int(m.groupdict()['val'])})
+                table.summary['total_mac_addresses'] = int(m.groupdict()['val'])
                 continue
 
             # 10    aaaa.bbbb.cccc    STATIC      Gi1/0/8 Gi1/0/9
@@ -99,29 +110,20 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    append(vlan, mac, None, group['entry_type'].lower(),
+                           None, None, None, True)
                     continue
 
                 for intf in intfs.replace(' ',',').split(','):
                     intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
                     entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
                     if group['entry']:
                         entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
+                    append(vlan, mac, intf, entry_type,
+                           entry if group['entry'] else None, None, None,
+                           False)
                 continue
 
             # Gi1/9,Gi1/10,Gi1/11,Gi1/12
@@ -132,23 +134,14 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 intfs = group['intfs'].strip()
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': entry_type})
+                    append(vlan, mac, None, entry_type, None, None, None,
+                           True)
                     continue
 
                 for intf in intfs.split(','):
                     intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
-                    intf_dict.update({'entry_type': entry_type})
-                    if entry:
-                        intf_dict.update({'entry': entry})
-                    if learn:
-                        intf_dict.update({'learn': learn})
-                    if age:
-                        intf_dict.update({'age': age})
+                    append(vlan, mac, intf, entry_type, entry or None,
+                           learn or None, age or None, False)
                 continue
 
             # *  101  44dd.ee55.ff66   dynamic  Yes         10   Gi1/40
@@ -162,40 +155,65 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    append(vlan, mac, None, group['entry_type'].lower(),
+                           None, None, None, True)
                     continue
 
                 for intf in intfs.split(','):
                     intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
                     entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
                     if group['entry']:
                         entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
                     if group['learn']:
                         learn = group['learn']
-                        intf_dict.update({'learn': learn})
                     if group['age']:
                         if group['age'].isdigit():
                             age = int(group['age'])
-                            intf_dict.update({'age': age})
                         else:
                             age = None
+                    append(vlan, mac, intf, entry_type,
+                           entry if group['entry'] else None,
+                           learn if group['learn'] else None,
+                           age if group['age'] else None, False)
+                continue
+
+        return table
+
+    @staticmethod
+    def to_dict(table):
+        """Build the parsed output from the ColumnTable of cli_columns"""
+        ret_dict = {}
+        if 'total_mac_addresses' in table.summary:
+            ret_dict['total_mac_addresses'] = \
+                table.summary['total_mac_addresses']
+
+        for vlan, mac, intf, entry_type, entry, learn, age, drop in table:
+            vlan_dict = ret_dict.setdefault('mac_table', {}) \
+            .setdefault('vlans', {}).setdefault(str(vlan), {})
+            vlan_dict['vlan'] = vlan
+            mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
+                                .setdefault(mac, {})
+            mac_dict['mac_address'] = mac
+
+            if drop:
+                drop_dict = mac_dict.setdefault('drop', {})
+                drop_dict.update({'drop': True})
+                drop_dict.update({'entry_type': entry_type})
                 continue
 
+            intf_dict = mac_dict.setdefault('interfaces', {}) \
+                                .setdefault(intf, {})
+            intf_dict.update({'interface': intf})
+            intf_dict.update({'entry_type': entry_type})
+            if entry is not None:
+                intf_dict.update({'entry': entry})
+            if learn is not None:
+                intf_dict.update({'learn': learn})
+            if age is not None:
+                intf_dict.update({'age': age})
+
         return ret_dict
 
 
@@ -45,6 +45,11 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.dispatch import LineDispatcher, LinePattern
+from genie.libs.parser.utils.record_filter import RecordFilter
+from genie.libs.parser.utils.parallel import RecordSplit
+from genie.libs.parser.utils.counters import CounterSample
+from genie.libs.parser.utils.yang_decoder import YangDecoder
 
 logger = logging.getLogger(__name__)
 
@@ -191,7 +196,319 @@ class ShowInterfaces(ShowInterfacesSchema):
         'reliability']
 
 
-    def cli(self,interface="",output=None):
+    # Compiled once; each line is only tried against the patterns keyed on
+    # its first word, see genie.libs.parser.utils.dispatch
+    patterns = LineDispatcher([
+        # GigabitEthernet1 is up, line protocol is up 
+        # Port-channel12 is up, line protocol is up (connected)
+        # Vlan1 is administratively down, line protocol is down , Autostate Enabled
+        LinePattern('p1', r'^(?P<interface>[\w\/\.\-]+) +is'
+                           ' +(?P<enabled>[\w\s]+),'
+                           ' +line +protocol +is +(?P<line_protocol>\w+)'
+                           '( *\((?P<attribute>\S+)\))?$',
+                    contains='protocol'),
+        LinePattern('p1_1', r'^(?P<interface>[\w\/\.\-]+) +is'
+                             ' +(?P<enabled>[\w\s]+),'
+                             ' +line +protocol +is +(?P<line_protocol>\w+)'
+                             '( *, *(?P<attribute>[\w\s]+))?$',
+                    contains='protocol'),
+
+        # Hardware is Gigabit Ethernet, address is 0057.d228.1a64 (bia 0057.d228.1a64)
+        # Hardware is Loopback
+        LinePattern('p2', r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
+                           '(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
+                           ' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$'),
+        # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
+        LinePattern('p2_2', r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
+                             '(?P<mac_address>.*)(?P<phys_address>.*)'),
+
+        # Description: desc
+        # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
+        LinePattern('p3', r'^Description: *(?P<description>.*)$'),
+
+        # Secondary address 10.2.2.2/24
+        LinePattern('p4', r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+                           '\/(?P<prefix_length>[0-9]+))$'),
+
+        # Internet Address is 10.4.4.4/24
+        # Internet address is 10.4.4.4/24
+        LinePattern('p5', r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+                           '\/(?P<prefix_length>[0-9]+))$'),
+
+        # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
+        # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
+        LinePattern('p6', r'^MTU +(?P<mtu>[0-9]+) +bytes, +BW'
+                           ' +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?, +DLY'
+                           ' +(?P<delay>[0-9]+) +usec,$'),
+
+        # reliability 255/255, txload 1/255, rxload 1/255
+        LinePattern('p7', r'^reliability +(?P<reliability>[\d\/]+),'
+                           ' +txload +(?P<txload>[\d\/]+), +rxload'
+                           ' +(?P<rxload>[\d\/]+)$'),
+
+        # Encapsulation LOOPBACK, loopback not set
+        # Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
+        # Encapsulation ARPA, medium is broadcast
+        # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
+        # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
+        # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
+        LinePattern('p8', r'^Encapsulation +(?P<encapsulation>[\w\s\.]+),'
+                           ' +(?P<rest>.*)$'),
+
+        # reliability 255/255, txload 1/255, rxload 1/255
+        LinePattern('p9', r'^reliability +(?P<reliability>[0-9]+),'
+                           ' +txload +(?P<txload>[0-9]+), +rxload'
+                           ' +(?P<rxload>[0-9]+)$'),
+
+        # Keepalive set (10 sec)
+        LinePattern('p10', r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
+                            ' +sec\)$'),
+
+        # Auto-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
+        # Full-duplex, 1000Mb/s, link type is auto, media type is
+        # Full Duplex, 1000Mbps, link type is auto, media type is RJ45
+        # Full Duplex, Auto Speed, link type is auto, media type is RJ45
+        LinePattern('p11', r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex, +'
+                            '(?P<port_speed>\d+|Auto-(S|s)peed|Auto (S|s)peed)(?: *(Mbps|Mb/s))?,'
+                            '( *link +type +is +(?P<link_type>\w+),)?'
+                            ' *media +type +is *(?P<media_type>[\w\/]+)?$',
+                    contains='media'),
+
+        # input flow-control is off, output flow-control is unsupported
+        LinePattern('p12', r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
+                            '(output|input) +flow-control +is +(?P<send>\w+)$',
+                    keys=('input', 'output')),
+
+        # Carrier delay is 10 sec
+        LinePattern('p_cd', r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$'),
+
+        # Asymmetric Carrier-Delay Up Timer is 2 sec
+        # Asymmetric Carrier-Delay Down Timer is 10 sec
+        LinePattern('p_cd_2', r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
+                               ' +Timer +is +(?P<carrier_delay>\d+).*$'),
+
+        # ARP type: ARPA, ARP Timeout 04:00:00
+        LinePattern('p13', r'^ARP +type: +(?P<arp_type>\w+), +'
+                            'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$'),
+
+        # Last input never, output 00:01:05, output hang never
+        LinePattern('p14', r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+                            'output +(?P<last_output>[\w\.\:]+), '
+                            'output +hang +(?P<output_hang>[\w\.\:]+)$'),
+
+        # Members in this channel: Gi1/0/2
+        # Members in this channel: Fo1/0/2 Fo1/0/4
+        LinePattern('p15', r'^Members +in +this +channel: +'
+                            '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$'),
+
+        # No. of active members in this channel: 12 
+        LinePattern('p15_1', r'^No\. +of +active +members +in +this +'
+                              'channel: +(?P<active_members>\d+)$'),
+
+        # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
+        LinePattern('p15_2', r'^Member +\d+ +: +(?P<interface>\S+) +,'
+                              ' +\S+, +\S+$'),
+
+        # No. of PF_JUMBO supported members in this channel : 0
+        LinePattern('p15_3', r'^No\. +of +PF_JUMBO +supported +members +'
+                              'in +this +channel +: +(?P<number>\d+)$'),
+
+        # Last clearing of "show interface" counters 1d02h
+        LinePattern('p16', r'^Last +clearing +of +\"show +interface\" +counters +'
+                            '(?P<last_clear>[\w\:\.]+)$'),
+
+        # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
+        LinePattern('p17', r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
+                            '(?P<drops>\d+)\/(?P<flushes>\d+) +'
+                            '\(size\/max\/drops\/flushes\); +'
+                            'Total +output +drops: +(?P<output_drop>\d+)$'),
+
+        # Queueing strategy: fifo
+        LinePattern('p18', r'^Queueing +strategy: +(?P<queue_strategy>\w+)$'),
+
+        # Output queue: 0/0 (size/max)
+        LinePattern('p19', r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
+                            ' +\(size\/max\)$'),
+
+        # 5 minute input rate 0 bits/sec, 0 packets/sec
+        LinePattern('p20', r'^(?P<load_interval>[0-9\#]+)'
+                            ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
+                            ' *(?P<in_rate>[0-9]+) *bits/sec,'
+                            ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$',
+                    keys=('minute', 'second', 'minutes', 'seconds')),
+
+        # 5 minute output rate 0 bits/sec, 0 packets/sec
+        LinePattern('p21', r'^(?P<load_interval>[0-9\#]+)'
+                            ' *(minute|second|minutes|seconds) *output *rate'
+                            ' *(?P<out_rate>[0-9]+) *bits/sec,'
+                            ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$',
+                    keys=('minute', 'second', 'minutes', 'seconds')),
+
+        # 0 packets input, 0 bytes, 0 no buffer
+        LinePattern('p22', r'^(?P<in_pkts>[0-9]+) +packets +input,'
+                            ' +(?P<in_octets>[0-9]+) +bytes,'
+                            ' +(?P<in_no_buffer>[0-9]+) +no +buffer$',
+                    keys='packets'),
+
+        # Received 4173 broadcasts (0 IP multicasts)
+        # Received 535996 broadcasts (535961 multicasts)
+        LinePattern('p23', r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
+                            '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$'),
+
+        # 0 runts, 0 giants, 0 throttles
+        LinePattern('p24', r'^(?P<in_runts>[0-9]+) *runts,'
+                            ' *(?P<in_giants>[0-9]+) *giants,'
+                            ' *(?P<in_throttles>[0-9]+) *throttles$',
+                    keys='runts'),
+
+        # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+        # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+        LinePattern('p25', r'^(?P<in_errors>[0-9]+) +input +errors, +'
+                            '(?P<in_crc_errors>[0-9]+) +CRC, +'
+                            '(?P<in_frame>[0-9]+) +frame, +'
+                            '(?P<in_overrun>[0-9]+) +overrun, +'
+                            '(?P<in_ignored>[0-9]+) +ignored'
+                            '(, *(?P<in_abort>[0-9]+) +abort)?$',
+                    keys='input'),
+
+        # 0 watchdog, 535961 multicast, 0 pause input
+        LinePattern('p26', r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
+                            '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
+                            '(?P<in_pause_input>[0-9]+) +pause +input$',
+                    keys='watchdog'),
+
+        # 0 input packets with dribble condition detected
+        LinePattern('p27', r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
+                            'dribble +condition +detected$',
+                    keys='input'),
+
+        # 23376 packets output, 3642296 bytes, 0 underruns
+        LinePattern('p28', r'^(?P<out_pkts>[0-9]+) +packets +output,'
+                            ' +(?P<out_octets>[0-9]+) +bytes,'
+                            ' +(?P<out_underruns>[0-9]+) +underruns$',
+                    keys='packets'),
+
+        # Received 4173 broadcasts (0 IP multicasts)
+        # Received 535996 broadcasts (535961 multicasts)
+        LinePattern('p29', r'^Received +(?P<out_broadcast_pkts>\d+) +broadcasts +'
+                            '\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$'),
+
+        # 0 output errors, 0 collisions, 2 interface resets
+        # 0 output errors, 0 interface resets
+        LinePattern('p30', r'^(?P<out_errors>[0-9]+) +output +errors,'
+                            '( *(?P<out_collision>[0-9]+) +collisions,)? +'
+                            '(?P<out_interface_resets>[0-9]+) +interface +resets$',
+                    keys='output'),
+
+        # 0 unknown protocol drops
+        LinePattern('p31', r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
+                            'unknown +protocol +drops$',
+                    keys='unknown'),
+
+        # 0 babbles, 0 late collision, 0 deferred
+        LinePattern('p32', r'^(?P<out_babble>[0-9]+) +babbles, +'
+                            '(?P<out_late_collision>[0-9]+) +late +collision, +'
+                            '(?P<out_deferred>[0-9]+) +deferred$',
+                    keys='babbles'),
+
+        # 0 lost carrier, 0 no carrier, 0 pause output
+        LinePattern('p33', r'^(?P<out_lost_carrier>[0-9]+) +lost +carrier, +'
+                            '(?P<out_no_carrier>[0-9]+) +no +carrier, +'
+                            '(?P<out_pause_output>[0-9]+) +pause +output$',
+                    keys='lost'),
+
+        # 0 output buffer failures, 0 output buffers swapped out
+        LinePattern('p34', r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
+                            '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$',
+                    keys='output'),
+
+        # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
+        # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
+        LinePattern('p35', r'^Interface +is +unnumbered. +Using +address +of +'
+                            '(?P<unnumbered_intf>[\w\/\.]+) +'
+                            '\((?P<unnumbered_ip>[\w\.\:]+)\)$'),
+    ])
+
+    # Rest of the 'Encapsulation' line
+    # Vlan ID 20, medium is p2p
+    p8_1 = re.compile(r'(Vlan +ID +(?P<first_dot1q>[0-9]+),)?'
+                       ' *medium +is +(?P<medium>[a-z0-9]+)$')
+    # will update key when output is valid
+    p8_2 = re.compile(r'loopback +(?P<loopback>[\w\s]+)$')
+    #  outer ID  10, inner ID 20
+    p8_3 = re.compile(r'outer +ID +(?P<first>[0-9]+), +'
+                       'inner +ID (?P<second>[0-9]+)$')
+    # Vlan ID  1., loopback not set
+    # Vlan ID  105.
+    p8_4 = re.compile(r'Vlan +ID +(?P<first_dot1q>\d+).'
+                       '|(?:,(?P<rest>[\s\w]+))$')
+
+    # Records of parse_parallel, see genie.libs.parser.utils.parallel
+    record_split = RecordSplit(header=(patterns['p1'], patterns['p1_1']))
+
+    # Header, last clearing, rate and counter lines, see cli_counters
+    counter_patterns = patterns.subset(
+        ['p1', 'p1_1', 'p16'] + ['p{}'.format(i) for i in range(20, 35)])
+
+    def record_depends(self, lines):
+        """Return the (header line, needed header line) of the interfaces
+           to parse with another, for parse_parallel"""
+        records, depends = self.records(lines)
+        first = {path: first for path, first, _ in records}
+        return [(first[path], first[needed]) for path, needed in depends
+                if path in first and needed in first]
+
+    def records(self, lines):
+        """Return the (path, first, last) of the interfaces in the lines,
+           and the (path, needed path) of the interfaces needing another"""
+        header = (self.patterns['p1'], self.patterns['p1_1'])
+        records = []
+        depends = []
+        path = None
+        for i, line in enumerate(lines):
+            line = line.strip()
+
+            # GigabitEthernet1 is up, line protocol is up
+            for pattern in header:
+                m = pattern.match(line)
+                if m:
+                    if path:
+                        records.append((path, first, i))
+                    path = (m.groupdict()['interface'],)
+                    first = i
+                    break
+            if m or not path:
+                continue
+
+            # Members in this channel: Gi1/0/2
+            if line.startswith('Members'):
+                m = self.patterns['p15'].match(line)
+                if m:
+                    for intf in m.groupdict()['port_channel_member_intfs']\
+                            .split(' '):
+                        intf = Common.convert_intf_name(intf.strip())
+                        depends.append(((intf,), path))
+
+            # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
+            elif line.startswith('Interface is unnumbered'):
+                m = self.patterns['p35'].match(line)
+                if m:
+                    depends.append(
+                        (path, (m.groupdict()['unnumbered_intf'],)))
+        if path:
+            records.append((path, first, len(lines)))
+        return records, depends
+
+    def cli_counters(self, interface="", output=None, filter=None,
+                     time=None):
+        """Return the counters of the interfaces as a CounterSample, see
+           genie.libs.parser.utils.counters. Only the header, counter and
+           rate lines are matched"""
+        return CounterSample.from_parsed(
+            self.cli(interface=interface, output=output, filter=filter,
+                     counters=True), time=time)
+
+    def cli(self,interface="",output=None, filter=None, counters=False):
         if output is None:
             if interface:
                 cmd = self.cli_command[1].format(interface=interface)
@@ -201,26 +518,32 @@ class ShowInterfaces(ShowInterfacesSchema):
         else:
             out = output
 
+        # Only parse the interfaces of the filter, and those they need,
+        # see genie.libs.parser.utils.record_filter
+        if filter is not None:
+            select = RecordFilter.build(filter,
+                                        normalize=Common.convert_intf_name)
+            lines = out.splitlines()
+            lines = select.select(lines, *self.records(lines))
+            return select.prune(self.cli(output='\n'.join(lines),
+                                         counters=counters), (None,))
+
+        # Only the lines of the counters, for cli_counters
+        patterns = self.counter_patterns if counters else self.patterns
+
         interface_dict = {}
         unnumbered_dict = {}
         for line in out.splitlines():
             line = line.strip()
-            
+
+            name, m = patterns.match(line)
+            if not m:
+                continue
+
             # GigabitEthernet1 is up, line protocol is up 
             # Port-channel12 is up, line protocol is up (connected)
             # Vlan1 is administratively down, line protocol is down , Autostate Enabled
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                              ' +(?P<enabled>[\w\s]+),'
-                              ' +line +protocol +is +(?P<line_protocol>\w+)'
-                              '( *\((?P<attribute>\S+)\))?$')
-            p1_1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                              ' +(?P<enabled>[\w\s]+),'
-                              ' +line +protocol +is +(?P<line_protocol>\w+)'
-                              '( *, *(?P<attribute>[\w\s]+))?$')
-            m = p1.match(line)
-            m1 = p1_1.match(line)
-            m = m if m else m1
-            if m:
+            if name in ('p1', 'p1_1'):
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled']
                 line_protocol = m.groupdict()['line_protocol']
@@ -252,15 +575,8 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Hardware is Gigabit Ethernet, address is 0057.d228.1a64 (bia 0057.d228.1a64)
             # Hardware is Loopback
-            p2 = re.compile(r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
-                            '(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
-                            ' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$')
             # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
-            p2_2 = re.compile(r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)(?P<mac_address>.*)(?P<phys_address>.*)')
-            m = p2.match(line)
-            m1 = p2_2.match(line)
-            m = m if m else m1
-            if m:
+            if name in ('p2', 'p2_2'):
                 types = m.groupdict()['type']
                 mac_address = m.groupdict()['mac_address']
                 phys_address = m.groupdict()['phys_address']
@@ -273,19 +589,14 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Description: desc
             # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-            p3 = re.compile(r'^Description: *(?P<description>.*)$')
-            m = p3.match(line)
-            if m:
+            if name == 'p3':
                 description = m.groupdict()['description']
 
                 interface_dict[interface]['description'] = description
                 continue
 
             # Secondary address 10.2.2.2/24
-            p4 = re.compile(r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                             '\/(?P<prefix_length>[0-9]+))$')
-            m = p4.match(line)
-            if m:
+            if name == 'p4':
                 ip_sec = m.groupdict()['ip']
                 prefix_length_sec = m.groupdict()['prefix_length']
                 address_sec = m.groupdict()['ipv4']
@@ -305,10 +616,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Internet Address is 10.4.4.4/24
             # Internet address is 10.4.4.4/24
-            p5 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                             '\/(?P<prefix_length>[0-9]+))$')
-            m = p5.match(line)
-            if m:
+            if name == 'p5':
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
                 address = m.groupdict()['ipv4']
@@ -326,11 +634,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             
             # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
             # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
-            p6 = re.compile(r'^MTU +(?P<mtu>[0-9]+) +bytes, +BW'
-                             ' +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?, +DLY'
-                             ' +(?P<delay>[0-9]+) +usec,$')
-            m = p6.match(line)
-            if m:
+            if name == 'p6':
                 mtu = m.groupdict()['mtu']
                 bandwidth = m.groupdict()['bandwidth']
                 if m.groupdict()['delay']:
@@ -342,11 +646,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            p7 = re.compile(r'^reliability +(?P<reliability>[\d\/]+),'
-                             ' +txload +(?P<txload>[\d\/]+), +rxload'
-                             ' +(?P<rxload>[\d\/]+)$')
-            m = p7.match(line)
-            if m:
+            if name in ('p7', 'p9'):
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
                 rxload = m.groupdict()['rxload']
@@ -360,11 +660,8 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Encapsulation ARPA, medium is broadcast
             # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
-            # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
-            p8 = re.compile(r'^Encapsulation +(?P<encapsulation>[\w\s\.]+),'
-                             ' +(?P<rest>.*)$')
-            m = p8.match(line)
-            if m:
+            # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
+            if name == 'p8':
                 encapsulation = m.groupdict()['encapsulation']
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
@@ -376,19 +673,16 @@ class ShowInterfaces(ShowInterfacesSchema):
 
                 rest = m.groupdict()['rest']
                 # Vlan ID 20, medium is p2p
-                m1 = re.compile(r'(Vlan +ID +(?P<first_dot1q>[0-9]+),)?'
-                                 ' *medium +is +(?P<medium>[a-z0-9]+)$').match(rest)
+                m1 = self.p8_1.match(rest)
                 # will update key when output is valid
-                m2 = re.compile(r'loopback +(?P<loopback>[\w\s]+)$').match(rest)
+                m2 = self.p8_2.match(rest)
 
                 #  outer ID  10, inner ID 20
-                m3 = re.compile(r'outer +ID +(?P<first>[0-9]+), +'
-                                 'inner +ID (?P<second>[0-9]+)$').match(rest)
+                m3 = self.p8_3.match(rest)
 
                 # Vlan ID  1., loopback not set
                 # Vlan ID  105.
-                m4 = re.compile(r'Vlan +ID +(?P<first_dot1q>\d+).'
-                                 '|(?:,(?P<rest>[\s\w]+))$').match(rest)
+                m4 = self.p8_4.match(rest)
 
                 if m1:
                     first_dot1q = m1.groupdict()['first_dot1q']
@@ -411,25 +705,8 @@ class ShowInterfaces(ShowInterfacesSchema):
 
                 continue
 
-            # reliability 255/255, txload 1/255, rxload 1/255
-            p9 = re.compile(r'^reliability +(?P<reliability>[0-9]+),'
-                             ' +txload +(?P<txload>[0-9]+), +rxload'
-                             ' +(?P<rxload>[0-9]+)$')
-            m = p9.match(line)
-            if m:
-                reliability = m.groupdict()['reliability']
-                txload = m.groupdict()['txload']
-                rxload = m.groupdict()['rxload']
-                interface_dict[interface]['reliability'] = reliability
-                interface_dict[interface]['txload'] = txload
-                interface_dict[interface]['rxload'] = rxload
-                continue
-
             # Keepalive set (10 sec)
-            p10 = re.compile(r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
-                             ' +sec\)$')
-            m = p10.match(line)
-            if m:
+            if name == 'p10':
                 keepalive = m.groupdict()['keepalive']
                 if keepalive:
                     interface_dict[interface]['keepalive'] = int(keepalive)
@@ -439,12 +716,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Full-duplex, 1000Mb/s, link type is auto, media type is
             # Full Duplex, 1000Mbps, link type is auto, media type is RJ45
             # Full Duplex, Auto Speed, link type is auto, media type is RJ45
-            p11 = re.compile(r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex, +'
-                              '(?P<port_speed>\d+|Auto-(S|s)peed|Auto (S|s)peed)(?: *(Mbps|Mb/s))?,'
-                              '( *link +type +is +(?P<link_type>\w+),)?'
-                              ' *media +type +is *(?P<media_type>[\w\/]+)?$')
-            m = p11.match(line)
-            if m:
+            if name == 'p11':
                 duplex_mode = m.groupdict()['duplex_mode'].lower()
                 port_speed = m.groupdict()['port_speed'].lower().replace('-speed', '')
                 link_type = m.groupdict()['link_type']
@@ -462,10 +734,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # input flow-control is off, output flow-control is unsupported
-            p12 = re.compile(r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
-                              '(output|input) +flow-control +is +(?P<send>\w+)$')
-            m = p12.match(line)
-            if m:
+            if name == 'p12':
                 receive = m.groupdict()['receive'].lower()
                 send = m.groupdict()['send'].lower()
                 if 'flow_control' not in interface_dict[interface]:
@@ -482,19 +751,15 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Carrier delay is 10 sec
-            p_cd = re.compile(r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd.match(line)
-            if m:
+            if name == 'p_cd':
                 group = m.groupdict()
                 sub_dict = interface_dict.setdefault(interface, {})
                 sub_dict['carrier_delay'] = int(group['carrier_delay'])
+                continue
 
             # Asymmetric Carrier-Delay Up Timer is 2 sec
             # Asymmetric Carrier-Delay Down Timer is 10 sec
-            p_cd_2 = re.compile(r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
-                                 ' +Timer +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd_2.match(line)
-            if m:
+            if name == 'p_cd_2':
                 group = m.groupdict()
                 tp = group['type'].lower()
                 sub_dict = interface_dict.setdefault(interface, {})
@@ -502,12 +767,10 @@ class ShowInterfaces(ShowInterfacesSchema):
                     sub_dict['carrier_delay_up'] = int(group['carrier_delay'])
                 else:
                     sub_dict['carrier_delay_down'] = int(group['carrier_delay'])
+                continue
 
             # ARP type: ARPA, ARP Timeout 04:00:00
-            p13 = re.compile(r'^ARP +type: +(?P<arp_type>\w+), +'
-                              'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$')
-            m = p13.match(line)
-            if m:
+            if name == 'p13':
                 arp_type = m.groupdict()['arp_type'].lower()
                 arp_timeout = m.groupdict()['arp_timeout']
                 interface_dict[interface]['arp_type'] = arp_type
@@ -515,11 +778,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last input never, output 00:01:05, output hang never
-            p14 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                              'output +(?P<last_output>[\w\.\:]+), '
-                              'output +hang +(?P<output_hang>[\w\.\:]+)$')
-            m = p14.match(line)
-            if m:
+            if name == 'p14':
                 last_input = m.groupdict()['last_input']
                 last_output = m.groupdict()['last_output']
                 output_hang = m.groupdict()['output_hang']
@@ -530,10 +789,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Members in this channel: Gi1/0/2
             # Members in this channel: Fo1/0/2 Fo1/0/4
-            p15 = re.compile(r'^Members +in +this +channel: +'
-                              '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')
-            m = p15.match(line)
-            if m:
+            if name == 'p15':
                 interface_dict[interface]['port_channel']\
                     ['port_channel_member'] = True
                 intfs = m.groupdict()['port_channel_member_intfs'].split(' ')
@@ -552,10 +808,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of active members in this channel: 12 
-            p15_1 = re.compile(r'^No\. +of +active +members +in +this +'
-                'channel: +(?P<active_members>\d+)$')
-            m = p15_1.match(line)
-            if m:
+            if name == 'p15_1':
                 group = m.groupdict()
                 active_members = int(group['active_members'])
                 interface_dict[interface]['port_channel']\
@@ -565,10 +818,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-            p15_2 = re.compile(r'^Member +\d+ +: +(?P<interface>\S+) +,'
-                ' +\S+, +\S+$')
-            m = p15_2.match(line)
-            if m:
+            if name == 'p15_2':
                 group = m.groupdict()
                 intf = group['interface']
                 if 'port_channel_member_intfs' not in interface_dict[interface]['port_channel']:
@@ -581,10 +831,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of PF_JUMBO supported members in this channel : 0
-            p15_3 = re.compile(r'^No\. +of +PF_JUMBO +supported +members +'
-                'in +this +channel +: +(?P<number>\d+)$')
-            m = p15_3.match(line)
-            if m:
+            if name == 'p15_3':
                 group = m.groupdict()
                 number = int(group['number'])
                 interface_dict[interface]['port_channel']\
@@ -592,20 +839,12 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last clearing of "show interface" counters 1d02h
-            p16 = re.compile(r'^Last +clearing +of +\"show +interface\" +counters +'
-                              '(?P<last_clear>[\w\:\.]+)$')
-            m = p16.match(line)
-            if m:                
+            if name == 'p16':
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-            p17 = re.compile(r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
-                              '(?P<drops>\d+)\/(?P<flushes>\d+) +'
-                              '\(size\/max\/drops\/flushes\); +'
-                              'Total +output +drops: +(?P<output_drop>\d+)$')
-            m = p17.match(line)
-            if m:
+            if name == 'p17':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
 
@@ -622,9 +861,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Queueing strategy: fifo
-            p18 = re.compile(r'^Queueing +strategy: +(?P<queue_strategy>\w+)$')
-            m = p18.match(line)
-            if m:
+            if name == 'p18':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
                 interface_dict[interface]['queues']['queue_strategy'] = \
@@ -632,10 +869,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Output queue: 0/0 (size/max)
-            p19 = re.compile(r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
-                              ' +\(size\/max\)$')
-            m = p19.match(line)
-            if m:
+            if name == 'p19':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
                 interface_dict[interface]['queues']['output_queue_size'] = \
@@ -645,12 +879,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            p20 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                              ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
-                              ' *(?P<in_rate>[0-9]+) *bits/sec,'
-                              ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
-            m = p20.match(line)
-            if m:
+            if name == 'p20':
                 load_interval = int(m.groupdict()['load_interval'])
                 in_rate = int(m.groupdict()['in_rate'])
                 in_rate_pkts = int(m.groupdict()['in_rate_pkts'])
@@ -683,12 +912,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                              ' *(minute|second|minutes|seconds) *output *rate'
-                              ' *(?P<out_rate>[0-9]+) *bits/sec,'
-                              ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$')
-            m = p21.match(line)
-            if m:
+            if name == 'p21':
                 out_rate = int(m.groupdict()['out_rate'])
                 out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
 
@@ -699,11 +923,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 packets input, 0 bytes, 0 no buffer
-            p22 = re.compile(r'^(?P<in_pkts>[0-9]+) +packets +input,'
-                              ' +(?P<in_octets>[0-9]+) +bytes,'
-                              ' +(?P<in_no_buffer>[0-9]+) +no +buffer$')
-            m = p22.match(line)
-            if m:
+            if name == 'p22':
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
 
@@ -717,10 +937,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            p23 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
-                              '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$')
-            m = p23.match(line)
-            if m:
+            if name == 'p23':
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
                     int(m.groupdict()['in_broadcast_pkts'])
                 interface_dict[interface]['counters']['in_broadcast_pkts'] = \
@@ -728,11 +945,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 runts, 0 giants, 0 throttles
-            p24 = re.compile(r'^(?P<in_runts>[0-9]+) *runts,'
-                              ' *(?P<in_giants>[0-9]+) *giants,'
-                              ' *(?P<in_throttles>[0-9]+) *throttles$')
-            m = p24.match(line)
-            if m:
+            if name == 'p24':
                 interface_dict[interface]['counters']['in_runts'] = \
                     int(m.groupdict()['in_runts'])
                 interface_dict[interface]['counters']['in_giants'] = \
@@ -743,14 +956,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            p25 = re.compile(r'^(?P<in_errors>[0-9]+) +input +errors, +'
-                              '(?P<in_crc_errors>[0-9]+) +CRC, +'
-                              '(?P<in_frame>[0-9]+) +frame, +'
-                              '(?P<in_overrun>[0-9]+) +overrun, +'
-                              '(?P<in_ignored>[0-9]+) +ignored'
-                              '(, *(?P<in_abort>[0-9]+) +abort)?$')
-            m = p25.match(line)
-            if m:
+            if name == 'p25':
                 interface_dict[interface]['counters']['in_errors'] = \
                     int(m.groupdict()['in_errors'])
                 interface_dict[interface]['counters']['in_crc_errors'] = \
@@ -767,11 +973,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 watchdog, 535961 multicast, 0 pause input
-            p26 = re.compile(r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
-                              '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
-                              '(?P<in_pause_input>[0-9]+) +pause +input$')
-            m = p26.match(line)
-            if m:
+            if name == 'p26':
                 interface_dict[interface]['counters']['in_watchdog'] = \
                     int(m.groupdict()['in_watchdog'])
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
@@ -781,20 +983,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 input packets with dribble condition detected
-            p27 = re.compile(r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
-                              'dribble +condition +detected$')
-            m = p27.match(line)
-            if m:
+            if name == 'p27':
                 interface_dict[interface]['counters']['in_with_dribble'] = \
                     int(m.groupdict()['in_with_dribble'])
                 continue
 
             # 23376 packets output, 3642296 bytes, 0 underruns
-            p28 = re.compile(r'^(?P<out_pkts>[0-9]+) +packets +output,'
-                              ' +(?P<out_octets>[0-9]+) +bytes,'
-                              ' +(?P<out_underruns>[0-9]+) +underruns$')
-            m = p28.match(line)
-            if m:
+            if name == 'p28':
                 interface_dict[interface]['counters']['out_pkts'] = \
                     int(m.groupdict()['out_pkts'])
                 interface_dict[interface]['counters']['out_octets'] = \
@@ -805,10 +1000,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            p29 = re.compile(r'^Received +(?P<out_broadcast_pkts>\d+) +broadcasts +'
-                              '\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$')
-            m = p29.match(line)
-            if m:
+            if name == 'p29':
                 interface_dict[interface]['counters']['out_broadcast_pkts'] = \
                     int(m.groupdict()['out_broadcast_pkts'])
                 interface_dict[interface]['counters']['out_multicast_pkts'] = \
@@ -817,11 +1009,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 output errors, 0 collisions, 2 interface resets
             # 0 output errors, 0 interface resets
-            p30 = re.compile(r'^(?P<out_errors>[0-9]+) +output +errors,'
-                              '( *(?P<out_collision>[0-9]+) +collisions,)? +'
-                              '(?P<out_interface_resets>[0-9]+) +interface +resets$')
-            m = p30.match(line)
-            if m:
+            if name == 'p30':
                 interface_dict[interface]['counters']['out_errors'] = \
                     int(m.groupdict()['out_errors'])
                 interface_dict[interface]['counters']['out_interface_resets'] = \
@@ -832,20 +1020,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 unknown protocol drops
-            p31 = re.compile(r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
-                              'unknown +protocol +drops$')
-            m = p31.match(line)
-            if m:
+            if name == 'p31':
                 interface_dict[interface]['counters']['out_unknown_protocl_drops'] = \
                     int(m.groupdict()['out_unknown_protocl_drops'])
                 continue
 
             # 0 babbles, 0 late collision, 0 deferred
-            p32 = re.compile(r'^(?P<out_babble>[0-9]+) +babbles, +'
-                              '(?P<out_late_collision>[0-9]+) +late +collision, +'
-                              '(?P<out_deferred>[0-9]+) +deferred$')
-            m = p32.match(line)
-            if m:
+            if name == 'p32':
                 interface_dict[interface]['counters']['out_babble'] = \
                     int(m.groupdict()['out_babble'])
                 interface_dict[interface]['counters']['out_late_collision'] = \
@@ -855,11 +1036,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 lost carrier, 0 no carrier, 0 pause output
-            p33 = re.compile(r'^(?P<out_lost_carrier>[0-9]+) +lost +carrier, +'
-                              '(?P<out_no_carrier>[0-9]+) +no +carrier, +'
-                              '(?P<out_pause_output>[0-9]+) +pause +output$')
-            m = p33.match(line)
-            if m:
+            if name == 'p33':
                 interface_dict[interface]['counters']['out_lost_carrier'] = \
                     int(m.groupdict()['out_lost_carrier'])
                 interface_dict[interface]['counters']['out_no_carrier'] = \
@@ -869,10 +1046,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            p34 = re.compile(r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
-                              '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$')
-            m = p34.match(line)
-            if m:
+            if name == 'p34':
                 interface_dict[interface]['counters']['out_buffer_failure'] = \
                     int(m.groupdict()['out_buffer_failure'])
                 interface_dict[interface]['counters']['out_buffers_swapped'] = \
@@ -881,11 +1055,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
             # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-            p35 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                              '(?P<unnumbered_intf>[\w\/\.]+) +'
-                              '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
-            m = p35.match(line)
-            if m:
+            if name == 'p35':
                 unnumbered_dict[interface] = {}
                 unnumbered_dict[interface]['unnumbered_intf'] = m.groupdict()['unnumbered_intf']
                 unnumbered_dict[interface]['unnumbered_ip'] = m.groupdict()['unnumbered_ip']
@@ -1031,7 +1201,15 @@ class ShowIpInterfaceBriefPipeVlan(ShowIpInterfaceBrief):
     # parsing mechanisms (cli(), yang(), xml()).
 
     cli_command = "show ip interface brief | include Vlan"
-    
+
+    # vlan id -> primary address, of the native interfaces
+    decoder = YangDecoder(
+        leaves={
+            'native/interface/Vlan/name': ('{Vlan}/vlan_id', str),
+            'native/interface/Vlan/ip/address/primary/address':
+                ('{Vlan}/ip_address', str),
+        },
+        keys={'native/interface/Vlan': ('name', str)})
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -1051,58 +1229,14 @@ class ShowIpInterfaceBriefPipeVlan(ShowIpInterfaceBrief):
         cmd = '''<native><interface><Vlan/></interface></native>'''
         output = self.device.get(('subtree', cmd))
 
-        for data in output.data:
-            for native in data:
-                for interface in native:
-                    vlan_id = None
-                    interface_name = None
-                    ip_address = None
-                    ip_mask = None
-                    for vlan in interface:
-                        # Remove the namespace
-                        text = vlan.tag[vlan.tag.find('}')+1:]
-                        #ydk.models.ned_edison.ned.Native.Interface.Vlan.name
-                        #ydk.models.xe_recent_edison.Cisco_IOS_XE_native.Native.Interface.Vlan.name
-                        if text == 'name':
-                            vlan_id = vlan.text
-                            interface_name = 'Vlan' + str(vlan_id)
-                            continue
-                        if text == 'ip':
-                            for ip in vlan:
-                                text = ip.tag[ip.tag.find('}')+1:]
-                                #ydk.models.ned_edison.ned.Native.Interface.Vlan.ip.address
-                                #ydk.models.xe_recent_edison.Cisco_IOS_XE_native.Native.Interface.Vlan.ip.address
-                                if text == 'address':
-                                    for address in ip:
-                                        text = address.tag[address.tag.find('}')+1:]
-                                        #ydk.models.ned_edison.ned.Native.Interface.Vlan.ip.address.primary
-                                        #ydk.models.xe_recent_edison.Cisco_IOS_XE_native.Native.Interface.Vlan.ip.address.primary
-                                        if text == 'primary':
-                                            for primary in address:
-                                                # Remove the namespace
-                                                text = primary.tag[primary.tag.find('}')+1:]
-                                                #ydk.models.ned_edison.ned.Native.Interface.Vlan.ip.address.primary.address
-                                                #ydk.models.xe_recent_edison.Cisco_IOS_XE_native.Native.Interface.Vlan.ip.address.primary.address
-                                                if text == 'address':
-                                                    ip_address = primary.text
-                                                    continue
-                                                #ydk.models.ned_edison.ned.Native.Interface.Vlan.ip.address.primary.mask
-                                                #ydk.models.xe_recent_edison.Cisco_IOS_XE_native.Native.Interface.Vlan.ip.address.primary.mask
-                                                if text == 'mask':
-                                                    ip_mask = primary.text
-                                                    continue
-                    # Let's build it now
-                    if 'interface' not in ret:
-                        ret['interface'] = {}
-                    if interface_name is not None:
-                        ret['interface'][interface_name] = {}
-                        if vlan_id is not None:
-                            ret['interface'][interface_name]['vlan_id'] = {}
-                            ret['interface'][interface_name]['vlan_id'][vlan_id] = {}
-                            if ip_address is not None:
-                                ret['interface'][interface_name]['vlan_id'][vlan_id]['ip_address'] = ip_address
-                            else:
-                                ret['interface'][interface_name]['vlan_id'][vlan_id]['ip_address'] = 'unassigned'
+        #ydk.models.ned_edison.ned.Native.Interface.Vlan
+        #ydk.models.xe_recent_edison.Cisco_IOS_XE_native.Native.Interface.Vlan
+        vlans = self.decoder.decode(output.data)
+        ret['interface'] = {}
+        for vlan_id, vlan in vlans.items():
+            ret['interface']['Vlan' + vlan_id] = {
+                'vlan_id': {vlan_id: {
+                    'ip_address': vlan.get('ip_address', 'unassigned')}}}
 
         return ret
 
@@ -1673,7 +1807,46 @@ class ShowIpInterface(ShowIpInterfaceSchema):
     cli_command = ['show ip interface','show ip interface {interface}']
     exclude = ['unnumbered', 'address_determined_by', '(Tunnel.*)', 'joins', 'leaves']
 
-    def cli(self,interface="",output=None):
+    # Vlan211 is up, line protocol is up
+    # GigabitEthernet2 is administratively down, line protocol is down
+    p1 = re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
+                     ' +(?P<enabled>[\w\s]+),'
+                     ' +line +protocol +is +(?P<oper_status>\w+)$')
+
+    # Interface is unnumbered. Using address of Loopback11 (192.168.151.1)
+    p40 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
+                      '(?P<unnumbered_intf>[\w\/\-\.]+) +'
+                      '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
+
+    def records(self, lines):
+        """Return the (path, first, last) of the interfaces in the lines,
+           and the (path, needed path) of the unnumbered interfaces"""
+        records = []
+        depends = []
+        path = None
+        for i, line in enumerate(lines):
+            line = line.strip()
+
+            # Vlan211 is up, line protocol is up
+            m = self.p1.match(line)
+            if m:
+                if path:
+                    records.append((path, first, i))
+                path = (m.groupdict()['interface'],)
+                first = i
+                continue
+
+            # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
+            if path and line.startswith('Interface is unnumbered'):
+                m = self.p40.match(line)
+                if m:
+                    depends.append(
+                        (path, (m.groupdict()['unnumbered_intf'],)))
+        if path:
+            records.append((path, first, len(lines)))
+        return records, depends
+
+    def cli(self,interface="",output=None, filter=None):
         if output is None:
             if interface:
                 cmd = self.cli_command[1].format(interface=interface)
@@ -1683,6 +1856,15 @@ class ShowIpInterface(ShowIpInterfaceSchema):
         else:
             out = output
 
+        # Only parse the interfaces of the filter, and those they need,
+        # see genie.libs.parser.utils.record_filter
+        if filter is not None:
+            select = RecordFilter.build(filter,
+                                        normalize=Common.convert_intf_name)
+            lines = out.splitlines()
+            lines = select.select(lines, *self.records(lines))
+            return select.prune(self.cli(output='\n'.join(lines)), (None,))
+
         interface_dict = {}
         unnumbered_dict = {}
         for line in out.splitlines():
@@ -1690,10 +1872,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
 
             # Vlan211 is up, line protocol is up
             # GigabitEthernet2 is administratively down, line protocol is down
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                              ' +(?P<enabled>[\w\s]+),'
-                              ' +line +protocol +is +(?P<oper_status>\w+)$')
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled'].lower()
@@ -2207,10 +2386,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         ['redirect_exclude'] = True
 
             # Interface is unnumbered. Using address of Loopback11 (192.168.151.1)
-            p40 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                              '(?P<unnumbered_intf>[\w\/\-\.]+) +'
-                              '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
-            m = p40.match(line)
+            m = self.p40.match(line)
             if m:
                 unnumbered_dict[interface] = {}
                 unnumbered_intf = m.groupdict()['unnumbered_intf']
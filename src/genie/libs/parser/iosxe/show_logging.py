@@ -11,6 +11,10 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# Parser
+from genie.libs.parser.utils.syslog import log_entry, log_cursor, \
+    after_cursor
+
 
 # ==============================================
 # Schema for:
@@ -25,6 +29,22 @@ class ShowLoggingSchema(MetaParser):
 
     schema = {
         'logs': list,
+        Optional('entries'): {
+            Any(): {
+                Optional('sequence'): int,
+                Optional('timestamp'): str,
+                Optional('facility'): str,
+                Optional('severity'): int,
+                Optional('mnemonic'): str,
+                'message': str,
+                },
+            },
+        Optional('cursor'): {
+            Optional('sequence'): int,
+            Optional('timestamp'): str,
+            'hash': str,
+            Optional('occurrence'): int,
+            },
         }
 
 
@@ -42,7 +62,25 @@ class ShowLogging(ShowLoggingSchema):
     cli_command = ['show logging | include {include}',
                    'show logging',]
 
-    def cli(self, include='', output=None):
+    # 000123: *Jun  5 05:09:30.838 EST: %IP-4-DUPADDR: Duplicate address 172.16.1.216 on GigabitEthernet1
+    # Jun  5 05:11:04.626 EST: Rollback:Acquired Configuration lock.
+    # 1d02h: %LINK-3-UPDOWN: Interface GigabitEthernet1, changed state to up
+    p1 = re.compile(r'^(?:(?P<sequence>\d+): +)?'
+                    r'(?:[*.]?(?P<timestamp>[A-Z][a-z]{2} +\d+ +(?:\d{4} +)?'
+                    r'\d+:\d+:\d+(?:\.\d+)?(?: +[A-Z]{3,4})?|\d+:\d+:\d+'
+                    r'(?:\.\d+)?|\d+[ywdh]\w*): +)?'
+                    r'(?:%(?P<facility>[A-Z0-9_]+(?:-[A-Z0-9_]+)*)-'
+                    r'(?P<severity>[0-7])-(?P<mnemonic>[A-Z0-9_]+): *)?'
+                    r'(?P<message>.*)$')
+
+    def cli(self, include='', output=None, structured=False, cursor=None):
+        '''
+            Args:
+                structured (`bool`): also split the syslog entries into their
+                                     fields, under 'entries'
+                cursor (`dict`): 'cursor' of a previous parse, only the lines
+                                 logged after its entry are parsed
+        '''
 
         if output is None:
             # Build the command
@@ -55,17 +93,40 @@ class ShowLogging(ShowLoggingSchema):
         else:
             out = output
 
+        # Lines after the last entry of the previous parse
+        if cursor:
+            lines = out[after_cursor(out, cursor):]
+        else:
+            lines = out
+
         # Init vars
         parsed_dict = {}
         log_lines = []
+        index = 0
 
-        for line in out.splitlines():
+        for line in lines.splitlines():
             line = line.strip()
 
             # Add line to 'logs'
             if line:
                 log_lines.append(line)
                 parsed_dict['logs'] = log_lines
+
+                if structured:
+                    # Jun  5 05:09:30.838 EST: %IP-4-DUPADDR: Duplicate address 172.16.1.216 on GigabitEthernet1
+                    m = self.p1.match(line)
+                    entry = log_entry(m) if m else None
+                    if entry:
+                        index += 1
+                        parsed_dict.setdefault('entries', {})[index] = entry
                 continue
 
+        if structured or cursor is not None:
+            last = log_cursor(log_lines, self.p1, output=out) or cursor
+            if last:
+                parsed_dict['cursor'] = last
+            if cursor is not None:
+                # Nothing logged since the cursor is not an empty output
+                parsed_dict['logs'] = log_lines
+
         return parsed_dict
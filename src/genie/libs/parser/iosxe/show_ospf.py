@@ -40,6 +40,110 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.command_cache import CommandCache
+from genie.libs.parser.utils.record_filter import RecordFilter, ALL
+from genie.libs.parser.utils.parallel import RecordSplit
+
+
+# ===========================================================
+# Indexes of the auxiliary commands run by the OSPF parsers.
+# Each command is run once per parse (see CommandCache) and
+# every interface/neighbor is looked up in its index
+# ===========================================================
+def _ospf_instance_vrfs(out):
+    ''' 'show running-config | section router ospf': instance -> vrf '''
+    vrfs = {}
+    for line in out.splitlines():
+        line = line.rstrip()
+
+        # Skip the show command line so as to not match
+        if re.search('show', line):
+            continue
+
+        # router ospf 1
+        # router ospf 2 vrf VRF1
+        p = re.search('router +ospf +(?P<instance>(\S+))'
+                      '(?: +vrf +(?P<vrf>(\S+)))?', line)
+        if p:
+            vrfs.setdefault(str(p.groupdict()['instance']),
+                            str(p.groupdict()['vrf'] or 'default'))
+    return vrfs
+
+
+def _ospf_interface_sections(out):
+    ''' 'show ip ospf interface': interface -> lines of its section '''
+    sections = {}
+    lines = None
+    for line in out.splitlines():
+        # GigabitEthernet2 is up, line protocol is up
+        p = re.match('^(?P<interface>(\S+)) +is( +administratively)?'
+                     ' +\S+, +line +protocol', line.strip())
+        if p:
+            lines = sections.setdefault(str(p.groupdict()['interface']), [])
+        if lines is not None:
+            lines.append(line)
+    return sections
+
+
+def _ospf_virtual_links(out):
+    ''' 'show ip ospf virtual-links': interface -> router address '''
+    links = {}
+    for line in out.splitlines():
+        line = line.rstrip()
+        # Virtual Link OSPF_VL0 to router 10.100.5.5 is down
+        p = re.search('Virtual +Link +(?P<intf>(\S+)) +to +router'
+                     ' +(?P<address>(\S+)) +is +(up|down)'
+                     '(?:.*)?', line)
+        if p:
+            links.setdefault(str(p.groupdict()['intf']),
+                             str(p.groupdict()['address']))
+    return links
+
+
+def _ospf_virtual_link_areas(out):
+    ''' 'show running-config | i virtual-link': address -> transit area '''
+    areas = {}
+    for line in out.splitlines():
+        line = line.rstrip()
+        #  area 1 virtual-link 10.100.5.5
+        q = re.search('area +(?P<q_area>(\d+)) +virtual-link'
+                      ' +(?P<addr>(\S+))(?: +(.*))?', line)
+        if q:
+            areas.setdefault(str(q.groupdict()['addr']),
+                             str(IPAddress(str(q.groupdict()['q_area']))))
+    return areas
+
+
+def _ospf_sham_links(out):
+    ''' 'show ip ospf sham-links': interface -> remote address '''
+    links = {}
+    for line in out.splitlines():
+        line = line.rstrip()
+        # Sham Link OSPF_SL1 to address 10.151.22.22 is up
+        p = re.search('Sham +Link +(?P<intf>(\S+)) +to +address'
+                     ' +(?P<remote>(\S+)) +is +(up|down)', line)
+        if p:
+            links.setdefault(str(p.groupdict()['intf']),
+                             str(p.groupdict()['remote']))
+    return links
+
+
+def _ospf_sham_link_local_ids(out):
+    ''' 'show running-config | i sham-link': (area, remote) -> local id '''
+    local_ids = {}
+    for line in out.splitlines():
+        line = line.rstrip()
+        # area 1 sham-link 10.229.11.11 10.151.22.22 cost 111 ttl-security hops 3
+        q = re.search('area +(?P<q_area>(\d+)) +sham-link'
+                      ' +(?P<local_id>(\S+))'
+                      ' +(?P<remote_id>(\S+)) +(.*)', line)
+        if q:
+            q_area = str(IPAddress(str(q.groupdict()['q_area'])))
+            q_remote_id = str(q.groupdict()['remote_id'])
+            local_ids.setdefault((q_area, q_remote_id),
+                                 str(q.groupdict()['local_id']))
+    return local_ids
+
 
 # ===========================================================
 # Schema for:
@@ -1704,6 +1808,12 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
         'last_flood_scan_time_msec', 
         'max_flood_scan_length', 'max_flood_scan_time_msec', 'state']
 
+    auxiliary_commands = ['show ip ospf virtual-links',
+                          'show running-config | i virtual-link',
+                          'show ip ospf sham-links',
+                          'show running-config | i sham-link',
+                          'show running-config | section router ospf']
+
 
     def cli(self, interface=None, output=None):
         if output is None:
@@ -1720,6 +1830,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
         # Init vars
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
+        cache = CommandCache.from_device(self.device)
 
         # Mapping dict
         bool_dict = {'up': True, 'down': False, 'unknown': False}
@@ -1904,41 +2015,17 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                     intf_name = interface
                 elif intf_type == 'virtual_links':
                     # Init
-                    vl_addr = None
                     vl_transit_area_id = None
 
-                    # Execute command to get virtual-link address
-                    cmd = 'show ip ospf virtual-links | i {intf}'.format(intf=interface)
-                    out = self.device.execute(cmd)
-
-                    for line in out.splitlines():
-                        line = line.rstrip()
-                        # Virtual Link OSPF_VL0 to router 10.100.5.5 is down
-                        p = re.search('Virtual +Link +(?P<intf>(\S+)) +to +router'
-                                     ' +(?P<address>(\S+)) +is +(up|down)'
-                                     '(?:.*)?', line)
-                        if p:
-                            if interface == str(p.groupdict()['intf']):
-                                vl_addr = str(p.groupdict()['address'])
-                                break
-
-                    # Execute command to get virtual-link transit_area_id
+                    # Get virtual-link address
+                    vl_addr = cache.index('show ip ospf virtual-links',
+                                          _ospf_virtual_links).get(interface)
+
+                    # Get virtual-link transit_area_id
                     if vl_addr is not None:
-                        cmd = 'show running-config | i virtual-link | i {addr}'.format(addr=vl_addr)
-                        out = self.device.execute(cmd)
-
-                        for line in out.splitlines():
-                            line = line.rstrip()
-                            #  area 1 virtual-link 10.100.5.5
-                            q = re.search('area +(?P<q_area>(\d+)) +virtual-link'
-                                          ' +(?P<addr>(\S+))(?: +(.*))?', line)
-                            if q:
-                                q_addr = str(q.groupdict()['addr'])
-
-                                # Check parameters match
-                                if q_addr == vl_addr:
-                                    vl_transit_area_id = str(IPAddress(str(q.groupdict()['q_area'])))
-                                    break
+                        vl_transit_area_id = cache.index(
+                            'show running-config | i virtual-link',
+                            _ospf_virtual_link_areas).get(vl_addr)
 
                     if vl_transit_area_id is not None:
                         intf_name = '{} {}'.format(vl_transit_area_id, router_id)
@@ -1946,70 +2033,26 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 elif intf_type == 'sham_links':
                     # Init
                     sl_local_id = None
-                    sl_remote_id = None
-
-                    # Execute command to get sham-link remote_id
-                    cmd = 'show ip ospf sham-links | i {intf}'.format(intf=interface)
-                    out = self.device.execute(cmd)
-
-                    for line in out.splitlines():
-                        line = line.rstrip()
-                        # Sham Link OSPF_SL1 to address 10.151.22.22 is up
-                        p = re.search('Sham +Link +(?P<intf>(\S+)) +to +address'
-                                     ' +(?P<remote>(\S+)) +is +(up|down)', line)
-                        if p:
-                            if interface == str(p.groupdict()['intf']):
-                                sl_remote_id = str(p.groupdict()['remote'])
-                                break
-
-                    # Execute command to get sham-link local_id
+
+                    # Get sham-link remote_id
+                    sl_remote_id = cache.index('show ip ospf sham-links',
+                                               _ospf_sham_links).get(interface)
+
+                    # Get sham-link local_id
                     if sl_remote_id is not None:
-                        cmd = 'show running-config | i sham-link | i {remote}'.format(remote=sl_remote_id)
-                        out = self.device.execute(cmd)
-
-                        for line in out.splitlines():
-                            line = line.rstrip()
-                            # area 1 sham-link 10.229.11.11 10.151.22.22 cost 111 ttl-security hops 3
-                            q = re.search('area +(?P<q_area>(\d+)) +sham-link'
-                                          ' +(?P<local_id>(\S+))'
-                                          ' +(?P<remote_id>(\S+)) +(.*)', line)
-                            if q:
-                                q_area = str(IPAddress(str(q.groupdict()['q_area'])))
-                                q_remote_id = str(q.groupdict()['remote_id'])
-
-                                # Check parameters match
-                                if q_area == area and q_remote_id == sl_remote_id:
-                                    sl_local_id = str(q.groupdict()['local_id'])
-                                    break
+                        sl_local_id = cache.index(
+                            'show running-config | i sham-link',
+                            _ospf_sham_link_local_ids).get((area, sl_remote_id))
 
                     # Set intf_name based on parsed values
                     if sl_local_id is not None:
                         intf_name = '{} {}'.format(sl_local_id, sl_remote_id)
 
                 # Get VRF information based on OSPF instance
-                cmd = 'show running-config | section router ospf {}'.format(instance)
-                out = self.device.execute(cmd)
-
-                for line in out.splitlines():
-                    line = line.rstrip()
-
-                    # Skip the show command line so as to not match
-                    if re.search('show', line):
-                        continue
-
-                    # router ospf 1
-                    # router ospf 2 vrf VRF1
-                    p = re.search('router +ospf +(?P<instance>(\S+))'
-                                  '(?: +vrf +(?P<vrf>(\S+)))?', line)
-                    if p:
-                        p_instance = str(p.groupdict()['instance'])
-                        if p_instance == instance:
-                            if p.groupdict()['vrf']:
-                                vrf = str(p.groupdict()['vrf'])
-                                break
-                            else:
-                                vrf = 'default'
-                                break
+                vrfs = cache.index('show running-config | section router ospf',
+                                   _ospf_instance_vrfs)
+                if instance in vrfs:
+                    vrf = vrfs[instance]
 
                 # Build dictionary
                 if 'vrf' not in ret_dict:
@@ -2411,6 +2454,9 @@ class ShowIpOspfLinksParser(MetaParser):
         * 'show ip ospf sham-links'
     '''
 
+    auxiliary_commands = ['show ip ospf interface',
+                          'show running-config | section router ospf']
+
     def cli(self, cmd, link_type,output=None):
 
         assert link_type in ['virtual_links', 'sham_links']
@@ -2423,6 +2469,7 @@ class ShowIpOspfLinksParser(MetaParser):
         # Init vars
         ret_dict = {}
         af = 'ipv4'
+        cache = CommandCache.from_device(self.device)
 
         # crypo_algorithm dict
         crypto_dict = {'cryptographic': 'md5', 'simple password': 'simple'}
@@ -2500,10 +2547,10 @@ class ShowIpOspfLinksParser(MetaParser):
                     real_link_name = interface
                 
                 # Get OSPF process ID from 'show ip ospf interface'
-                cmd = 'show ip ospf interface | section {}'.format(interface)
-                out = self.device.execute(cmd)
+                sections = cache.index('show ip ospf interface',
+                                       _ospf_interface_sections)
 
-                for line in out.splitlines():
+                for line in sections.get(interface, []):
                     line = line.rstrip()
 
                     # Process ID 2, Router ID 10.229.11.11, Network Type SHAM_LINK, Cost: 111
@@ -2515,29 +2562,11 @@ class ShowIpOspfLinksParser(MetaParser):
 
                 # Get VRF information using the ospf instance
                 if instance is not None:
-                    cmd = 'show running-config | section router ospf {}'.format(instance)
-                    out = self.device.execute(cmd)
-
-                    for line in out.splitlines():
-                        line = line.rstrip()
-
-                        # Skip the show command line so as to not match
-                        if re.search('show', line):
-                            continue
-
-                        # router ospf 1
-                        # router ospf 2 vrf VRF1
-                        p = re.search('router +ospf +(?P<instance>(\S+))'
-                                      '(?: +vrf +(?P<vrf>(\S+)))?', line)
-                        if p:
-                            p_instance = str(p.groupdict()['instance'])
-                            if p_instance == instance:
-                                if p.groupdict()['vrf']:
-                                    vrf = str(p.groupdict()['vrf'])
-                                    break
-                                else:
-                                    vrf = 'default'
-                                    break
+                    vrfs = cache.index(
+                        'show running-config | section router ospf',
+                        _ospf_instance_vrfs)
+                    if instance in vrfs:
+                        vrf = vrfs[instance]
 
                 # Build dict
                 if 'vrf' not in ret_dict:
@@ -3124,6 +3153,13 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
         'last_retrans_max_scan_time_msec', 'total_retransmission',
         'uptime', 'last_retrans_scan_length', 'last_retrans_scan_time_msec']
 
+    auxiliary_commands = ['show ip ospf interface',
+                          'show running-config | section router ospf',
+                          'show ip ospf virtual-links',
+                          'show running-config | i virtual-link',
+                          'show ip ospf sham-links',
+                          'show running-config | i sham-link']
+
 
     def cli(self, output=None):
 
@@ -3136,6 +3172,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
         # Init vars
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
+        cache = CommandCache.from_device(self.device)
 
         p1 = re.compile(r'^Neighbor +(?P<neighbor>(\S+)), +interface'
                             ' +address +(?P<address>(\S+))'
@@ -3200,10 +3237,10 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 router_id = None
 
                 # Get OSPF process ID from 'show ip ospf interface'
-                cmd = 'show ip ospf interface | section {}'.format(interface)
-                out = self.device.execute(cmd)
+                sections = cache.index('show ip ospf interface',
+                                       _ospf_interface_sections)
 
-                for line in out.splitlines():
+                for line in sections.get(interface, []):
                     line = line.rstrip()
 
                     # Process ID 2, Router ID 10.229.11.11, Network Type SHAM_LINK, Cost: 111
@@ -3216,29 +3253,11 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
 
                 # Get VRF information using the ospf instance
                 if instance is not None:
-                    cmd = 'show running-config | section router ospf {}'.format(instance)
-                    out = self.device.execute(cmd)
-
-                    for line in out.splitlines():
-                        line = line.rstrip()
-
-                        # Skip the show command line so as to not match
-                        if re.search('show', line):
-                            continue
-
-                        # router ospf 1
-                        # router ospf 2 vrf VRF1
-                        p = re.search('router +ospf +(?P<instance>(\S+))'
-                                      '(?: +vrf +(?P<vrf>(\S+)))?', line)
-                        if p:
-                            p_instance = str(p.groupdict()['instance'])
-                            if p_instance == instance:
-                                if p.groupdict()['vrf']:
-                                    vrf = str(p.groupdict()['vrf'])
-                                    break
-                                else:
-                                    vrf = 'default'
-                                    break
+                    vrfs = cache.index(
+                        'show running-config | section router ospf',
+                        _ospf_instance_vrfs)
+                    if instance in vrfs:
+                        vrf = vrfs[instance]
 
                 # Build dict
                 if 'vrf' not in ret_dict:
@@ -3260,40 +3279,17 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 if re.search('VL', interface):
                     # Init
                     intf_type = 'virtual_links'
-                    vl_addr = None
                     vl_transit_area_id = None
 
-                    # Execute command to get virtual-link address
-                    cmd = 'show ip ospf virtual-links | i {intf}'.format(intf=interface)
-                    out = self.device.execute(cmd)
-
-                    for line in out.splitlines():
-                        line = line.rstrip()
-                        # Virtual Link OSPF_VL0 to router 10.100.5.5 is down
-                        p = re.search('Virtual +Link +(?P<intf>(\S+)) +to +router'
-                                     ' +(?P<address>(\S+)) +is +(up|down)'
-                                     '(?:.*)?', line)
-                        if p:
-                            if interface == str(p.groupdict()['intf']):
-                                vl_addr = str(p.groupdict()['address'])
-                                break
-
-                    # Execute command to get virtual-link transit_area_id
+                    # Get virtual-link address
+                    vl_addr = cache.index('show ip ospf virtual-links',
+                                          _ospf_virtual_links).get(interface)
+
+                    # Get virtual-link transit_area_id
                     if vl_addr is not None and router_id is not None:
-                        cmd = 'show running-config | i virtual-link | i {addr}'.format(addr=vl_addr)
-                        out = self.device.execute(cmd)
-
-                        for line in out.splitlines():
-                            line = line.rstrip()
-                            #  area 1 virtual-link 10.100.5.5
-                            q = re.search('area +(?P<q_area>(\d+)) +virtual-link'
-                                          ' +(?P<addr>(\S+))(?: +(.*))?', line)
-                            if q:
-                                q_addr = str(q.groupdict()['addr'])
-                                # Check parameters match
-                                if q_addr == vl_addr:
-                                    vl_transit_area_id = str(IPAddress(str(q.groupdict()['q_area'])))
-                                    break
+                        vl_transit_area_id = cache.index(
+                            'show running-config | i virtual-link',
+                            _ospf_virtual_link_areas).get(vl_addr)
 
                     if vl_transit_area_id is not None:
                         intf_name = '{} {}'.format(vl_transit_area_id, router_id)
@@ -3302,41 +3298,16 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                     # Init
                     intf_type = 'sham_links'
                     sl_local_id = None
-                    sl_remote_id = None
-
-                    # Execute command to get sham-link remote_id
-                    cmd = 'show ip ospf sham-links | i {intf}'.format(intf=interface)
-                    out = self.device.execute(cmd)
-
-                    for line in out.splitlines():
-                        line = line.rstrip()
-                        # Sham Link OSPF_SL1 to address 10.151.22.22 is up
-                        p = re.search('Sham +Link +(?P<intf>(\S+)) +to +address'
-                                     ' +(?P<remote>(\S+)) +is +(up|down)', line)
-                        if p:
-                            if interface == str(p.groupdict()['intf']):
-                                sl_remote_id = str(p.groupdict()['remote'])
-                                break
-
-                    # Execute command to get sham-link local_id
+
+                    # Get sham-link remote_id
+                    sl_remote_id = cache.index('show ip ospf sham-links',
+                                               _ospf_sham_links).get(interface)
+
+                    # Get sham-link local_id
                     if sl_remote_id is not None:
-                        cmd = 'show running-config | i sham-link | i {remote}'.format(remote=sl_remote_id)
-                        out = self.device.execute(cmd)
-
-                        for line in out.splitlines():
-                            line = line.rstrip()
-                            # area 1 sham-link 10.229.11.11 10.151.22.22 cost 111 ttl-security hops 3
-                            q = re.search('area +(?P<q_area>(\d+)) +sham-link'
-                                          ' +(?P<local_id>(\S+))'
-                                          ' +(?P<remote_id>(\S+)) +(.*)', line)
-                            if q:
-                                q_area = str(IPAddress(str(q.groupdict()['q_area'])))
-                                q_remote_id = str(q.groupdict()['remote_id'])
-
-                                # Check parameters match
-                                if q_area == area and q_remote_id == sl_remote_id:
-                                    sl_local_id = str(q.groupdict()['local_id'])
-                                    break
+                        sl_local_id = cache.index(
+                            'show running-config | i sham-link',
+                            _ospf_sham_link_local_ids).get((area, sl_remote_id))
 
                     # Set intf_name based on parsed values
                     if sl_local_id is not None:
@@ -3714,11 +3685,127 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
         * 'show ip ospf database opaque-area self-originate''
     '''
 
-    def cli(self, db_type, out=None):
+    # OSPF Router with ID (10.36.3.3) (Process ID 1)
+    # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
+    p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                        ' +\(Process +ID +(?P<instance>(\d+))'
+                        '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+
+    # Router Link States (Area 0)
+    # Type-5 AS External Link States
+    p2 = re.compile(r'^(?P<lsa_type_name>(.*)) +Link +States'
+                        '(?: +\(Area +(?P<area>(\S+))\))?$')
+
+    # Routing Bit Set on this LSA
+    p3_1 = re.compile(r'^Routing +Bit +Set +on +this +LSA$')
+
+    # LS age: 1565
+    p3_2 = re.compile(r'^LS +age: +(?P<age>(\d+))$')
+
+    # LS age: MAXAGE(3601)
+    p3_2_1 = re.compile(r'^LS +age: +\w+\((?P<age>(\d+))\)$')
+
+    # Link State ID: 10.4.1.1
+    # Link State ID: 10.94.44.44 (Network address)
+    p5_2 = re.compile(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
+                        '(?: +\(.*\))?$')
+
+    # Advertising Router: 10.64.4.4
+    p6 = re.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
+
+    # Records of parse_parallel, see genie.libs.parser.utils.parallel. The
+    # router and area carry over to the next lsas, the state of the TLVs
+    # carries over from an lsa to the next
+    record_split = RecordSplit(header=(p3_1, p3_2, p3_2_1), context=(p1, p2),
+                               serial='TLV Type:')
+
+    # Levels of the lsas in the parsed output
+    lsa_levels = ('vrf', ALL, 'address_family', ALL, 'instance', ALL,
+                  'areas', ALL, 'database', 'lsa_types', ALL, 'lsas', None)
+
+    @classmethod
+    def prune(cls, select, parsed):
+        """Remove the lsas not wanted by the RecordFilter select, and the
+           lsa types left without lsas"""
+        select.prune(parsed, cls.lsa_levels)
+        for vrf in parsed.get('vrf', {}).values():
+            for af in vrf.get('address_family', {}).values():
+                for instance in af.get('instance', {}).values():
+                    for area in instance.get('areas', {}).values():
+                        lsa_types = area.get('database', {}).get('lsa_types', {})
+                        for lsa_type in list(lsa_types):
+                            if 'lsas' not in lsa_types[lsa_type]:
+                                del lsa_types[lsa_type]
+        # Empty dicts on the way
+        return select.prune(parsed, cls.lsa_levels)
+
+    def records(self, lines):
+        """Return the (path, first, last) of the lsas in the lines. An lsa
+           starts at its 'Routing Bit Set' or 'LS age' line and ends at the
+           next lsa, router or lsa type line"""
+        records = []
+        first = path = lsa_id = None
+        aged = False
+        for i, line in enumerate(lines):
+            line = line.strip()
+
+            # OSPF Router with ID (10.36.3.3) (Process ID 1)
+            # Router Link States (Area 0)
+            if self.p1.match(line) or self.p2.match(line):
+                start = None
+
+            # Routing Bit Set on this LSA
+            elif self.p3_1.match(line):
+                start = i
+
+            # LS age: 1565
+            elif self.p3_2.match(line) or self.p3_2_1.match(line):
+                if first is not None and not aged:
+                    # After the Routing Bit Set line of the lsa
+                    aged = True
+                    continue
+                start = i
+
+            else:
+                if first is None:
+                    continue
+                # Link State ID: 10.4.1.1
+                m = self.p5_2.match(line)
+                if m:
+                    lsa_id = m.groupdict()['lsa_id']
+                    continue
+                # Advertising Router: 10.64.4.4
+                m = self.p6.match(line)
+                if m and lsa_id is not None:
+                    path = ('{} {}'.format(lsa_id,
+                                           m.groupdict()['adv_router']),)
+                continue
+
+            if path:
+                records.append((path, first, i))
+            first, path, lsa_id = start, None, None
+            aged = start is not None and not line.startswith('Routing')
+        if path:
+            records.append((path, first, len(lines)))
+        return records
+
+    def cli(self, db_type, out=None, filter=None):
 
         assert db_type in ['external', 'network', 'summary', 'router',
                            'opaque']
 
+        # Only parse the lsas of the filter, ex: '10.4.1.1 10.64.4.4' or
+        # '* 10.64.4.4', see genie.libs.parser.utils.record_filter
+        if filter is not None:
+            select = RecordFilter.build(filter)
+            # The state of the TLVs carries over from an lsa to the next,
+            # those outputs are parsed whole then pruned
+            if 'TLV Type:' not in out:
+                lines = out.splitlines()
+                out = '\n'.join(select.select(lines, self.records(lines)))
+            return self.prune(select, ShowIpOspfDatabaseTypeParser.cli(
+                self, db_type=db_type, out=out))
+
         # Init vars
         ret_dict = {}
         af = 'ipv4'
@@ -3740,28 +3827,24 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
             'opaque': 10,
             }
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            ' +\(Process +ID +(?P<instance>(\d+))'
-                            '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p1 = self.p1
        
-        p2 = re.compile(r'^(?P<lsa_type_name>(.*)) +Link +States'
-                            '(?: +\(Area +(?P<area>(\S+))\))?$')
+        p2 = self.p2
        
-        p3_1 = re.compile(r'^Routing +Bit +Set +on +this +LSA$')
+        p3_1 = self.p3_1
        
-        p3_2 = re.compile(r'^LS +age: +(?P<age>(\d+))$')
+        p3_2 = self.p3_2
        
-        p3_2_1 = re.compile(r'^LS +age: +\w+\((?P<age>(\d+))\)$')
+        p3_2_1 = self.p3_2_1
        
         p4 = re.compile(r'^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?'
                         '(?: *\((?P<option_desc>(.*))\))?$')
        
         p5_1 = re.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
        
-        p5_2 = re.compile(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
-                            '(?: +\(.*\))?$')
+        p5_2 = self.p5_2
        
-        p6 = re.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
+        p6 = self.p6
        
         p7 = re.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
        
@@ -4989,11 +5072,11 @@ class ShowIpOspfDatabaseRouter(ShowIpOspfDatabaseRouterSchema, ShowIpOspfDatabas
     exclude = ['age', 'seq_num', 'checksum', 'links']
 
 
-    def cli(self, output=None):
+    def cli(self, output=None, filter=None):
         if not output:
             output = self.device.execute(self.cli_command)
 
-        return super().cli(db_type='router', out=output)
+        return super().cli(db_type='router', out=output, filter=filter)
 
 
 # ====================================
@@ -5078,11 +5161,11 @@ class ShowIpOspfDatabaseExternal(ShowIpOspfDatabaseExternalSchema, ShowIpOspfDat
 
     cli_command = 'show ip ospf database external'
 
-    def cli(self, output=None):
+    def cli(self, output=None, filter=None):
         if not output:
             output = self.device.execute(self.cli_command)
 
-        return super().cli(db_type='external', out=output)
+        return super().cli(db_type='external', out=output, filter=filter)
 
 
 # ===================================
@@ -5163,11 +5246,11 @@ class ShowIpOspfDatabaseNetwork(ShowIpOspfDatabaseNetworkSchema, ShowIpOspfDatab
     cli_command = 'show ip ospf database network'
     exclude = ['age', 'seq_num', 'checksum', 'lsas']
 
-    def cli(self, output=None):
+    def cli(self, output=None, filter=None):
         if not output:
             output = self.device.execute(self.cli_command)
 
-        return super().cli(db_type='network', out=output)
+        return super().cli(db_type='network', out=output, filter=filter)
 
 
 # ===================================
@@ -5251,11 +5334,11 @@ class ShowIpOspfDatabaseSummary(ShowIpOspfDatabaseSummarySchema, ShowIpOspfDatab
     exclude = ['age', 'seq_num', 'checksum']
 
 
-    def cli(self, output=None):
+    def cli(self, output=None, filter=None):
         if not output:
             output = self.device.execute(self.cli_command)
 
-        return super().cli(db_type='summary', out=output)
+        return super().cli(db_type='summary', out=output, filter=filter)
 
 
 # =======================================
@@ -5492,11 +5575,11 @@ class ShowIpOspfDatabaseOpaqueArea(ShowIpOspfDatabaseOpaqueAreaSchema, ShowIpOsp
 
     cli_command = 'show ip ospf database opaque-area'
 
-    def cli(self, output=None):
+    def cli(self, output=None, filter=None):
         if not output:
             output = self.device.execute(self.cli_command)
 
-        return super().cli(db_type='opaque', out=output)
+        return super().cli(db_type='opaque', out=output, filter=filter)
 
 
 # =====================================
@@ -5817,6 +5900,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
     '''
 
     cli_command = 'show ip ospf mpls traffic-eng link'
+    auxiliary_commands = ['show running-config | section router ospf']
 
     def cli(self, output=None):
 
@@ -5829,6 +5913,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
         # Init vars
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
+        cache = CommandCache.from_device(self.device)
 
         p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
                             ' +\(Process +ID +(?P<instance>(\S+))\)$')
@@ -5878,29 +5963,10 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
                 instance = str(m.groupdict()['instance'])
 
                 # Get VRF information using the ospf instance
-                cmd = 'show running-config | section router ospf {}'.format(instance)
-                out = self.device.execute(cmd)
-
-                for line in out.splitlines():
-                    line = line.rstrip()
-
-                    # Skip the show command line so as to not match
-                    if re.search('show', line):
-                        continue
-
-                    # router ospf 1
-                    # router ospf 2 vrf VRF1
-                    p = re.search('router +ospf +(?P<instance>(\S+))'
-                                  '(?: +vrf +(?P<vrf>(\S+)))?', line)
-                    if p:
-                        p_instance = str(p.groupdict()['instance'])
-                        if p_instance == instance:
-                            if p.groupdict()['vrf']:
-                                vrf = str(p.groupdict()['vrf'])
-                                break
-                            else:
-                                vrf = 'default'
-                                break
+                vrfs = cache.index('show running-config | section router ospf',
+                                   _ospf_instance_vrfs)
+                if instance in vrfs:
+                    vrf = vrfs[instance]
 
                 # Create dict
                 if 'vrf' not in ret_dict:
@@ -7092,11 +7158,11 @@ class ShowIpOspfDatabaseRouterSelfOriginate(ShowIpOspfDatabaseRouterSchema, Show
     cli_command = 'show ip ospf database router self-originate'
     exclude = ['age' , 'checksum', 'seq_num', 'dead_time']
 
-    def cli(self, output=None):
+    def cli(self, output=None, filter=None):
         if not output:
             output = self.device.execute(self.cli_command)
 
-        return super().cli(db_type='router', out=output)
+        return super().cli(db_type='router', out=output, filter=filter)
 
 
 class ShowIpOspfSegmentRoutingSchema(MetaParser):
@@ -8010,14 +8076,14 @@ class ShowIpOspfDatabaseOpaqueAreaSelfOriginate(ShowIpOspfDatabaseOpaqueAreaSche
     cli_command = ['show ip ospf database opaque-area {lsa_id} self-originate', 
                    'show ip ospf database opaque-area self-originate']
 
-    def cli(self, lsa_id=None, output=None):
+    def cli(self, lsa_id=None, output=None, filter=None):
         if output is None:
             if lsa_id:
                 output = self.device.execute(self.cli_command[0].format(lsa_id=lsa_id))
             else:
                 output = self.device.execute(self.cli_command[1])
 
-        return super().cli(db_type='opaque', out=output)
+        return super().cli(db_type='opaque', out=output, filter=filter)
 
 class ShowIpOspfDatabaseOpaqueAreaAdvRouter(ShowIpOspfDatabaseOpaqueAreaSchema, ShowIpOspfDatabaseTypeParser):
     ''' Parser for:
@@ -8026,8 +8092,8 @@ class ShowIpOspfDatabaseOpaqueAreaAdvRouter(ShowIpOspfDatabaseOpaqueAreaSchema,
 
     cli_command = 'show ip ospf database opaque-area adv-router {address}'
 
-    def cli(self, address, output=None):
+    def cli(self, address, output=None, filter=None):
         if not output:
             output = self.device.execute(self.cli_command.format(address=address))
 
-        return super().cli(db_type='opaque', out=output)
\ No newline at end of file
+        return super().cli(db_type='opaque', out=output, filter=filter)
\ No newline at end of file
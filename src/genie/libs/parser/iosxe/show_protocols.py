@@ -13,6 +13,7 @@ from netaddr import IPAddress
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.command_cache import CommandCache
 
 
 # ==============================
@@ -262,6 +263,7 @@ class ShowIpProtocols(ShowIpProtocolsSchema):
 
     cli_command = ['show ip protocols','show ip protocols vrf {vrf}']
     exclude = ['last_update', ' network' , 'next_update']
+    auxiliary_commands = ['show running-config | section router ospf']
 
     def cli(self, vrf="" ,cmd="",output=None):
 
@@ -279,6 +281,7 @@ class ShowIpProtocols(ShowIpProtocolsSchema):
 
         # Init vars
         ret_dict = {}
+        cache = CommandCache.from_device(self.device)
 
         if not vrf:
             vrf = "default"
@@ -508,11 +511,14 @@ class ShowIpProtocols(ShowIpProtocolsSchema):
 
                 if protocol == 'ospf':
                     # Get VRF information based on OSPF instance
-                    out = self.device.execute("show running-config | section "
-                                              "router ospf {}".format(instance))
+                    out = cache.execute("show running-config | section "
+                                        "router ospf")
                     # Parse for VRF
                     for line in out.splitlines():
                         line = line.strip()
+                        # Skip the show command line so as to not match
+                        if re.search('show', line):
+                            continue
                         # router ospf 1
                         # router ospf 2 vrf VRF1
                         p = re.search('router +ospf +(?P<instance>(\S+))'
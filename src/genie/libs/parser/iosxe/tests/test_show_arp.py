@@ -204,6 +204,13 @@ class test_show_arp(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output,self.golden_parsed_output_2)
 
+    def test_golden_columns(self):
+        self.device = Mock(**self.golden_output)
+        obj = ShowArp(device=self.device)
+        table = obj.cli_columns()
+        self.assertEqual(table.columns, ShowArp.columns)
+        self.assertEqual(obj.to_dict(table), self.golden_parsed_output)
+
 #=========================================================
 # Unit test for show ip arp
 #=========================================================
@@ -46,6 +46,8 @@ from genie.libs.parser.iosxe.show_bgp import ShowBgpAll,\
                                              ShowIpBgpTemplatePeerPolicy,\
                                              ShowIpBgpAllDampeningParameters
 
+from genie.libs.parser.utils.stream import fold_records
+
 
 # ===================================
 # Unit test for:
@@ -885,6 +887,22 @@ class test_show_bgp_all(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output3)
 
+    def test_show_bgp_all_iter_routes(self):
+        self.maxDiff = None
+        obj = ShowBgpAll(device=Mock())
+        lines = iter(self.golden_output1['execute.return_value'].splitlines())
+        records = obj.iter_routes(lines)
+
+        # Records are yielded while the lines are read
+        keys, values = next(records)
+        self.assertEqual(keys[:4], ('vrf', 'evpn1', 'address_family',
+                                    'vpnv4 unicast RD 65535:1'))
+        self.assertIsNotNone(next(lines, None))
+
+        records = list(obj.iter_routes(
+            self.golden_output1['execute.return_value'].splitlines()))
+        self.assertEqual(fold_records(records), self.golden_parsed_output1)
+
 
 # =======================================
 # Unit test for:
@@ -12457,6 +12475,20 @@ class test_show_bgp_all_neighbors(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output4)
 
+    def test_show_bgp_all_neighbors_filter(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output1)
+        obj = ShowBgpAllNeighbors(device=self.device)
+        parsed_output = obj.parse(filter=[('VRF1', '*'), '10.16.2.2'])
+        vrfs = self.golden_parsed_output1['vrf']
+        self.assertEqual(parsed_output, {
+            'list_of_neighbors': ['10.16.2.2', '10.4.6.6', '2001:DB8:4:6::6'],
+            'vrf': {
+                'VRF1': vrfs['VRF1'],
+                'default': {'neighbor': {
+                    '10.16.2.2': vrfs['default']['neighbor']['10.16.2.2']}},
+            }})
+
 
 
 # =================================================================
@@ -20745,6 +20777,16 @@ class test_show_bgp_all_cluster_ids(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output_2)
 
+    def test_golden_output(self):
+        vrf_output, output = self.golden_output_2['execute.return_value'].\
+            split('R4_iosv#show bgp all cluster-ids')
+        self.device = Mock(execute=Mock(return_value=vrf_output))
+        obj = ShowBgpAllClusterIds(device=self.device)
+        parsed_output = obj.parse(output=output)
+        self.assertEqual(parsed_output, self.golden_parsed_output_2)
+        self.device.execute.assert_called_once_with(
+            r'show vrf detail | inc \(VRF')
+
 
 #-------------------------------------------------------------------------------
 
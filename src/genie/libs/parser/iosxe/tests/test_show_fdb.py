@@ -180,6 +180,14 @@ class test_show_mac_address_table(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output,self.golden_parsed_output)
 
+    def test_golden_columns(self):
+        self.maxDiff = None
+        self.dev_c3850 = Mock(**self.golden_output)
+        obj = ShowMacAddressTable(device=self.dev_c3850)
+        table = obj.cli_columns()
+        self.assertEqual(len(table['mac']), len(table))
+        self.assertEqual(obj.to_dict(table), self.golden_parsed_output)
+
 
 class test_show_mac_address_table_2(unittest.TestCase):
     dev1 = Device(name='empty')
@@ -14933,6 +14933,31 @@ Tunnel10 is up, line protocol is up
         self.maxDiff = None
         self.assertEqual(parsed_output,self.golden_parsed_output)
 
+    def test_golden_filter(self):
+        self.device = Mock(**self.golden_output)
+        interface_obj = ShowInterfaces(device=self.device)
+        # Members and unnumbered interfaces need the interfaces they refer
+        # to, which are parsed then pruned
+        parsed_output = interface_obj.parse(
+            filter=['Gi1/0/2', 'GigabitEthernet3', 'Vlan*'])
+        self.maxDiff = None
+        self.assertEqual(parsed_output, {
+            intf: self.golden_parsed_output[intf] for intf in
+            ['GigabitEthernet1/0/2', 'GigabitEthernet3', 'Vlan100']})
+
+    def test_golden_counters(self):
+        self.device = Mock(**self.golden_output)
+        interface_obj = ShowInterfaces(device=self.device)
+        sample = interface_obj.cli_counters()
+        # The counters of the whole parser
+        self.maxDiff = None
+        self.assertEqual(
+            {intf: sample.to_dict(intf) for intf in sample},
+            {intf: {key: value for key, value in intf_dict['counters'].items()
+                   if not isinstance(value, bool)}
+             for intf, intf_dict in self.golden_parsed_output.items()
+             if intf_dict.get('counters')})
+
     def test_show_interfaces(self):
         self.device = Mock(**self.golden_interface_output)
         interface_obj = ShowInterfaces(device=self.device)
@@ -15648,6 +15673,42 @@ GigabitEthernet1 is administratively down, line protocol is down
         self.maxDiff = None
         self.assertEqual(parsed_output, self.golden_parsed_interface_output)
 
+    def test_golden_filter(self):
+        self.device = Mock(**self.golden_output)
+        interface_obj = ShowIpInterface(device=self.device)
+        parsed_output = interface_obj.parse(filter=['Gi0/0', 'Vlan*'])
+        self.maxDiff = None
+        self.assertEqual(parsed_output, {
+            intf: self.golden_parsed_output[intf] for intf in
+            ['GigabitEthernet0/0', 'Vlan211']})
+
+    def test_filter_unnumbered(self):
+        # The unnumbered interface needs the interface it uses the address
+        # of, which is parsed then pruned
+        output = dedent('''\
+            Loopback0 is up, line protocol is up
+              Internet address is 10.4.1.1/32
+              Broadcast address is 255.255.255.255
+            GigabitEthernet1 is up, line protocol is up
+              Internet address is 10.1.1.1/24
+              Broadcast address is 255.255.255.255
+            Tunnel1 is up, line protocol is up
+              Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
+              Broadcast address is 255.255.255.255
+            ''')
+        interface_obj = ShowIpInterface(device=Mock())
+        parsed_output = interface_obj.parse(output=output, filter=['Tunnel1'])
+        self.assertEqual(parsed_output, {
+            'Tunnel1': {
+                'enabled': True,
+                'oper_status': 'up',
+                'ipv4': {
+                    '10.4.1.1/32': {
+                        'ip': '10.4.1.1',
+                        'prefix_length': '32',
+                        'secondary': False,
+                        'broadcase_address': '255.255.255.255'}}}})
+
 
 #############################################################################
 # unitest For show ipv6 interface
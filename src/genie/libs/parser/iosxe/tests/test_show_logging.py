@@ -113,6 +113,104 @@ class test_show_logging(unittest.TestCase):
         parsed_output = obj.parse(include='Rollback')
         self.assertEqual(parsed_output, self.golden_parsed_output_2)
 
+    golden_parsed_output_3 = {
+        "logs": [
+            "000045: *Jun  5 05:10:59.519 EST: %SYS-5-CONFIG_I: Configured from console by cisco on console",
+            "000046: *Jun  5 05:11:04.626 EST: Rollback:Acquired Configuration lock.",
+            "000047: 1d02h: %LINEPROTO-5-UPDOWN: Line protocol on Interface GigabitEthernet1, changed state to up",
+            "-Traceback= 1#0a1b2c3d4e5f",
+        ],
+        "entries": {
+            1: {
+                "sequence": 45,
+                "timestamp": "Jun  5 05:10:59.519 EST",
+                "facility": "SYS",
+                "severity": 5,
+                "mnemonic": "CONFIG_I",
+                "message": "Configured from console by cisco on console",
+            },
+            2: {
+                "sequence": 46,
+                "timestamp": "Jun  5 05:11:04.626 EST",
+                "message": "Rollback:Acquired Configuration lock.",
+            },
+            3: {
+                "sequence": 47,
+                "timestamp": "1d02h",
+                "facility": "LINEPROTO",
+                "severity": 5,
+                "mnemonic": "UPDOWN",
+                "message": "Line protocol on Interface GigabitEthernet1, changed state to up",
+            },
+        },
+        "cursor": {
+            "sequence": 47,
+            "timestamp": "1d02h",
+            "hash": "7794b5c680a36d02",
+        },
+    }
+
+    golden_output_3 = {'execute.return_value': '''
+        000045: *Jun  5 05:10:59.519 EST: %SYS-5-CONFIG_I: Configured from console by cisco on console
+        000046: *Jun  5 05:11:04.626 EST: Rollback:Acquired Configuration lock.
+        000047: 1d02h: %LINEPROTO-5-UPDOWN: Line protocol on Interface GigabitEthernet1, changed state to up
+        -Traceback= 1#0a1b2c3d4e5f
+        '''}
+
+    def test_show_logging_structured(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output_1)
+        obj = ShowLogging(device=self.device)
+        parsed_output = obj.parse(structured=True)
+        # The header is not made of entries
+        self.assertEqual(parsed_output['logs'],
+                         self.golden_parsed_output_1['logs'])
+        self.assertEqual(len(parsed_output['entries']), 7)
+        self.assertEqual(parsed_output['entries'][1], {
+            'timestamp': 'Jun  5 05:09:30.838 EST',
+            'facility': 'IP',
+            'severity': 4,
+            'mnemonic': 'DUPADDR',
+            'message': 'Duplicate address 172.16.1.216 on GigabitEthernet1, sourced by 5e00.8006.0000'})
+
+        self.device = Mock(**self.golden_output_3)
+        obj = ShowLogging(device=self.device)
+        parsed_output = obj.parse(structured=True)
+        self.assertEqual(parsed_output, self.golden_parsed_output_3)
+
+    def test_show_logging_cursor(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output_1)
+        obj = ShowLogging(device=self.device)
+        cursor = obj.parse(structured=True)['cursor']
+        self.assertEqual(cursor['timestamp'], 'Jun  5 05:11:14.115 EST')
+
+        # Nothing new
+        parsed_output = obj.parse(cursor=cursor)
+        self.assertEqual(parsed_output, {'logs': [], 'cursor': cursor})
+
+        # Two entries logged since, the buffer wrapped
+        out = self.golden_output_1['execute.return_value'].replace(
+            'Jun  5 05:09:30.838 EST: %IP-4-DUPADDR: Duplicate address 172.16.1.216 on GigabitEthernet1, sourced by 5e00.8006.0000\n', '')
+        out += '''
+        Jun  5 05:12:00.001 EST: %SYS-5-CONFIG_I: Configured from console by cisco on console
+        Jun  5 05:12:10.002 EST: %SYS-5-CONFIG_R: Config Replace is Done
+        '''
+        self.device = Mock(**{'execute.return_value': out})
+        obj = ShowLogging(device=self.device)
+        parsed_output = obj.parse(cursor=cursor, structured=True)
+        self.assertEqual(parsed_output['logs'], [
+            'Jun  5 05:12:00.001 EST: %SYS-5-CONFIG_I: Configured from console by cisco on console',
+            'Jun  5 05:12:10.002 EST: %SYS-5-CONFIG_R: Config Replace is Done'])
+        self.assertEqual(sorted(parsed_output['entries']), [1, 2])
+        self.assertEqual(parsed_output['cursor']['timestamp'],
+                         'Jun  5 05:12:10.002 EST')
+
+        # The entry of the cursor is gone, every line is new
+        parsed_output = obj.parse(cursor={'timestamp': 'Jun  4 00:00:00.000 EST',
+                                          'hash': cursor['hash']})
+        self.assertEqual(len(parsed_output['logs']), 23)
+
 
 if __name__ == '__main__':
     unittest.main()
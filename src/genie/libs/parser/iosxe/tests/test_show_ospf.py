@@ -1387,10 +1387,9 @@ class test_show_ip_ospf_interface(unittest.TestCase):
 
         self.outputs = {}
         self.outputs['show ip ospf interface'] = raw1
-        self.outputs['show ip ospf sham-links | i OSPF_SL1'] = raw2
-        self.outputs['show running-config | i sham-link | i 10.151.22.22'] = raw3
-        self.outputs['show running-config | section router ospf 1'] = raw4
-        self.outputs['show running-config | section router ospf 2'] = raw5
+        self.outputs['show ip ospf sham-links'] = raw2
+        self.outputs['show running-config | i sham-link'] = raw3
+        self.outputs['show running-config | section router ospf'] = raw4 + raw5
 
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
@@ -1517,10 +1516,9 @@ class test_show_ip_ospf_interface(unittest.TestCase):
 
         self.outputs = {}
         self.outputs['show ip ospf interface'] = raw1
-        self.outputs['show ip ospf virtual-links | i OSPF_VL1'] = raw2
-        self.outputs['show running-config | i virtual-link | i 10.100.5.5'] = raw3
-        self.outputs['show running-config | section router ospf 1'] = raw4
-        self.outputs['show running-config | section router ospf 2'] = raw5
+        self.outputs['show ip ospf virtual-links'] = raw2
+        self.outputs['show running-config | i virtual-link'] = raw3
+        self.outputs['show running-config | section router ospf'] = raw4 + raw5
 
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
@@ -1587,7 +1585,7 @@ class test_show_ip_ospf_interface(unittest.TestCase):
 
         self.outputs = {}
         self.outputs['show ip ospf interface GigabitEthernet2'] = raw1
-        self.outputs['show running-config | section router ospf 65109'] = raw2        
+        self.outputs['show running-config | section router ospf'] = raw2
 
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
@@ -2163,14 +2161,10 @@ class test_show_ip_ospf_neighbor_detail(unittest.TestCase):
 
         self.outputs = {}
         self.outputs['show ip ospf neighbor detail'] = raw1
-        self.outputs['show ip ospf interface | section GigabitEthernet2'] = raw2_1
-        self.outputs['show ip ospf interface | section GigabitEthernet1'] = raw2_2
-        self.outputs['show ip ospf interface | section OSPF_SL1'] = raw2_3
-        self.outputs['show ip ospf interface | section GigabitEthernet3'] = raw2_4
-        self.outputs['show ip ospf sham-links | i OSPF_SL1'] = raw3_1
-        self.outputs['show running-config | i sham-link | i 10.151.22.22'] = raw3_2
-        self.outputs['show running-config | section router ospf 1'] = raw4_1
-        self.outputs['show running-config | section router ospf 2'] = raw4_2
+        self.outputs['show ip ospf interface'] = raw2_1 + raw2_2 + raw2_3 + raw2_4
+        self.outputs['show ip ospf sham-links'] = raw3_1
+        self.outputs['show running-config | i sham-link'] = raw3_2
+        self.outputs['show running-config | section router ospf'] = raw4_1 + raw4_2
 
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
@@ -2332,15 +2326,10 @@ class test_show_ip_ospf_neighbor_detail(unittest.TestCase):
 
         self.outputs = {}
         self.outputs['show ip ospf neighbor detail'] = raw1
-        self.outputs['show ip ospf interface | section OSPF_VL1'] = raw2_1
-        self.outputs['show ip ospf interface | section GigabitEthernet0/1'] = raw2_2
-        self.outputs['show ip ospf interface | section GigabitEthernet0/0'] = raw2_3
-
-        self.outputs['show ip ospf virtual-links | i OSPF_VL1'] = raw3_1
-        self.outputs['show running-config | i virtual-link | i 10.100.5.5'] = raw3_2
-        
-        self.outputs['show running-config | section router ospf 1'] = raw4_1
-        self.outputs['show running-config | section router ospf 2'] = raw4_2
+        self.outputs['show ip ospf interface'] = raw2_1 + raw2_2 + raw2_3
+        self.outputs['show ip ospf virtual-links'] = raw3_1
+        self.outputs['show running-config | i virtual-link'] = raw3_2
+        self.outputs['show running-config | section router ospf'] = raw4_1 + raw4_2
 
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
@@ -2571,20 +2560,16 @@ class test_show_ip_ospf_neighbor_detail(unittest.TestCase):
 
         self.outputs = {}
         self.outputs['show ip ospf neighbor detail'] = raw1
-        self.outputs['show ip ospf interface | section TenGigabitEthernet3/1/1'] = raw2_1
-        self.outputs['show ip ospf interface | section TenGigabitEthernet3/1/2'] = raw2_2
-        self.outputs['show ip ospf interface | section TenGigabitEthernet3/1/3'] = raw2_3
-        self.outputs['show ip ospf interface | section TenGigabitEthernet3/1/4'] = raw2_4
-        self.outputs['show ip ospf interface | section TenGigabitEthernet3/1/5'] = raw2_5
-
-        self.outputs['show running-config | section router ospf 1666'] = raw3_1
-        self.outputs['show running-config | section router ospf 1668'] = raw3_2
+        self.outputs['show ip ospf interface'] = raw2_1 + raw2_2 + raw2_3 + raw2_4 + raw2_5
+        self.outputs['show running-config | section router ospf'] = raw3_1 + raw3_2
 
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
         obj = ShowIpOspfNeighborDetail(device=self.device)
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output3)
+        # Auxiliary commands are run once, not once per neighbor
+        self.assertEqual(self.device.execute.call_count, 3)
     
     golden_output4 = {'execute.return_value': '''
         show ip ospf neighbor detail
@@ -2926,12 +2911,8 @@ class test_show_ip_ospf_neighbor_detail(unittest.TestCase):
 
         self.outputs = {}
         self.outputs['show ip ospf neighbor detail'] = raw1
-        self.outputs['show ip ospf interface | section GigabitEthernet5'] = raw2_1
-        self.outputs['show ip ospf interface | section GigabitEthernet4'] = raw2_2
-        self.outputs['show ip ospf interface | section GigabitEthernet3'] = raw2_3
-        self.outputs['show ip ospf interface | section GigabitEthernet2'] = raw2_4
-
-        self.outputs['show running-config | section router ospf 65109'] = raw3_1
+        self.outputs['show ip ospf interface'] = raw2_1 + raw2_2 + raw2_3 + raw2_4
+        self.outputs['show running-config | section router ospf'] = raw3_1
 
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
@@ -3047,8 +3028,8 @@ class test_show_ip_ospf_sham_links(unittest.TestCase):
 
         self.outputs = {}
         self.outputs['show ip ospf sham-links'] = raw1
-        self.outputs['show ip ospf interface | section OSPF_SL0'] = raw2
-        self.outputs['show running-config | section router ospf 2'] = raw3
+        self.outputs['show ip ospf interface'] = raw2
+        self.outputs['show running-config | section router ospf'] = raw3
 
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
@@ -3170,8 +3151,8 @@ class test_show_ip_ospf_virtual_links(unittest.TestCase):
 
         self.outputs = {}
         self.outputs['show ip ospf virtual-links'] = raw1
-        self.outputs['show ip ospf interface | section OSPF_VL0'] = raw2
-        self.outputs['show running-config | section router ospf 2'] = raw3
+        self.outputs['show ip ospf interface'] = raw2
+        self.outputs['show running-config | section router ospf'] = raw3
 
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
@@ -4898,6 +4879,28 @@ class test_show_ip_ospf_database_router(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output1)
 
+    def test_show_ip_ospf_database_router_filter(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output1)
+        obj = ShowIpOspfDatabaseRouter(device=self.device)
+        parsed_output = obj.parse(filter='* 10.36.3.3')
+        instances = self.golden_parsed_output1['vrf']['default']\
+            ['address_family']['ipv4']['instance']
+
+        def lsa(instance, area):
+            lsa_type = instances[instance]['areas'][area]['database']\
+                ['lsa_types'][1]
+            return {'database': {'lsa_types': {1: {
+                'lsa_type': 1,
+                'lsas': {'10.36.3.3 10.36.3.3':
+                         lsa_type['lsas']['10.36.3.3 10.36.3.3']}}}}}
+
+        self.assertEqual(parsed_output, {'vrf': {'default': {
+            'address_family': {'ipv4': {'instance': {
+                '1': {'areas': {'0.0.0.0': lsa('1', '0.0.0.0')}},
+                '2': {'areas': {'0.0.0.1': lsa('2', '0.0.0.1')}},
+            }}}}}})
+
     def test_show_ip_ospf_database_router_empty(self):
         self.maxDiff = None
         self.device = Mock(**self.empty_output)
@@ -8709,8 +8712,7 @@ class test_show_ip_ospf_mpls_traffic_eng_link(unittest.TestCase):
 
         self.outputs = {}
         self.outputs['show ip ospf mpls traffic-eng link'] = raw1
-        self.outputs['show running-config | section router ospf 1'] = raw2
-        self.outputs['show running-config | section router ospf 2'] = raw3
+        self.outputs['show running-config | section router ospf'] = raw2 + raw3
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
         obj = ShowIpOspfMplsTrafficEngLink(device=self.device)
@@ -577,8 +577,7 @@ class test_show_ip_protocols(unittest.TestCase):
 
         self.outputs = {}
         self.outputs['show ip protocols'] = raw1
-        self.outputs['show running-config | section router ospf 1'] = raw2
-        self.outputs['show running-config | section router ospf 2'] = raw3
+        self.outputs['show running-config | section router ospf'] = raw2 + raw3
 
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
@@ -657,8 +656,7 @@ class test_show_ip_protocols(unittest.TestCase):
 
         self.outputs = {}
         self.outputs['show ip protocols'] = raw1
-        self.outputs['show running-config | section router ospf 1'] = raw2
-        self.outputs['show running-config | section router ospf 2'] = raw3
+        self.outputs['show running-config | section router ospf'] = raw2 + raw3
 
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
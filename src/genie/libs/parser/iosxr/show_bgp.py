@@ -57,6 +57,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 
 # Parser
 from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
+from genie.libs.parser.utils.stream import fold_records
 
 # Logger
 logger = logging.getLogger(__name__)
@@ -3297,7 +3298,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
         # Execute YANG 'get' operational state RPC and parse the XML
         bgpOC = BgpOpenconfigYang(self.device)
-        yang_dict = bgpOC.yang()
+        yang_dict = bgpOC.yang(subtree='neighbors')
 
         # Map keys from yang_dict to map_dict
 
@@ -4779,6 +4780,28 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                                                    vrf=vrf))
         else:
             out = output
+
+        # The dict result is the fold of the route records
+        return fold_records(self.iter_routes(out.splitlines(),
+                                             vrf_type=vrf_type,
+                                             address_family=address_family,
+                                             vrf=vrf))
+
+    def iter_routes(self, lines, vrf_type='all', address_family='', vrf='all'):
+        '''Parse the output line by line and yield the route records
+
+            Args:
+                lines (`iterable`): lines of the output, ex: a file object
+                vrf_type (`str`): 'all' or 'vrf', as for the command
+                address_family (`str`): address family of the command
+                vrf (`str`): vrf of the command
+
+            Yields:
+                (keys, values) records, see genie.libs.parser.utils.stream.
+                A path is yielded as soon as the next one starts:
+                (('instance', instance, 'vrf', vrf, 'address_family', af,
+                  'prefix', prefix, 'index', index), {'next_hop': ..., ...})
+        '''
         p1 = re.compile(r'^\s*BGP *instance *(?P<instance_number>[0-9]+):'
                         ' *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
         p2 = re.compile(r'^\s*VRF: *(?P<vrf>[a-zA-Z0-9\_]+)$')
@@ -4803,10 +4826,12 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
         p16_1 = re.compile(r'^\s*(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+) *(?P<prefix>(?P<ip>[\w\:]+)/(?P<mask>\d+)) *(?P<next_hop>[\w\:]+)$')
         p16_2 = re.compile(r'^\s*(?P<metric>[0-9]+) *(?P<weight>[0-9]+) *(?P<path>[0-9\{\}\s]+) (?P<origin_codes>(i|e|\?))$')
         p16 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+) *(?P<prefix>(?P<ip>[\w\.\:]+)/(?P<mask>\d+))? +(?P<next_hop>[\w\.\:]+) +(?P<number>[\d\s\{\}]+)(?: *(?P<origin_codes>(i|e|\?)))?$')
+        p16_3 = re.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\{\}\s]+)$')
+        p16_4 = re.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\{\}\s]+)$')
+        p16_5 = re.compile(r'^(?P<weight>[0-9]+) (?P<path>((\d+\s)|(\{\d+\}\s))+)$')
         p17 = re.compile(r'(?P<path>[\d\s]+)'
                         ' *(?P<origin_codes>(i|e|\?))?$')
         p18 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+) +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
-        bgp_instance_all_all_dict = {}
 
         if vrf_type == 'all':
             vrf = 'default'
@@ -4820,9 +4845,13 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             else:
                 af_default = 'vpnv4 unicast'
 
+        # The path being parsed, its numbers and path may be on the next lines
+        path_keys = None
+        path_dict = {}
+
         # init the route_distinguisher when all all all command
 
-        for line in out.splitlines():
+        for line in lines:
             line = line.rstrip()
 
             # BGP instance 0: 'default'
@@ -4832,58 +4861,35 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 instance = m.groupdict()['instance']
                 instance = instance.replace("'","")
                 instance_number = str(m.groupdict()['instance_number'])
-                if 'instance' not in bgp_instance_all_all_dict:
-                    bgp_instance_all_all_dict['instance'] = {}
-                if instance not in bgp_instance_all_all_dict['instance']:
-                    bgp_instance_all_all_dict['instance'][instance] = {}
+                yield ('instance', instance), {}
                 # VRF is default - init dictionary here
                 if vrf_type == 'all' and vrf == 'default':
-                    if 'vrf' not in bgp_instance_all_all_dict['instance'][instance]:
-                        bgp_instance_all_all_dict['instance'][instance]['vrf'] = {}
-                    if vrf not in bgp_instance_all_all_dict['instance'][instance]['vrf']:
-                        bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf] = {}
-                        continue
+                    yield ('instance', instance, 'vrf', vrf), {}
+                continue
 
             # VRF: VRF1
 
             m = p2.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
-                if 'vrf' not in bgp_instance_all_all_dict['instance'][instance]:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'] = {}
-                if vrf not in bgp_instance_all_all_dict['instance'][instance]['vrf']:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf] = {}
+                yield ('instance', instance, 'vrf', vrf), {}
                 # Address family is default - init ipv4 unicast dictionary here
                 if vrf_type == 'vrf' and af_default:
                     address_family = af_default
                     original_address_family = address_family
-                    if 'address_family' not in bgp_instance_all_all_dict['instance']\
-                                                        [instance]['vrf'][vrf]:
-                        bgp_instance_all_all_dict['instance'][instance]['vrf']\
-                                                    [vrf]['address_family'] = {}
-                    if address_family not in bgp_instance_all_all_dict['instance']\
-                                    [instance]['vrf'][vrf]['address_family']:
-                        bgp_instance_all_all_dict['instance'][instance]['vrf']\
-                                    [vrf]['address_family'][address_family] = {}
-                        continue
+                    yield ('instance', instance, 'vrf', vrf,
+                           'address_family', address_family), {}
+                continue
 
-                   
             # Address Family: VPNv4 Unicast
 
             m = p3.match(line)
             if m:
                 address_family = m.groupdict()['address_family'].lower()
                 original_address_family = address_family
-                if 'address_family' not in bgp_instance_all_all_dict['instance']\
-                                                        [instance]['vrf'][vrf]:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]\
-                                                        ['address_family'] = {}
-                if address_family not in bgp_instance_all_all_dict['instance']\
-                                    [instance]['vrf'][vrf]['address_family']:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]\
-                                        ['address_family'][address_family] = {}
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]\
-                ['address_family'][address_family]['instance_number'] = instance_number
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'instance_number': instance_number}
                 continue
 
             # BGP VRF VRF1, state: Active
@@ -4892,122 +4898,113 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             if m:
                 # if no vrf key, set it to be the user input
                 if not vrf:
-                    bgp_instance_all_all_dict.setdefault('instance', {})
-                    vrf_dict = bgp_instance_all_all_dict['instance'][instance].setdefault('vrf', {}).setdefault(input_vrf,{})
+                    vrf = input_vrf
                     if vrf_type == 'vrf' and af_default:
                         address_family = af_default
                         original_address_family = address_family
-                        vrf_dict.setdefault('address_family', {}).setdefault(address_family, {})
-                    vrf=input_vrf
-                else:
-                    vrf_dict = bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]
-                bgp_vrf = m.groupdict()['bgp_vrf'].lower()
-                vrf_state = m.groupdict()['vrf_state'].lower()
-
-                vrf_dict['address_family'][address_family]['bgp_vrf'] = bgp_vrf
-
-                vrf_dict['address_family'][address_family]['vrf_state'] = vrf_state
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'bgp_vrf': m.groupdict()['bgp_vrf'].lower(),
+                     'vrf_state': m.groupdict()['vrf_state'].lower()}
                 continue
 
             # VRF ID: 0x60000001    
 
             m = p5.match(line)
             if m:
-                vrf_id = m.groupdict()['vrf_id']
-
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]\
-                    ['address_family'][address_family]['vrf_id'] = vrf_id
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'vrf_id': m.groupdict()['vrf_id']}
                 continue
 
             # BGP router identifier 10.4.1.1, local AS number 100
 
             m = p6.match(line)
             if m:
-                router_identifier = m.groupdict()['router_identifier']
-                local_as = int(m.groupdict()['local_as'])
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family']\
-                    [address_family]['router_identifier'] = router_identifier
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family']\
-                    [address_family]['local_as'] = local_as
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'router_identifier': m.groupdict()['router_identifier'],
+                     'local_as': int(m.groupdict()['local_as'])}
                 continue 
 
             # BGP generic scan interval 60 secs 
 
             m = p7.match(line)
             if m:
-                generic_scan_interval = m.groupdict()['generic_scan_interval']
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family']\
-                [address_family]['generic_scan_interval'] = generic_scan_interval
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'generic_scan_interval':
+                        m.groupdict()['generic_scan_interval']}
                 continue          
 
             # Non-stop routing is enabled
 
             m = p8.match(line)
             if m:
-                non_stop_routing = True
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family']\
-                [address_family]['non_stop_routing'] = non_stop_routing
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'non_stop_routing': True}
                 continue
 
             # BGP table state: Active
 
             m = p9.match(line)
             if m:
-                table_state = m.groupdict()['table_state'].lower()
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family']\
-                    [address_family]['table_state'] = table_state
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'table_state': m.groupdict()['table_state'].lower()}
                 continue
 
             # Table ID: 0x0   RD version: 0
 
             m = p10.match(line)
             if m:
-                table_id = m.groupdict()['table_id']
-                rd_version = int(m.groupdict()['rd_version'])
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]\
-                ['address_family'][address_family]['table_id'] = table_id
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]\
-                ['address_family'][address_family]['rd_version'] = rd_version
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'table_id': m.groupdict()['table_id'],
+                     'rd_version': int(m.groupdict()['rd_version'])}
                 continue
 
             # BGP main routing table version 43
 
             m = p11.match(line)
             if m:
-                bgp_table_version = int(m.groupdict()['bgp_table_version'])
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]\
-                ['address_family'][address_family]['bgp_table_version'] = bgp_table_version
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'bgp_table_version':
+                        int(m.groupdict()['bgp_table_version'])}
                 continue
 
             # BGP NSR Initial initsync version 11 (Reached)
 
             m = p12.match(line)
             if m:
-                nsr_initial_initsync_version = m.groupdict()['nsr_initial_initsync_version']
-                nsr_initial_init_ver_status = str(m.groupdict()['nsr_initial_init_ver_status']).lower()
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family']\
-                [address_family]['nsr_initial_initsync_version'] = nsr_initial_initsync_version
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family']\
-                [address_family]['nsr_initial_init_ver_status'] = nsr_initial_init_ver_status
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'nsr_initial_initsync_version':
+                        m.groupdict()['nsr_initial_initsync_version'],
+                     'nsr_initial_init_ver_status':
+                        str(m.groupdict()['nsr_initial_init_ver_status']).lower()}
                 continue
 
             # BGP NSR/ISSU Sync-Group versions 0/0
 
             m = p13.match(line)
             if m:
-                nsr_issu_sync_group_versions = m.groupdict()['nsr_issu_sync_group_versions']
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family']\
-                [address_family]['nsr_issu_sync_group_versions'] = nsr_issu_sync_group_versions
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'nsr_issu_sync_group_versions':
+                        m.groupdict()['nsr_issu_sync_group_versions']}
                 continue
 
             # BGP scan interval 60 secs
 
             m = p14.match(line)
             if m:
-               scan_interval = int(m.groupdict()['scan_interval'])
-               bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family']\
-               [address_family]['scan_interval'] = int(scan_interval)
-               continue
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'scan_interval': int(m.groupdict()['scan_interval'])}
+                continue
 
             # Route Distinguisher: 200:1 (default for vrf VRF1)
 
@@ -5015,19 +5012,11 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 address_family = original_address_family + ' RD ' + route_distinguisher
-                default_vrf = str(m.groupdict()['default_vrf']).lower()   
-                if 'address_family' not in bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'] = {}
-                if address_family not in bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family']:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family] = {}
-                try:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]\
-                    ['address_family'][address_family]['default_vrf'] = default_vrf
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]\
-                    ['address_family'][address_family]['route_distinguisher'] = route_distinguisher
-                except Exception:
-                    pass
-
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'default_vrf': str(m.groupdict()['default_vrf']).lower(),
+                     'route_distinguisher': route_distinguisher}
+                continue
 
             m = p16_1.match(line)
             if m:
@@ -5039,37 +5028,26 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 if prefix:
                     index = 1
                     last_prefix = prefix
-                
-                if 'prefix' not in bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'] = {}
-
-                if last_prefix not in bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix']:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix] = {}
 
-                if 'index' not in bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'] = {}
-
-                if index not in bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index']:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index] = {}
-
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['next_hop'] = next_hop
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['status_codes'] = status_codes
-                    continue
+                # New path, the previous one is complete
+                if path_keys:
+                    yield path_keys, path_dict
+                path_keys = ('instance', instance, 'vrf', vrf,
+                             'address_family', address_family,
+                             'prefix', last_prefix, 'index', index)
+                path_dict = {'next_hop': next_hop,
+                             'status_codes': status_codes}
+                continue
 
             #2219             0 200 33299 51178 47751 {27016} e
 
             m = p16_2.match(line)
             if m:
-                metric = str(m.groupdict()['metric'])
-                weight = str(m.groupdict()['weight'])
-                path = str(m.groupdict()['path'])
-                origin_codes = str(m.groupdict()['origin_codes'])
-                if m:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['metric'] = metric    
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['weight'] = weight
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['path'] = path
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['origin_codes'] = origin_codes
-                    continue
+                path_dict['metric'] = str(m.groupdict()['metric'])
+                path_dict['weight'] = str(m.groupdict()['weight'])
+                path_dict['path'] = str(m.groupdict()['path'])
+                path_dict['origin_codes'] = str(m.groupdict()['origin_codes'])
+                continue
                     
             # prefix key
 
@@ -5087,73 +5065,65 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 else:
                     prefix = last_prefix
                     index = index + 1
-                
-                if 'prefix' not in bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'] = {}
-
-                if last_prefix not in bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix']:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix] = {}
-
-                if 'index' not in bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'] = {}
-
-                if index not in bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index']:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index] = {}
 
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['next_hop'] = next_hop
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['status_codes'] = status_codes
+                # New path, the previous one is complete
+                if path_keys:
+                    yield path_keys, path_dict
+                path_keys = ('instance', instance, 'vrf', vrf,
+                             'address_family', address_family,
+                             'prefix', last_prefix, 'index', index)
+                path_dict = {'next_hop': next_hop,
+                             'status_codes': status_codes}
 
-                    group_num = m.groupdict()['number']
+                group_num = m.groupdict()['number']
 
-                    m1 = re.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\{\}\s]+)$').match(group_num)
+                m1 = p16_3.match(group_num)
 
-                    m2 = re.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\{\}\s]+)$').match(group_num)
+                m2 = p16_4.match(group_num)
 
-                    m3 = re.compile(r'^(?P<weight>[0-9]+) (?P<path>((\d+\s)|(\{\d+\}\s))+)$').match(group_num)
+                m3 = p16_5.match(group_num)
 
-                    if m1:
-                        bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['metric'] = m1.groupdict()['metric']
-                        bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['locprf'] = m1.groupdict()['locprf']
-                        bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['weight'] = m1.groupdict()['weight']
-                        bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['path'] = m1.groupdict()['path'].strip()
-                    elif m2:
-                        if len(m2.groupdict()['space']) > 8:
-                            bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['metric'] = m2.groupdict()['value']
-                        else:
-                            bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['locprf'] = m2.groupdict()['value']
+                if m1:
+                    path_dict['metric'] = m1.groupdict()['metric']
+                    path_dict['locprf'] = m1.groupdict()['locprf']
+                    path_dict['weight'] = m1.groupdict()['weight']
+                    path_dict['path'] = m1.groupdict()['path'].strip()
+                elif m2:
+                    if len(m2.groupdict()['space']) > 8:
+                        path_dict['metric'] = m2.groupdict()['value']
+                    else:
+                        path_dict['locprf'] = m2.groupdict()['value']
 
-                        bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['weight'] = m2.groupdict()['weight']
-                        bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['path'] = m2.groupdict()['path'].strip()
-                    elif m3:
-                        bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['weight'] = m3.groupdict()['weight']
-                        bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['path'] = m3.groupdict()['path'].strip()
+                    path_dict['weight'] = m2.groupdict()['weight']
+                    path_dict['path'] = m2.groupdict()['path'].strip()
+                elif m3:
+                    path_dict['weight'] = m3.groupdict()['weight']
+                    path_dict['path'] = m3.groupdict()['path'].strip()
 
-                    if m.groupdict()['origin_codes']:
-                        bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['origin_codes'] = m.groupdict()['origin_codes']
-                    continue
+                if m.groupdict()['origin_codes']:
+                    path_dict['origin_codes'] = m.groupdict()['origin_codes']
+                continue
 
-            p17 = re.compile(r'(?P<path>[\d\s]+)'
-                            ' *(?P<origin_codes>(i|e|\?))?$')
             m = p17.match(line)
             if m:
-                if 'path' in bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['path'] += ' ' + m.groupdict()['path'].strip()
+                if 'path' in path_dict:
+                    path_dict['path'] += ' ' + m.groupdict()['path'].strip()
 
                 if m.groupdict()['origin_codes']:
-                    bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['prefix'][last_prefix]['index'][index]['origin_codes'] = m.groupdict()['origin_codes']
+                    path_dict['origin_codes'] = m.groupdict()['origin_codes']
                 continue
 
             # Processed 40 prefixes, 50 paths
-            p18 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+) +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
             m = p18.match(line)
             if m:
-                processed_prefix = int(m.groupdict()['processed_prefix'])
-                processed_paths = int(m.groupdict()['processed_paths'])
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['processed_prefix'] = processed_prefix
-                bgp_instance_all_all_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['processed_paths'] = processed_paths
+                yield ('instance', instance, 'vrf', vrf,
+                       'address_family', address_family), \
+                    {'processed_prefix': int(m.groupdict()['processed_prefix']),
+                     'processed_paths': int(m.groupdict()['processed_paths'])}
                 continue
 
-        return bgp_instance_all_all_dict 
+        if path_keys:
+            yield path_keys, path_dict
 
 
 ################################################################################
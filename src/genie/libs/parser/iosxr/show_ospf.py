@@ -22,6 +22,7 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.command_cache import CommandCache
 
 
 # ==================================================
@@ -235,6 +236,9 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
 
     cli_command = 'show ospf vrf all-inclusive interface'
     exclude = ['dead_timer', 'hello_timer', 'last_flood_scan_length', 'max_flood_scan_length', 'high_water_mark']
+    auxiliary_commands = ['show ospf vrf all-inclusive virtual-links',
+                          'show ospf vrf all-inclusive sham-links',
+                          'show run formal router ospf | i sham']
 
     def cli(self, output=None):
         if output is None:
@@ -245,6 +249,7 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
         # Init vars
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
+        cache = CommandCache.from_device(self.device)
 
         # Mapping dict
         bool_dict = {'up': True, 'down': False, 'unknown': False}
@@ -395,7 +400,7 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
 
                     # Execute 'show ospf vrf all-inclusive virtual-links' to get the vl_transit_area_id
                     obj = ShowOspfVrfAllInclusiveVirtualLinks(device=self.device)
-                    vl_out = obj.parse()
+                    vl_out = obj.parse(output=cache.execute(obj.cli_command))
 
                     for vl_vrf in vl_out['vrf']:
                         for vl_af in vl_out['vrf'][vl_vrf]['address_family']:
@@ -416,8 +421,7 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
                     sl_remote_id = None
 
                     # Execute command to get sham-link remote_id
-                    cmd = 'show ospf vrf all-inclusive sham-links | i {intf}'.format(intf=interface)
-                    out = self.device.execute(cmd)
+                    out = cache.execute('show ospf vrf all-inclusive sham-links')
 
                     for line in out.splitlines():
                         line = line.rstrip()
@@ -431,8 +435,7 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
 
                     # Execute command to get sham-link local_id
                     if sl_remote_id is not None:
-                        cmd = 'show run formal router ospf | i sham | i {remote}'.format(remote=sl_remote_id)
-                        out = self.device.execute(cmd)
+                        out = cache.execute('show run formal router ospf | i sham')
 
                         for line in out.splitlines():
                             line = line.rstrip()
@@ -787,6 +790,7 @@ class ShowOspfVrfAllInclusiveNeighborDetail(ShowOspfVrfAllInclusiveNeighborDetai
 
     cli_command = 'show ospf vrf all-inclusive neighbor detail'
     exclude = ['dead_timer', 'neighbor_uptime', 'hello_timer', 'total_dbd_retrans']
+    auxiliary_commands = ['show ospf vrf all-inclusive virtual-links']
 
     def cli(self, output=None):
         if output is None:
@@ -797,6 +801,7 @@ class ShowOspfVrfAllInclusiveNeighborDetail(ShowOspfVrfAllInclusiveNeighborDetai
         # Init vars
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
+        cache = CommandCache.from_device(self.device)
 
         p1 = re.compile(r'^Neighbors +for +OSPF +(?P<instance>(\S+))'
                             '(?:, +VRF +(?P<vrf>(\S+)))?$')
@@ -889,7 +894,7 @@ class ShowOspfVrfAllInclusiveNeighborDetail(ShowOspfVrfAllInclusiveNeighborDetai
 
                     # Execute 'show ospf vrf all-inclusive virtual-links' to get the vl_transit_area_id
                     obj = ShowOspfVrfAllInclusiveVirtualLinks(device=self.device)
-                    vl_out = obj.parse()
+                    vl_out = obj.parse(output=cache.execute(obj.cli_command))
 
                     for vl_vrf in vl_out['vrf']:
                         for vl_af in vl_out['vrf'][vl_vrf]['address_family']:
@@ -1244,6 +1249,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
 
     cli_command = 'show ospf vrf all-inclusive'
     exclude = ['area_scope_lsa_cksum_sum', 'topology_version', 'spf_runs_count', 'external_lsa_checksum']
+    auxiliary_commands = ['show run formal router ospf | i nsf']
 
 
     def cli(self, output=None):
@@ -1254,6 +1260,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
 
         # Init vars
         ret_dict = {}
+        cache = CommandCache.from_device(self.device)
         af = 'ipv4' # this is ospf - always ipv4
         p1 = re.compile(r'(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process'
                             ' +\"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))\"'
@@ -2029,7 +2036,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
             m = p42.match(line)
             if m:
                 # Execute command on device
-                out = self.device.execute('show run formal router ospf | i nsf')
+                out = cache.execute('show run formal router ospf | i nsf')
 
                 # router ospf 1 vrf VRF1 nsf ietf
                 for line in out.splitlines():
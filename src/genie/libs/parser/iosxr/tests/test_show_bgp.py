@@ -24,6 +24,8 @@ from genie.libs.parser.iosxr.show_bgp import ShowPlacementProgramAll,\
                                   ShowBgpInstanceAllAll, ShowBgpInstances,\
                                   ShowBgpL2vpnEvpnNeighbors
 
+from genie.libs.parser.utils.stream import fold_records
+
 
 # ==================================
 # Unit test for 'show bgp instances'
@@ -7141,6 +7143,24 @@ class test_show_bgp_instance_all_all_all(unittest.TestCase):
        self.maxDiff = None
        self.assertEqual(parsed_output,self.golden_parsed_output)
 
+    def test_iter_routes(self):
+        self.maxDiff = None
+        obj = ShowBgpInstanceAllAll(device=Mock())
+        lines = iter(self.golden_output['execute.return_value'].splitlines())
+        records = obj.iter_routes(lines)
+
+        # Records are yielded while the lines are read
+        for keys, values in records:
+            if 'prefix' in keys:
+                break
+        self.assertEqual(keys[:6], ('instance', 'default', 'vrf', 'default',
+                                    'address_family', 'vpnv4 unicast RD 200:1'))
+        self.assertIsNotNone(next(lines, None))
+
+        records = list(obj.iter_routes(
+            self.golden_output['execute.return_value'].splitlines()))
+        self.assertEqual(fold_records(records), self.golden_parsed_output)
+
 
 # =============================================
 # Unit test for 'show bgp instance all vrf all'
@@ -4092,5 +4092,28 @@ class test_show_interfaces(unittest.TestCase):
         parsed_output = obj.parse(interface='Bundle-Ether1')
         self.assertEqual(parsed_output,self.golden_interface_parsed_output)
 
+    def test_golden_filter(self):
+        self.device = Mock(**self.golden_output)
+        obj = ShowInterfaces(device=self.device)
+        parsed_output = obj.parse(filter=['BE100', 'Bundle-Ether100.*',
+                                          'Te0/0/0/1'])
+        self.assertEqual(parsed_output, {
+            intf: self.golden_parsed_output[intf] for intf in
+            ['Bundle-Ether100', 'Bundle-Ether100.12', 'Bundle-Ether100.22',
+             'TenGigE0/0/0/1']})
+
+    def test_golden_counters(self):
+        self.device = Mock(**self.golden_output)
+        obj = ShowInterfaces(device=self.device)
+        sample = obj.cli_counters()
+        # The counters of the whole parser
+        self.maxDiff = None
+        self.assertEqual(
+            {intf: sample.to_dict(intf) for intf in sample},
+            {intf: {key: value for key, value in intf_dict['counters'].items()
+                   if not isinstance(value, bool)}
+             for intf, intf_dict in self.golden_parsed_output.items()
+             if intf_dict.get('counters')})
+
 if __name__ == '__main__':
     unittest.main()
@@ -668,8 +668,8 @@ class test_show_ospf_vrf_all_inclusive_interface(unittest.TestCase):
 
         self.outputs = {}
         self.outputs['show ospf vrf all-inclusive interface'] = raw1
-        self.outputs['show ospf vrf all-inclusive sham-links | i OSPF_SL0'] = raw2
-        self.outputs['show run formal router ospf | i sham | i 10.151.22.22'] = raw3
+        self.outputs['show ospf vrf all-inclusive sham-links'] = raw2
+        self.outputs['show run formal router ospf | i sham'] = raw3
 
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
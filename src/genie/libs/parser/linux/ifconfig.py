@@ -3,15 +3,68 @@
 Linux parsers for the following commands:
     * ifconfig
     * ifconfig <interface>
+
+Ifconfig.local reads the interfaces of the host running the parser from
+/sys/class/net and /proc/net instead of running ifconfig, with the same
+output as cli:
+
+    >>> Ifconfig(device=None, context='local').parse(interface='eth0')
+    >>> sample = Ifconfig(device=None).local_counters()
+    >>> sample.delta(previous)
 """
 
 # python
+import os
 import re
+import fcntl
+import socket
+import struct
+import ipaddress
 
 # metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# parser utils
+from genie.libs.parser.utils.counters import CounterSample
+
+# Flags of the interfaces, in the order ifconfig prints them
+_FLAGS = [(0x1, 'UP'), (0x2, 'BROADCAST'), (0x4, 'DEBUG'),
+          (0x8, 'LOOPBACK'), (0x10, 'POINTOPOINT'), (0x20, 'NOTRAILERS'),
+          (0x40, 'RUNNING'), (0x80, 'NOARP'), (0x100, 'PROMISC'),
+          (0x200, 'ALLMULTI'), (0x400, 'MASTER'), (0x800, 'SLAVE'),
+          (0x1000, 'MULTICAST'), (0x2000, 'PORTSEL'), (0x4000, 'AUTOMEDIA'),
+          (0x8000, 'DYNAMIC')]
+_IFF_BROADCAST = 0x2
+_IFF_RUNNING = 0x40
+
+# ARPHRD_* of /sys/class/net/<interface>/type -> (type, destription)
+_TYPES = {
+    1: ('ether', 'Ethernet'),
+    32: ('infiniband', 'InfiniBand'),
+    512: ('ppp', 'Point-to-Point Protocol'),
+    768: ('tunnel', 'IPIP Tunnel'),
+    772: ('loop', 'Local Loopback'),
+    776: ('sit', 'IPv6-in-IPv4'),
+    778: ('gre', 'GRE over IP'),
+    65534: ('unspec', 'UNSPEC'),
+}
+
+# Scope of the ipv6 addresses in /proc/net/if_inet6 -> ifconfig name
+_SCOPES = {0x0: 'global', 0x10: 'host', 0x20: 'link', 0x40: 'site',
+           0x80: 'compat'}
+
+# Columns of /proc/net/dev, after the interface name
+_DEV_COUNTERS = ['rx_bytes', 'rx_pkts', 'rx_errors', 'rx_dropped',
+                 'rx_overruns', 'rx_frame', None, None,
+                 'tx_bytes', 'tx_pkts', 'tx_errors', 'tx_dropped',
+                 'tx_overruns', 'tx_collisions', 'tx_carrier', None]
+
+# ioctl of the ipv4 address, netmask and broadcast address
+_SIOCGIFADDR = 0x8915
+_SIOCGIFBRDADDR = 0x8919
+_SIOCGIFNETMASK = 0x891b
+
 # =======================================================
 # Schema for 'ifconfig [<interface>]'
 # =======================================================
@@ -63,6 +116,33 @@ class IfconfigSchema(MetaParser):
         }
     }
 
+def _scaled(value):
+    """Bytes as ifconfig prints them, ex: 4.0 MiB"""
+    units = ['B', 'KiB', 'MiB', 'GiB', 'TiB']
+    unit = 0
+    fraction = 0
+    while value > 1024 and unit < len(units) - 1:
+        fraction = (value % 1024) * 10 // 1024
+        value //= 1024
+        unit += 1
+    return '{v}.{f} {u}'.format(v=value, f=fraction, u=units[unit])
+
+
+def _ipv4(interface):
+    """(ip, netmask, broadcast) of the interface, read with ioctl as
+       ifconfig does; None without an ipv4 address"""
+    request = struct.pack('256s', interface.encode()[:15])
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        addresses = []
+        for code in (_SIOCGIFADDR, _SIOCGIFNETMASK, _SIOCGIFBRDADDR):
+            try:
+                reply = fcntl.ioctl(sock.fileno(), code, request)
+            except OSError:
+                return None
+            addresses.append(socket.inet_ntoa(reply[20:24]))
+    return addresses
+
+
 # =======================================================
 # Parser for 'ifconfig [<interface>]'
 # =======================================================
@@ -71,6 +151,118 @@ class Ifconfig(IfconfigSchema):
 
     cli_command = ['ifconfig {interface}','ifconfig' ]
 
+    def _read(self, root, *path):
+        with open(os.path.join(root, *path)) as f:
+            return f.read().strip()
+
+    def _dev_counters(self, root, interface=None):
+        """interface -> counters of /proc/net/dev"""
+        ret_dict = {}
+        with open(os.path.join(root, 'proc', 'net', 'dev')) as f:
+            # Inter-|   Receive                            ...
+            #  face |bytes    packets errs drop fifo frame ...
+            #     lo: 4274334   66766    0    0    0     0 ...
+            for line in f:
+                name, sep, values = line.partition(':')
+                name = name.strip()
+                if not sep or '|' in values or \
+                        (interface and name != interface):
+                    continue
+                ret_dict[name] = {key: int(value) for key, value in
+                                  zip(_DEV_COUNTERS, values.split())
+                                  if key}
+        return ret_dict
+
+    def local(self, interface=None, root='/'):
+        """Parse the interfaces of the local host from /sys/class/net and
+           /proc/net, without running ifconfig
+
+            Args:
+                interface (`str`): only read this interface
+                root (`str`): root of the /sys and /proc trees
+        """
+        net = os.path.join(root, 'sys', 'class', 'net')
+        if interface:
+            interfaces = [interface] if os.path.isdir(
+                os.path.join(net, interface)) else []
+        else:
+            interfaces = sorted(os.listdir(net))
+        if not interfaces:
+            return {}
+        counters = self._dev_counters(root, interface)
+
+        # fe800000000000000039 02 40 20 80 enp0s31f6
+        ipv6 = {}
+        try:
+            with open(os.path.join(root, 'proc', 'net', 'if_inet6')) as f:
+                for line in f:
+                    fields = line.split()
+                    if len(fields) == 6 and (not interface or
+                                             fields[5] == interface):
+                        ipv6.setdefault(fields[5], []).append(fields)
+        except OSError:
+            # no ipv6
+            pass
+
+        result_dict = {}
+        for name in interfaces:
+            flags = int(self._read(net, name, 'flags'), 16)
+            # RUNNING is not in the flags of sysfs, it is the carrier
+            try:
+                if self._read(net, name, 'carrier') == '1':
+                    flags |= _IFF_RUNNING
+            except OSError:
+                # carrier is unreadable while the interface is down
+                pass
+            intf_dict = result_dict.setdefault(name, {})
+            intf_dict['interface'] = name
+            intf_dict['flags'] = '{f}<{n}>'.format(
+                f=flags, n=','.join(flag_name for bit, flag_name in _FLAGS
+                                    if flags & bit))
+            intf_dict['mtu'] = int(self._read(net, name, 'mtu'))
+
+            # The ipv4 addresses of the schema require a broadcast address,
+            # so only broadcast interfaces have them. The addresses are only
+            # known to the kernel of the host
+            if flags & _IFF_BROADCAST and root == '/':
+                addresses = _ipv4(name)
+                if addresses:
+                    ip, netmask, broadcast = addresses
+                    intf_dict.setdefault('ipv4', {})[ip] = {
+                        'ip': ip, 'netmask': netmask, 'broadcast': broadcast}
+
+            for address, _, prefixlen, scope, _, _ in ipv6.get(name, []):
+                ip = ipaddress.IPv6Address(bytes.fromhex(address)).compressed
+                scope = int(scope, 16)
+                intf_dict.setdefault('ipv6', {})[ip] = {
+                    'ip': ip, 'prefixlen': int(prefixlen, 16),
+                    'scopeid': '0x{s:x}<{n}>'.format(
+                        s=scope, n=_SCOPES.get(scope, 'unknown'))}
+
+            intf_type = int(self._read(net, name, 'type'))
+            intf_dict['type'], intf_dict['destription'] = \
+                _TYPES.get(intf_type, _TYPES[65534])
+            if intf_type == 1:
+                intf_dict['mac'] = self._read(net, name, 'address')
+            intf_dict['txqueuelen'] = int(self._read(net, name,
+                                                     'tx_queue_len'))
+
+            counter_dict = counters.get(name)
+            if counter_dict is not None:
+                counter_dict['rx_value'] = _scaled(counter_dict['rx_bytes'])
+                counter_dict['tx_value'] = _scaled(counter_dict['tx_bytes'])
+                intf_dict['counters'] = counter_dict
+
+        return result_dict
+
+    def local_counters(self, interface=None, root='/', time=None):
+        """Return the counters of the local interfaces as a CounterSample,
+           only reading /proc/net/dev, see genie.libs.parser.utils.counters
+           for the delta of two samples"""
+        return CounterSample.from_parsed(
+            {name: {'counters': counters} for name, counters in
+             self._dev_counters(root, interface).items()}, time=time)
+
     def cli(self, interface=None, output=None):
         if output is None:
             if interface:
@@ -1,4 +1,6 @@
+import os
 import re
+import tempfile
 import unittest
 from unittest.mock import Mock
 
@@ -439,5 +441,149 @@ class test_ifconfig(unittest.TestCase):
         self.assertEqual(parsed_output,self.golden_parsed_output_interface)
 
 
+
+#############################################################################
+# unitest For the /sys and /proc backend of ifconfig [<interface>]
+#############################################################################
+
+class test_ifconfig_local(unittest.TestCase):
+
+    sys_class_net = {
+        'enp0s31f6': {'flags': '0x1003', 'carrier': '1', 'mtu': '1500',
+                      'type': '1', 'address': '48:2a:e3:13:45:42',
+                      'tx_queue_len': '1000'},
+        'lo': {'flags': '0x9', 'carrier': '1', 'mtu': '65536', 'type': '772',
+               'address': '00:00:00:00:00:00', 'tx_queue_len': '1000'},
+        # down, carrier unreadable
+        'docker0': {'flags': '0x1003', 'mtu': '1500', 'type': '1',
+                    'address': '02:42:b0:8e:d1:a0', 'tx_queue_len': '0'},
+    }
+
+    proc_net_dev = """\
+Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed
+    lo: 7418012  100389    0    0    0     0          0         0  7418012  100389    0    0    0     0       0          0
+enp0s31f6: 4274334   66766    0    0    0     0          0      1247 67689136  365916    0    0    0     0       0          0
+docker0: 13092415  201975    0    0    0     0          0         0 610816249  464814    0    0    0     0       0          0
+"""
+
+    proc_net_if_inet6 = """\
+00000000000000000000000000000001 01 80 10 80       lo
+fe8000000000000000391a5c726db23e 02 40 20 80 enp0s31f6
+"""
+
+    golden_parsed_output = {
+        'enp0s31f6': {
+            'interface': 'enp0s31f6',
+            'flags': '4163<UP,BROADCAST,RUNNING,MULTICAST>',
+            'mtu': 1500,
+            'ipv6': {
+                'fe80::39:1a5c:726d:b23e': {
+                    'ip': 'fe80::39:1a5c:726d:b23e',
+                    'prefixlen': 64,
+                    'scopeid': '0x20<link>'}},
+            'type': 'ether',
+            'destription': 'Ethernet',
+            'mac': '48:2a:e3:13:45:42',
+            'txqueuelen': 1000,
+            'counters': {
+                'rx_pkts': 66766,
+                'rx_bytes': 4274334,
+                'rx_value': '4.0 MiB',
+                'rx_errors': 0,
+                'rx_dropped': 0,
+                'rx_overruns': 0,
+                'rx_frame': 0,
+                'tx_pkts': 365916,
+                'tx_bytes': 67689136,
+                'tx_value': '64.5 MiB',
+                'tx_errors': 0,
+                'tx_dropped': 0,
+                'tx_overruns': 0,
+                'tx_carrier': 0,
+                'tx_collisions': 0}},
+        'lo': {
+            'interface': 'lo',
+            'flags': '73<UP,LOOPBACK,RUNNING>',
+            'mtu': 65536,
+            'ipv6': {
+                '::1': {
+                    'ip': '::1',
+                    'prefixlen': 128,
+                    'scopeid': '0x10<host>'}},
+            'type': 'loop',
+            'destription': 'Local Loopback',
+            'txqueuelen': 1000,
+            'counters': {
+                'rx_pkts': 100389,
+                'rx_bytes': 7418012,
+                'rx_value': '7.0 MiB',
+                'rx_errors': 0,
+                'rx_dropped': 0,
+                'rx_overruns': 0,
+                'rx_frame': 0,
+                'tx_pkts': 100389,
+                'tx_bytes': 7418012,
+                'tx_value': '7.0 MiB',
+                'tx_errors': 0,
+                'tx_dropped': 0,
+                'tx_overruns': 0,
+                'tx_carrier': 0,
+                'tx_collisions': 0}},
+    }
+
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        for name, files in self.sys_class_net.items():
+            path = os.path.join(self.root.name, 'sys', 'class', 'net', name)
+            os.makedirs(path)
+            for file_name, value in files.items():
+                with open(os.path.join(path, file_name), 'w') as f:
+                    f.write(value + '\n')
+        os.makedirs(os.path.join(self.root.name, 'proc', 'net'))
+        for file_name, value in (('dev', self.proc_net_dev),
+                                 ('if_inet6', self.proc_net_if_inet6)):
+            with open(os.path.join(self.root.name, 'proc', 'net',
+                                   file_name), 'w') as f:
+                f.write(value)
+
+    def tearDown(self):
+        self.root.cleanup()
+
+    def test_local(self):
+        obj = Ifconfig(device=None, context='local')
+        parsed_output = obj.parse(root=self.root.name)
+        self.maxDiff = None
+        self.assertEqual(parsed_output['enp0s31f6'],
+                         self.golden_parsed_output['enp0s31f6'])
+        self.assertEqual(parsed_output['lo'],
+                         self.golden_parsed_output['lo'])
+        self.assertEqual(parsed_output['docker0']['flags'],
+                         '4099<UP,BROADCAST,MULTICAST>')
+
+    def test_local_interface(self):
+        obj = Ifconfig(device=None, context='local')
+        parsed_output = obj.parse(interface='lo', root=self.root.name)
+        self.assertEqual(parsed_output,
+                         {'lo': self.golden_parsed_output['lo']})
+        with self.assertRaises(SchemaEmptyParserError):
+            obj.parse(interface='eth9', root=self.root.name)
+
+    def test_local_counters(self):
+        obj = Ifconfig(device=None)
+        previous = obj.local_counters(root=self.root.name, time=0)
+        self.assertEqual(previous.get('enp0s31f6', 'rx_bytes'), 4274334)
+        with open(os.path.join(self.root.name, 'proc', 'net', 'dev'),
+                  'w') as f:
+            f.write(self.proc_net_dev.replace('4274334   66766',
+                                              '4284334   66776'))
+        sample = obj.local_counters(interface='enp0s31f6',
+                                    root=self.root.name, time=10)
+        self.assertEqual(list(sample), ['enp0s31f6'])
+        delta = sample.delta(previous)['enp0s31f6']
+        self.assertEqual(delta['delta']['rx_bytes'], 10000)
+        self.assertEqual(delta['rate']['rx_pkts'], 1.0)
+        self.assertFalse(delta['cleared'])
+
 if __name__ == '__main__':
     unittest.main()
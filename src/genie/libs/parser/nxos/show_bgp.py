@@ -51,7 +51,6 @@ NXOS parsers for the following show commands:
 # Python
 import re
 from copy import deepcopy
-import xml.etree.ElementTree as ET
 
 # Metaparser
 from genie.metaparser import MetaParser
@@ -63,6 +62,8 @@ from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.stream import fold_records
+from genie.libs.parser.utils.xml_stream import XmlStream, local_name
 
 
 # =====================================
@@ -806,259 +807,249 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             out = output
 
         etree_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        xml_output = ET.fromstring(out)
-
-        for item in xml_output:
-            for data in item:
-                for show in data:
-                    for bgp in show:
-                        for __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf in bgp:
-                            for process in __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf:
-                                for __XML__OPT_Cmd_show_bgp_process_cmd_vrf in process:
-                                    for __XML__OPT_Cmd_show_bgp_process_cmd___readonly__ in __XML__OPT_Cmd_show_bgp_process_cmd_vrf:
-                                        for key in __XML__OPT_Cmd_show_bgp_process_cmd___readonly__:
-                                            # Get key text
-                                            text = key.tag[key.tag.find('}')+1:]
-                                            # bgp_pid
-                                            if text == 'processid':
-                                                etree_dict['bgp_pid'] = int(key.text)
-                                            # bgp_protocol_started_reason
-                                            if text == 'protocolstartedreason':
-                                                etree_dict['bgp_protocol_started_reason'] = key.text
-                                            # bgp_tag
-                                            if text == 'protocoltag':
-                                                etree_dict['bgp_tag'] = key.text
-                                            # bgp_protocol_state
-                                            if text == 'protocolstate':
-                                                etree_dict['bgp_protocol_state'] = str(key.text).lower()
-                                            # bgp_isolate_mode
-                                            if text == 'isolatemode':
-                                                etree_dict['bgp_isolate_mode'] = key.text
-                                            # bgp_mmode
-                                            if text == 'mmode':
-                                                etree_dict['bgp_mmode'] = key.text
-                                            # bgp_memory_state
-                                            if text == 'memorystate':
-                                                etree_dict['bgp_memory_state'] = str(key.text).lower()
-                                            # bgp_performance_mode
-                                            if text == 'forwardingstatesaved':
-                                                if key.text == 'false':
-                                                    etree_dict['bgp_performance_mode'] = 'No'
-                                                else:
-                                                    etree_dict['bgp_performance_mode'] = 'Yes'
-                                            # bgp_asformat
-                                            if text == 'asformat':
-                                                etree_dict['bgp_asformat'] = key.text
-                                            if text == 'srgbmin':
-                                                srgbin = key.text
-                                            if text == 'srgbmax':
-                                                srgmax = key.text
-                                                try:
-                                                    etree_dict['segment_routing_global_block'] = srgbin + '-' + srgmax
-                                                except Exception:
-                                                    pass
-                                            # num_attr_entries
-                                            if text == 'attributeentries':
-                                                etree_dict['num_attr_entries'] = int(key.text)
-                                            # hwm_attr_entries
-                                            if text == 'hwmattributeentries':
-                                                etree_dict['hwm_attr_entries'] = int(key.text)
-                                            # bytes_used
-                                            if text == 'bytesused':
-                                                etree_dict['bytes_used'] = int(key.text)
-                                            # entries_pending_delete
-                                            if text == 'entriespendingdelete':
-                                                etree_dict['entries_pending_delete'] = int(key.text)
-                                            # hwm_entries_pending_delete
-                                            if text == 'hwmentriespendingdelete':
-                                                etree_dict['hwm_entries_pending_delete'] = int(key.text)
-                                            # bgp_paths_per_hwm_attr
-                                            if text == 'pathsperattribute':
-                                                etree_dict['bgp_paths_per_hwm_attr'] = int(key.text)
-                                            # bgp_as_path_entries
-                                            if text == 'aspathentries':
-                                                etree_dict['bgp_as_path_entries'] = int(key.text)
-                                            # bytes_used_as_path_entries
-                                            if text == 'aspathbytes':
-                                                etree_dict['bytes_used_as_path_entries'] = int(key.text)
-                                            
-                                            if text == 'TABLE_vrf':
-                                                for table_vrf in key:
-                                                    for row_vrf in table_vrf:
-                                                        vrf_tag = row_vrf.tag[row_vrf.tag.find('}')+1:]
-
-                                                        # vrf
-                                                        #   vrf_name
-                                                        if vrf_tag == 'vrf-name-out':
-                                                            vrf_name = row_vrf.text
-                                                            if 'vrf' not in etree_dict:
-                                                                etree_dict['vrf'] = {}
-                                                            if vrf_name not in etree_dict['vrf']:
-                                                                etree_dict['vrf'][vrf_name] = {}
-                                                                vrf_dict = etree_dict['vrf'][vrf_name]
-                                                        # vrf_id
-                                                        if vrf_tag == 'vrf-id':
-                                                            vrf_dict['vrf_id'] = row_vrf.text
-                                                        # vrf_state
-                                                        if vrf_tag == 'vrf-state':
-                                                            vrf_dict['vrf_state'] = str(row_vrf.text).lower()
-                                                        # router_id
-                                                        if vrf_tag == 'vrf-router-id':
-                                                            vrf_dict['router_id'] = row_vrf.text
-                                                        # conf_router_id
-                                                        if vrf_tag == 'vrf-cfgd-id':
-                                                            vrf_dict['conf_router_id'] = row_vrf.text
-                                                        # confed_id
-                                                        if vrf_tag == 'vrf-confed-id':
-                                                            vrf_dict['confed_id'] = int(row_vrf.text)
-                                                        # cluster_id
-                                                        if vrf_tag == 'vrf-cluster-id':
-                                                           vrf_dict['cluster_id'] = row_vrf.text
-                                                        # num_conf_peers
-                                                        if vrf_tag == 'vrf-peers':
-                                                            vrf_dict['num_conf_peers'] = int(row_vrf.text)
-                                                        # num_pending_conf_peers
-                                                        if vrf_tag == 'vrf-pending-peers':
-                                                            vrf_dict['num_pending_conf_peers'] = int(row_vrf.text)
-                                                        # num_established_peers
-                                                        if vrf_tag == 'vrf-est-peers':
-                                                            vrf_dict['num_established_peers'] = int(row_vrf.text)
-                                                            vrf_dict['vrf_rd'] = 'not configured'
-                                                        # vrf_rd
-                                                        if vrf_tag == 'vrf-rd':
-                                                            vrf_dict['vrf_rd'] = row_vrf.text
-
-                                                        if vrf_tag == 'TABLE_af':
-                                                            for table_af in row_vrf:
-                                                                for row_af in table_af:
-                                                                    af_tag = row_af.tag[row_af.tag.find('}')+1:]
-
-                                                                    # address_family
-                                                                    #   address_family_name
-                                                                    if af_tag == 'af-name':
-                                                                        address_family_name = str(row_af.text).lower()
-                                                                        if 'address_family' not in etree_dict['vrf'][vrf_name]:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'] = {}
-                                                                        if address_family_name not in etree_dict['vrf'][vrf_name]['address_family']:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'][address_family_name] = {}
-                                                                            af_dict = etree_dict['vrf'][vrf_name]['address_family'][address_family_name]
-                                                                        # Initialize empty lists
-                                                                        export_rt_list = ''
-                                                                        import_rt_list = ''
-                                                                    # table_id
-                                                                    if af_tag == 'af-table-id':
-                                                                        table_id = str(row_af.text)
-                                                                        if '0x' in table_id:
-                                                                            af_dict['table_id'] = table_id
-                                                                        else:
-                                                                            af_dict['table_id'] = '0x' + table_id
-                                                                    # table_state
-                                                                    if af_tag == 'af-state':
-                                                                        af_dict['table_state'] = str(row_af.text).lower()
-                                                                    # peers
-                                                                    if af_tag == 'af-num-peers':
-                                                                        peers = int(row_af.text)
-                                                                        if 'peers' not in af_dict:
-                                                                            af_dict['peers'] = {}
-                                                                        if peers not in af_dict['peers']:
-                                                                            af_dict['peers'][peers] = {}
-                                                                    # active_peers
-                                                                    if af_tag == 'af-num-active-peers':
-                                                                        af_dict['peers'][peers]['active_peers'] = int(row_af.text)
-                                                                    # routes
-                                                                    if af_tag == 'af-peer-routes':
-                                                                        af_dict['peers'][peers]['routes'] = int(row_af.text)
-                                                                    # paths
-                                                                    if af_tag == 'af-peer-paths':
-                                                                        af_dict['peers'][peers]['paths'] = int(row_af.text)
-                                                                    # networks
-                                                                    if af_tag == 'af-peer-networks':
-                                                                        af_dict['peers'][peers]['networks'] = int(row_af.text)
-                                                                    # aggregates
-                                                                    if af_tag == 'af-peer-aggregates':
-                                                                        af_dict['peers'][peers]['aggregates'] = int(row_af.text)
-                                                                    # route_reflector
-                                                                    if af_tag == 'af-rr':
-                                                                        if row_af.text == 'true':
-                                                                            af_dict['route_reflector'] = True
-                                                                    # next_hop_trigger_delay
-                                                                    #   critical
-                                                                    if af_tag == 'nexthop-trigger-delay-critical':
-                                                                        if 'next_hop_trigger_delay' not in af_dict:
-                                                                            af_dict['next_hop_trigger_delay'] = {}
-                                                                        af_dict['next_hop_trigger_delay']['critical'] = int(row_af.text)
-                                                                    # next_hop_trigger_delay
-                                                                    #   non_critical
-                                                                    if af_tag == 'nexthop-trigger-delay-non-critical':
-                                                                        af_dict['next_hop_trigger_delay']['non_critical'] = int(row_af.text)
-                                                                    # aggregate_label
-                                                                    if af_tag == 'af-aggregate-label':
-                                                                        af_dict['aggregate_label'] = row_af.text
-                                                                    # label_mode
-                                                                    if af_tag == 'af-label-mode':
-                                                                        af_dict['label_mode'] = row_af.text
-                                                                    # import_default_map
-                                                                    if af_tag == 'importdefault_map':
-                                                                        af_dict['import_default_map'] = row_af.text
-                                                                    # import_default_prefix_limit
-                                                                    if af_tag == 'importdefault_prefixlimit':
-                                                                        af_dict['import_default_prefix_limit'] = int(row_af.text)
-                                                                    # import_default_prefix_count
-                                                                    if af_tag == 'importdefault_prefixcount':
-                                                                        af_dict['import_default_prefix_count'] = int(row_af.text)
-                                                                    # export_default_map
-                                                                    if af_tag == 'exportdefault_map':
-                                                                        af_dict['export_default_map'] = row_af.text
-                                                                    # export_default_prefix_limit
-                                                                    if af_tag == 'exportdefault_prefixlimit':
-                                                                        af_dict['export_default_prefix_limit'] = int(row_af.text)
-                                                                    # export_default_prefix_count
-                                                                    if af_tag == 'exportdefault_prefixcount':
-                                                                        af_dict['export_default_prefix_count'] = int(row_af.text)
-
-                                                                    # TABLE_redist
-                                                                    #   ROW_redist
-                                                                    if af_tag == 'TABLE_redist':
-                                                                        for table_redist in row_af:
-                                                                            for row_redist in table_redist:
-                                                                                row_redist_tag = row_redist.tag[row_redist.tag.find('}')+1:]
-                                                                                # protocol
-                                                                                if row_redist_tag == 'protocol':
-                                                                                    protocol = row_redist.text
-                                                                                    if 'redistribution' not in af_dict:
-                                                                                        af_dict['redistribution'] = {}
-                                                                                    if protocol not in af_dict['redistribution']:
-                                                                                        af_dict['redistribution'][protocol] = {}
-                                                                                # route_map
-                                                                                if row_redist_tag == 'route-map':
-                                                                                    af_dict['redistribution'][protocol]['route_map'] = row_redist.text
-
-                                                                    # TABLE_evpn_export_rt
-                                                                    #   ROW_evpn_export_rt
-                                                                    if af_tag == 'TABLE_evpn_export_rt':
-                                                                        for table_evpn_export in row_af:
-                                                                            for row_export in table_evpn_export:
-                                                                                row_export_tag = row_export.tag[row_export.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_export_tag == 'evpn-export-rt':
-                                                                                    export_rt_list = str(export_rt_list + ' ' + row_export.text).strip()
-                                                                                    af_dict['export_rt_list'] = export_rt_list
-                                                                    # TABLE_evpn_import_rt
-                                                                    #   ROW_evpn_import_rt
-                                                                    if af_tag == 'TABLE_evpn_import_rt':
-                                                                        for table_evpn_import in row_af:
-                                                                            for row_import in table_evpn_import:
-                                                                                row_import_tag = row_import.tag[row_import.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_import_tag == 'evpn-import-rt':
-                                                                                    import_rt_list = str(import_rt_list + ' ' + row_import.text).strip()
-                                                                                    af_dict['import_rt_list'] = import_rt_list
-
-                                                                    # parsed all tags
-                                                                    continue
-                                                                                    
+        # The vrf rows come out of the stream before the leaves of the process
+        for row in XmlStream(out, rows=('ROW_vrf', '__readonly__')):
+            if local_name(row.tag) == 'ROW_vrf':
+                for row_vrf in row:
+                    vrf_tag = local_name(row_vrf.tag)
+
+                    # vrf
+                    #   vrf_name
+                    if vrf_tag == 'vrf-name-out':
+                        vrf_name = row_vrf.text
+                        if 'vrf' not in etree_dict:
+                            etree_dict['vrf'] = {}
+                        if vrf_name not in etree_dict['vrf']:
+                            etree_dict['vrf'][vrf_name] = {}
+                            vrf_dict = etree_dict['vrf'][vrf_name]
+                    # vrf_id
+                    if vrf_tag == 'vrf-id':
+                        vrf_dict['vrf_id'] = row_vrf.text
+                    # vrf_state
+                    if vrf_tag == 'vrf-state':
+                        vrf_dict['vrf_state'] = str(row_vrf.text).lower()
+                    # router_id
+                    if vrf_tag == 'vrf-router-id':
+                        vrf_dict['router_id'] = row_vrf.text
+                    # conf_router_id
+                    if vrf_tag == 'vrf-cfgd-id':
+                        vrf_dict['conf_router_id'] = row_vrf.text
+                    # confed_id
+                    if vrf_tag == 'vrf-confed-id':
+                        vrf_dict['confed_id'] = int(row_vrf.text)
+                    # cluster_id
+                    if vrf_tag == 'vrf-cluster-id':
+                       vrf_dict['cluster_id'] = row_vrf.text
+                    # num_conf_peers
+                    if vrf_tag == 'vrf-peers':
+                        vrf_dict['num_conf_peers'] = int(row_vrf.text)
+                    # num_pending_conf_peers
+                    if vrf_tag == 'vrf-pending-peers':
+                        vrf_dict['num_pending_conf_peers'] = int(row_vrf.text)
+                    # num_established_peers
+                    if vrf_tag == 'vrf-est-peers':
+                        vrf_dict['num_established_peers'] = int(row_vrf.text)
+                        vrf_dict['vrf_rd'] = 'not configured'
+                    # vrf_rd
+                    if vrf_tag == 'vrf-rd':
+                        vrf_dict['vrf_rd'] = row_vrf.text
+
+                    if vrf_tag == 'TABLE_af':
+                        for table_af in row_vrf:
+                            for row_af in table_af:
+                                af_tag = local_name(row_af.tag)
+
+                                # address_family
+                                #   address_family_name
+                                if af_tag == 'af-name':
+                                    address_family_name = str(row_af.text).lower()
+                                    if 'address_family' not in etree_dict['vrf'][vrf_name]:
+                                        etree_dict['vrf'][vrf_name]['address_family'] = {}
+                                    if address_family_name not in etree_dict['vrf'][vrf_name]['address_family']:
+                                        etree_dict['vrf'][vrf_name]['address_family'][address_family_name] = {}
+                                        af_dict = etree_dict['vrf'][vrf_name]['address_family'][address_family_name]
+                                    # Initialize empty lists
+                                    export_rt_list = ''
+                                    import_rt_list = ''
+                                # table_id
+                                if af_tag == 'af-table-id':
+                                    table_id = str(row_af.text)
+                                    if '0x' in table_id:
+                                        af_dict['table_id'] = table_id
+                                    else:
+                                        af_dict['table_id'] = '0x' + table_id
+                                # table_state
+                                if af_tag == 'af-state':
+                                    af_dict['table_state'] = str(row_af.text).lower()
+                                # peers
+                                if af_tag == 'af-num-peers':
+                                    peers = int(row_af.text)
+                                    if 'peers' not in af_dict:
+                                        af_dict['peers'] = {}
+                                    if peers not in af_dict['peers']:
+                                        af_dict['peers'][peers] = {}
+                                # active_peers
+                                if af_tag == 'af-num-active-peers':
+                                    af_dict['peers'][peers]['active_peers'] = int(row_af.text)
+                                # routes
+                                if af_tag == 'af-peer-routes':
+                                    af_dict['peers'][peers]['routes'] = int(row_af.text)
+                                # paths
+                                if af_tag == 'af-peer-paths':
+                                    af_dict['peers'][peers]['paths'] = int(row_af.text)
+                                # networks
+                                if af_tag == 'af-peer-networks':
+                                    af_dict['peers'][peers]['networks'] = int(row_af.text)
+                                # aggregates
+                                if af_tag == 'af-peer-aggregates':
+                                    af_dict['peers'][peers]['aggregates'] = int(row_af.text)
+                                # route_reflector
+                                if af_tag == 'af-rr':
+                                    if row_af.text == 'true':
+                                        af_dict['route_reflector'] = True
+                                # next_hop_trigger_delay
+                                #   critical
+                                if af_tag == 'nexthop-trigger-delay-critical':
+                                    if 'next_hop_trigger_delay' not in af_dict:
+                                        af_dict['next_hop_trigger_delay'] = {}
+                                    af_dict['next_hop_trigger_delay']['critical'] = int(row_af.text)
+                                # next_hop_trigger_delay
+                                #   non_critical
+                                if af_tag == 'nexthop-trigger-delay-non-critical':
+                                    af_dict['next_hop_trigger_delay']['non_critical'] = int(row_af.text)
+                                # aggregate_label
+                                if af_tag == 'af-aggregate-label':
+                                    af_dict['aggregate_label'] = row_af.text
+                                # label_mode
+                                if af_tag == 'af-label-mode':
+                                    af_dict['label_mode'] = row_af.text
+                                # import_default_map
+                                if af_tag == 'importdefault_map':
+                                    af_dict['import_default_map'] = row_af.text
+                                # import_default_prefix_limit
+                                if af_tag == 'importdefault_prefixlimit':
+                                    af_dict['import_default_prefix_limit'] = int(row_af.text)
+                                # import_default_prefix_count
+                                if af_tag == 'importdefault_prefixcount':
+                                    af_dict['import_default_prefix_count'] = int(row_af.text)
+                                # export_default_map
+                                if af_tag == 'exportdefault_map':
+                                    af_dict['export_default_map'] = row_af.text
+                                # export_default_prefix_limit
+                                if af_tag == 'exportdefault_prefixlimit':
+                                    af_dict['export_default_prefix_limit'] = int(row_af.text)
+                                # export_default_prefix_count
+                                if af_tag == 'exportdefault_prefixcount':
+                                    af_dict['export_default_prefix_count'] = int(row_af.text)
+
+                                # TABLE_redist
+                                #   ROW_redist
+                                if af_tag == 'TABLE_redist':
+                                    for table_redist in row_af:
+                                        for row_redist in table_redist:
+                                            row_redist_tag = local_name(row_redist.tag)
+                                            # protocol
+                                            if row_redist_tag == 'protocol':
+                                                protocol = row_redist.text
+                                                if 'redistribution' not in af_dict:
+                                                    af_dict['redistribution'] = {}
+                                                if protocol not in af_dict['redistribution']:
+                                                    af_dict['redistribution'][protocol] = {}
+                                            # route_map
+                                            if row_redist_tag == 'route-map':
+                                                af_dict['redistribution'][protocol]['route_map'] = row_redist.text
+
+                                # TABLE_evpn_export_rt
+                                #   ROW_evpn_export_rt
+                                if af_tag == 'TABLE_evpn_export_rt':
+                                    for table_evpn_export in row_af:
+                                        for row_export in table_evpn_export:
+                                            row_export_tag = local_name(row_export.tag)
+                                            # export_rt_list
+                                            if row_export_tag == 'evpn-export-rt':
+                                                export_rt_list = str(export_rt_list + ' ' + row_export.text).strip()
+                                                af_dict['export_rt_list'] = export_rt_list
+                                # TABLE_evpn_import_rt
+                                #   ROW_evpn_import_rt
+                                if af_tag == 'TABLE_evpn_import_rt':
+                                    for table_evpn_import in row_af:
+                                        for row_import in table_evpn_import:
+                                            row_import_tag = local_name(row_import.tag)
+                                            # export_rt_list
+                                            if row_import_tag == 'evpn-import-rt':
+                                                import_rt_list = str(import_rt_list + ' ' + row_import.text).strip()
+                                                af_dict['import_rt_list'] = import_rt_list
+
+                                # parsed all tags
+                                continue
+                continue
+
+            for key in row:
+                # Get key text
+                text = local_name(key.tag)
+                # bgp_pid
+                if text == 'processid':
+                    etree_dict['bgp_pid'] = int(key.text)
+                # bgp_protocol_started_reason
+                if text == 'protocolstartedreason':
+                    etree_dict['bgp_protocol_started_reason'] = key.text
+                # bgp_tag
+                if text == 'protocoltag':
+                    etree_dict['bgp_tag'] = key.text
+                # bgp_protocol_state
+                if text == 'protocolstate':
+                    etree_dict['bgp_protocol_state'] = str(key.text).lower()
+                # bgp_isolate_mode
+                if text == 'isolatemode':
+                    etree_dict['bgp_isolate_mode'] = key.text
+                # bgp_mmode
+                if text == 'mmode':
+                    etree_dict['bgp_mmode'] = key.text
+                # bgp_memory_state
+                if text == 'memorystate':
+                    etree_dict['bgp_memory_state'] = str(key.text).lower()
+                # bgp_performance_mode
+                if text == 'forwardingstatesaved':
+                    if key.text == 'false':
+                        etree_dict['bgp_performance_mode'] = 'No'
+                    else:
+                        etree_dict['bgp_performance_mode'] = 'Yes'
+                # bgp_asformat
+                if text == 'asformat':
+                    etree_dict['bgp_asformat'] = key.text
+                if text == 'srgbmin':
+                    srgbin = key.text
+                if text == 'srgbmax':
+                    srgmax = key.text
+                    try:
+                        etree_dict['segment_routing_global_block'] = srgbin + '-' + srgmax
+                    except Exception:
+                        pass
+                # num_attr_entries
+                if text == 'attributeentries':
+                    etree_dict['num_attr_entries'] = int(key.text)
+                # hwm_attr_entries
+                if text == 'hwmattributeentries':
+                    etree_dict['hwm_attr_entries'] = int(key.text)
+                # bytes_used
+                if text == 'bytesused':
+                    etree_dict['bytes_used'] = int(key.text)
+                # entries_pending_delete
+                if text == 'entriespendingdelete':
+                    etree_dict['entries_pending_delete'] = int(key.text)
+                # hwm_entries_pending_delete
+                if text == 'hwmentriespendingdelete':
+                    etree_dict['hwm_entries_pending_delete'] = int(key.text)
+                # bgp_paths_per_hwm_attr
+                if text == 'pathsperattribute':
+                    etree_dict['bgp_paths_per_hwm_attr'] = int(key.text)
+                # bgp_as_path_entries
+                if text == 'aspathentries':
+                    etree_dict['bgp_as_path_entries'] = int(key.text)
+                # bytes_used_as_path_entries
+                if text == 'aspathbytes':
+                    etree_dict['bytes_used_as_path_entries'] = int(key.text)
+
         return etree_dict
 
     def yang(self, vrf=''):
@@ -1740,15 +1731,32 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
         else:
             out = output
 
-        # Init dictionary
-        parsed_dict = {}
-        af_dict = {}
-        prefix_dict = {}
+        # The dict result is the fold of the route records
+        return fold_records(self.iter_routes(out.splitlines()))
+
+    def iter_routes(self, lines):
+        '''Parse the output line by line and yield the route records
+
+            Args:
+                lines (`iterable`): lines of the output, ex: a file object
+
+            Yields:
+                (keys, values) records, see genie.libs.parser.utils.stream.
+                The paths of a prefix are yielded, ordered by next hop, as
+                soon as the next prefix starts:
+                (('vrf', vrf, 'address_family', af, 'prefixes', prefix,
+                  'index', index), {'next_hop': ..., ...})
+        '''
 
         # Init vars
         index = 1
         data_on_nextline = False
         bgp_table_version = local_router_id = ''
+        # Keys of the address family, and the paths of the prefix being
+        # parsed, held until all of them are read
+        af_keys = ()
+        path_keys = None
+        paths = {}
 
         p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
         p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF'
@@ -1793,7 +1801,29 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                                 ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
                                 ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
 
-        for line in out.splitlines():
+        # Metric     LocPrf     Weight Path
+        #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
+        p5_1 = re.compile(r'^(?P<metric>[0-9]+)'
+                           '(?P<space1>\s{5,10})'
+                           '(?P<localprf>[0-9]+)'
+                           '(?P<space2>\s{5,10})'
+                           '(?P<weight>[0-9]+)'
+                           '(?: *(?P<path>[0-9\{\}\s]+))?$')
+
+        #    100        ---          0 10 20 30 40 50 60 70 80 90
+        #    ---        100          0 10 20 30 40 50 60 70 80 90
+        #    100        ---      32788 ---
+        #    ---        100      32788 ---
+        p5_2 = re.compile(r'^(?P<value>[0-9]+)'
+                           '(?P<space>\s{2,21})'
+                           '(?P<weight>[0-9]+)'
+                           '(?: *(?P<path>[0-9\{\}\s]+))?$')
+
+        #    ---        ---      32788 200 33299 51178 47751 {27016}
+        p5_3 = re.compile(r'^(?P<weight>[0-9]+)'
+                           ' +(?P<path>[0-9\{\}\s]+)$')
+
+        for line in lines:
             line = line.rstrip()
             # Network            Next Hop            Metric     LocPrf     Weight Path
             m = p.match(line)
@@ -1807,18 +1837,10 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                 vrf_name = str(m.groupdict()['vrf_name'])
                 address_family = str(m.groupdict()['address_family']).lower()
                 original_address_family = address_family
-                if 'vrf' not in parsed_dict:
-                    parsed_dict['vrf'] = {}
-                if vrf_name not in parsed_dict['vrf']:
-                    parsed_dict['vrf'][vrf_name] = {}
-                if 'address_family' not in parsed_dict['vrf'][vrf_name]:
-                    parsed_dict['vrf'][vrf_name]['address_family'] = {}
-                if address_family not in parsed_dict['vrf'][vrf_name]\
-                    ['address_family']:
-                    parsed_dict['vrf'][vrf_name]['address_family'][address_family] = {}
 
-                # Set af_dict
-                af_dict = parsed_dict['vrf'][vrf_name]['address_family'][address_family]
+                # Set af_keys
+                af_keys = ('vrf', vrf_name, 'address_family', address_family)
+                yield af_keys, {}
                 continue
 
             # BGP table version is 35, local router ID is 10.229.11.11
@@ -1827,8 +1849,9 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = str(m.groupdict()['local_router_id'])
-                af_dict['bgp_table_version'] = bgp_table_version
-                af_dict['local_router_id'] = local_router_id
+                if af_keys:
+                    yield af_keys, {'bgp_table_version': bgp_table_version,
+                                    'local_router_id': local_router_id}
                 continue
 
             #                     20:47::21a:1ff:fe00:161/128
@@ -1844,8 +1867,10 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                         index += 1
 
                     # Init dict
-                    index_dict = af_dict.setdefault('prefixes', {}).setdefault(prefix, {})\
-                      .setdefault('index', {}).setdefault(index, {})
+                    if path_keys != (af_keys, prefix):
+                        yield from self._prefix_records(path_keys, paths)
+                        path_keys, paths = (af_keys, prefix), {}
+                    index_dict = paths.setdefault(index, {})
 
                     # Set keys
                     index_dict['next_hop'] = next_hop
@@ -1876,45 +1901,30 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                 if status_codes == 'None' or path_type == 'None' or prefix == 'None':
                     continue
                 # Init dict
-                if 'prefixes' not in af_dict:
-                    af_dict['prefixes'] = {}
-                if prefix not in af_dict['prefixes']:
-                    af_dict['prefixes'][prefix] = {}
-                if 'index' not in af_dict['prefixes'][prefix]:
-                    af_dict['prefixes'][prefix]['index'] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
+                if path_keys != (af_keys, prefix):
+                    yield from self._prefix_records(path_keys, paths)
+                    path_keys, paths = (af_keys, prefix), {}
+                index_dict = paths.setdefault(index, {})
 
                 # Set keys
-                af_dict['prefixes'][prefix]['index'][index]['status_codes'] = status_codes
-                af_dict['prefixes'][prefix]['index'][index]['path_type'] = path_type
+                index_dict['status_codes'] = status_codes
+                index_dict['path_type'] = path_type
                 if 'next_hop' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['next_hop'] = str(m.groupdict()['next_hop'])
+                    index_dict['next_hop'] = str(m.groupdict()['next_hop'])
                 if 'metric' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m.groupdict()['metric'])
+                    index_dict['metric'] = int(m.groupdict()['metric'])
                 if 'localprf' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m.groupdict()['localprf'])
+                    index_dict['localprf'] = int(m.groupdict()['localprf'])
                 if 'weight' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m.groupdict()['weight'])
+                    index_dict['weight'] = int(m.groupdict()['weight'])
                 if 'path' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['path'] = m.groupdict()['path'].strip()
-                if 'origin_codes' in m.groupdict():                
-                    af_dict['prefixes'][prefix]['index'][index]['origin_codes'] = str(m.groupdict()['origin_codes'])
+                    index_dict['path'] = m.groupdict()['path'].strip()
+                if 'origin_codes' in m.groupdict():
+                    index_dict['origin_codes'] = str(m.groupdict()['origin_codes'])
                 
                 # Check if aggregate_address_ipv4_address
                 if 'a' in path_type:
-                    address, mask = prefix.split("/")
-                    if ':' in prefix:
-                        af_dict['v6_aggregate_address_ipv6_address'] = prefix
-                        af_dict['v6_aggregate_address_as_set'] = True
-                        af_dict['v6_aggregate_address_summary_only'] = True
-                        continue
-                    else:
-                        af_dict['aggregate_address_ipv4_address'] = address
-                        af_dict['aggregate_address_ipv4_mask'] = mask
-                        af_dict['aggregate_address_as_set'] = True
-                        af_dict['aggregate_address_summary_only'] = True
-                        continue
+                    yield from self._aggregate_records(af_keys, prefix)
                 continue
 
 
@@ -1942,73 +1952,50 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                     index += 1
 
                 # Init dict
-                if 'prefixes' not in af_dict:
-                    af_dict['prefixes'] = {}
-                if prefix not in af_dict['prefixes']:
-                    af_dict['prefixes'][prefix] = {}
-                if 'index' not in af_dict['prefixes'][prefix]:
-                    af_dict['prefixes'][prefix]['index'] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
+                if path_keys != (af_keys, prefix):
+                    yield from self._prefix_records(path_keys, paths)
+                    path_keys, paths = (af_keys, prefix), {}
+                index_dict = paths.setdefault(index, {})
 
                 # Set keys
-                af_dict['prefixes'][prefix]['index'][index]['next_hop'] = next_hop
-                af_dict['prefixes'][prefix]['index'][index]['origin_codes'] = origin_codes
+                index_dict['next_hop'] = next_hop
+                index_dict['origin_codes'] = origin_codes
 
                 try:
                     # Set values of status_codes and path_type from prefix line
-                    af_dict['prefixes'][prefix]['index'][index]['status_codes'] = status_codes
-                    af_dict['prefixes'][prefix]['index'][index]['path_type'] = path_type
+                    index_dict['status_codes'] = status_codes
+                    index_dict['path_type'] = path_type
                 except Exception:
                     pass
 
                 # Parse numbers
                 numbers = m.groupdict()['numbers']
-                
-                # Metric     LocPrf     Weight Path
-                #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
-
-                #    100        ---          0 10 20 30 40 50 60 70 80 90
-                #    ---        100          0 10 20 30 40 50 60 70 80 90
-                #    100        ---      32788 ---
-                #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
-
-                #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m1 = p5_1.match(numbers)
+                m2 = p5_2.match(numbers)
+                m3 = p5_3.match(numbers)
 
                 if m1:
-                    af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
-                    af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m1.groupdict()['localprf'])
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m1.groupdict()['weight'])
+                    index_dict['metric'] = int(m1.groupdict()['metric'])
+                    index_dict['localprf'] = int(m1.groupdict()['localprf'])
+                    index_dict['weight'] = int(m1.groupdict()['weight'])
                     # Set path
                     if m1.groupdict()['path']:
-                        af_dict['prefixes'][prefix]['index'][index]['path'] = m1.groupdict()['path'].strip()
+                        index_dict['path'] = m1.groupdict()['path'].strip()
                         continue
                 elif m2:
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m2.groupdict()['weight'])
+                    index_dict['weight'] = int(m2.groupdict()['weight'])
                     # Set metric or localprf
                     if len(m2.groupdict()['space']) > 10:
-                        af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m2.groupdict()['value'])
+                        index_dict['metric'] = int(m2.groupdict()['value'])
                     else:
-                        af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m2.groupdict()['value'])
+                        index_dict['localprf'] = int(m2.groupdict()['value'])
                     # Set path
                     if m2.groupdict()['path']:
-                        af_dict['prefixes'][prefix]['index'][index]['path'] = m2.groupdict()['path'].strip()
+                        index_dict['path'] = m2.groupdict()['path'].strip()
                         continue
                 elif m3:
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m3.groupdict()['weight'])
-                    af_dict['prefixes'][prefix]['index'][index]['path'] = m3.groupdict()['path'].strip()
+                    index_dict['weight'] = int(m3.groupdict()['weight'])
+                    index_dict['path'] = m3.groupdict()['path'].strip()
                     continue
                 continue
 
@@ -2021,30 +2008,20 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
                 
-                # Init dict
-                if 'address_family' not in parsed_dict['vrf'][vrf_name]:
-                    parsed_dict['vrf'][vrf_name]['address_family'] = {}
-                if new_address_family not in parsed_dict['vrf'][vrf_name]['address_family']:
-                    parsed_dict['vrf'][vrf_name]['address_family'][new_address_family] = {}
-                
                 # Set keys
-                parsed_dict['vrf'][vrf_name]['address_family'][new_address_family]['bgp_table_version'] = bgp_table_version
-                parsed_dict['vrf'][vrf_name]['address_family'][new_address_family]['local_router_id'] = local_router_id
-                parsed_dict['vrf'][vrf_name]['address_family'][new_address_family]['route_distinguisher'] = route_distinguisher
-
+                af_dict = {'bgp_table_version': bgp_table_version,
+                           'local_router_id': local_router_id,
+                           'route_distinguisher': route_distinguisher}
 
                 if m.groupdict()['default_vrf']:
-                    parsed_dict['vrf'][vrf_name]['address_family']\
-                        [new_address_family]['default_vrf'] = \
-                            str(m.groupdict()['default_vrf'])
+                    af_dict['default_vrf'] = str(m.groupdict()['default_vrf'])
                 elif m.groupdict()['default_vrf1']:
-                    parsed_dict['vrf'][vrf_name]['address_family']\
-                        [new_address_family]['default_vrf'] = \
-                            str(m.groupdict()['default_vrf1'])
+                    af_dict['default_vrf'] = str(m.groupdict()['default_vrf1'])
 
-                # Reset address_family key and af_dict for use in other regex
+                # Reset address_family key and af_keys for use in other regex
                 address_family = new_address_family
-                af_dict = parsed_dict['vrf'][vrf_name]['address_family'][address_family]
+                af_keys = ('vrf', vrf_name, 'address_family', address_family)
+                yield af_keys, af_dict
                 continue
 
             # Network            Next Hop            Metric     LocPrf     Weight Path
@@ -2076,109 +2053,83 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                 origin_codes = str(m.groupdict()['origin_codes'])
 
                 # Init dict
-                if 'prefixes' not in af_dict:
-                    af_dict['prefixes'] = {}
-                if prefix not in af_dict['prefixes']:
-                    af_dict['prefixes'][prefix] = {}
-                if 'index' not in af_dict['prefixes'][prefix]:
-                    af_dict['prefixes'][prefix]['index'] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
+                if path_keys != (af_keys, prefix):
+                    yield from self._prefix_records(path_keys, paths)
+                    path_keys, paths = (af_keys, prefix), {}
+                index_dict = paths.setdefault(index, {})
 
                 # Set keys
-                af_dict['prefixes'][prefix]['index'][index]['status_codes'] = status_codes
-                af_dict['prefixes'][prefix]['index'][index]['path_type'] = path_type
-                af_dict['prefixes'][prefix]['index'][index]['next_hop'] = next_hop
-                af_dict['prefixes'][prefix]['index'][index]['origin_codes'] = origin_codes
+                index_dict['status_codes'] = status_codes
+                index_dict['path_type'] = path_type
+                index_dict['next_hop'] = next_hop
+                index_dict['origin_codes'] = origin_codes
 
                 # Parse numbers
                 numbers = m.groupdict()['numbers']
-                
-                # Metric     LocPrf     Weight Path
-                #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
-
-                #    100        ---          0 10 20 30 40 50 60 70 80 90
-                #    ---        100          0 10 20 30 40 50 60 70 80 90
-                #    100        ---      32788 ---
-                #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
-
-                #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m1 = p5_1.match(numbers)
+                m2 = p5_2.match(numbers)
+                m3 = p5_3.match(numbers)
 
                 if m1:
-                    af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
-                    af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m1.groupdict()['localprf'])
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m1.groupdict()['weight'])
+                    index_dict['metric'] = int(m1.groupdict()['metric'])
+                    index_dict['localprf'] = int(m1.groupdict()['localprf'])
+                    index_dict['weight'] = int(m1.groupdict()['weight'])
                     # Set path
                     if m1.groupdict()['path']:
-                        af_dict['prefixes'][prefix]['index'][index]['path'] = m1.groupdict()['path'].strip()
+                        index_dict['path'] = m1.groupdict()['path'].strip()
                 elif m2:
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m2.groupdict()['weight'])
+                    index_dict['weight'] = int(m2.groupdict()['weight'])
                     # Set metric or localprf
                     if len(m2.groupdict()['space']) > 10:
-                        af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m2.groupdict()['value'])
+                        index_dict['metric'] = int(m2.groupdict()['value'])
                     else:
-                        af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m2.groupdict()['value'])
+                        index_dict['localprf'] = int(m2.groupdict()['value'])
                     # Set path
                     if m2.groupdict()['path']:
-                        af_dict['prefixes'][prefix]['index'][index]['path'] = m2.groupdict()['path'].strip()
+                        index_dict['path'] = m2.groupdict()['path'].strip()
                 elif m3:
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m3.groupdict()['weight'])
-                    af_dict['prefixes'][prefix]['index'][index]['path'] = m3.groupdict()['path'].strip()
+                    index_dict['weight'] = int(m3.groupdict()['weight'])
+                    index_dict['path'] = m3.groupdict()['path'].strip()
 
                 # Check if aggregate_address_ipv4_address
                 if 'a' in path_type:
-                    address, mask = prefix.split("/")
-                    if ':' in prefix:
-                        af_dict['v6_aggregate_address_ipv6_address'] = prefix
-                        af_dict['v6_aggregate_address_as_set'] = True
-                        af_dict['v6_aggregate_address_summary_only'] = True
-                        continue
-                    else:
-                        af_dict['aggregate_address_ipv4_address'] = address
-                        af_dict['aggregate_address_ipv4_mask'] = mask
-                        af_dict['aggregate_address_as_set'] = True
-                        af_dict['aggregate_address_summary_only'] = True
-                        continue
-                continue
-
-        # order the af prefixes index
-        # return dict when parsed dictionary is empty
-        if 'vrf' not in parsed_dict:
-            return parsed_dict
-
-        for vrf_name in parsed_dict['vrf']:
-            if 'address_family' not in parsed_dict['vrf'][vrf_name]:
-                continue
-            for af in parsed_dict['vrf'][vrf_name]['address_family']:
-                af_dict = parsed_dict['vrf'][vrf_name]['address_family'][af]
-                if 'prefixes' in af_dict:
-                    for prefixes in af_dict['prefixes']:
-                        if len(af_dict['prefixes'][prefixes]['index'].keys()) > 1:                            
-                            ind = 1
-                            nexthop_dict = {}
-                            sorted_list = sorted(af_dict['prefixes'][prefixes]['index'].items(),
-                                               key = lambda x:x[1]['next_hop'])
-                            for i, j in enumerate(sorted_list):
-                                nexthop_dict[ind] = af_dict['prefixes'][prefixes]['index'][j[0]]
-                                ind += 1
-                            del(af_dict['prefixes'][prefixes]['index'])
-                            af_dict['prefixes'][prefixes]['index'] = nexthop_dict
-
-        return parsed_dict
+                    yield from self._aggregate_records(af_keys, prefix)
+                continue
+
+        yield from self._prefix_records(path_keys, paths)
+
+    @staticmethod
+    def _prefix_records(path_keys, paths):
+        '''Yield the paths of a prefix, indexed in the order of their next
+           hop when there are more than one'''
+
+        # Paths read before any address family are dropped
+        if not path_keys or not path_keys[0]:
+            return
+        af_keys, prefix = path_keys
+        keys = af_keys + ('prefixes', prefix, 'index')
+        if len(paths) > 1:
+            paths = dict(enumerate(sorted(paths.values(),
+                                          key=lambda x: x['next_hop']),
+                                   start=1))
+        for index, index_dict in paths.items():
+            yield keys + (index,), index_dict
+
+    @staticmethod
+    def _aggregate_records(af_keys, prefix):
+        '''Yield the aggregate address of the address family'''
+        if not af_keys:
+            return
+        address, mask = prefix.split("/")
+        if ':' in prefix:
+            yield af_keys, {'v6_aggregate_address_ipv6_address': prefix,
+                            'v6_aggregate_address_as_set': True,
+                            'v6_aggregate_address_summary_only': True}
+        else:
+            yield af_keys, {'aggregate_address_ipv4_address': address,
+                            'aggregate_address_ipv4_mask': mask,
+                            'aggregate_address_as_set': True,
+                            'aggregate_address_summary_only': True}
 
 
 # ==============================================
@@ -3204,7 +3155,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
         # Execute YANG 'get' operational state RPC and parse the XML
         bgpOC = BgpOpenconfigYang(self.device)
-        yang_dict = bgpOC.yang()
+        yang_dict = bgpOC.yang(subtree='neighbors')
 
         if 'vrf' in yang_dict:
             for vrf_name in yang_dict['vrf']:
@@ -3837,313 +3788,293 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
 
         return sum_dict
 
-    def xml(self, vrf='all', address_family='all'):
+    def _xml_address_family(self, vrf_tree, saf_root, namespace):
+        '''vrf, address family and attributes of the address family of a
+           ROW_saf, None when they are not in the row'''
+        # vrf
+        try:
+            vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
+        except Exception:
+            return None
 
-        out = self.device.execute(self.xml_command.format(vrf=vrf))
+        # <vrf-router-id>10.106.0.6</vrf-router-id>
+        try:
+            route_identifier = vrf_tree.find('{}vrf-router-id'.format(namespace)).text
+        except Exception:
+            route_identifier = None
 
-        etree_dict = {}
+        # <vrf-local-as>333</vrf-local-as>
+        try:
+            local_as = vrf_tree.find('{}vrf-local-as'.format(namespace)).text
+        except Exception:
+            local_as = None
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
+        # neighbor
+        try:
+            af = saf_root.find('{}af-name'.format(namespace)).text
+            af = af.lower()
+            # initial af dictionary
+            af_dict = {}
+            if route_identifier:
+                af_dict['route_identifier'] = route_identifier
+            if local_as:
+                af_dict['local_as'] = int(local_as)
+        except Exception:
+            return None
 
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
+        # <tableversion>7</tableversion>
         try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
+            af_dict['bgp_table_version'] = int(
+                saf_root.find('{}tableversion'.format(namespace)).text)
         except Exception:
-            return etree_dict
+            # for valide entry, table version should be there
+            return None
 
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=self.cli_command[2].format(vrf=vrf,
-                                                                              address_family=address_family))
+        # <configuredpeers>3</configuredpeers>
+        af_dict['config_peers'] = \
+            int(saf_root.find('{}configuredpeers'.format(namespace)).text)
 
-        # find Vrf root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
+        # <capablepeers>2</capablepeers>
+        af_dict['capable_peers'] = \
+            int(saf_root.find('{}capablepeers'.format(namespace)).text)
 
-        if not root:
-            return etree_dict
+        # <totalnetworks>5</totalnetworks>
+        try:
+            total_prefix_entries = \
+                int(saf_root.find('{}totalnetworks'.format(namespace)).text)
+            if 'prefixes' not in af_dict:
+                af_dict['prefixes'] = {}
+            af_dict['prefixes']['total_entries'] = total_prefix_entries
+        except Exception:
+            pass
 
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
+        # <totalpaths>10</totalpaths>
+        try:
+            total_path_entries = \
+                int(saf_root.find('{}totalpaths'.format(namespace)).text)
+            if 'path' not in af_dict:
+                af_dict['path'] = {}
+            af_dict['path']['total_entries'] = total_path_entries
+        except Exception:
+            pass
 
-            # <vrf-router-id>10.106.0.6</vrf-router-id>
-            try:
-                route_identifier = vrf_tree.find('{}vrf-router-id'.format(namespace)).text
-            except Exception:
-                route_identifier = None
+        # <memoryused>1820</memoryused>
+        try:
+            memory_usage = \
+                int(saf_root.find('{}memoryused'.format(namespace)).text)
+            af_dict['path']['memory_usage'] = memory_usage
+            af_dict['prefixes']['memory_usage'] = memory_usage
+        except Exception:
+            pass
 
-            # <vrf-local-as>333</vrf-local-as>
-            try:
-                local_as = vrf_tree.find('{}vrf-local-as'.format(namespace)).text
-            except Exception:
-                local_as = None
+        try:
+            # <numberattrs>1</numberattrs>
+            entries_1 = \
+                saf_root.find('{}numberattrs'.format(namespace)).text
 
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_af'.format(namespace))
-            if not af_tree:
-                continue
-            for af_root in af_tree.findall('{}ROW_af'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_saf'.format(namespace))
-                if not saf_tree:
-                    continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_saf'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                        # initial af dictionary
-                        af_dict = {}
-                        if route_identifier:
-                            af_dict['route_identifier'] = route_identifier
-                        if local_as:
-                            af_dict['local_as'] = int(local_as)
-                    except Exception:
-                        continue
+            # <bytesattrs>160</bytesattrs>
+            entries_2 = \
+                saf_root.find('{}bytesattrs'.format(namespace)).text
 
-                    # <tableversion>7</tableversion>
-                    try:
-                        af_dict['bgp_table_version'] = int(
-                            saf_root.find('{}tableversion'.format(namespace)).text)
-                    except Exception:
-                        # for valide entry, table version should be there
-                        continue
+            af_dict['attribute_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
+        except Exception:
+            pass
 
-                    # <configuredpeers>3</configuredpeers>
-                    af_dict['config_peers'] = \
-                        int(saf_root.find('{}configuredpeers'.format(namespace)).text)
-                        
-                    # <capablepeers>2</capablepeers>
-                    af_dict['capable_peers'] = \
-                        int(saf_root.find('{}capablepeers'.format(namespace)).text)
+        try:
+            # <numberpaths>1</numberpaths>
+            entries_1 = \
+                saf_root.find('{}numberpaths'.format(namespace)).text
 
-                    # <totalnetworks>5</totalnetworks>
-                    try:
-                        total_prefix_entries = \
-                            int(saf_root.find('{}totalnetworks'.format(namespace)).text)
-                        if 'prefixes' not in af_dict:
-                            af_dict['prefixes'] = {}
-                        af_dict['prefixes']['total_entries'] = total_prefix_entries
-                    except Exception:
-                        pass
-                        
-                    # <totalpaths>10</totalpaths>
-                    try:
-                        total_path_entries = \
-                            int(saf_root.find('{}totalpaths'.format(namespace)).text)
-                        if 'path' not in af_dict:
-                            af_dict['path'] = {}
-                        af_dict['path']['total_entries'] = total_path_entries
-                    except Exception:
-                        pass
-                        
-                    # <memoryused>1820</memoryused>
-                    try:
-                        memory_usage = \
-                            int(saf_root.find('{}memoryused'.format(namespace)).text)
-                        af_dict['path']['memory_usage'] = memory_usage
-                        af_dict['prefixes']['memory_usage'] = memory_usage
-                    except Exception:
-                        pass
+            # <bytespaths>34</bytespaths>
+            entries_2 = \
+                saf_root.find('{}bytespaths'.format(namespace)).text
 
-                    try:
-                        # <numberattrs>1</numberattrs>
-                        entries_1 = \
-                            saf_root.find('{}numberattrs'.format(namespace)).text
-                            
-                        # <bytesattrs>160</bytesattrs>
-                        entries_2 = \
-                            saf_root.find('{}bytesattrs'.format(namespace)).text
+            af_dict['as_path_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
+        except Exception:
+            pass
 
-                        af_dict['attribute_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberpaths>1</numberpaths>
-                        entries_1 = \
-                            saf_root.find('{}numberpaths'.format(namespace)).text
+        try:
+            # <numbercommunities>0</numbercommunities>
+            entries_1 = \
+                saf_root.find('{}numbercommunities'.format(namespace)).text
 
-                        # <bytespaths>34</bytespaths>
-                        entries_2 = \
-                            saf_root.find('{}bytespaths'.format(namespace)).text
+            # <bytescommunities>0</bytescommunities>
+            entries_2 = \
+                saf_root.find('{}bytescommunities'.format(namespace)).text
 
-                        af_dict['as_path_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numbercommunities>0</numbercommunities>
-                        entries_1 = \
-                            saf_root.find('{}numbercommunities'.format(namespace)).text
+            af_dict['community_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
+        except Exception:
+            pass
 
-                        # <bytescommunities>0</bytescommunities>
-                        entries_2 = \
-                            saf_root.find('{}bytescommunities'.format(namespace)).text
+        try:
+            # <numberclusterlist>0</numberclusterlist>
+            entries_1 = \
+                saf_root.find('{}numberclusterlist'.format(namespace)).text
 
-                        af_dict['community_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberclusterlist>0</numberclusterlist>
-                        entries_1 = \
-                            saf_root.find('{}numberclusterlist'.format(namespace)).text
+            # <bytesclusterlist>0</bytesclusterlist>
+            entries_2 = \
+                saf_root.find('{}bytesclusterlist'.format(namespace)).text
 
-                        # <bytesclusterlist>0</bytesclusterlist>
-                        entries_2 = \
-                            saf_root.find('{}bytesclusterlist'.format(namespace)).text
+            af_dict['clusterlist_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
+        except Exception:
+            pass
 
-                        af_dict['clusterlist_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
+        # <dampening>Enabled</dampening>
+        dampening = saf_root.find('{}dampening'.format(namespace)).text.lower()
+        if 'enabled' in dampening or 'true' in dampening:
+            af_dict['dampening'] = True
 
-                    # <dampening>Enabled</dampening>
-                    dampening = saf_root.find('{}dampening'.format(namespace)).text.lower()
-                    if 'enabled' in dampening or 'true' in dampening:
-                        af_dict['dampening'] = True
+        # <historypaths>0</historypaths>
+        try:
+            af_dict['history_paths'] = int(saf_root.find('{}historypaths'.format(namespace)).text)
+        except Exception:
+            pass
 
-                    # <historypaths>0</historypaths>
-                    try:
-                        af_dict['history_paths'] = int(saf_root.find('{}historypaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+        # <dampenedpaths>0</dampenedpaths>
+        try:
+            af_dict['dampened_paths'] = int(saf_root.find('{}dampenedpaths'.format(namespace)).text)
+        except Exception:
+            pass
 
-                    # <dampenedpaths>0</dampenedpaths>
-                    try:
-                        af_dict['dampened_paths'] = int(saf_root.find('{}dampenedpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+        # <softreconfigrecvdpaths>10</softreconfigrecvdpaths>
+        try:
+            af_dict['soft_reconfig_recvd_paths'] = int(
+                    saf_root.find('{}softreconfigrecvdpaths'.format(namespace)).text)
+        except Exception:
+            pass
 
-                    # <softreconfigrecvdpaths>10</softreconfigrecvdpaths>
-                    try:
-                        af_dict['soft_reconfig_recvd_paths'] = int(
-                                saf_root.find('{}softreconfigrecvdpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigidenticalpaths>10</softreconfigidenticalpaths>
-                    try:
-                        af_dict['soft_reconfig_identical_paths'] = int(
-                                saf_root.find('{}softreconfigidenticalpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+        # <softreconfigidenticalpaths>10</softreconfigidenticalpaths>
+        try:
+            af_dict['soft_reconfig_identical_paths'] = int(
+                    saf_root.find('{}softreconfigidenticalpaths'.format(namespace)).text)
+        except Exception:
+            pass
 
-                    # <softreconfigcombopaths>0</softreconfigcombopaths>
-                    try:
-                        af_dict['soft_reconfig_combo_paths'] = int(
-                                saf_root.find('{}softreconfigcombopaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+        # <softreconfigcombopaths>0</softreconfigcombopaths>
+        try:
+            af_dict['soft_reconfig_combo_paths'] = int(
+                    saf_root.find('{}softreconfigcombopaths'.format(namespace)).text)
+        except Exception:
+            pass
 
-                    # <softreconfigfilteredrecvd>0</softreconfigfilteredrecvd>
-                    try:
-                        af_dict['soft_reconfig_filtered_recvd'] = int(
-                                saf_root.find('{}softreconfigfilteredrecvd'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigbytes>0</softreconfigbytes>
-                    try:
-                        af_dict['soft_reconfig_bytes'] = int(
-                                saf_root.find('{}softreconfigbytes'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                     # Neighbor table
-                    nei_tree = saf_root.find('{}TABLE_neighbor'.format(namespace))
-                    if not nei_tree:
-                        continue
+        # <softreconfigfilteredrecvd>0</softreconfigfilteredrecvd>
+        try:
+            af_dict['soft_reconfig_filtered_recvd'] = int(
+                    saf_root.find('{}softreconfigfilteredrecvd'.format(namespace)).text)
+        except Exception:
+            pass
 
-                    # -----   loop neighbors  -----
-                    for nei_root in nei_tree.findall('{}ROW_neighbor'.format(namespace)):
-                        # neighbor
-                        try:
-                            nei = nei_root.find('{}neighborid'.format(namespace)).text
-                        except Exception:
-                            continue
+        # <softreconfigbytes>0</softreconfigbytes>
+        try:
+            af_dict['soft_reconfig_bytes'] = int(
+                    saf_root.find('{}softreconfigbytes'.format(namespace)).text)
+        except Exception:
+            pass
 
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
+        return vrf, af, af_dict
 
-                        if 'neighbor' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['neighbor'] = {}
-                        if nei not in etree_dict['vrf'][vrf]['neighbor']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei] = {}
+    def xml(self, vrf='all', address_family='all'):
 
-                        if 'address_family' not in etree_dict['vrf'][vrf]['neighbor'][nei]:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'] = {}
+        out = self.device.execute(self.xml_command.format(vrf=vrf))
 
-                        if af not in etree_dict['vrf'][vrf]['neighbor'][nei]['address_family']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af] = {}
-                    
-                        sub_dict = etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af]
+        etree_dict = {}
+        stream = XmlStream(out, rows='ROW_neighbor',
+                           command=self.cli_command[2].format(
+                               vrf=vrf, address_family=address_family))
+        saf_root = None
+        address_family_attr = None
+
+        # -----   loop neighbors  -----
+        for nei_root in stream:
+            namespace = stream.namespace
+
+            # Address family of the neighbors of a ROW_saf, read from its
+            # leaves with the first neighbor
+            if stream.ancestor('ROW_saf') is not saf_root:
+                saf_root = stream.ancestor('ROW_saf')
+                address_family_attr = self._xml_address_family(
+                    vrf_tree=stream.ancestor('ROW_vrf'), saf_root=saf_root,
+                    namespace=namespace)
+            if not address_family_attr:
+                continue
+            vrf, af, af_dict = address_family_attr
+
+            # neighbor
+            try:
+                nei = nei_root.find('{}neighborid'.format(namespace)).text
+            except Exception:
+                continue
 
-                        #  ---   AF attributes -------
-                        update_dict = deepcopy(af_dict)
-                        sub_dict.update(update_dict)
+            if 'vrf' not in etree_dict:
+                etree_dict['vrf'] = {}
+            if vrf not in etree_dict['vrf']:
+                etree_dict['vrf'][vrf] = {}
 
-                        #  ---   Neighbors attributes -------
-                        # <neighborversion>4</neighborversion>
-                        sub_dict['neighbor_table_version'] = int(
-                            nei_root.find('{}neighborversion'.format(namespace)).text)
+            if 'neighbor' not in etree_dict['vrf'][vrf]:
+                etree_dict['vrf'][vrf]['neighbor'] = {}
+            if nei not in etree_dict['vrf'][vrf]['neighbor']:
+                etree_dict['vrf'][vrf]['neighbor'][nei] = {}
 
-                        # <msgrecvd>5471</msgrecvd>
-                        sub_dict['msg_rcvd'] = int(
-                            nei_root.find('{}msgrecvd'.format(namespace)).text)
-                        
-                        # <msgsent>5459</msgsent>
-                        sub_dict['msg_sent'] = int(
-                            nei_root.find('{}msgsent'.format(namespace)).text)
-                        
-                        # <neighbortableversion>7</neighbortableversion>
-                        sub_dict['tbl_ver'] = int(
-                            nei_root.find('{}neighbortableversion'.format(namespace)).text)
-                        
-                        # <inq>0</inq>
-                        sub_dict['inq'] = int(
-                            nei_root.find('{}inq'.format(namespace)).text)
-                        
-                        # <outq>0</outq>
-                        sub_dict['outq'] = int(
-                            nei_root.find('{}outq'.format(namespace)).text)
-                        
-                        # <neighboras>333</neighboras>
-                        sub_dict['as'] = int(
-                            nei_root.find('{}neighboras'.format(namespace)).text)
-                        
-                        # <time>3d18h</time>
-                        sub_dict['up_down'] = \
-                            nei_root.find('{}time'.format(namespace)).text
-                        
-                        # <state>Established</state>
-                        state = nei_root.find('{}state'.format(namespace)).text.lower()
+            if 'address_family' not in etree_dict['vrf'][vrf]['neighbor'][nei]:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'] = {}
 
-                        # <prefixreceived>5</prefixreceived>
-                        prefix_received = \
-                            nei_root.find('{}prefixreceived'.format(namespace)).text
+            if af not in etree_dict['vrf'][vrf]['neighbor'][nei]['address_family']:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af] = {}
+
+            sub_dict = etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af]
+
+            #  ---   AF attributes -------
+            update_dict = deepcopy(af_dict)
+            sub_dict.update(update_dict)
+
+            #  ---   Neighbors attributes -------
+            # <neighborversion>4</neighborversion>
+            sub_dict['neighbor_table_version'] = int(
+                nei_root.find('{}neighborversion'.format(namespace)).text)
+
+            # <msgrecvd>5471</msgrecvd>
+            sub_dict['msg_rcvd'] = int(
+                nei_root.find('{}msgrecvd'.format(namespace)).text)
+
+            # <msgsent>5459</msgsent>
+            sub_dict['msg_sent'] = int(
+                nei_root.find('{}msgsent'.format(namespace)).text)
+
+            # <neighbortableversion>7</neighbortableversion>
+            sub_dict['tbl_ver'] = int(
+                nei_root.find('{}neighbortableversion'.format(namespace)).text)
+
+            # <inq>0</inq>
+            sub_dict['inq'] = int(
+                nei_root.find('{}inq'.format(namespace)).text)
+
+            # <outq>0</outq>
+            sub_dict['outq'] = int(
+                nei_root.find('{}outq'.format(namespace)).text)
+
+            # <neighboras>333</neighboras>
+            sub_dict['as'] = int(
+                nei_root.find('{}neighboras'.format(namespace)).text)
+
+            # <time>3d18h</time>
+            sub_dict['up_down'] = \
+                nei_root.find('{}time'.format(namespace)).text
+
+            # <state>Established</state>
+            state = nei_root.find('{}state'.format(namespace)).text.lower()
+
+            # <prefixreceived>5</prefixreceived>
+            prefix_received = \
+                nei_root.find('{}prefixreceived'.format(namespace)).text
+
+            if 'established' in state:
+                sub_dict['state'] = state
+                sub_dict['prefix_received'] = prefix_received
+                sub_dict['state_pfxrcd'] = prefix_received
+            else:
+                sub_dict['state'] = state
+                sub_dict['state_pfxrcd'] = state
 
-                        if 'established' in state:
-                            sub_dict['state'] = state
-                            sub_dict['prefix_received'] = prefix_received
-                            sub_dict['state_pfxrcd'] = prefix_received
-                        else:
-                            sub_dict['state'] = state
-                            sub_dict['state_pfxrcd'] = state
-                
         return etree_dict
 
 
@@ -4324,201 +4255,164 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
         out = self.device.execute(self.xml_command.format(vrf=vrf))
         etree_dict = {}
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=self.cli_command[1].format(vrf=vrf,
-                                                                              address_family=address_family))
+        stream = XmlStream(out, rows='ROW_rd',
+                           command=self.cli_command[1].format(
+                               vrf=vrf, address_family=address_family))
 
-        root = Common.retrieve_xml_child(
-                root=root,
-                key='TABLE_vrf')
+        # -----   loop rd  -----
+        for rd_root in stream:
+            namespace = stream.namespace
 
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
             # vrf
             try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
+                vrf = stream.ancestor('ROW_vrf').find(
+                    '{}vrf-name-out'.format(namespace)).text
             except Exception:
                 break
 
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_afi'.format(namespace))
-            if not af_tree:
+            # address family
+            try:
+                af = stream.ancestor('ROW_safi').find(
+                    '{}af-name'.format(namespace)).text
+                af = af.lower()
+            except Exception:
                 continue
-            for af_root in af_tree.findall('{}ROW_afi'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_safi'.format(namespace))
-                if not saf_tree:
-                    continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_safi'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                    except Exception:
-                        continue
 
-                     # RD table
-                    rd_tree = saf_root.find('{}TABLE_rd'.format(namespace))
-                    if not rd_tree:
-                        continue
+            # neighbor
+            try:
+                rd = rd_root.find('{}rd_val'.format(namespace)).text
+            except Exception:
+                rd = None
 
-                    # -----   loop rd  -----
-                    for rd_root in rd_tree.findall('{}ROW_rd'.format(namespace)):
+            if 'vrf' not in etree_dict:
+                etree_dict['vrf'] = {}
+            if vrf not in etree_dict['vrf']:
+                etree_dict['vrf'][vrf] = {}
 
-                        # neighbor
-                        try:
-                            rd = rd_root.find('{}rd_val'.format(namespace)).text
-                        except Exception:
-                            rd = None
+            if 'address_family' not in etree_dict['vrf'][vrf]:
+                etree_dict['vrf'][vrf]['address_family'] = {}
 
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
+            if af not in etree_dict['vrf'][vrf]['address_family']:
+                etree_dict['vrf'][vrf]['address_family'][af] = {}
 
-                        if 'address_family' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['address_family'] = {}
+            # dampening
+            etree_dict['vrf'][vrf]['address_family'][af]['dampening'] = 'True'
 
-                        if af not in etree_dict['vrf'][vrf]['address_family']:
-                            etree_dict['vrf'][vrf]['address_family'][af] = {}
+            if rd:
+                if 'route_distinguisher' not in etree_dict['vrf'][vrf]:
+                    etree_dict['vrf'][vrf]['address_family'][af]\
+                        ['route_distinguisher'] = {}
 
-                        # dampening
-                        etree_dict['vrf'][vrf]['address_family'][af]['dampening'] = 'True'
+                if rd not in etree_dict['vrf'][vrf]['address_family']:
+                    etree_dict['vrf'][vrf]['address_family'][af]\
+                        ['route_distinguisher'][rd] = {}
+                sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
+                        ['route_distinguisher'][rd]
+            else:
+                sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
 
-                        if rd:
-                            if 'route_distinguisher' not in etree_dict['vrf'][vrf]:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'] = {}
 
-                            if rd not in etree_dict['vrf'][vrf]['address_family']:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd] = {}
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd]
-                        else:
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
-                                    
+            # <dampconfigured>Configured</dampconfigured>
+            # cli does not have this key
 
-                        # <dampconfigured>Configured</dampconfigured>
-                        # cli does not have this key
+            # <rpmname>test</rpmname>
+            try:
+                sub_dict['dampening_route_map'] = \
+                    rd_root.find('{}rpmname'.format(namespace)).text
+            except Exception:
+                pass
 
-                        # <rpmname>test</rpmname>
-                        try:
-                            sub_dict['dampening_route_map'] = \
-                                rd_root.find('{}rpmname'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <rd_vrf>vpn2</rd_vrf>
+            try:
+                sub_dict['rd_vrf'] = \
+                    rd_root.find('{}rd_vrf'.format(namespace)).text
+            except Exception:
+                pass
 
-                        # <rd_vrf>vpn2</rd_vrf>
-                        try:
-                            sub_dict['rd_vrf'] = \
-                                rd_root.find('{}rd_vrf'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <rd_vniid>2</rd_vniid>
+            try:
+                sub_dict['rd_vni_id'] = \
+                    rd_root.find('{}rd_vniid'.format(namespace)).text
+            except Exception:
+                pass
 
-                        # <rd_vniid>2</rd_vniid>
-                        try:
-                            sub_dict['rd_vni_id'] = \
-                                rd_root.find('{}rd_vniid'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <damphalflife>1</damphalflife>
+            try:
+                sub_dict['dampening_half_life_time'] = \
+                    rd_root.find('{}damphalflife'.format(namespace)).text
+            except Exception:
+                pass
 
-                        # <damphalflife>1</damphalflife>
-                        try:
-                            sub_dict['dampening_half_life_time'] = \
-                                rd_root.find('{}damphalflife'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <dampsuppress>30</dampsuppress>
+            try:
+                sub_dict['dampening_suppress_time'] = \
+                    rd_root.find('{}dampsuppress'.format(namespace)).text
+            except Exception:
+                pass
 
-                        # <dampsuppress>30</dampsuppress>
-                        try:
-                            sub_dict['dampening_suppress_time'] = \
-                                rd_root.find('{}dampsuppress'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <dampreuse>10</dampreuse>
+            try:
+                sub_dict['dampening_reuse_time'] = \
+                    rd_root.find('{}dampreuse'.format(namespace)).text
+            except Exception:
+                pass
 
-                        # <dampreuse>10</dampreuse>
-                        try:
-                            sub_dict['dampening_reuse_time'] = \
-                                rd_root.find('{}dampreuse'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <dampsuppresstime>2</dampsuppresstime>
+            try:
+                sub_dict['dampening_max_suppress_time'] = \
+                    rd_root.find('{}dampsuppresstime'.format(namespace)).text
+            except Exception:
+                pass
 
-                        # <dampsuppresstime>2</dampsuppresstime>
-                        try:
-                            sub_dict['dampening_max_suppress_time'] = \
-                                rd_root.find('{}dampsuppresstime'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <dampmaxpenalty>40</dampmaxpenalty>
+            try:
+                sub_dict['dampening_max_suppress_penalty'] = \
+                    rd_root.find('{}dampmaxpenalty'.format(namespace)).text
+            except Exception:
+                pass
 
-                        # <dampmaxpenalty>40</dampmaxpenalty>
-                        try:
-                            sub_dict['dampening_max_suppress_penalty'] = \
-                                rd_root.find('{}dampmaxpenalty'.format(namespace)).text
-                        except Exception:
-                            pass
+            # TABLE_rpm
+            rpm_tree = rd_root.find('{}TABLE_rpm'.format(namespace))
+            if not rpm_tree:
+                continue
 
-                        # TABLE_rpm
-                        rpm_tree = rd_root.find('{}TABLE_rpm'.format(namespace))
-                        if not rpm_tree:
-                            continue
+            # ROW_rpm
+            for rpm_root in rpm_tree.findall('{}ROW_rpm'.format(namespace)):
 
-                        # ROW_rpm
-                        for rpm_root in rpm_tree.findall('{}ROW_rpm'.format(namespace)):
-
-                            # <rpmdamphalflife>1</rpmdamphalflife>
-                            try:
-                                sub_dict['dampening_half_life_time'] = \
-                                    rpm_root.find('{}rpmdamphalflife'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampsuppress>30</rpmdampsuppress>
-                            try:
-                                sub_dict['dampening_suppress_time'] = \
-                                    rpm_root.find('{}rpmdampsuppress'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampreuse>10</rpmdampreuse>
-                            try:
-                                sub_dict['dampening_reuse_time'] = \
-                                    rpm_root.find('{}rpmdampreuse'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampsuppresstime>2</rpmdampsuppresstime>
-                            try:
-                                sub_dict['dampening_max_suppress_time'] = \
-                                    rpm_root.find('{}rpmdampsuppresstime'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampmaxpenalty>40</rpmdampmaxpenalty>
-                            try:
-                                sub_dict['dampening_max_suppress_penalty'] = \
-                                    rpm_root.find('{}rpmdampmaxpenalty'.format(namespace)).text
-                            except Exception:
-                                pass
+                # <rpmdamphalflife>1</rpmdamphalflife>
+                try:
+                    sub_dict['dampening_half_life_time'] = \
+                        rpm_root.find('{}rpmdamphalflife'.format(namespace)).text
+                except Exception:
+                    pass
+
+                # <rpmdampsuppress>30</rpmdampsuppress>
+                try:
+                    sub_dict['dampening_suppress_time'] = \
+                        rpm_root.find('{}rpmdampsuppress'.format(namespace)).text
+                except Exception:
+                    pass
+
+                # <rpmdampreuse>10</rpmdampreuse>
+                try:
+                    sub_dict['dampening_reuse_time'] = \
+                        rpm_root.find('{}rpmdampreuse'.format(namespace)).text
+                except Exception:
+                    pass
+
+                # <rpmdampsuppresstime>2</rpmdampsuppresstime>
+                try:
+                    sub_dict['dampening_max_suppress_time'] = \
+                        rpm_root.find('{}rpmdampsuppresstime'.format(namespace)).text
+                except Exception:
+                    pass
+
+                # <rpmdampmaxpenalty>40</rpmdampmaxpenalty>
+                try:
+                    sub_dict['dampening_max_suppress_penalty'] = \
+                        rpm_root.find('{}rpmdampmaxpenalty'.format(namespace)).text
+                except Exception:
+                    pass
 
         return etree_dict
 
@@ -7541,222 +7435,204 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
         return ret_dict
 
 
-    def xml(self):
-        out = self.device.execute(self.xml_command)
+    def _xml_rd(self, stream, rd_root, etree_dict):
+        '''dict of the prefixes of a ROW_rd, None when the vrf or the address
+           family of the row is not known'''
+        namespace = stream.namespace
 
-        etree_dict = {}
-        sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
+        # vrf
         try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
+            vrf = stream.ancestor('ROW_vrf').find(
+                '{}vrf-name-out'.format(namespace)).text
         except Exception:
-            return etree_dict
+            return None
 
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
+        # address_family
+        try:
+            af = stream.ancestor('ROW_safi').find(
+                '{}af-name'.format(namespace)).text.lower()
+        except Exception:
+            return None
 
-        # top table root
-        vrf_root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-        if not vrf_root:
-            return etree_dict
+        if 'vrf' not in etree_dict:
+            etree_dict['vrf'] = {}
+        if vrf not in etree_dict['vrf']:
+            etree_dict['vrf'][vrf] = {}
 
-        # -----   loop vrf  -----
-        for vrf_tree in vrf_root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
+        if 'address_family' not in etree_dict['vrf'][vrf]:
+            etree_dict['vrf'][vrf]['address_family'] = {}
+        if af not in etree_dict['vrf'][vrf]['address_family']:
+            etree_dict['vrf'][vrf]['address_family'][af] = {}
+
+        # rd
+        try:
+            rd = rd_root.find('{}rd_val'.format(namespace)).text
+        except Exception:
+            rd = None
+
+        # <dampeningenabled>true</dampeningenabled>
+        try:
+            dampeningenabled = rd_root.find('{}dampeningenabled'
+                                            .format(namespace)).text
+        except Exception:
+            # <dampening>true</dampening>
             try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
+                dampeningenabled = rd_root.find('{}dampening'
+                                                .format(namespace)).text
             except Exception:
-                break
+                pass
 
-            # address_family table
-            afi = vrf_tree.find('{}TABLE_afi'.format(namespace))
+        # <historypaths>0</historypaths>
+        historypaths = int(rd_root.find('{}historypaths'
+                                        .format(namespace)).text)
+        # <dampenedpaths>2</dampenedpaths>
+        dampenedpaths = int(rd_root.find('{}dampenedpaths'
+                                         .format(namespace)).text)
 
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_afi'.format(namespace)):
+        if rd:
+            # set default attributes under address family
+            # <dampeningenabled>true</dampeningenabled>
+            if dampeningenabled == 'true':
+                etree_dict['vrf'][vrf]['address_family'][af]['dampening_enabled'] = True
 
-                # address_family
-                row_safi = af_root.find('{}TABLE_safi'.format(namespace))
-                row_safi = row_safi.find('{}ROW_safi'.format(namespace))
+            # <historypaths>0</historypaths>
+            etree_dict['vrf'][vrf]['address_family'][af]['history_paths'] = historypaths
 
-                try:
-                    af = row_safi.find('{}af-name'.format(namespace)).text.lower()
-                except Exception:
-                    continue
+            # <dampenedpaths>2</dampenedpaths>
+            etree_dict['vrf'][vrf]['address_family'][af]['dampened_paths'] = dampenedpaths
 
-                # rd table
-                rd = row_safi.find('{}TABLE_rd'.format(namespace))
-                if not rd:
-                    continue
-                else:
-                    if 'vrf' not in etree_dict:
-                        etree_dict['vrf'] = {}
-                    if vrf not in etree_dict['vrf']:
-                        etree_dict['vrf'][vrf] = {}
-
-                    if 'address_family' not in etree_dict['vrf'][vrf]:
-                        etree_dict['vrf'][vrf]['address_family'] = {}
-                    if af not in etree_dict['vrf'][vrf]['address_family']:
-                        etree_dict['vrf'][vrf]['address_family'][af] = {}
-
-                # -----   loop rd  -----
-                for rd_root in rd.findall('{}ROW_rd'.format(namespace)):
-                    # rd
-                    try:
-                        rd = rd_root.find('{}rd_val'.format(namespace)).text
-                    except Exception:
-                        rd = None
+            if 'route_identifier' not in etree_dict['vrf'][vrf]\
+                ['address_family'][af]:
+                etree_dict['vrf'][vrf]['address_family'][af]\
+                    ['route_identifier'] = {}
 
-                    # <dampeningenabled>true</dampeningenabled>
-                    try:
-                        dampeningenabled = rd_root.find('{}dampeningenabled'
-                                                        .format(namespace)).text
-                    except Exception:
-                        # <dampening>true</dampening>
-                        try:
-                            dampeningenabled = rd_root.find('{}dampening'
-                                                            .format(namespace)).text
-                        except Exception:
-                            pass
-                            
-                    # <historypaths>0</historypaths>
-                    historypaths = int(rd_root.find('{}historypaths'
-                                                    .format(namespace)).text)
-                    # <dampenedpaths>2</dampenedpaths>
-                    dampenedpaths = int(rd_root.find('{}dampenedpaths'
-                                                     .format(namespace)).text)
+            if rd not in etree_dict['vrf'][vrf]\
+                ['address_family'][af]['route_identifier']:
+                etree_dict['vrf'][vrf]['address_family'][af]\
+                    ['route_identifier'][rd] = {}
 
-                    if rd:
-                        # set default attributes under address family 
-                        # <dampeningenabled>true</dampeningenabled>
-                        if dampeningenabled == 'true':
-                            etree_dict['vrf'][vrf]['address_family'][af]['dampening_enabled'] = True
+            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
+                ['route_identifier'][rd]
+        else:
+            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
 
-                        # <historypaths>0</historypaths>
-                        etree_dict['vrf'][vrf]['address_family'][af]['history_paths'] = historypaths
-                        
-                        # <dampenedpaths>2</dampenedpaths>
-                        etree_dict['vrf'][vrf]['address_family'][af]['dampened_paths'] = dampenedpaths
+        # <dampeningenabled>true</dampeningenabled>
+        if dampeningenabled == 'true':
+            sub_dict['dampening_enabled'] = True
 
-                        if 'route_identifier' not in etree_dict['vrf'][vrf]\
-                            ['address_family'][af]:
-                            etree_dict['vrf'][vrf]['address_family'][af]\
-                                ['route_identifier'] = {}
+        # <historypaths>0</historypaths>
+        sub_dict['history_paths'] = historypaths
 
-                        if rd not in etree_dict['vrf'][vrf]\
-                            ['address_family'][af]['route_identifier']:
-                            etree_dict['vrf'][vrf]['address_family'][af]\
-                                ['route_identifier'][rd] = {}
+        # <dampenedpaths>2</dampenedpaths>
+        sub_dict['dampened_paths'] = dampenedpaths
 
-                        sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['route_identifier'][rd]
-                    else:
-                        sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
+        return sub_dict
 
-                    # <dampeningenabled>true</dampeningenabled>
-                    if dampeningenabled == 'true':
-                        sub_dict['dampening_enabled'] = True
+    def xml(self):
+        out = self.device.execute(self.xml_command)
 
-                    # <historypaths>0</historypaths>
-                    sub_dict['history_paths'] = historypaths
+        etree_dict = {}
+        sub_dict = None
+        rd_root = None
+        stream = XmlStream(out, rows=('ROW_rd', 'ROW_prefix'),
+                           command=self.cli_command)
 
-                    # <dampenedpaths>2</dampenedpaths>
-                    sub_dict['dampened_paths'] = dampenedpaths
+        # -----   loop prefix  -----
+        for prefix_root in stream:
+            namespace = stream.namespace
 
-                    # prefix table
-                    prefix = rd_root.find('{}TABLE_prefix'.format(namespace))
-                    if not prefix:
-                        continue
+            # rd without prefixes
+            if local_name(prefix_root.tag) == 'ROW_rd':
+                if prefix_root is not rd_root:
+                    self._xml_rd(stream, prefix_root, etree_dict)
+                continue
 
-                    # -----   loop prefix  -----
-                    for prefix_root in prefix.findall('{}ROW_prefix'.format(namespace)):
+            # rd of the prefixes, read from its leaves with the first prefix
+            if stream.ancestor('ROW_rd') is not rd_root:
+                rd_root = stream.ancestor('ROW_rd')
+                sub_dict = self._xml_rd(stream, rd_root, etree_dict)
+            if sub_dict is None:
+                continue
 
-                        # <ipprefix>10.25.1.0/24</ipprefix>
-                        try:
-                            network = prefix_root.find('{}ipprefix'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <ipprefix>10.25.1.0/24</ipprefix>
+            try:
+                network = prefix_root.find('{}ipprefix'.format(namespace)).text
+            except Exception:
+                pass
 
-                        # ipv6prefix>2001::/112</ipv6prefix>
-                        try:
-                            network = prefix_root.find('{}ipv6prefix'.format(namespace)).text
-                        except Exception:
-                            pass
+            # ipv6prefix>2001::/112</ipv6prefix>
+            try:
+                network = prefix_root.find('{}ipv6prefix'.format(namespace)).text
+            except Exception:
+                pass
 
-                        # <nonipprefix>[2]:[0]:[0]:[48]:[0201.0201.0201]:[32]:[10.81.1.1]/248</nonipprefix>
-                        try:
-                            network = prefix_root.find('{}nonipprefix'.format(namespace)).text
-                        except Exception:
-                            pass
-                           
-                        if 'network' not in sub_dict:
-                            sub_dict['network'] = {}
+            # <nonipprefix>[2]:[0]:[0]:[48]:[0201.0201.0201]:[32]:[10.81.1.1]/248</nonipprefix>
+            try:
+                network = prefix_root.find('{}nonipprefix'.format(namespace)).text
+            except Exception:
+                pass
 
-                        if network not in sub_dict['network']:
-                            sub_dict['network'][network] = {}
+            if 'network' not in sub_dict:
+                sub_dict['network'] = {}
 
-                        # <status>d</status>
-                        sub_dict['network'][network]['status'] = \
-                            prefix_root.find('{}status'.format(namespace)).text
+            if network not in sub_dict['network']:
+                sub_dict['network'][network] = {}
 
-                        # <pathtype>e</pathtype>
-                        sub_dict['network'][network]['pathtype'] = \
-                            prefix_root.find('{}pathtype'.format(namespace)).text
+            # <status>d</status>
+            sub_dict['network'][network]['status'] = \
+                prefix_root.find('{}status'.format(namespace)).text
 
-                        # <peer>10.106.102.3</peer>
-                        try:
-                            sub_dict['network'][network]['peer'] = \
-                                prefix_root.find('{}peer'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <pathtype>e</pathtype>
+            sub_dict['network'][network]['pathtype'] = \
+                prefix_root.find('{}pathtype'.format(namespace)).text
 
-                        # <ipv6peer>fec0::2002</ipv6peer>
-                        try:
-                            sub_dict['network'][network]['peer'] = \
-                                prefix_root.find('{}ipv6peer'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <peer>10.106.102.3</peer>
+            try:
+                sub_dict['network'][network]['peer'] = \
+                    prefix_root.find('{}peer'.format(namespace)).text
+            except Exception:
+                pass
 
-                        # <flapcount>39</flapcount>
-                        sub_dict['network'][network]['flaps'] = \
-                            int(prefix_root.find('{}flapcount'.format(namespace)).text)
-                            
-                        # <duration>00:09:53</duration>
-                        sub_dict['network'][network]['duration'] = \
-                            prefix_root.find('{}duration'.format(namespace)).text
-                            
-                        # <reuse>00:01:40</reuse>
-                        reuse = prefix_root.find('{}reuse'.format(namespace)).text
-                        if reuse:
-                            sub_dict['network'][network]['reuse_time'] = reuse
-                            
-                            
-                        # <penalty>34</penalty>
-                        penalty = prefix_root.find('{}penalty'.format(namespace)).text
-                        if penalty:
-                            sub_dict['network'][network]['current_penalty'] = int(penalty)
-                            
-                        # <suppresslimit>30</suppresslimit>
-                        sub_dict['network'][network]['suppress_limit'] = \
-                            int(prefix_root.find('{}suppresslimit'.format(namespace)).text)
+            # <ipv6peer>fec0::2002</ipv6peer>
+            try:
+                sub_dict['network'][network]['peer'] = \
+                    prefix_root.find('{}ipv6peer'.format(namespace)).text
+            except Exception:
+                pass
 
-                       # <reuselimit>10</reuselimit>
-                        sub_dict['network'][network]['reuse_limit'] = \
-                            int(prefix_root.find('{}reuselimit'.format(namespace)).text)
+            # <flapcount>39</flapcount>
+            sub_dict['network'][network]['flaps'] = \
+                int(prefix_root.find('{}flapcount'.format(namespace)).text)
+
+            # <duration>00:09:53</duration>
+            sub_dict['network'][network]['duration'] = \
+                prefix_root.find('{}duration'.format(namespace)).text
+
+            # <reuse>00:01:40</reuse>
+            reuse = prefix_root.find('{}reuse'.format(namespace)).text
+            if reuse:
+                sub_dict['network'][network]['reuse_time'] = reuse
+
+
+            # <penalty>34</penalty>
+            penalty = prefix_root.find('{}penalty'.format(namespace)).text
+            if penalty:
+                sub_dict['network'][network]['current_penalty'] = int(penalty)
+
+            # <suppresslimit>30</suppresslimit>
+            sub_dict['network'][network]['suppress_limit'] = \
+                int(prefix_root.find('{}suppresslimit'.format(namespace)).text)
+
+           # <reuselimit>10</reuselimit>
+            sub_dict['network'][network]['reuse_limit'] = \
+                int(prefix_root.find('{}reuselimit'.format(namespace)).text)
+
+           # <best>false</best>
+            if prefix_root.find('{}best'.format(namespace)).text == 'false':
+                sub_dict['network'][network]['best'] = False
+            else:
+                sub_dict['network'][network]['best'] = True
 
-                       # <best>false</best>
-                        if prefix_root.find('{}best'.format(namespace)).text == 'false':
-                            sub_dict['network'][network]['best'] = False
-                        else:
-                            sub_dict['network'][network]['best'] = True                                                                                    
         return etree_dict
 
 
@@ -7783,230 +7659,233 @@ class ShowBgpAllNexthopDatabase(ShowBgpVrfAllAllNextHopDatabase):
     def cli(self,output=None):
         return super().cli(cmd=self.cli_command,output=output)
 
-    def xml(self):
-        out = self.device.execute(self.xml_command)
+    def _xml_address_family(self, stream, af_root, etree_dict):
+        '''dict of the nexthops of a ROW_nhsafi, None when the vrf or the
+           address family of the row is not known'''
+        namespace = stream.namespace
 
-        etree_dict = {}
-        sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
+        # vrf
         try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
+            vrf = stream.ancestor('ROW_nhvrf').find(
+                '{}nhvrf-name-out'.format(namespace)).text
         except Exception:
-            return etree_dict
+            return None
 
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
+        if 'vrf' not in etree_dict:
+            etree_dict['vrf'] = {}
+        if vrf not in etree_dict['vrf']:
+            etree_dict['vrf'][vrf] = {}
 
-        # top table root
-        vrf_root = Common.retrieve_xml_child(root=root, key='TABLE_nhvrf')
-        if not vrf_root:
-            return etree_dict
+        # address_family
+        try:
+            af = af_root.find('{}af-name'.format(namespace)).text.lower()
+        except Exception:
+            return None
 
-        # -----   loop vrf  -----
-        for vrf_tree in vrf_root.findall('{}ROW_nhvrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}nhvrf-name-out'.format(namespace)).text
-            except Exception:
-                break
+        if 'address_family' not in etree_dict['vrf'][vrf]:
+            etree_dict['vrf'][vrf]['address_family'] = {}
+        if af not in etree_dict['vrf'][vrf]['address_family']:
+            etree_dict['vrf'][vrf]['address_family'][af] = {}
 
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
+        # af_nexthop_trigger_enable
+        etree_dict['vrf'][vrf]['address_family'][af]\
+            ['af_nexthop_trigger_enable'] = True
 
-            # address_family table
-            afi = vrf_tree.find('{}TABLE_nhafi'.format(namespace))
+        # <nhnoncriticaldelay>10000</nhnoncriticaldelay>
+        etree_dict['vrf'][vrf]['address_family'][af]\
+            ['nexthop_trigger_delay_non_critical'] = int(af_root.find('{}nhnoncriticaldelay'
+                                                     .format(namespace)).text)
+        # <nhcriticaldelay>3000</nhcriticaldelay>
+        etree_dict['vrf'][vrf]['address_family'][af]\
+            ['nexthop_trigger_delay_critical'] = int(af_root.find('{}nhcriticaldelay'
+                                                     .format(namespace)).text)
 
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_nhafi'.format(namespace)):
+        return etree_dict['vrf'][vrf]['address_family'][af]
 
-                # address_family
-                row_safi = af_root.find('{}TABLE_nhsafi'.format(namespace))
-                af_root = row_safi.find('{}ROW_nhsafi'.format(namespace))
+    def xml(self):
+        out = self.device.execute(self.xml_command)
+
+        etree_dict = {}
+        af_dict = None
+        af_root = None
+        stream = XmlStream(out,
+                           rows=('ROW_nhvrf', 'ROW_nhsafi', 'ROW_nexthop'),
+                           command=self.cli_command)
+
+        # -----   loop nexthop  -----
+        for nexthop_root in stream:
+            namespace = stream.namespace
+            tag = local_name(nexthop_root.tag)
+
+            # vrf without address family
+            if tag == 'ROW_nhvrf':
                 try:
-                    af = af_root.find('{}af-name'.format(namespace)).text.lower()
+                    vrf = nexthop_root.find(
+                        '{}nhvrf-name-out'.format(namespace)).text
                 except Exception:
                     continue
 
-                if 'address_family' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['address_family'] = {}
-                if af not in etree_dict['vrf'][vrf]['address_family']:
-                    etree_dict['vrf'][vrf]['address_family'][af] = {}
+                if 'vrf' not in etree_dict:
+                    etree_dict['vrf'] = {}
+                if vrf not in etree_dict['vrf']:
+                    etree_dict['vrf'][vrf] = {}
+                continue
 
-                # af_nexthop_trigger_enable
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['af_nexthop_trigger_enable'] = True
+            # address family without nexthops
+            if tag == 'ROW_nhsafi':
+                if nexthop_root is not af_root:
+                    self._xml_address_family(stream, nexthop_root, etree_dict)
+                continue
 
-                # <nhnoncriticaldelay>10000</nhnoncriticaldelay>
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['nexthop_trigger_delay_non_critical'] = int(af_root.find('{}nhnoncriticaldelay'
-                                                             .format(namespace)).text)
-                # <nhcriticaldelay>3000</nhcriticaldelay>
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['nexthop_trigger_delay_critical'] = int(af_root.find('{}nhcriticaldelay'
-                                                             .format(namespace)).text)
+            # address family of the nexthops, read from its leaves with the
+            # first nexthop
+            if stream.ancestor('ROW_nhsafi') is not af_root:
+                af_root = stream.ancestor('ROW_nhsafi')
+                af_dict = self._xml_address_family(stream, af_root,
+                                                   etree_dict)
+            if af_dict is None:
+                continue
 
-                # nexthop table
-                next_hop = af_root.find('{}TABLE_nexthop'.format(namespace))
-                if not next_hop:
-                    continue
+            # nexthop
+            # <ipnexthop-out>192.168.154.1</ipnexthop-out>
+            try:
+                nexthop = nexthop_root.find('{}ipnexthop-out'.format(namespace)).text
+            except Exception:
+                pass
 
-                # -----   loop nexthop  -----
-                for nexthop_root in next_hop.findall('{}ROW_nexthop'.format(namespace)):
-                    # nexthop
-                    # <ipnexthop-out>192.168.154.1</ipnexthop-out>
-                    try:
-                        nexthop = nexthop_root.find('{}ipnexthop-out'.format(namespace)).text
-                    except Exception:
-                        pass
+            # <ipv6nexthop-out>2000::3:1</ipv6nexthop-out>
+            try:
+                nexthop = nexthop_root.find('{}ipv6nexthop-out'.format(namespace)).text
+            except Exception:
+                pass
 
-                    # <ipv6nexthop-out>2000::3:1</ipv6nexthop-out>
-                    try:
-                        nexthop = nexthop_root.find('{}ipv6nexthop-out'.format(namespace)).text
-                    except Exception:
-                        pass
+            if 'next_hop' not in af_dict:
+                af_dict['next_hop'] = {}
 
-                    if 'next_hop' not in etree_dict['vrf'][vrf]\
-                        ['address_family'][af]:
-                        etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['next_hop'] = {}
+            if nexthop not in af_dict['next_hop']:
+                af_dict['next_hop'][nexthop] = {}
 
-                    if nexthop not in etree_dict['vrf'][vrf]\
-                        ['address_family'][af]['next_hop']:
-                        etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['next_hop'][nexthop] = {}
+            sub_dict = af_dict['next_hop'][nexthop]
 
-                    sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                        ['next_hop'][nexthop]
+            # <refcount>1</refcount>
+            sub_dict['refcount'] = int(nexthop_root.find(
+                                        '{}refcount'.format(namespace)).text)
 
-                    # <refcount>1</refcount>
-                    sub_dict['refcount'] = int(nexthop_root.find(
-                                                '{}refcount'.format(namespace)).text)
+            # <igpmetric>3</igpmetric>
+            sub_dict['igp_cost'] = \
+                int(nexthop_root.find('{}igpmetric'.format(namespace)).text)
 
-                    # <igpmetric>3</igpmetric>
-                    sub_dict['igp_cost'] = \
-                        int(nexthop_root.find('{}igpmetric'.format(namespace)).text)
+            # <multipath>false</multipath>
+            try:
+                if nexthop_root.find('{}multipath'.format(namespace)).text == 'false':
+                    sub_dict['multipath'] = 'No'
+                else:
+                    sub_dict['multipath'] = 'Yes'
+            except Exception:
+                pass
 
-                    # <multipath>false</multipath>
-                    try:
-                        if nexthop_root.find('{}multipath'.format(namespace)).text == 'false':
-                            sub_dict['multipath'] = 'No'
-                        else:
-                            sub_dict['multipath'] = 'Yes'
-                    except Exception:
-                        pass
+            # <igptype>0</igptype>
+            sub_dict['igp_route_type'] = \
+                int(nexthop_root.find('{}igptype'.format(namespace)).text)
 
-                    # <igptype>0</igptype>
-                    sub_dict['igp_route_type'] = \
-                        int(nexthop_root.find('{}igptype'.format(namespace)).text)
+            # <igppref>110</igppref>
+            sub_dict['igp_preference'] = \
+                int(nexthop_root.find('{}igppref'.format(namespace)).text)
 
-                    # <igppref>110</igppref>
-                    sub_dict['igp_preference'] = \
-                        int(nexthop_root.find('{}igppref'.format(namespace)).text)
+            # <attached>false</attached>
+            if nexthop_root.find('{}attached'.format(namespace)).text == 'false':
+                sub_dict['attached'] = False
+            else:
+                sub_dict['attached'] = True
 
-                    # <attached>false</attached>
-                    if nexthop_root.find('{}attached'.format(namespace)).text == 'false':
-                        sub_dict['attached'] = False
-                    else:
-                        sub_dict['attached'] = True
 
+            # <local>false</local>
+            if nexthop_root.find('{}local'.format(namespace)).text == 'false':
+                sub_dict['local'] = False
+            else:
+                sub_dict['local'] = True
 
-                    # <local>false</local>
-                    if nexthop_root.find('{}local'.format(namespace)).text == 'false':
-                        sub_dict['local'] = False
-                    else:
-                        sub_dict['local'] = True
+            # <reachable>true</reachable>
+            if nexthop_root.find('{}reachable'.format(namespace)).text == 'false':
+                sub_dict['reachable'] = False
+            else:
+                sub_dict['reachable'] = True
 
-                    # <reachable>true</reachable>
-                    if nexthop_root.find('{}reachable'.format(namespace)).text == 'false':
-                        sub_dict['reachable'] = False
-                    else:
-                        sub_dict['reachable'] = True
+            # <labeled>true</labeled>
+            if nexthop_root.find('{}labeled'.format(namespace)).text == 'false':
+                sub_dict['labeled'] = False
+            else:
+                sub_dict['labeled'] = True
 
-                    # <labeled>true</labeled>
-                    if nexthop_root.find('{}labeled'.format(namespace)).text == 'false':
-                        sub_dict['labeled'] = False
-                    else:
-                        sub_dict['labeled'] = True
+            # <filtered>false</filtered>
+            if nexthop_root.find('{}filtered'.format(namespace)).text == 'false':
+                sub_dict['filtered'] = False
+            else:
+                sub_dict['filtered'] = True
 
-                    # <filtered>false</filtered>
-                    if nexthop_root.find('{}filtered'.format(namespace)).text == 'false':
-                        sub_dict['filtered'] = False
-                    else:
-                        sub_dict['filtered'] = True
+            # <pendingupdate>false</pendingupdate>
+            if nexthop_root.find('{}pendingupdate'.format(namespace)).text == 'false':
+                sub_dict['pending_update'] = False
+            else:
+                sub_dict['pending_update'] = True
 
-                    # <pendingupdate>false</pendingupdate>
-                    if nexthop_root.find('{}pendingupdate'.format(namespace)).text == 'false':
-                        sub_dict['pending_update'] = False
-                    else:
-                        sub_dict['pending_update'] = True
+            # <resolvetime>18:38:21</resolvetime>
+            sub_dict['resolve_time'] = \
+                nexthop_root.find('{}resolvetime'.format(namespace)).text
 
-                    # <resolvetime>18:38:21</resolvetime>
-                    sub_dict['resolve_time'] = \
-                        nexthop_root.find('{}resolvetime'.format(namespace)).text
+            # <ribroute>192.168.154.1/32</ribroute>
+            try:
+                sub_dict['rib_route'] = \
+                    nexthop_root.find('{}ribroute'.format(namespace)).text
+            except Exception:
+                pass
 
-                    # <ribroute>192.168.154.1/32</ribroute>
-                    try:
-                        sub_dict['rib_route'] = \
-                            nexthop_root.find('{}ribroute'.format(namespace)).text
-                    except Exception:
-                        pass                    
+            # <ipv6ribroute>0::/0</ipv6ribroute>
+            try:
+                sub_dict['rib_route'] = \
+                    nexthop_root.find('{}ipv6ribroute'.format(namespace)).text
+            except Exception:
+                pass
 
-                    # <ipv6ribroute>0::/0</ipv6ribroute>
-                    try:
-                        sub_dict['rib_route'] = \
-                            nexthop_root.find('{}ipv6ribroute'.format(namespace)).text
-                    except Exception:
-                        pass
+            # <nextadvertise>Never</nextadvertise>
+            sub_dict['metric_next_advertise'] = \
+                nexthop_root.find('{}nextadvertise'.format(namespace)).text.lower()
+
+            # <rnhepoch>1</rnhepoch>
+            sub_dict['rnh_epoch'] = \
+                int(nexthop_root.find('{}rnhepoch'.format(namespace)).text)
 
-                    # <nextadvertise>Never</nextadvertise>
-                    sub_dict['metric_next_advertise'] = \
-                        nexthop_root.find('{}nextadvertise'.format(namespace)).text.lower()
 
-                    # <rnhepoch>1</rnhepoch>
-                    sub_dict['rnh_epoch'] = \
-                        int(nexthop_root.find('{}rnhepoch'.format(namespace)).text)
+            # attachedhops table
+            attached = nexthop_root.find('{}TABLE_attachedhops'.format(namespace))
+            if not attached:
+                continue
 
+            # -----   loop attachedhops  -----
+            for attach_root in attached.findall('{}ROW_attachedhops'.format(namespace)):
 
-                    # attachedhops table
-                    attached = nexthop_root.find('{}TABLE_attachedhops'.format(namespace))
-                    if not attached:
-                        continue
+                # <attachedhop>192.168.66.2</attachedhop>
+                try:
+                    att_hop = attach_root.find('{}attachedhop'.format(namespace)).text
+                except Exception:
+                    pass
 
-                    # -----   loop attachedhops  -----
-                    for attach_root in attached.findall('{}ROW_attachedhops'.format(namespace)):
+                # <ipv6attachedhop>fe80::6e9c:edff:fe4d:ff41</ipv6attachedhop>
+                try:
+                    att_hop = attach_root.find('{}ipv6attachedhop'.format(namespace)).text
+                except Exception:
+                    pass
 
-                        # <attachedhop>192.168.66.2</attachedhop>
-                        try:
-                            att_hop = attach_root.find('{}attachedhop'.format(namespace)).text
-                        except Exception:
-                            pass
+                if 'attached_nexthop' not in sub_dict:
+                    sub_dict['attached_nexthop'] = {}
 
-                        # <ipv6attachedhop>fe80::6e9c:edff:fe4d:ff41</ipv6attachedhop>
-                        try:
-                            att_hop = attach_root.find('{}ipv6attachedhop'.format(namespace)).text
-                        except Exception:
-                            pass
-                           
-                        if 'attached_nexthop' not in sub_dict:
-                            sub_dict['attached_nexthop'] = {}
+                if att_hop not in sub_dict['attached_nexthop']:
+                    sub_dict['attached_nexthop'][att_hop] = {}
 
-                        if att_hop not in sub_dict['attached_nexthop']:
-                            sub_dict['attached_nexthop'][att_hop] = {}
+                # <interface>port-channel2.100</interface>
+                sub_dict['attached_nexthop'][att_hop]['attached_nexthop_interface'] = \
+                    attach_root.find('{}interface'.format(namespace)).text
 
-                        # <interface>port-channel2.100</interface>
-                        sub_dict['attached_nexthop'][att_hop]['attached_nexthop_interface'] = \
-                            attach_root.find('{}interface'.format(namespace)).text                                                                                                          
         return etree_dict
 
 
@@ -8385,31 +8264,12 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
         etree_dict = {}
         sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
+        stream = XmlStream(out, rows='ROW_neighbor', command=self.cli_command)
 
-        # top table root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_neighbor')
-        if not root:
-            return etree_dict
+        # -----   loop template  -----
+        for peer_tree in stream:
+            namespace = stream.namespace
 
-        # -----   loop vrf  -----
-        for peer_tree in root.findall('{}ROW_neighbor'.format(namespace)):
             # vrf
             try:
                 template = peer_tree.find('{}templatepeer'.format(namespace)).text
@@ -8914,49 +8774,12 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
         out = self.device.execute('{cmd} | xml'.format(cmd=cmd))
 
         etree_dict = {}
-        neighbor = None
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cmd)
-
-        # get neighbor
-        nei = Common.retrieve_xml_child(root=root, key='__XML__PARAM__neighbor-id')
-
-        if hasattr(nei, 'tag'):
-            for item in nei.getchildren():
-                if '__XML__value' in item.tag:
-                    neighbor = item.text
-                    continue
-
-                # cover the senario that __readonly__ may be mssing when
-                # there are values in the output
-                if '__readonly__' in item.tag:
-                    root = item.getchildren()[0]
-                else:
-                    root = item
-        else:
-            # top table rootl
-            root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-
-        if not root:
-            return etree_dict
+        stream = XmlStream(out, rows='ROW_vrf', command=cmd)
 
         # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
+        for vrf_tree in stream:
+            namespace = stream.namespace
+
             # vrf
             try:
                 vrf = vrf_tree.find('{}vrf-name-polstats'.format(namespace)).text
@@ -9349,69 +9172,45 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
         out = self.device.execute(cmd)
 
         etree_dict = {}
+        stream = XmlStream(out, rows=('ROW_vrf', '__readonly__'),
+                           command=cli_cmd)
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cli_cmd)
-
-        ret = Common.retrieve_xml_child(
-                root=root,
-                key='__readonly__')
-
-        if hasattr(ret, 'tag'):
-            # get total_peers                
-            try:
-                total_peers = ret.find('{}totalpeers'.format(namespace)).text
-                etree_dict['total_peers'] = int(total_peers)
-            except Exception:
-                pass
-
-            # get total_established_peers            
-            try:
-                total_established_peers = ret.find(
-                    '{}totalestablishedpeers'.format(namespace)).text
-                etree_dict['total_established_peers'] = int(total_established_peers)
-            except Exception:
-                pass
+        # -----   loop vrf  -----
+        for row in stream:
+            namespace = stream.namespace
 
-            # get local_as               
-            try:
-                local_as = ret.find('{}localas'.format(namespace)).text
-                etree_dict['local_as'] = int(local_as)
-            except Exception:
-                pass
+            # The totals come out of the stream after the vrf rows
+            if local_name(row.tag) == '__readonly__':
+                # get total_peers
+                try:
+                    total_peers = row.find('{}totalpeers'.format(namespace)).text
+                    etree_dict['total_peers'] = int(total_peers)
+                except Exception:
+                    pass
 
-        else:
-            # output is empty
-            return etree_dict
+                # get total_established_peers
+                try:
+                    total_established_peers = row.find(
+                        '{}totalestablishedpeers'.format(namespace)).text
+                    etree_dict['total_established_peers'] = int(total_established_peers)
+                except Exception:
+                    pass
 
-        # find Vrf root
-        root = ret.find('{}TABLE_vrf'.format(namespace))
+                # get local_as
+                try:
+                    local_as = row.find('{}localas'.format(namespace)).text
+                    etree_dict['local_as'] = int(local_as)
+                except Exception:
+                    pass
+                continue
 
-        if not root:
-            return etree_dict
+            vrf_tree = row
 
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
             # vrf
             try:
                 vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
             except Exception:
-                break
+                continue
 
             if 'vrf' not in etree_dict:
                 etree_dict['vrf'] = {}
@@ -9789,6 +9588,94 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
 
         return ret_dict
 
+    def _xml_address_family(self, stream, saf_root, etree_dict):
+        '''dict of the address family of a ROW_safi, None when it is not
+           known'''
+        namespace = stream.namespace
+
+        # vrf
+        try:
+            vrf = stream.ancestor('ROW_vrf').find(
+                '{}vrf-name-out'.format(namespace)).text
+        except Exception:
+            return None
+
+        # address family
+        try:
+            af = saf_root.find('{}af-name'.format(namespace)).text
+            af = af.lower()
+        except Exception:
+            return None
+
+        # <table-version>7</table-version>
+        try:
+            table_version = \
+                int(saf_root.find('{}table-version'.format(namespace)).text)
+        except Exception:
+            table_version = None
+
+        # <router-id>10.106.0.6</router-id>
+        try:
+            router_id = \
+                saf_root.find('{}router-id'.format(namespace)).text
+        except Exception:
+            router_id = None
+
+        if table_version or router_id:
+            if 'vrf' not in etree_dict:
+                etree_dict['vrf'] = {}
+            if vrf not in etree_dict['vrf']:
+                etree_dict['vrf'][vrf] = {}
+
+            if 'address_family' not in etree_dict['vrf'][vrf]:
+                etree_dict['vrf'][vrf]['address_family'] = {}
+
+            if af not in etree_dict['vrf'][vrf]['address_family']:
+                etree_dict['vrf'][vrf]['address_family'][af] = {}
+            if table_version:
+                etree_dict['vrf'][vrf]['address_family'][af]['table_version'] = table_version
+            if router_id:
+                etree_dict['vrf'][vrf]['address_family'][af]['router_id'] = router_id
+
+        try:
+            return etree_dict['vrf'][vrf]['address_family'][af]
+        except KeyError:
+            return None
+
+    def _xml_rd(self, stream, rd_root, etree_dict):
+        '''dict of the prefixes of a ROW_rd, None when its address family
+           is not known'''
+        namespace = stream.namespace
+
+        af_dict = self._xml_address_family(
+            stream, stream.ancestor('ROW_safi'), etree_dict)
+        if af_dict is None:
+            return None
+
+        # neighbor
+        try:
+            rd = rd_root.find('{}rd_val'.format(namespace)).text
+        except Exception:
+            rd = None
+
+        if rd:
+            if 'route_distinguisher' not in af_dict:
+                af_dict['route_distinguisher'] = {}
+
+            if rd not in af_dict['route_distinguisher']:
+                af_dict['route_distinguisher'][rd] = {}
+            sub_dict = af_dict['route_distinguisher'][rd]
+        else:
+            sub_dict = af_dict
+
+        # <rd_vrf>vrf-9100</rd_vrf>
+        try:
+            sub_dict['rd_vrf'] = rd_root.find('{}rd_vrf'.format(namespace)).text
+        except Exception:
+            pass
+
+        return sub_dict
+
     def xml(self, address_family, vrf=''):
         assert address_family in ['ipv4 unicast', 'ipv4 multicast',
                                   'ipv6 unicast', 'ipv6 multicast',
@@ -9805,222 +9692,135 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
         out = self.device.execute(cmd)
 
         etree_dict = {}
+        sub_dict = None
+        rd_root = None
+        saf_root = None
+        stream = XmlStream(out, rows=('ROW_safi', 'ROW_rd', 'ROW_prefix'),
+                           command=cli_cmd)
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
+        # -----   loop prefix  -----
+        for prefix_root in stream:
+            namespace = stream.namespace
+            tag = local_name(prefix_root.tag)
 
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cli_cmd)
+            # address family without route distinguishers
+            if tag == 'ROW_safi':
+                if prefix_root is not saf_root:
+                    self._xml_address_family(stream, prefix_root, etree_dict)
+                continue
 
-        # find Vrf root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
+            # route distinguisher without prefixes
+            if tag == 'ROW_rd':
+                saf_root = stream.ancestor('ROW_safi')
+                if prefix_root is not rd_root:
+                    self._xml_rd(stream, prefix_root, etree_dict)
+                continue
 
-        if not root:
-            return etree_dict
+            # route distinguisher of the prefixes, read from its leaves with
+            # the first prefix
+            if stream.ancestor('ROW_rd') is not rd_root:
+                rd_root = stream.ancestor('ROW_rd')
+                saf_root = stream.ancestor('ROW_safi')
+                sub_dict = self._xml_rd(stream, rd_root, etree_dict)
+            if sub_dict is None:
+                continue
 
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
+            # <ipprefix>10.1.1.1</ipprefix>
             try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
+                prefix = prefix_root.find('{}ipprefix'.format(namespace)).text
             except Exception:
-                break
+                # <ipv6prefix>83::/112</ipv6prefix>
+                try:
+                    prefix = prefix_root.find('{}ipv6prefix'.format(namespace)).text
+                except Exception:
+                    continue
+
+            if 'prefix' not in sub_dict:
+                sub_dict['prefix'] = {}
+
+            if prefix not in sub_dict['prefix']:
+                sub_dict['prefix'][prefix] = {}
 
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_afi'.format(namespace))
-            if not af_tree:
+             # path table
+            index_tree = prefix_root.find('{}TABLE_path'.format(namespace))
+            if not index_tree:
                 continue
-            for af_root in af_tree.findall('{}ROW_afi'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_safi'.format(namespace))
-                if not saf_tree:
+
+            # -----   loop path  -----
+            for index_root in index_tree.findall('{}ROW_path'.format(namespace)):
+                # neighbor
+                try:
+                    index = int(index_root.find('{}pathnr'.format(namespace)).text)
+                except Exception:
                     continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_safi'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                    except Exception:
-                        continue
 
-                    # <table-version>7</table-version>
-                    try:
-                        table_version = \
-                            int(saf_root.find('{}table-version'.format(namespace)).text)
-                    except Exception:
-                        table_version = None
+                if 'index' not in sub_dict['prefix'][prefix]:
+                    sub_dict['prefix'][prefix]['index'] = {}
 
-                    # <router-id>10.106.0.6</router-id>
-                    try:
-                        router_id = \
-                            saf_root.find('{}router-id'.format(namespace)).text
-                    except Exception:
-                        router_id = None
+                if index not in sub_dict['prefix'][prefix]['index']:
+                    sub_dict['prefix'][prefix]['index'][index] = {}
 
-                    if table_version or router_id:
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
-
-                        if 'address_family' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['address_family'] = {}
-
-                        if af not in etree_dict['vrf'][vrf]['address_family']:
-                            etree_dict['vrf'][vrf]['address_family'][af] = {}
-                        if table_version:
-                            etree_dict['vrf'][vrf]['address_family'][af]['table_version'] = table_version
-                        if router_id:
-                            etree_dict['vrf'][vrf]['address_family'][af]['router_id'] = router_id
-
-                     # RD table
-                    rd_tree = saf_root.find('{}TABLE_rd'.format(namespace))
-                    if not rd_tree:
-                        continue
+                # <status>valid</status>
+                sub_dict['prefix'][prefix]['index'][index]['status'] = \
+                    index_root.find('{}status'.format(namespace)).text
 
-                    # -----   loop rd  -----
-                    for rd_root in rd_tree.findall('{}ROW_rd'.format(namespace)):
-                        # neighbor
-                        try:
-                            rd = rd_root.find('{}rd_val'.format(namespace)).text
-                        except Exception:
-                            rd = None
-
-                        if rd:
-                            if 'route_distinguisher' not in etree_dict['vrf'][vrf]:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'] = {}
-
-                            if rd not in etree_dict['vrf'][vrf]['address_family']:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd] = {}
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd]
-                        else:
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
+                # <best>bestpath</best>
+                sub_dict['prefix'][prefix]['index'][index]['best_path'] = \
+                    False if 'none' in index_root.find('{}best'.format(namespace)).text \
+                    else True
 
-                        # <rd_vrf>vrf-9100</rd_vrf>
-                        try:
-                            sub_dict['rd_vrf'] = rd_root.find('{}rd_vrf'.format(namespace)).text
-                        except Exception:
-                            pass
+                # <type>internal</type>
+                sub_dict['prefix'][prefix]['index'][index]['type'] = \
+                    index_root.find('{}type'.format(namespace)).text
 
-                         # prefix table
-                        prefix_tree = rd_root.find('{}TABLE_prefix'.format(namespace))
-                        if not prefix_tree:
-                            continue
+                try:
+                    # <statuscode>*</statuscode>
+                    status_code = index_root.find('{}statuscode'.format(namespace)).text
+                    sub_dict['prefix'][prefix]['index'][index]\
+                        .setdefault('status_code', status_code) if status_code.strip() else None
+
+                    # <bestcode>&gt;</bestcode>
+                    best_code = index_root.find('{}bestcode'.format(namespace)).text
+                    best_code = '>' if '&gt;' in best_code else best_code.strip()
+                    if best_code:
+                        sub_dict['prefix'][prefix]['index'][index]['best_code'] = best_code
+
+                    # <typecode>i</typecode>
+                    sub_dict['prefix'][prefix]['index'][index]['type_code'] = \
+                        index_root.find('{}typecode'.format(namespace)).text
+                except Exception:
+                    pass
 
-                        # -----   loop prefix  -----
-                        for prefix_root in prefix_tree.findall('{}ROW_prefix'.format(namespace)):
-                            # <ipprefix>10.1.1.1</ipprefix>
-                            try:
-                                prefix = prefix_root.find('{}ipprefix'.format(namespace)).text
-                            except Exception:
-                                # <ipv6prefix>83::/112</ipv6prefix>
-                                try:
-                                    prefix = prefix_root.find('{}ipv6prefix'.format(namespace)).text
-                                except Exception:
-                                    continue 
-
-                            if 'prefix' not in sub_dict:
-                                sub_dict['prefix'] = {}
-
-                            if prefix not in sub_dict['prefix']:
-                                sub_dict['prefix'][prefix] = {}
-
-                             # path table
-                            index_tree = prefix_root.find('{}TABLE_path'.format(namespace))
-                            if not index_tree:
-                                continue
+                # <ipnexthop>10.106.101.1</ipnexthop>
+                try:
+                    sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
+                        index_root.find('{}ipnexthop'.format(namespace)).text
+                except Exception:
+                    # <ipv6nexthop>50:1::1:101</ipv6nexthop>
+                    try:
+                        sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
+                            index_root.find('{}ipv6nexthop'.format(namespace)).text
+                    except Exception:
+                        pass
+
+                # <inlabel>nolabel</inlabel>
+                sub_dict['prefix'][prefix]['index'][index]['in_label'] = \
+                    index_root.find('{}inlabel'.format(namespace)).text
+
+                # <outlabel>nolabel</outlabel>
+                sub_dict['prefix'][prefix]['index'][index]['out_label'] = \
+                    index_root.find('{}outlabel'.format(namespace)).text
+
+                # <vpn></vpn>
+                vpn = index_root.find('{}vpn'.format(namespace)).text
+                if vpn:
+                    sub_dict['prefix'][prefix]['index'][index]['vpn'] = vpn
 
-                            # -----   loop path  -----
-                            for index_root in index_tree.findall('{}ROW_path'.format(namespace)):
-                                # neighbor
-                                try:
-                                    index = int(index_root.find('{}pathnr'.format(namespace)).text)
-                                except Exception:
-                                    continue
-
-                                if 'index' not in sub_dict['prefix'][prefix]:
-                                    sub_dict['prefix'][prefix]['index'] = {}
-
-                                if index not in sub_dict['prefix'][prefix]['index']:
-                                    sub_dict['prefix'][prefix]['index'][index] = {}
-
-                                # <status>valid</status>
-                                sub_dict['prefix'][prefix]['index'][index]['status'] = \
-                                    index_root.find('{}status'.format(namespace)).text
-
-                                # <best>bestpath</best>
-                                sub_dict['prefix'][prefix]['index'][index]['best_path'] = \
-                                    False if 'none' in index_root.find('{}best'.format(namespace)).text \
-                                    else True
-
-                                # <type>internal</type>
-                                sub_dict['prefix'][prefix]['index'][index]['type'] = \
-                                    index_root.find('{}type'.format(namespace)).text
-
-                                try:
-                                    # <statuscode>*</statuscode>
-                                    status_code = index_root.find('{}statuscode'.format(namespace)).text
-                                    sub_dict['prefix'][prefix]['index'][index]\
-                                        .setdefault('status_code', status_code) if status_code.strip() else None                                        
-
-                                    # <bestcode>&gt;</bestcode>
-                                    best_code = index_root.find('{}bestcode'.format(namespace)).text
-                                    best_code = '>' if '&gt;' in best_code else best_code.strip()
-                                    if best_code:
-                                        sub_dict['prefix'][prefix]['index'][index]['best_code'] = best_code
-                                       
-                                    # <typecode>i</typecode>
-                                    sub_dict['prefix'][prefix]['index'][index]['type_code'] = \
-                                        index_root.find('{}typecode'.format(namespace)).text
-                                except Exception:
-                                    pass
-
-                                # <ipnexthop>10.106.101.1</ipnexthop>
-                                try:
-                                    sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
-                                        index_root.find('{}ipnexthop'.format(namespace)).text
-                                except Exception:
-                                    # <ipv6nexthop>50:1::1:101</ipv6nexthop>
-                                    try:
-                                        sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
-                                            index_root.find('{}ipv6nexthop'.format(namespace)).text
-                                    except Exception:
-                                        pass
-
-                                # <inlabel>nolabel</inlabel>
-                                sub_dict['prefix'][prefix]['index'][index]['in_label'] = \
-                                    index_root.find('{}inlabel'.format(namespace)).text
-
-                                # <outlabel>nolabel</outlabel>
-                                sub_dict['prefix'][prefix]['index'][index]['out_label'] = \
-                                    index_root.find('{}outlabel'.format(namespace)).text
-
-                                # <vpn></vpn>
-                                vpn = index_root.find('{}vpn'.format(namespace)).text
-                                if vpn:
-                                    sub_dict['prefix'][prefix]['index'][index]['vpn'] = vpn
-                                    
 
-                                # <hold_down></hold_down>
-                                hold_down = index_root.find('{}hold_down'.format(namespace)).text
-                                if hold_down:
-                                    sub_dict['prefix'][prefix]['index'][index]['hold_down'] = hold_down
+                # <hold_down></hold_down>
+                hold_down = index_root.find('{}hold_down'.format(namespace)).text
+                if hold_down:
+                    sub_dict['prefix'][prefix]['index'][index]['hold_down'] = hold_down
 
         return etree_dict
 
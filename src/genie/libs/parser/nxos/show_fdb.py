@@ -21,6 +21,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import ColumnTable
 
 class ShowMacAddressTableVniSchema(MetaParser):
     """Schema for:
@@ -66,10 +67,16 @@ class ShowMacAddressTableBase(ShowMacAddressTableVniSchema):
         'show mac address-table'
         'show system internal l2fwder mac'"""
 
+    # Columns of the table built by _columns, one row per mac address
+    columns = ('vlan', 'mac_address', 'entry', 'drop', 'interface',
+               'mac_type', 'age', 'secure', 'ntfy')
+
     def cli(self, out):
+        return self.to_dict(self._columns(out))
 
-        # initial return dictionary
-        ret_dict = {}
+    def _columns(self, out):
+        """Return the rows of the output as a ColumnTable"""
+        table = ColumnTable(self.columns)
 
         # C 1001     0000.04b1.0000   dynamic  0     F      F nve1(10.9.0.101)
         # * 1001     0000.0191.0000   dynamic  0     F      F    Eth1/11
@@ -88,35 +95,45 @@ class ShowMacAddressTableBase(ShowMacAddressTableVniSchema):
             m = p1.match(line)
             if m:
                 group = m.groupdict()
-                vlan = str(group['vlan'])
-                vlan_dict = ret_dict.setdefault('mac_table', {})\
-                .setdefault('vlans', {}).setdefault(vlan, {})
-                vlan_dict.update({'vlan': str(vlan)})
-                mac_address = str(group['mac_address'])
-                mac_dict = vlan_dict.setdefault('mac_addresses', {})\
-                .setdefault(mac_address,{})
-                mac_dict.update({'mac_address': mac_address})
-                if group['entry']:
-                    mac_dict.update({'entry': str(group['entry']).strip()})
-                if not str(group['drop']) == 'None':
-                    intf_dict = mac_dict.setdefault('drop',{})
-                    intf_dict.update({'drop': True})
-                port = str(group['ports'])
-                if not port == 'None':
-                    converted_port = Common.convert_intf_name(group['ports'])
-                    intf_dict = mac_dict.setdefault('interfaces',{})\
-                    .setdefault(converted_port,{})
-                    intf_dict.update({'interface': converted_port})
-                mac_type = str(group['mac_type'])
-                age = str(group['age'])
-                secure = str(group['secure'])
-                ntfy = str(group['ntfy'])
-                intf_dict.update({'mac_type': str(group['mac_type'])})
-                intf_dict.update({'age': str(group['age'])})                
-                mac_dict.update({'secure': str(group['secure'])})
-                mac_dict.update({'ntfy': str(group['ntfy'])})
+                port = group['ports']
+                table.append(group['vlan'], group['mac_address'],
+                             group['entry'].strip() if group['entry'] else None,
+                             group['drop'] is not None,
+                             Common.convert_intf_name(port) \
+                                if port is not None else None,
+                             group['mac_type'], group['age'],
+                             group['secure'], group['ntfy'])
                 continue
-                
+
+        return table
+
+    @staticmethod
+    def to_dict(table):
+        """Build the parsed output from the ColumnTable of _columns"""
+        ret_dict = {}
+
+        for vlan, mac_address, entry, drop, port, mac_type, age, secure, \
+                ntfy in table:
+            vlan_dict = ret_dict.setdefault('mac_table', {})\
+            .setdefault('vlans', {}).setdefault(vlan, {})
+            vlan_dict.update({'vlan': vlan})
+            mac_dict = vlan_dict.setdefault('mac_addresses', {})\
+            .setdefault(mac_address,{})
+            mac_dict.update({'mac_address': mac_address})
+            if entry:
+                mac_dict.update({'entry': entry})
+            if drop:
+                intf_dict = mac_dict.setdefault('drop',{})
+                intf_dict.update({'drop': True})
+            if port is not None:
+                intf_dict = mac_dict.setdefault('interfaces',{})\
+                .setdefault(port,{})
+                intf_dict.update({'interface': port})
+            intf_dict.update({'mac_type': mac_type})
+            intf_dict.update({'age': age})
+            mac_dict.update({'secure': secure})
+            mac_dict.update({'ntfy': ntfy})
+
         return ret_dict
 
 
@@ -171,6 +188,15 @@ class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableVniSchema)
 
         return ret_dict
 
+    def cli_columns(self, output=None):
+        """Return the rows of the output as a ColumnTable"""
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        return self._columns(out)
+
 
 class ShowMacAddressTableAgingTimeSchema(MetaParser):
     """Schema for show mac address-table aging-time"""
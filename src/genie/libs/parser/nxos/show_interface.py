@@ -18,6 +18,11 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
                                          
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.dispatch import LineDispatcher, LinePattern
+from genie.libs.parser.utils.interface_name import get_converter
+from genie.libs.parser.utils.record_filter import RecordFilter
+from genie.libs.parser.utils.parallel import RecordSplit
+from genie.libs.parser.utils.counters import CounterSample
 
 
 # ===========================
@@ -178,7 +183,334 @@ class ShowInterface(ShowInterfaceSchema):
       'in_crc_errors',
       'reliability']
 
-    def cli(self, interface="", output=None):
+    # Compiled once; each line is only tried against the patterns keyed on
+    # its first word, see genie.libs.parser.utils.dispatch. Keys are given
+    # where the regex allows words to run together (' *')
+    patterns = LineDispatcher([
+        # Ethernet2/1.10 is down (Administratively down)
+        LinePattern('p1', r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) *is'
+                           ' *(?P<enabled>(down))'
+                           '( *\((?P<link_state>[a-zA-Z0-9\-\s]+)\))?$',
+                    contains='down'),
+
+        # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
+        # Vlan23 is administratively down (Administratively down), line protocol is down, autostate enabled
+        LinePattern('p1_1', r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) *is'
+                             ' *(?P<enabled>[\w\s]+)'
+                             '( *\((?P<link_state>[\w\-\/\s]+)\))?, +'
+                             'line +protocol +is +(?P<line_protocol>\w+),? *'
+                             '(autostate +(?P<autostate>\w+))?$',
+                    contains='protocol'),
+
+        # Ethernet2/2 is up
+        LinePattern('p1_2', r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) *is'
+                             ' *(?P<enabled>(up))'
+                             '( *\((?P<link_state>[a-zA-Z\s]+)\))?$',
+                    contains='up'),
+
+        # admin state is up
+        # admin state is up,
+        # admin state is up, Dedicated Interface
+        # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
+        LinePattern('p2', r'^\s*admin +state +is'
+                           ' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
+                           '(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
+                           '(?:, +\[parent +interface +is'
+                           ' +(?P<parent_intf>(\S+))\])?$',
+                    keys='admin'),
+
+        # Dedicated Interface
+        LinePattern('p2_1', r'^\s*Dedicated Interface$'),
+
+        # Belongs to Po1
+        LinePattern('p2_2', r'^\s*Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$',
+                    keys='Belongs'),
+
+        # Hardware: Ethernet, address: 5254.00c9.d26e (bia 5254.00c9.d26e)
+        LinePattern('p3', r'^\s*Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
+                           ' *address: *(?P<mac_address>[a-z0-9\.]+)'
+                           ' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$'),
+
+        #Description: desc
+        LinePattern('p4', r'^\s*Description: *(?P<description>.*)$'),
+
+        #Internet Address is 10.4.4.4/24 secondary tag 10
+        LinePattern('p5', r'^\s*Internet *Address *is *(?P<ip>[0-9\.]+)'
+                           '\/(?P<prefix_length>[0-9]+)'
+                           '(?: *(?P<secondary>(secondary)))?(?: *tag'
+                           ' *(?P<route_tag>[0-9]+))?$',
+                    keys='Internet'),
+
+        # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
+        # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
+        # MTU 1500 bytes, BW 1000000 Kbit
+        LinePattern('p6', r'^\s*MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+                           ' *(?P<bandwidth>[0-9]+) *Kbit(, *DLY'
+                           ' *(?P<delay>[0-9]+) *usec)?,?$',
+                    keys='MTU'),
+
+        # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
+        LinePattern('p6_1', r'^\s*MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+                             ' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
+                             ' *([0-9]+) *Kbit, *DLY'
+                             ' *(?P<delay>[0-9]+) *usec$',
+                    keys='MTU'),
+
+        # reliability 255/255, txload 1/255, rxload 1/255
+        LinePattern('p7', r'^\s*reliability *(?P<reliability>[0-9\/]+),'
+                           ' *txload *(?P<txload>[0-9\/]+),'
+                           ' *rxload *(?P<rxload>[0-9\/]+)$',
+                    keys='reliability'),
+
+        #Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
+        #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
+        #Encapsulation ARPA, medium is broadcast
+        LinePattern('p8', r'^\s*Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                           ' *medium *is *(?P<medium>[a-zA-Z]+)$',
+                    keys='Encapsulation'),
+
+        LinePattern('p8_1', r'^\s*Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                             ' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
+                             ' *medium *is *(?P<medium>[a-z0-9]+)$',
+                    keys='Encapsulation'),
+
+        # Encapsulation ARPA, loopback not set
+        # Encapsulation ARPA, loopback not set
+        LinePattern('p8_2', r'^\s*Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                             ' *([\w\s]+)$',
+                    keys='Encapsulation'),
+
+        #Port mode is routed
+        LinePattern('p9', r'^\s*Port *mode *is *(?P<port_mode>[a-z]+)$',
+                    keys='Port'),
+
+        # auto-duplex, auto-speed
+        LinePattern('p10_1', r'^\s*auto-duplex, +auto-speed$'),
+
+        #full-duplex, 1000 Mb/s
+        # auto-duplex, auto-speed
+        LinePattern('p10', r'^\s*(?P<duplex_mode>[a-z]+)-duplex,'
+                            ' *(?P<port_speed>[a-z0-9\-]+)(?: *Mb/s)?$',
+                    contains='-duplex'),
+
+        #Beacon is turned off
+        LinePattern('p11', r'^\s*Beacon *is *turned *(?P<beacon>[a-z]+)$',
+                    keys='Beacon'),
+
+        #Auto-Negotiation is turned off
+        LinePattern('p12', r'^\s*Auto-Negotiation *is *turned'
+                            ' *(?P<auto_negotiate>(off))$',
+                    keys='Auto'),
+
+        #Auto-Negotiation is turned on
+        LinePattern('p12_1', r'^\s*Auto-Negotiation *is *turned'
+                              ' *(?P<auto_negotiate>(on))$',
+                    keys='Auto'),
+
+        #Input flow-control is off, output flow-control is off
+        LinePattern('p13', r'^\s*Input *flow-control *is *(?P<receive>(off)+),'
+                            ' *output *flow-control *is *(?P<send>(off)+)$',
+                    keys='Input'),
+
+        #Input flow-control is off, output flow-control is on
+        LinePattern('p13_1', r'^\s*Input *flow-control *is *(?P<receive>(on)+),'
+                              ' *output *flow-control *is *(?P<send>(on)+)$',
+                    keys='Input'),
+
+        #Auto-mdix is turned off
+        LinePattern('p14', r'^\s*Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$',
+                    keys='Auto'),
+
+        #Switchport monitor is off
+        LinePattern('p15', r'^\s*Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$',
+                    keys='Switchport'),
+
+        #EtherType is 0x8100
+        LinePattern('p16', r'^\s*EtherType *is *(?P<ethertype>[a-z0-9]+)$',
+                    keys='EtherType'),
+
+        # Members in this channel: Eth1/15, Eth1/16
+        # Members in this channel: Eth1/28
+        LinePattern('p38', r'^\s*Members +in +this +channel *: *'
+                            '(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$'),
+
+        #EEE (efficient-ethernet) : n/a
+        LinePattern('p17', r'^\s*EEE *\(efficient-ethernet\) *:'
+                            ' *(?P<efficient_ethernet>[A-Za-z\/]+)$',
+                    keys='EEE'),
+
+        #Last link flapped 00:07:28
+        LinePattern('p18', r'^\s*Last *link *flapped'
+                            ' *(?P<last_link_flapped>[a-z0-9\:]+)$',
+                    keys='Last'),
+
+        # Last clearing of "show interface" counters never
+        LinePattern('p19', r'^\s*Last *clearing *of *\"show *interface\"'
+                            ' *counters *(?P<last_clear>[a-z0-9\:]+)$',
+                    keys='Last'),
+
+        # Last clearing of "" counters 00:15:42
+        LinePattern('p19_1', r'^\s*Last *clearing *of *\" *\"'
+                              ' *counters *(?P<last_clear>[a-z0-9\:]+)$',
+                    keys='Last'),
+
+        #1 interface resets
+        LinePattern('p20', r'^\s*(?P<interface_reset>[0-9]+) *interface'
+                            ' *resets$',
+                    keys='interface'),
+
+        # 1 minute input rate 0 bits/sec, 0 packets/sec
+        LinePattern('p21', r'^\s*(?P<load_interval>[0-9\#]+)'
+                            ' *(minute|second|minutes|seconds) *input *rate'
+                            ' *(?P<in_rate>[0-9]+) *bits/sec,'
+                            ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$',
+                    keys=('minute', 'second', 'minutes', 'seconds')),
+
+        #1 minute output rate 24 bits/sec, 0 packets/sec
+        LinePattern('p22', r'^\s*(?P<load_interval>[0-9\#]+)'
+                            ' *(minute|second|minutes|seconds) *output'
+                            ' *rate *(?P<out_rate>[0-9]+)'
+                            ' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
+                            ' *packets/sec$',
+                    keys=('minute', 'second', 'minutes', 'seconds')),
+
+        #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
+        LinePattern('p23', r'^\s*input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
+                            ' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
+                            ' *(?P<out_rate_bps>[0-9]+) *bps,'
+                            ' *(?P<out_rate_pps>[0-9]+) *pps$',
+                    keys='input'),
+
+        LinePattern('p23_1', r'^\s*(?P<rx>(RX))$',
+                    keys='RX'),
+
+        #0 unicast packets  0 multicast packets  0 broadcast packets
+        LinePattern('p24', r'^\s*(?P<in_unicast_pkts>[0-9]+) +unicast +packets'
+                            ' +(?P<in_multicast_pkts>[0-9]+) +multicast +packets'
+                            ' +(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets$',
+                    keys='unicast'),
+
+        #0 input packets  0 bytes
+        LinePattern('p25', r'^\s*(?P<in_pkts>[0-9]+) +input +packets'
+                            ' +(?P<in_octets>[0-9]+) +bytes$',
+                    keys='input'),
+
+        #0 jumbo packets  0 storm suppression packets
+        LinePattern('p26', r'^\s*(?P<in_jumbo_packets>[0-9]+) +jumbo +packets'
+                            ' *(?P<in_storm_suppression_packets>[0-9]+)'
+                            ' *storm *suppression *packets$',
+                    keys='jumbo'),
+
+        #0 runts  0 giants  0 CRC/FCS  0 no buffer
+        #0 runts  0 giants  0 CRC  0 no buffer
+        LinePattern('p27', r'^\s*(?P<in_runts>[0-9]+) *runts'
+                            ' *(?P<in_oversize_frame>[0-9]+) *giants'
+                            ' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
+                            ' *(?P<in_no_buffer>[0-9]+) *no *buffer$',
+                    keys='runts'),
+
+        #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
+        LinePattern('p28', r'^\s*(?P<in_errors>[0-9]+) *input *error'
+                            ' *(?P<in_short_frame>[0-9]+) *short *frame'
+                            ' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
+                            ' *underrun *(?P<in_ignored>[0-9]+) *ignored$',
+                    keys='input'),
+
+        #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
+        LinePattern('p29', r'^\s*(?P<in_watchdog>[0-9]+) *watchdog'
+                            ' *(?P<in_bad_etype_drop>[0-9]+)'
+                            ' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
+                            ' *bad *proto'
+                            ' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$',
+                    keys='watchdog'),
+
+        LinePattern('p30', r'^\s*(?P<in_with_dribble>[0-9]+) *input *with'
+                            ' *dribble *(?P<in_discard>[0-9]+) *input *discard$',
+                    keys='input'),
+
+        LinePattern('p31', r'^\s*(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$',
+                    keys='Rx'),
+
+        LinePattern('p31_1', r'^\s*(?P<tx>(TX))$',
+                    keys='TX'),
+
+        #0 unicast packets  0 multicast packets  0 broadcast packets
+        LinePattern('p32', r'^\s*(?P<out_unicast_pkts>[0-9]+) *unicast *packets'
+                            ' *(?P<out_multicast_pkts>[0-9]+) *multicast *packets'
+                            ' *(?P<out_broadcast_pkts>[0-9]+) *broadcast *packets$',
+                    keys='unicast'),
+
+        #0 output packets  0 bytes
+        LinePattern('p33', r'^\s*(?P<out_pkts>[0-9]+) *output *packets'
+                            ' *(?P<out_octets>[0-9]+) *bytes$',
+                    keys='output'),
+
+        #0 jumbo packets
+        LinePattern('p34', r'^\s*(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$',
+                    keys='jumbo'),
+
+        #0 output error  0 collision  0 deferred  0 late collision
+        LinePattern('p35', r'^\s*(?P<out_errors>[0-9]+) *output *error'
+                            ' *(?P<out_collision>[0-9]+) *collision'
+                            ' *(?P<out_deferred>[0-9]+) *deferred'
+                            ' *(?P<out_late_collision>[0-9]+)'
+                            ' *late *collision$',
+                    keys='output'),
+
+        #0 lost carrier  0 no carrier  0 babble  0 output discard
+        LinePattern('p36', r'^\s*(?P<out_lost_carrier>[0-9]+) *lost *carrier'
+                            ' *(?P<out_no_carrier>[0-9]+) *no *carrier'
+                            ' *(?P<out_babble>[0-9]+) *babble'
+                            ' *(?P<out_discard>[0-9]+) *output *discard$',
+                    keys='lost'),
+
+        #0 Tx pause
+        LinePattern('p37', r'^\s*(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$',
+                    keys='Tx'),
+    ])
+
+    # Records of parse_parallel, see genie.libs.parser.utils.parallel
+    record_split = RecordSplit(header=(patterns['p1'], patterns['p1_1'],
+                                       patterns['p1_2']))
+
+    # Header, last clearing, rate and counter lines, see cli_counters
+    counter_patterns = patterns.subset(
+        ['p1', 'p1_1', 'p1_2', 'p19', 'p19_1', 'p23_1', 'p31_1'] +
+        ['p{}'.format(i) for i in range(21, 38)])
+
+    def records(self, lines):
+        """Return the (path, first, last) of the interfaces in the lines,
+           and the (path, needed path) of the interfaces needing another"""
+        header = (self.patterns['p1'], self.patterns['p1_1'],
+                  self.patterns['p1_2'])
+        records = []
+        path = None
+        for i, line in enumerate(lines):
+            line = line.replace('\t', '    ').rstrip()
+
+            # Ethernet2/2 is up
+            for pattern in header:
+                m = pattern.match(line)
+                if m:
+                    if path:
+                        records.append((path, first, i))
+                    path = (m.groupdict()['interface'],)
+                    first = i
+                    break
+        if path:
+            records.append((path, first, len(lines)))
+        return records, ()
+
+    def cli_counters(self, interface="", output=None, filter=None,
+                     time=None):
+        """Return the counters of the interfaces as a CounterSample, see
+           genie.libs.parser.utils.counters. Only the header, counter and
+           rate lines are matched"""
+        return CounterSample.from_parsed(
+            self.cli(interface=interface, output=output, filter=filter,
+                     counters=True), time=time)
+
+    def cli(self, interface="", output=None, filter=None, counters=False):
         if output is None:
             if interface:
                 cmd = self.cli_command[1].format(interface=interface)
@@ -188,21 +520,34 @@ class ShowInterface(ShowInterfaceSchema):
         else:
             out = output
 
+        # Only parse the interfaces of the filter,
+        # see genie.libs.parser.utils.record_filter
+        if filter is not None:
+            select = RecordFilter.build(
+                filter, normalize=get_converter('nxos').convert)
+            lines = out.splitlines()
+            lines = select.select(lines, *self.records(lines))
+            return select.prune(self.cli(output='\n'.join(lines),
+                                         counters=counters), (None,))
+
+        # Only the lines of the counters, for cli_counters
+        patterns = self.counter_patterns if counters else self.patterns
+
         interface_dict = {}
 
-        rx = False
-        tx = False
+        # RX and TX unicast counters are only parsed after the RX and TX
+        # header lines respectively
+        skip = {'p24', 'p32'}
         for line in out.splitlines():
             line = line.replace('\t', '    ')
             line = line.rstrip()
 
+            name, m = patterns.match(line, skip=skip)
+            if not m:
+                continue
 
             # Ethernet2/1.10 is down (Administratively down)
-            p1 =  re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) *is'
-                              ' *(?P<enabled>(down))'
-                              '( *\((?P<link_state>[a-zA-Z0-9\-\s]+)\))?$')
-            m = p1.match(line)
-            if m:
+            if name == 'p1':
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled']
                 link_state = m.groupdict()['link_state']
@@ -222,13 +567,7 @@ class ShowInterface(ShowInterfaceSchema):
 
             # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
             # Vlan23 is administratively down (Administratively down), line protocol is down, autostate enabled
-            p1_1 =  re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) *is'
-                              ' *(?P<enabled>[\w\s]+)'
-                              '( *\((?P<link_state>[\w\-\/\s]+)\))?, +'
-                              'line +protocol +is +(?P<line_protocol>\w+),? *'
-                              '(autostate +(?P<autostate>\w+))?$')
-            m = p1_1.match(line)
-            if m:
+            if name == 'p1_1':
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled']
                 link_state = m.groupdict()['link_state']
@@ -257,11 +596,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Ethernet2/2 is up
-            p1_2 =  re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) *is'
-                              ' *(?P<enabled>(up))'
-                              '( *\((?P<link_state>[a-zA-Z\s]+)\))?$')
-            m = p1_2.match(line)
-            if m:
+            if name == 'p1_2':
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled']
                 link_state = m.groupdict()['link_state']
@@ -283,13 +618,7 @@ class ShowInterface(ShowInterfaceSchema):
             # admin state is up,
             # admin state is up, Dedicated Interface
             # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
-            p2 = re.compile(r'^\s*admin +state +is'
-                             ' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
-                             '(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
-                             '(?:, +\[parent +interface +is'
-                             ' +(?P<parent_intf>(\S+))\])?$')
-            m = p2.match(line)
-            if m:
+            if name == 'p2':
                 # admin_state
                 interface_dict[interface]['admin_state'] = \
                     m.groupdict()['admin_state']
@@ -303,16 +632,12 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Dedicated Interface
-            p2_1 = re.compile(r'^\s*Dedicated Interface$')
-            m = p2_1.match(line)
-            if m:
+            if name == 'p2_1':
                 interface_dict[interface]['dedicated_intface'] = True
                 continue
 
             # Belongs to Po1
-            p2_2 = re.compile(r'^\s*Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$')
-            m = p2_2.match(line)
-            if m:
+            if name == 'p2_2':
                 port_channel_int = str(m.groupdict()['port_channel_int'])
                 if 'port_channel' not in interface_dict[interface]:
                     interface_dict[interface]['port_channel'] = {}
@@ -323,11 +648,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Hardware: Ethernet, address: 5254.00c9.d26e (bia 5254.00c9.d26e)
-            p3 = re.compile(r'^\s*Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
-                            ' *address: *(?P<mac_address>[a-z0-9\.]+)'
-                            ' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$')
-            m = p3.match(line)
-            if m:
+            if name == 'p3':
                 types = m.groupdict()['types']
                 mac_address = m.groupdict()['mac_address']
                 phys_address = m.groupdict()['phys_address']
@@ -340,21 +661,14 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Description: desc
-            p4 = re.compile(r'^\s*Description: *(?P<description>.*)$')
-            m = p4.match(line)
-            if m:
+            if name == 'p4':
                 description = m.groupdict()['description']
 
                 interface_dict[interface]['description'] = description
                 continue
 
             #Internet Address is 10.4.4.4/24 secondary tag 10
-            p5 = re.compile(r'^\s*Internet *Address *is *(?P<ip>[0-9\.]+)'
-                             '\/(?P<prefix_length>[0-9]+)'
-                             '(?: *(?P<secondary>(secondary)))?(?: *tag'
-                             ' *(?P<route_tag>[0-9]+))?$')
-            m = p5.match(line)
-            if m:
+            if name == 'p5':
                 ip = m.groupdict()['ip']
                 prefix_length = str(m.groupdict()['prefix_length'])
                 secondary = m.groupdict()['secondary']
@@ -382,11 +696,7 @@ class ShowInterface(ShowInterfaceSchema):
             # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
             # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
             # MTU 1500 bytes, BW 1000000 Kbit
-            p6 = re.compile(r'^\s*MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                             ' *(?P<bandwidth>[0-9]+) *Kbit(, *DLY'
-                             ' *(?P<delay>[0-9]+) *usec)?,?$')
-            m = p6.match(line)
-            if m:
+            if name == 'p6':
                 mtu = int(m.groupdict()['mtu'])
                 bandwidth = int(m.groupdict()['bandwidth'])
                 if m.groupdict()['delay']:
@@ -397,12 +707,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
             
             # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
-            p6_1 = re.compile(r'^\s*MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                             ' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
-                             ' *([0-9]+) *Kbit, *DLY'
-                             ' *(?P<delay>[0-9]+) *usec$')
-            m = p6_1.match(line)
-            if m:
+            if name == 'p6_1':
                 mtu = int(m.groupdict()['mtu'])
                 bandwidth = int(m.groupdict()['bandwidth'])
                 
@@ -412,11 +717,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            p7 = re.compile(r'^\s*reliability *(?P<reliability>[0-9\/]+),'
-                             ' *txload *(?P<txload>[0-9\/]+),'
-                             ' *rxload *(?P<rxload>[0-9\/]+)$')
-            m = p7.match(line)
-            if m:
+            if name == 'p7':
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
                 rxload = m.groupdict()['rxload']
@@ -430,10 +731,7 @@ class ShowInterface(ShowInterfaceSchema):
             #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
             #Encapsulation ARPA, medium is broadcast
 
-            p8 = re.compile(r'^\s*Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                             ' *medium *is *(?P<medium>[a-zA-Z]+)$')
-            m = p8.match(line)
-            if m:
+            if name == 'p8':
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
                 medium = m.groupdict()['medium']
@@ -446,11 +744,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['medium'] = medium
                 continue
 
-            p8_1 = re.compile(r'^\s*Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               ' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
-                               ' *medium *is *(?P<medium>[a-z0-9]+)$')
-            m = p8_1.match(line)
-            if m:
+            if name == 'p8_1':
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
                 first_dot1q = str(m.groupdict()['first_dot1q'])
@@ -467,10 +761,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Encapsulation ARPA, loopback not set
-            p8_2 = re.compile(r'^\s*Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                             ' *([\w\s]+)$')
-            m = p8_2.match(line)
-            if m:
+            if name == 'p8_2':
                 encapsulation = m.groupdict()['encapsulation'].lower()
 
                 if 'encapsulations' not in interface_dict[interface]:
@@ -481,26 +772,19 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Port mode is routed
-            p9 = re.compile(r'^\s*Port *mode *is *(?P<port_mode>[a-z]+)$')
-            m = p9.match(line)
-            if m:
+            if name == 'p9':
                 port_mode = m.groupdict()['port_mode']
                 interface_dict[interface]['port_mode'] = port_mode
                 continue
 
             # auto-duplex, auto-speed
-            p10_1 = re.compile(r'^\s*auto-duplex, +auto-speed$')
-            m = p10_1.match(line)
-            if m:
+            if name == 'p10_1':
                 # not caring for this line
                 continue
 
             #full-duplex, 1000 Mb/s
             # auto-duplex, auto-speed
-            p10 = re.compile(r'^\s*(?P<duplex_mode>[a-z]+)-duplex,'
-                              ' *(?P<port_speed>[a-z0-9\-]+)(?: *Mb/s)?$')
-            m = p10.match(line)
-            if m:
+            if name == 'p10':
                 duplex_mode = m.groupdict()['duplex_mode'].lower()
                 port_speed = m.groupdict()['port_speed']
 
@@ -509,36 +793,25 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Beacon is turned off
-            p11 = re.compile(r'^\s*Beacon *is *turned *(?P<beacon>[a-z]+)$')
-            m = p11.match(line)
-            if m:
+            if name == 'p11':
                 beacon = m.groupdict()['beacon']
                 interface_dict[interface]['beacon'] = beacon
                 continue
 
             #Auto-Negotiation is turned off
-            p12 = re.compile(r'^\s*Auto-Negotiation *is *turned'
-                              ' *(?P<auto_negotiate>(off))$')
-            m = p12.match(line)
-            if m:
+            if name == 'p12':
                 auto_negotiation = m.groupdict()['auto_negotiate']
                 interface_dict[interface]['auto_negotiate'] = False
                 continue
 
             #Auto-Negotiation is turned on
-            p12_1 = re.compile(r'^\s*Auto-Negotiation *is *turned'
-                              ' *(?P<auto_negotiate>(on))$')
-            m = p12_1.match(line)
-            if m:
+            if name == 'p12_1':
                 auto_negotiation = m.groupdict()['auto_negotiate']
                 interface_dict[interface]['auto_negotiate'] = True
                 continue
 
             #Input flow-control is off, output flow-control is off
-            p13 = re.compile(r'^\s*Input *flow-control *is *(?P<receive>(off)+),'
-                              ' *output *flow-control *is *(?P<send>(off)+)$')
-            m = p13.match(line)
-            if m:
+            if name == 'p13':
                 receive = m.groupdict()['receive']
                 send = m.groupdict()['send']
 
@@ -549,10 +822,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['flow_control']['send'] = False
                 continue
             #Input flow-control is off, output flow-control is on
-            p13_1 = re.compile(r'^\s*Input *flow-control *is *(?P<receive>(on)+),'
-                                ' *output *flow-control *is *(?P<send>(on)+)$')
-            m = p13_1.match(line)
-            if m:
+            if name == 'p13_1':
                 receive = m.groupdict()['receive']
                 send = m.groupdict()['send']
 
@@ -564,35 +834,26 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Auto-mdix is turned off
-            p14 = re.compile(r'^\s*Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$')
-            m = p14.match(line)
-            if m:
+            if name == 'p14':
                 auto_mdix = m.groupdict()['auto_mdix']
                 interface_dict[interface]['auto_mdix'] = auto_mdix
                 continue
 
             #Switchport monitor is off 
-            p15 = re.compile(r'^\s*Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$')
-            m = p15.match(line)
-            if m:
+            if name == 'p15':
                 switchport_monitor = m.groupdict()['switchport_monitor']
                 interface_dict[interface]['switchport_monitor'] = switchport_monitor
                 continue
 
             #EtherType is 0x8100 
-            p16 = re.compile(r'^\s*EtherType *is *(?P<ethertype>[a-z0-9]+)$')
-            m = p16.match(line)
-            if m:
+            if name == 'p16':
                 ethertype = m.groupdict()['ethertype']
                 interface_dict[interface]['ethertype'] = ethertype
                 continue
 
             # Members in this channel: Eth1/15, Eth1/16
             # Members in this channel: Eth1/28
-            p38 = re.compile(r'^\s*Members +in +this +channel *: *'
-                              '(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
-            m = p38.match(line)
-            if m:
+            if name == 'p38':
                 port_channel_member_intfs = m.groupdict()['port_channel_member_intfs']
                 if port_channel_member_intfs:
                     if 'port_channel' not in interface_dict[interface]:
@@ -605,56 +866,36 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
             
             #EEE (efficient-ethernet) : n/a
-            p17 = re.compile(r'^\s*EEE *\(efficient-ethernet\) *:'
-                              ' *(?P<efficient_ethernet>[A-Za-z\/]+)$')
-            m = p17.match(line)
-            if m:
+            if name == 'p17':
                 efficient_ethernet = m.groupdict()['efficient_ethernet']
                 interface_dict[interface]['efficient_ethernet'] = efficient_ethernet
                 continue
 
             #Last link flapped 00:07:28
-            p18 = re.compile(r'^\s*Last *link *flapped'
-                              ' *(?P<last_link_flapped>[a-z0-9\:]+)$')
-            m = p18.match(line)
-            if m:
+            if name == 'p18':
                 last_link_flapped = m.groupdict()['last_link_flapped']
                 interface_dict[interface]['last_link_flapped']\
                  = last_link_flapped
                 continue
 
             # Last clearing of "show interface" counters never
-            p19 = re.compile(r'^\s*Last *clearing *of *\"show *interface\"'
-                              ' *counters *(?P<last_clear>[a-z0-9\:]+)$')
-            m = p19.match(line)
-            if m:
+            if name == 'p19':
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             # Last clearing of "" counters 00:15:42
-            p19_1 = re.compile(r'^\s*Last *clearing *of *\" *\"'
-                              ' *counters *(?P<last_clear>[a-z0-9\:]+)$')
-            m = p19_1.match(line)
-            if m:
+            if name == 'p19_1':
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             #1 interface resets
-            p20 = re.compile(r'^\s*(?P<interface_reset>[0-9]+) *interface'
-                              ' *resets$')
-            m = p20.match(line)
-            if m:
+            if name == 'p20':
                 interface_reset = int(m.groupdict()['interface_reset'])
                 interface_dict[interface]['interface_reset'] = interface_reset
                 continue
 
             # 1 minute input rate 0 bits/sec, 0 packets/sec  
-            p21 = re.compile(r'^\s*(?P<load_interval>[0-9\#]+)'
-                              ' *(minute|second|minutes|seconds) *input *rate'
-                              ' *(?P<in_rate>[0-9]+) *bits/sec,'
-                              ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
-            m = p21.match(line)
-            if m:
+            if name == 'p21':
 
                 load_interval = int(m.groupdict()['load_interval'])
                 in_rate = int(m.groupdict()['in_rate'])
@@ -674,13 +915,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #1 minute output rate 24 bits/sec, 0 packets/sec
-            p22 = re.compile(r'^\s*(?P<load_interval>[0-9\#]+)'
-                              ' *(minute|second|minutes|seconds) *output'
-                              ' *rate *(?P<out_rate>[0-9]+)'
-                              ' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
-                              ' *packets/sec$')
-            m = p22.match(line)
-            if m:
+            if name == 'p22':
                 load_interval = int(m.groupdict()['load_interval'])
                 out_rate = int(m.groupdict()['out_rate'])
                 out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
@@ -694,12 +929,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
-            p23 = re.compile(r'^\s*input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
-                              ' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
-                              ' *(?P<out_rate_bps>[0-9]+) *bps,'
-                              ' *(?P<out_rate_pps>[0-9]+) *pps$')
-            m = p23.match(line)
-            if m:
+            if name == 'p23':
                 in_rate_bps = int(m.groupdict()['in_rate_bps'])
                 in_rate_pps = int(m.groupdict()['in_rate_pps'])
                 out_rate_bps = int(m.groupdict()['out_rate_bps'])
@@ -720,43 +950,32 @@ class ShowInterface(ShowInterfaceSchema):
                 ['out_rate_pps'] = out_rate_pps
                 continue
             
-            p23_1 = re.compile(r'^\s*(?P<rx>(RX))$')
-            m = p23_1.match(line)
-            if m:
-                rx = m.groupdict()['rx']
+            if name == 'p23_1':
+                skip.discard('p24')
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
 
                 interface_dict[interface]['counters']['rx'] = True
                 continue
 
-            if rx:
-                #0 unicast packets  0 multicast packets  0 broadcast packets
-                p24 = re.compile(r'^\s*(?P<in_unicast_pkts>[0-9]+) +unicast +packets'
-                                  ' +(?P<in_multicast_pkts>[0-9]+) +multicast +packets'
-                                  ' +(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets$')
+            #0 unicast packets  0 multicast packets  0 broadcast packets
+            if name == 'p24':
+                in_unicast_pkts = int(m.groupdict()['in_unicast_pkts'])
+                in_multicast_pkts = int(m.groupdict()['in_multicast_pkts'])
+                in_broadcast_pkts = int(m.groupdict()['in_broadcast_pkts'])
+        
+                interface_dict[interface]['counters']['in_unicast_pkts'] = in_unicast_pkts
+                interface_dict[interface]['counters']['in_multicast_pkts'] = in_multicast_pkts
+                interface_dict[interface]['counters']['in_broadcast_pkts'] = in_broadcast_pkts
+                try:
+                    interface_dict[interface]['counters']['last_clear'] = last_clear
+                except Exception:
+                    pass
+                continue
 
-                m = p24.match(line)
-                if m:
-                    in_unicast_pkts = int(m.groupdict()['in_unicast_pkts'])
-                    in_multicast_pkts = int(m.groupdict()['in_multicast_pkts'])
-                    in_broadcast_pkts = int(m.groupdict()['in_broadcast_pkts'])
-            
-                    interface_dict[interface]['counters']['in_unicast_pkts'] = in_unicast_pkts
-                    interface_dict[interface]['counters']['in_multicast_pkts'] = in_multicast_pkts
-                    interface_dict[interface]['counters']['in_broadcast_pkts'] = in_broadcast_pkts
-                    try:
-                        interface_dict[interface]['counters']['last_clear'] = last_clear
-                    except Exception:
-                        pass
-                    continue
-                    
 
             #0 input packets  0 bytes
-            p25 = re.compile(r'^\s*(?P<in_pkts>[0-9]+) +input +packets'
-                              ' +(?P<in_octets>[0-9]+) +bytes$')
-            m = p25.match(line)
-            if m:
+            if name == 'p25':
                 in_pkts = int(m.groupdict()['in_pkts'])
                 in_octets = int(m.groupdict()['in_octets'])
                 if 'counters' not in interface_dict[interface]:
@@ -767,11 +986,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 jumbo packets  0 storm suppression packets
-            p26 = re.compile(r'^\s*(?P<in_jumbo_packets>[0-9]+) +jumbo +packets'
-                              ' *(?P<in_storm_suppression_packets>[0-9]+)'
-                              ' *storm *suppression *packets$')
-            m = p26.match(line)
-            if m:
+            if name == 'p26':
                 in_jumbo_packets = int(m.groupdict()['in_jumbo_packets'])
                 in_storm_suppression_packets = int(m.groupdict()['in_storm_suppression_packets'])
 
@@ -782,12 +997,7 @@ class ShowInterface(ShowInterfaceSchema):
 
             #0 runts  0 giants  0 CRC/FCS  0 no buffer
             #0 runts  0 giants  0 CRC  0 no buffer
-            p27 = re.compile(r'^\s*(?P<in_runts>[0-9]+) *runts'
-                              ' *(?P<in_oversize_frame>[0-9]+) *giants'
-                              ' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
-                              ' *(?P<in_no_buffer>[0-9]+) *no *buffer$')
-            m = p27.match(line)
-            if m:
+            if name == 'p27':
 
                 interface_dict[interface]['counters']['in_runts'] = int(m.groupdict()['in_runts'])
                 interface_dict[interface]['counters']['in_oversize_frame'] = int(m.groupdict()['in_oversize_frame'])
@@ -796,12 +1006,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
-            p28 = re.compile(r'^\s*(?P<in_errors>[0-9]+) *input *error'
-                              ' *(?P<in_short_frame>[0-9]+) *short *frame'
-                              ' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
-                              ' *underrun *(?P<in_ignored>[0-9]+) *ignored$')
-            m = p28.match(line)
-            if m:
+            if name == 'p28':
 
                 interface_dict[interface]['counters']['in_errors'] = int(m.groupdict()['in_errors'])
                 interface_dict[interface]['counters']['in_short_frame'] = int(m.groupdict()['in_short_frame'])
@@ -811,13 +1016,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
-            p29 = re.compile(r'^\s*(?P<in_watchdog>[0-9]+) *watchdog'
-                              ' *(?P<in_bad_etype_drop>[0-9]+)'
-                              ' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
-                              ' *bad *proto'
-                              ' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$')
-            m = p29.match(line)
-            if m:
+            if name == 'p29':
 
                 interface_dict[interface]['counters']['in_watchdog'] = int(m.groupdict()['in_watchdog'])
                 interface_dict[interface]['counters']['in_bad_etype_drop'] = int(m.groupdict()['in_bad_etype_drop'])
@@ -825,10 +1024,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['counters']['in_if_down_drop'] = int(m.groupdict()['in_if_down_drop'])
                 continue
 
-            p30 = re.compile(r'^\s*(?P<in_with_dribble>[0-9]+) *input *with'
-                              ' *dribble *(?P<in_discard>[0-9]+) *input *discard$')
-            m = p30.match(line)
-            if m:
+            if name == 'p30':
                 in_with_dribble = int(m.groupdict()['in_with_dribble'])
                 in_discard = int(m.groupdict()['in_discard'])
 
@@ -836,41 +1032,29 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['counters']['in_discard'] = in_discard
                 continue
 
-            p31 = re.compile(r'^\s*(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$')
-            m = p31.match(line)
-            if m:
+            if name == 'p31':
                 in_mac_pause_frames = int(m.groupdict()['in_mac_pause_frames'])
 
                 interface_dict[interface]['counters']['in_mac_pause_frames'] = in_mac_pause_frames
                 continue
                 
-            p31_1 = re.compile(r'^\s*(?P<tx>(TX))$')
-            m = p31_1.match(line)
-            if m:
-                rx = False
-                tx = m.groupdict()['tx']
+            if name == 'p31_1':
+                skip.add('p24')
+                skip.discard('p32')
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
                 interface_dict[interface]['counters']['tx'] = True
                 continue
                 
-            if tx:
-                #0 unicast packets  0 multicast packets  0 broadcast packets
-                p32 = re.compile(r'^\s*(?P<out_unicast_pkts>[0-9]+) *unicast *packets'
-                                  ' *(?P<out_multicast_pkts>[0-9]+) *multicast *packets'
-                                  ' *(?P<out_broadcast_pkts>[0-9]+) *broadcast *packets$')
-                m = p32.match(line)
-                if m:
-                    interface_dict[interface]['counters']['out_unicast_pkts'] = int(m.groupdict()['out_unicast_pkts'])
-                    interface_dict[interface]['counters']['out_multicast_pkts'] = int(m.groupdict()['out_multicast_pkts'])
-                    interface_dict[interface]['counters']['out_broadcast_pkts'] = int(m.groupdict()['out_broadcast_pkts'])
-                    continue
+            #0 unicast packets  0 multicast packets  0 broadcast packets
+            if name == 'p32':
+                interface_dict[interface]['counters']['out_unicast_pkts'] = int(m.groupdict()['out_unicast_pkts'])
+                interface_dict[interface]['counters']['out_multicast_pkts'] = int(m.groupdict()['out_multicast_pkts'])
+                interface_dict[interface]['counters']['out_broadcast_pkts'] = int(m.groupdict()['out_broadcast_pkts'])
+                continue
 
             #0 output packets  0 bytes
-            p33 = re.compile(r'^\s*(?P<out_pkts>[0-9]+) *output *packets'
-                              ' *(?P<out_octets>[0-9]+) *bytes$')
-            m = p33.match(line)
-            if m:
+            if name == 'p33':
                 out_pkts = int(m.groupdict()['out_pkts'])
                 out_octets = int(m.groupdict()['out_octets'])
 
@@ -879,22 +1063,14 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 jumbo packets
-            p34 = re.compile(r'^\s*(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$')
-            m = p34.match(line)
-            if m:
+            if name == 'p34':
                 out_jumbo_packets = int(m.groupdict()['out_jumbo_packets'])
 
                 interface_dict[interface]['counters']['out_jumbo_packets'] = out_jumbo_packets
                 continue
 
             #0 output error  0 collision  0 deferred  0 late collision
-            p35 = re.compile(r'^\s*(?P<out_errors>[0-9]+) *output *error'
-                              ' *(?P<out_collision>[0-9]+) *collision'
-                              ' *(?P<out_deferred>[0-9]+) *deferred'
-                              ' *(?P<out_late_collision>[0-9]+)'
-                              ' *late *collision$')
-            m = p35.match(line)
-            if m:
+            if name == 'p35':
                 interface_dict[interface]['counters']['out_errors'] = int(m.groupdict()['out_errors'])
                 interface_dict[interface]['counters']['out_collision'] = int(m.groupdict()['out_collision'])
                 interface_dict[interface]['counters']['out_deferred'] = int(m.groupdict()['out_deferred'])
@@ -902,12 +1078,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 lost carrier  0 no carrier  0 babble  0 output discard
-            p36 = re.compile(r'^\s*(?P<out_lost_carrier>[0-9]+) *lost *carrier'
-                              ' *(?P<out_no_carrier>[0-9]+) *no *carrier'
-                              ' *(?P<out_babble>[0-9]+) *babble'
-                              ' *(?P<out_discard>[0-9]+) *output *discard$')
-            m = p36.match(line)
-            if m:
+            if name == 'p36':
 
                 interface_dict[interface]['counters']['out_lost_carrier'] = int(m.groupdict()['out_lost_carrier'])
                 interface_dict[interface]['counters']['out_no_carrier'] = int(m.groupdict()['out_no_carrier'])
@@ -916,9 +1087,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 Tx pause
-            p37 = re.compile(r'^\s*(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$')
-            m = p37.match(line)
-            if m:
+            if name == 'p37':
                 out_mac_pause_frames = int(m.groupdict()['out_mac_pause_frames'])
 
                 interface_dict[interface]['counters']['out_mac_pause_frames'] = out_mac_pause_frames
@@ -12,6 +12,10 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# Parser
+from genie.libs.parser.utils.syslog import log_entry, log_cursor, \
+    after_cursor
+
 
 # ==============================================
 # Schema for:
@@ -27,6 +31,21 @@ class ShowLoggingLogfileSchema(MetaParser):
 
     schema = {
         'logs': list,
+        Optional('entries'): {
+            Any(): {
+                'timestamp': str,
+                Optional('hostname'): str,
+                Optional('facility'): str,
+                Optional('severity'): int,
+                Optional('mnemonic'): str,
+                'message': str,
+                },
+            },
+        Optional('cursor'): {
+            'timestamp': str,
+            'hash': str,
+            Optional('occurrence'): int,
+            },
         }
 
 
@@ -45,9 +64,25 @@ class ShowLoggingLogfile(ShowLoggingLogfileSchema):
     cli_command = ['show logging logfile | include {include}',
                    'show logging logfile',
                    ]
-    exclude = ['logs']
-
-    def cli(self, include='', output=None):
+    exclude = ['logs', 'entries', 'cursor']
+
+    # 2019 May 22 16:20:45 ha01-n7010-01 %ACLLOG-5-ACLLOG_FLOW_INTERVAL: Src IP: 172.30.10.100, Dst IP: 10.135.15.2
+    # 2019 May 22 16:20:45.123 %VSHD-5-VSHD_SYSLOG_CONFIG_I: Configured from vty by admin on console0
+    p1 = re.compile(r'^(?P<timestamp>\d{4} +[A-Z][a-z]{2} +\d+ +\d+:\d+:\d+'
+                    r'(?:\.\d+)?(?: +[A-Z]{3,4}(?=:))?):? +'
+                    r'(?:(?:(?P<hostname>[^%\s]\S*) +)?'
+                    r'%(?P<facility>[A-Z0-9_]+(?:-[A-Z0-9_]+)*)-'
+                    r'(?P<severity>[0-7])-(?P<mnemonic>[A-Z0-9_]+): *)?'
+                    r'(?P<message>.*)$')
+
+    def cli(self, include='', output=None, structured=False, cursor=None):
+        '''
+            Args:
+                structured (`bool`): also split the syslog entries into their
+                                     fields, under 'entries'
+                cursor (`dict`): 'cursor' of a previous parse, only the lines
+                                 logged after its entry are parsed
+        '''
 
         if output is None:
             # Build the command
@@ -60,17 +95,40 @@ class ShowLoggingLogfile(ShowLoggingLogfileSchema):
         else:
             out = output
 
+        # Lines after the last entry of the previous parse
+        if cursor:
+            lines = out[after_cursor(out, cursor):]
+        else:
+            lines = out
+
         # Init vars
         parsed_dict = {}
         log_lines = []
+        index = 0
 
-        for line in out.splitlines():
+        for line in lines.splitlines():
             line = line.strip()
 
             # Add line to 'logs'
             if line and 'show logging logfile' not in line:
                 log_lines.append(line)
                 parsed_dict['logs'] = log_lines
+
+                if structured:
+                    # 2019 May 22 16:20:45 ha01-n7010-01 %ACLLOG-5-ACLLOG_FLOW_INTERVAL: Src IP: 172.30.10.100
+                    m = self.p1.match(line)
+                    if m:
+                        index += 1
+                        parsed_dict.setdefault('entries', {})[index] = \
+                            log_entry(m)
                 continue
 
+        if structured or cursor is not None:
+            last = log_cursor(log_lines, self.p1, output=out) or cursor
+            if last:
+                parsed_dict['cursor'] = last
+            if cursor is not None:
+                # Nothing logged since the cursor is not an empty output
+                parsed_dict['logs'] = log_lines
+
         return parsed_dict
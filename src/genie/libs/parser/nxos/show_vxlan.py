@@ -27,6 +27,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.parallel import RecordSplit
 
 
 class ShowL2routeEvpnImetAllDetailSchema(MetaParser):
@@ -1297,6 +1298,13 @@ class ShowL2routeMacAllDetail(ShowL2routeMacAllDetailSchema):
     exclude = [
         'mac']
 
+    # 101         5e00.0002.0007 VXLAN  Rmac          0          192.168.106.1
+    p1 = re.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<mac_addr>[\w\.]+) +(?P<prod_type>[\w\,]+)'
+                    ' +(?P<flags>[\w\,\-]+) +(?P<seq_num>[\d]+) +(?P<next_hop1>[\w\/\.]+)$')
+
+    # Records of parse_parallel, see genie.libs.parser.utils.parallel
+    record_split = RecordSplit(header=p1)
+
     def cli(self, output=None):
         # excute command to get output
         if output is None:
@@ -1312,8 +1320,7 @@ class ShowL2routeMacAllDetail(ShowL2routeMacAllDetailSchema):
         #            Forwarding State: Resolved (PeerID: 2)
         #            Sent To: BGP
         #            SOO: 774975538
-        p1 = re.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<mac_addr>[\w\.]+) +(?P<prod_type>[\w\,]+)'
-                        ' +(?P<flags>[\w\,\-]+) +(?P<seq_num>[\d]+) +(?P<next_hop1>[\w\/\.]+)$')
+        p1 = self.p1
 
         p2 = re.compile(r'^\s*Route +Resolution +Type: +(?P<rte_res>[\w]+)$')
         p3 = re.compile(r'^\s*Forwarding +State: +(?P<fwd_state>[\w]+)( +\(PeerID: +(?P<peer_id>[\d]+)\))?$')
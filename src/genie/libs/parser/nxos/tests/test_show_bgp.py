@@ -43,6 +43,8 @@ from genie.libs.parser.nxos.show_bgp import ShowBgpProcessVrfAll,\
                                  ShowBgpL2vpnEvpnNeighborsAdvertisedRoutes, \
                                  ShowBgpVrfIpv4Unicast
 
+from genie.libs.parser.utils.stream import fold_records
+
 # =========================================
 #  Unit test for 'show bgp process vrf all'
 # =========================================
@@ -7117,6 +7119,27 @@ class test_show_bgp_vrf_all_all(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output,self.golden_parsed_output4)
 
+    def test_show_bgp_vrf_all_all_iter_routes(self):
+        self.maxDiff = None
+        obj = ShowBgpVrfAllAll(device=Mock())
+        lines = iter(self.golden_output3['execute.return_value'].splitlines())
+        records = obj.iter_routes(lines)
+
+        # Records are yielded while the lines are read
+        keys, values = next(records)
+        self.assertEqual(keys, ('vrf', 'default', 'address_family',
+                                'ipv4 unicast'))
+        keys, values = next(records)
+        keys, values = next(records)
+        self.assertEqual(keys, ('vrf', 'default', 'address_family',
+                                'ipv4 unicast', 'prefixes', '10.4.1.0/24',
+                                'index', 1))
+        self.assertIsNotNone(next(lines, None))
+
+        records = list(obj.iter_routes(
+            self.golden_output3['execute.return_value'].splitlines()))
+        self.assertEqual(fold_records(records), self.golden_parsed_output3)
+
     def test_show_bgp_vrf_all_all_empty(self):
         self.device = Mock(**self.empty_output)
         obj = ShowBgpVrfAllAll(device=self.device)
@@ -723,6 +723,14 @@ class test_show_mac_address_table(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output)
 
+    def test_golden_columns(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output)
+        obj = ShowMacAddressTable(device=self.device)
+        table = obj.cli_columns()
+        self.assertEqual(len(table['mac_address']), len(table))
+        self.assertEqual(obj.to_dict(table), self.golden_parsed_output)
+
     def test_empty(self):
         self.device = Mock(**self.empty_output)
         obj = ShowMacAddressTable(device=self.device)
@@ -884,6 +884,28 @@ class test_show_interface(unittest.TestCase):
         self.maxDiff = None
         self.assertEqual(parsed_output, self.golden_parsed_output_custom)
 
+    def test_golden_filter(self):
+        self.device = Mock(**self.golden_output1)
+        interface_obj = ShowInterface(device=self.device)
+        parsed_output = interface_obj.parse(filter=['Ethernet2/1.*', 'Eth1/1'])
+        self.maxDiff = None
+        self.assertEqual(parsed_output, {
+            intf: self.golden_parsed_output1[intf] for intf in
+            ['Ethernet2/1.10', 'Ethernet2/1.20', 'Ethernet1/1']})
+
+    def test_golden_counters(self):
+        self.device = Mock(**self.golden_output1)
+        interface_obj = ShowInterface(device=self.device)
+        sample = interface_obj.cli_counters()
+        # The counters of the whole parser
+        self.maxDiff = None
+        self.assertEqual(
+            {intf: sample.to_dict(intf) for intf in sample},
+            {intf: {key: value for key, value in intf_dict['counters'].items()
+                   if not isinstance(value, bool)}
+             for intf, intf_dict in self.golden_parsed_output1.items()
+             if intf_dict.get('counters')})
+
 # #############################################################################
 # # Unitest For Show Ip Interface Vrf All
 # #############################################################################
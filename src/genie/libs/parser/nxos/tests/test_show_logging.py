@@ -54,6 +54,70 @@ class test_show_logging(unittest.TestCase):
         parsed_output = obj.parse(include='acl')
         self.assertEqual(parsed_output, self.golden_parsed_output_1)
 
+    def test_show_logging_structured(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output_1)
+        obj = ShowLoggingLogfile(device=self.device)
+        parsed_output = obj.parse(include='acl', structured=True)
+        self.assertEqual(parsed_output['logs'],
+                         self.golden_parsed_output_1['logs'])
+        self.assertEqual(parsed_output['entries'][2], {
+            'timestamp': '2019 May 22 16:20:50',
+            'hostname': 'ha01-n7010-01',
+            'facility': 'ACLLOG',
+            'severity': 5,
+            'mnemonic': 'ACLLOG_FLOW_INTERVAL',
+            'message': 'Src IP: 172.30.10.100, Dst IP: 10.135.15.2, Src Port: 0, Dst Port: 0, Src Intf: Ethernet3/3, Protocol: "IP"(253), ACL Name: match-ef-acl, ACE Action: Permit, Appl Intf: Vlan10, Hit-count: 500'})
+        self.assertEqual(parsed_output['cursor']['timestamp'],
+                         '2019 May 22 16:20:50')
+
+    def test_show_logging_cursor(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output_1)
+        obj = ShowLoggingLogfile(device=self.device)
+        cursor = obj.parse(include='acl', structured=True)['cursor']
+        out = self.golden_output_1['execute.return_value'] + \
+            '2019 May 22 16:20:55 %VSHD-5-VSHD_SYSLOG_CONFIG_I: Configured from vty by admin on console0\n'
+        self.device = Mock(**{'execute.return_value': out})
+        obj = ShowLoggingLogfile(device=self.device)
+        parsed_output = obj.parse(cursor=cursor, structured=True)
+        self.assertEqual(parsed_output['logs'], [
+            '2019 May 22 16:20:55 %VSHD-5-VSHD_SYSLOG_CONFIG_I: Configured from vty by admin on console0'])
+        self.assertEqual(parsed_output['entries'][1]['mnemonic'],
+                         'VSHD_SYSLOG_CONFIG_I')
+        self.assertNotIn('hostname', parsed_output['entries'][1])
+
+        # Nothing new
+        parsed_output = obj.parse(cursor=parsed_output['cursor'])
+        self.assertEqual(parsed_output['logs'], [])
+
+    def test_show_logging_cursor_duplicates(self):
+        self.maxDiff = None
+        line = '2019 May 22 16:20:55 %VSHD-5-VSHD_SYSLOG_CONFIG_I: Configured from vty by admin on console0'
+        out = self.golden_output_1['execute.return_value'] + line + '\n'
+        self.device = Mock(**{'execute.return_value': out})
+        obj = ShowLoggingLogfile(device=self.device)
+        cursor = obj.parse(structured=True)['cursor']
+
+        # The same message again in the same second, then another one
+        out += line + '\n' + '2019 May 22 16:20:56 %VSHD-5-VSHD_SYSLOG_CONFIG_I: Configured from vty by admin on console1\n'
+        self.device = Mock(**{'execute.return_value': out})
+        obj = ShowLoggingLogfile(device=self.device)
+        parsed_output = obj.parse(cursor=cursor, structured=True)
+        self.assertEqual(parsed_output['logs'], [
+            line,
+            '2019 May 22 16:20:56 %VSHD-5-VSHD_SYSLOG_CONFIG_I: Configured from vty by admin on console1'])
+
+        # Cursor on the second identical line
+        out = self.golden_output_1['execute.return_value'] + line + '\n' + line + '\n'
+        self.device = Mock(**{'execute.return_value': out})
+        obj = ShowLoggingLogfile(device=self.device)
+        cursor = obj.parse(structured=True)['cursor']
+        self.assertEqual(cursor['occurrence'], 2)
+        self.device = Mock(**{'execute.return_value': out + line + '\n'})
+        obj = ShowLoggingLogfile(device=self.device)
+        self.assertEqual(obj.parse(cursor=cursor)['logs'], [line])
+
 
 if __name__ == '__main__':
     unittest.main()
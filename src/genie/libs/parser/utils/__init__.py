@@ -1 +1,5 @@
-from .common import get_parser, get_parser_exclude, get_parser_commands
+from .common import get_parser, get_parser_exclude, get_parser_commands, \
+                    get_parser_docs, get_parser_auxiliary_commands, \
+                    prefetch_outputs, parse_output
+from .orchestrator import parse_devices, ParseResult
+from .parallel import parse_parallel
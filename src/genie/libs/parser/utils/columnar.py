@@ -0,0 +1,68 @@
+'''Columnar results for tabular parsers
+
+A tabular parser builds one small dict per row of the output; with 200k
+MAC addresses the dicts cost more memory and time than the parsing itself.
+Parsers with a `cli_columns` method return the rows as a ColumnTable
+instead: one list per column, a row being a position in the lists.
+
+    >>> table = ShowMacAddressTable(device=dev).cli_columns()
+    >>> len(table)
+    200000
+    >>> table['mac']
+    ['aaaa.bbbb.cccc', ...]
+    >>> table.index('vlan')['10']
+    [0, 4, 12, ...]
+
+The parser `to_dict(table)` turns the table into the usual parsed output;
+`cli()` is cli_columns followed by to_dict.
+'''
+
+
+class ColumnTable(object):
+    '''Rows stored as one list per column
+
+        Args:
+            columns (`tuple`): names of the columns, in the order of the
+                               values given to append
+    '''
+
+    def __init__(self, columns):
+        self.columns = tuple(columns)
+        self._data = [[] for _ in self.columns]
+        self._appends = [values.append for values in self._data]
+        self._position = {name: i for i, name in enumerate(self.columns)}
+        # column -> {value: [row, ...]}
+        self._indexes = {}
+        # Values of the output outside the rows, ex: a total
+        self.summary = {}
+
+    def append(self, *values):
+        '''Add a row, one value per column'''
+        for append, value in zip(self._appends, values):
+            append(value)
+        self._indexes.clear()
+
+    def __len__(self):
+        return len(self._data[0]) if self._data else 0
+
+    def __getitem__(self, column):
+        '''Values of the column, one per row'''
+        return self._data[self._position[column]]
+
+    def __iter__(self):
+        '''Rows as tuples of values'''
+        return zip(*self._data)
+
+    def row(self, i):
+        '''Row i as a dict of column -> value'''
+        return {name: values[i] for name, values in zip(self.columns,
+                                                        self._data)}
+
+    def index(self, column):
+        '''Dict of value -> positions of the rows holding it, built once'''
+        index = self._indexes.get(column)
+        if index is None:
+            index = self._indexes[column] = {}
+            for i, value in enumerate(self[column]):
+                index.setdefault(value, []).append(i)
+        return index
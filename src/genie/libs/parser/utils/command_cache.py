@@ -0,0 +1,192 @@
+'''Cache of the auxiliary commands run by parsers
+
+Some parsers run extra commands to complete their output, once per record
+of the main command: 'show running-config | section router ospf {}' per
+OSPF interface, 'show ip ospf interface | section {}' per neighbor, ... On
+a device with hundreds of records this is hundreds of round-trips, most of
+them returning the same output.
+
+CommandCache runs each command once and keeps its output. Instead of a
+filtered command per record, a parser can run the unfiltered command once
+and build an index of its output with `index`; later records are answered
+from the index.
+
+By default a cache lives for one parse. A cache attached to the device is
+shared by all the parses on that device, until its outputs expire:
+
+    >>> cache = CommandCache.attach(device, ttl=30)
+    >>> device.parse('show ip ospf interface')
+    >>> device.parse('show ip ospf neighbor detail')  # config not fetched again
+    >>> CommandCache.detach(device)
+
+Parsers list the commands they run through the cache in their
+`auxiliary_commands` attribute. Given the outputs of those commands, an
+offline cache never reaches the device and the parse is pure:
+
+    >>> CommandCache.attach(device, outputs=outputs, offline=True)
+
+NETCONF replies are cached the same way, keyed by their filter: `get`
+sends a get with a subtree filter once and keeps the reply, so the yang
+parsers built on the same model share a single RPC. Outputs known to be
+stale are dropped with `invalidate`:
+
+    >>> bgp = '<bgp xmlns="http://openconfig.net/yang/bgp"/>'
+    >>> reply = cache.get(bgp)
+    >>> cache.invalidate(('subtree', bgp))
+
+A cache can be shared by threads: a command asked for by several threads at
+once runs once, the others wait for its output.
+'''
+
+# python
+import time
+import threading
+from concurrent.futures import Future
+
+
+class CommandCache(object):
+    '''Outputs of the commands run on a device, and indexes built on them
+
+        Args:
+            device (`Device`): device to run the commands on. None for an
+                               offline cache, which only knows `outputs`
+            ttl (`int`): seconds an output is kept. None to keep it for the
+                         life of the cache
+            outputs (`dict`): command -> output, known beforehand. These
+                              never expire. The command of a NETCONF get
+                              is its filter, ex: ('subtree', '<bgp/>')
+    '''
+
+    # Attribute of the device holding the cache shared by its parsers
+    ATTRIBUTE = 'parser_command_cache'
+
+    def __init__(self, device, ttl=None, outputs=None, clock=time.monotonic):
+        self.device = device
+        self.ttl = ttl
+        self._clock = clock
+        # command -> (time of execution, output, {builder: index}), the time
+        # is None for the outputs given by the user
+        self._entries = {}
+        for command, output in (outputs or {}).items():
+            self._entries[command] = (None, output, {})
+        self._lock = threading.Lock()
+        # command -> Future of the entry, while the command runs
+        self._running = {}
+
+    @classmethod
+    def attach(cls, device, ttl=None, outputs=None, offline=False):
+        '''Create a cache shared by all the parsers of the device
+
+            Args:
+                device (`Device`): device to attach the cache to
+                ttl (`int`): seconds an output is kept
+                outputs (`dict`): command -> output, known beforehand
+                offline (`bool`): never run a command on the device, the
+                                  commands missing from outputs fail
+        '''
+        cache = cls(None if offline else device, ttl=ttl, outputs=outputs)
+        setattr(device, cls.ATTRIBUTE, cache)
+        return cache
+
+    @classmethod
+    def detach(cls, device):
+        '''Remove the cache attached to the device, if any'''
+        if isinstance(getattr(device, cls.ATTRIBUTE, None), cls):
+            delattr(device, cls.ATTRIBUTE)
+
+    @classmethod
+    def from_device(cls, device):
+        '''Return the cache attached to the device, or a new one to be used
+           for a single parse'''
+        cache = getattr(device, cls.ATTRIBUTE, None)
+        if isinstance(cache, cls):
+            return cache
+        return cls(device)
+
+    def _fresh(self, command):
+        entry = self._entries.get(command)
+        if entry is not None and entry[0] is not None and \
+                self.ttl is not None and self._clock() - entry[0] >= self.ttl:
+            entry = None
+        return entry
+
+    def _entry(self, command):
+        with self._lock:
+            entry = self._fresh(command)
+            if entry is not None:
+                return entry
+            running = self._running.get(command)
+            if running is None:
+                future = self._running[command] = Future()
+        if running is not None:
+            # Run by another thread
+            return running.result()
+
+        try:
+            if self.device is None:
+                raise KeyError("No output given for '{c}' and no device to "
+                               "run it on".format(c=command))
+            if isinstance(command, tuple):
+                # filter of a NETCONF get
+                output = self.device.get(command)
+            else:
+                output = self.device.execute(command)
+        except BaseException as e:
+            with self._lock:
+                del self._running[command]
+            future.set_exception(e)
+            raise
+        entry = (self._clock(), output, {})
+        with self._lock:
+            self._entries[command] = entry
+            del self._running[command]
+        future.set_result(entry)
+        return entry
+
+    def execute(self, command):
+        '''Return the output of the command, running it on the device only
+           if it is not cached'''
+        return self._entry(command)[1]
+
+    def get(self, subtree):
+        '''Return the reply of a NETCONF get with the subtree filter,
+           sending it to the device only if it is not cached'''
+        return self._entry(('subtree', subtree))[1]
+
+    def cached(self, command):
+        '''True if the output of the command is known and not expired'''
+        return self._fresh(command) is not None
+
+    def index(self, command, builder):
+        '''Return builder(output of the command)
+
+           The index is built once per output and dropped with it.
+
+            Args:
+                command (`str`): command to run
+                builder (`callable`): function of the output, returning the
+                                      index, usually a dict
+        '''
+        _, output, indexes = self._entry(command)
+        if builder not in indexes:
+            indexes[builder] = builder(output)
+        return indexes[builder]
+
+    @property
+    def outputs(self):
+        '''command -> output of all the commands known to the cache'''
+        with self._lock:
+            return {command: entry[1]
+                    for command, entry in self._entries.items()}
+
+    def invalidate(self, *commands):
+        '''Forget the outputs of the commands, ex: after a configuration
+           change'''
+        with self._lock:
+            for command in commands:
+                self._entries.pop(command, None)
+
+    def clear(self):
+        '''Forget all the outputs'''
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,190 @@
+'''Precompiled command lookup index used by get_parser
+
+The parser data (parsers.json) maps show commands, some of them templated
+with '{keyword}' placeholders, to the parser module and class per os and
+platform token. Resolving a templated command used to mean compiling one
+regex per template and trying all of them on every call.
+
+CommandIndex does that work once per process:
+
+    * Every template is compiled into a single matcher.
+    * Templates are stored in a trie keyed on their leading literal words,
+      so only the templates sharing a prefix with the command are tried.
+    * Results are cached per (command, os, lookup tokens), in a cache
+      shared by the threads of the process.
+
+The result is identical to the original rule: among the templates which
+match the command and support the device os, the one with the most
+literal words wins, ties going to the first one found in the parser data.
+'''
+
+# python
+import re
+import threading
+from collections import OrderedDict
+
+# Placeholders which can only ever be a single word
+SINGLE_WORD_KEYWORDS = ('vrf', 'rd', 'instance', 'vrf_type')
+
+# Any character which makes a word more than a literal in the template regex
+_REGEX_SPECIAL = re.compile(r'[.^$*+?()\[\]\\{}]')
+
+# Not cached, None is a cached miss
+_MISSING = object()
+
+
+class CommandTemplate(object):
+    '''One templated command from the parser data, compiled once.
+
+        Args:
+            command (`str`): templated command, ex: 'show bgp vrf {vrf} all'
+            data (`dict`): parser data for this command (os -> ...)
+            order (`int`): position of the command in the parser data
+    '''
+
+    __slots__ = ('command', 'data', 'order', 'regex', 'literal_words',
+                 'prefix')
+
+    def __init__(self, command, data, order):
+        self.command = command
+        self.data = data
+        self.order = order
+
+        patterns = re.findall('{.*?}', command)
+        # Number of literal words, used to find the most specific template
+        self.literal_words = len(set(command.split()) - set(patterns))
+
+        reg = command
+        for pattern in patterns:
+            word = pattern.replace('{', '').replace('}', '')
+            if word in SINGLE_WORD_KEYWORDS:
+                new_pattern = r'(?P<{p}>\\S+)'.format(p=word)
+            else:
+                new_pattern = '(?P<{p}>.*)'.format(p=word)
+            reg = re.sub(pattern, new_pattern, reg)
+        reg += '$'
+        # Convert | to \|
+        reg = reg.replace('|', r'\|')
+        self.regex = re.compile(reg)
+
+        # Leading words which are matched literally by the regex; the
+        # command must start with exactly those words for the regex to match
+        self.prefix = []
+        words = command.split(' ')
+        for word in words[:-1]:
+            if _REGEX_SPECIAL.search(word.replace('|', '')):
+                break
+            self.prefix.append(word)
+
+    def match(self, command):
+        return self.regex.match(command)
+
+
+class CommandIndex(object):
+    '''Dispatch index over the templated commands of the parser data
+
+        Args:
+            data (`dict`): parser data, as loaded from parsers.json
+            cache_size (`int`): maximum number of resolved commands to keep
+
+        example:
+
+            >>> index = CommandIndex(parser_data)
+            >>> index.lookup('show bgp vrf VRF1 all', 'nxos', ['nxos'])
+            ({'module_name': 'show_bgp', ...}, {'vrf': 'VRF1'})
+    '''
+
+    def __init__(self, data, cache_size=4096):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        # parse_devices looks up from many threads
+        self._lock = threading.Lock()
+        self._trie = {}
+        self.templates = []
+
+        for order, (command, values) in enumerate(data.items()):
+            if '{' not in command or not isinstance(values, dict):
+                # Disregard the non regex ones
+                continue
+            template = CommandTemplate(command, values, order)
+            self.templates.append(template)
+
+            node = self._trie
+            for word in template.prefix:
+                node = node.setdefault(word, {})
+            node.setdefault(None, []).append(template)
+
+    def candidates(self, command):
+        '''Return the templates which could match the command, in parser
+           data order'''
+        found = list(self._trie.get(None, []))
+        node = self._trie
+        for word in command.split(' '):
+            node = node.get(word)
+            if node is None:
+                break
+            found.extend(node.get(None, []))
+        found.sort(key=lambda template: template.order)
+        return found
+
+    def lookup(self, command, os, tokens):
+        '''Find the parser data and kwargs for a templated command
+
+            Args:
+                command (`str`): command to find, ex: 'show bgp vrf VRF1 all'
+                os (`str`): device os
+                tokens (`list`): lookup tokens of the device
+
+            Returns:
+                tuple of the parser data reached through the tokens and the
+                kwargs extracted from the command
+
+            Raises:
+                SyntaxError: could not find a parser match
+        '''
+        key = (command, os, tuple(tokens))
+        with self._lock:
+            matches = self._cache.get(key, _MISSING)
+            if matches is not _MISSING:
+                self._cache.move_to_end(key)
+        if matches is _MISSING:
+            # Outside the lock, the templates are only read
+            matches = self._lookup(command, os, tokens)
+            with self._lock:
+                self._cache[key] = matches
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        if matches is None:
+            raise SyntaxError('Could not find a parser match')
+
+        # kwargs are handed to the caller, who is free to modify them
+        return matches[0], dict(matches[1])
+
+    def _lookup(self, command, os, tokens):
+        max_length = 0
+        matches = None
+        for template in self.candidates(command):
+            if template.literal_words <= max_length:
+                # Cannot win over the current match
+                continue
+
+            match = template.match(command)
+            if not match or os not in template.data:
+                continue
+
+            # Check if all the tokens exists; take the farthest one
+            ret_data = template.data
+            for token in tokens:
+                if token in ret_data:
+                    ret_data = ret_data[token]
+
+            max_length = template.literal_words
+            matches = (ret_data, match.groupdict())
+
+        return matches
+
+    def clear(self):
+        '''Empty the resolved command cache'''
+        with self._lock:
+            self._cache.clear()
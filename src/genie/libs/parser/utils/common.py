@@ -13,16 +13,49 @@ import importlib
 from genie.libs import parser
 from genie.abstract import Lookup
 
+from .command_index import CommandIndex
+from .command_cache import CommandCache
+from .interface_name import convert_intf_name
+
 log = logging.getLogger(__name__)
 
 
-def _load_parser_json():
-    '''get all parser data in json file'''
+# Keys of the parser data needed to find a parser class; everything else
+# (doc, schema, uid, url) is documentation and only loaded on demand
+INDEX_KEYS = ('module_name', 'class')
+
+
+def _parser_file(name):
+    '''return the path of a data file shipped with genie.libs.parser'''
     try:
         mod = importlib.import_module('genie.libs.parser')
-        parsers = os.path.join(mod.__path__[0], 'parsers.json')
+        return os.path.join(mod.__path__[0], name)
     except Exception:
-        parsers = ''
+        return ''
+
+
+def _strip_parser_data(data):
+    '''keep only the lookup keys of the parser data'''
+    index = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            index[key] = _strip_parser_data(value)
+        elif key in INDEX_KEYS or key == 'tokens':
+            index[key] = value
+    return index
+
+
+def _load_parser_json():
+    '''get the parser lookup index (command -> os/platform -> module/class)
+
+       parsers_index.json only holds what is needed to find a parser class;
+       older packages without it fall back on the full parsers.json'''
+    index = _parser_file('parsers_index.json')
+    if os.path.isfile(index):
+        with open(index) as f:
+            return json.load(f)
+
+    parsers = _parser_file('parsers.json')
     if not os.path.isfile(parsers):
         log.warning('parsers.json does not exist, make sure you '
                     'are running with latest version of '
@@ -31,12 +64,31 @@ def _load_parser_json():
     else:
         # Open all the parsers in json file
         with open(parsers) as f:
-            parser_data = json.load(f)
+            parser_data = _strip_parser_data(json.load(f))
     return parser_data
 
 # Parser within Genie
 parser_data = _load_parser_json()
 
+# Parser documentation within Genie, loaded on first use
+_parser_doc_data = None
+
+def get_parser_docs():
+    '''get all parser data in json file, including the doc, schema, uid
+       and url of each parser. Loaded on first call only.'''
+    global _parser_doc_data
+    if _parser_doc_data is None:
+        parsers = _parser_file('parsers.json')
+        if not os.path.isfile(parsers):
+            log.warning('parsers.json does not exist, make sure you '
+                        'are running with latest version of '
+                        'genie.libs.parsers')
+            _parser_doc_data = {}
+        else:
+            with open(parsers) as f:
+                _parser_doc_data = json.load(f)
+    return _parser_doc_data
+
 def get_parser_commands(device, data=parser_data):
     '''Remove all commands which contain { as this requires
        extra kwargs which cannot be guessed dynamically
@@ -70,20 +122,76 @@ def get_parser_exclude(command, device):
     except AttributeError:
         return []
 
+def get_parser_auxiliary_commands(command, device):
+    '''Return the commands the parser of the command runs on top of it'''
+    try:
+        return list(get_parser(command, device)[0].auxiliary_commands)
+    except Exception:
+        # No auxiliary_commands, or no parser for the command: get_parser
+        # raises a bare Exception
+        return []
+
+def prefetch_outputs(commands, device):
+    '''Run the commands, and the auxiliary commands of their parsers, on the
+       device. Each command is run once.
+
+        Args:
+            commands (`list`): show commands
+            device (`Device`): connected device
+
+        Returns:
+            dict of command -> output, to be given to parse_output
+    '''
+    cache = CommandCache.from_device(device)
+    for command in commands:
+        cache.execute(command)
+        for aux in get_parser_auxiliary_commands(command, device):
+            cache.execute(aux)
+    return cache.outputs
+
+def parse_output(command, device, outputs):
+    '''Parse the output of a show command without running anything on the
+       device
+
+        Args:
+            command (`str`): show command
+            device (`Device`): device the outputs come from, used to find
+                               the parser. Does not need to be connected
+            outputs (`dict`): command -> output, holding the command and
+                              the auxiliary commands of its parser
+
+        Returns:
+            parsed output
+
+        Raises:
+            KeyError: an output needed by the parser is missing
+    '''
+    parser_cls, kwargs = get_parser(command, device)
+
+    previous = getattr(device, CommandCache.ATTRIBUTE, None)
+    CommandCache.attach(device, outputs=outputs, offline=True)
+    try:
+        return parser_cls(device=device).parse(output=outputs[command],
+                                               **kwargs)
+    finally:
+        CommandCache.detach(device)
+        if isinstance(previous, CommandCache):
+            setattr(device, CommandCache.ATTRIBUTE, previous)
+
 def get_parser(command, device):
     '''From a show command and device, return parser class and kwargs if any'''
 
     kwargs = {}
+    lookup = Lookup.from_device(device, packages={'parser':parser})
     if command in parser_data:
         # Then just return it
-        lookup = Lookup.from_device(device, packages={'parser':parser})
         # Check if all the tokens exists; take the farthest one
         data = parser_data[command]
         for token in lookup._tokens:
             if token in data:
                 data = data[token]
         try:
-            return _find_parser_cls(device, data), kwargs
+            return _find_parser_cls(device, data, lookup=lookup), kwargs
         except KeyError:
             # Case when the show command is only found under one of
             # the child level tokens
@@ -93,60 +201,37 @@ def get_parser(command, device):
     else:
         # Regex world!
         try:
-            found_data, kwargs = _find_command(command, parser_data, device)
+            found_data, kwargs = _get_command_index().lookup(
+                command, device.os, lookup._tokens)
         except SyntaxError:
             # Could not find a match
             raise Exception("Could not find parser for "
                             "'{c}'".format(c=command)) from None
 
-        return _find_parser_cls(device, found_data), kwargs
+        return _find_parser_cls(device, found_data, lookup=lookup), kwargs
 
-def _find_command(command, data, device):
-    ratio = 0
-    max_lenght = 0
-    matches = None
-    for key in data:
-        if not '{' in key:
-            # Disregard the non regex ones
-            continue
+# Index over the templated commands, built on first use
+_command_index = None
+
+def _get_command_index():
+    '''Return the command index of the parsers within Genie'''
+    global _command_index
+    if _command_index is None:
+        _command_index = CommandIndex(parser_data)
+    return _command_index
 
-        # Okay... this is not optimal
-        patterns = re.findall('{.*?}', key)
-        len_normal_words = len(set(key.split()) - set(patterns))
-        reg = key
-
-        for pattern in patterns:
-            word = pattern.replace('{', '').replace('}', '')
-            new_pattern = r'(?P<{p}>\\S+)'.format(p=word) if word == 'vrf' or word == 'rd' or word == 'instance' or word=='vrf_type' else '(?P<{p}>.*)'.format(p=word)
-            reg = re.sub(pattern, new_pattern, reg)
-        reg += '$'
-        # Convert | to \|
-        reg = reg.replace('|', '\|')
-
-        match = re.match(reg, command)
-        if match:
-            if device.os not in data[key].keys():
-                continue
-
-            # Found a match!
-            lookup = Lookup.from_device(device, packages={'parser':parser})
-            # Check if all the tokens exists; take the farthest one
-            ret_data = data[key]
-            for token in lookup._tokens:
-                if token in ret_data:
-                    ret_data = ret_data[token]
-
-            if len_normal_words > max_lenght:
-                max_lenght = len_normal_words
-                matches = (ret_data, match.groupdict())
-
-    if matches:
-        return matches
-    raise SyntaxError('Could not find a parser match')
-
-
-def _find_parser_cls(device, data):
+def _find_command(command, data, device):
+    if data is parser_data:
+        index = _get_command_index()
+    else:
+        index = CommandIndex(data)
     lookup = Lookup.from_device(device, packages={'parser':parser})
+    return index.lookup(command, device.os, lookup._tokens)
+
+
+def _find_parser_cls(device, data, lookup=None):
+    if lookup is None:
+        lookup = Lookup.from_device(device, packages={'parser':parser})
     return getattr(getattr(lookup.parser, data['module_name']), data['class'])
 
 class Common():
@@ -180,46 +265,7 @@ class Common():
                 >>> convert_intf_name(intf='Eth2/1')
         '''
 
-        # Please add more when face other type of interface
-        convert = {'Eth': 'Ethernet',
-                   'Lo': 'Loopback',
-                   'Fa': 'FastEthernet',
-                   'Fas': 'FastEthernet',
-                   'Po': 'Port-channel',
-                   'PO': 'Port-channel',
-                   'Null': 'Null',
-                   'Gi': 'GigabitEthernet',
-                   'Gig': 'GigabitEthernet',
-                   'GE': 'GigabitEthernet',
-                   'Te': 'TenGigabitEthernet',
-                   'mgmt': 'mgmt',
-                   'Vl': 'Vlan',
-                   'Tu': 'Tunnel',
-                   'Fe': '',
-                   'Hs': 'HSSI',
-                   'AT': 'ATM',
-                   'Et': 'Ethernet',
-                   'BD': 'BridgeDomain',
-                   'Se': 'Serial',
-                   'Fo': 'FortyGigabitEthernet',
-                   'Hu': 'HundredGigE',
-                   'vl': 'vasileft',
-                   'rl': 'vasiright'
-                   }
-        m = re.search('([a-zA-Z]+)', intf) 
-        m1 = re.search('([\d\/\.]+)', intf)
-        if hasattr(m, 'group') and hasattr(m1, 'group'):
-            int_type = m.group(0)
-            int_port = m1.group(0)
-            if int_type in convert.keys():
-                return(convert[int_type] + int_port)
-            else:
-                # Unifying interface names
-                converted_intf = intf[0].capitalize()+intf[1:].replace(
-                    ' ','').replace('ethernet', 'Ethernet')
-                return(converted_intf)
-        else:
-            return(intf)
+        return convert_intf_name(intf)
 
 
     @classmethod
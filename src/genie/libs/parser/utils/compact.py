@@ -0,0 +1,212 @@
+'''Memory-compact parsed outputs
+
+A full routing or BGP table parses into millions of small dicts: one per
+path or next hop, each with its own hash table for the same few keys, and
+each holding its own copy of values such as 'ipv4 unicast', '*>' or
+'i'. The dicts and the strings cost several times the output itself.
+
+compact() turns a parsed output into an equivalent one built for memory:
+
+    * each dict of a fixed shape, one whose schema has no Any() key, becomes
+      a Record: a tuple of its values and a layout of its keys shared by
+      all the records of the output with the same keys. Without the schema,
+      the leaf dicts, holding no dict, become records
+    * equal strings and numbers are one object, keys and values alike
+
+    >>> parsed = compact(ShowBgpAllDetail(device=dev).parse(),
+    ...                  ShowBgpAllDetail.schema)
+    >>> path = parsed['instance']['default']['vrf']['default'] \\
+    ...     ['address_family']['vpnv4 unicast']['prefixes']['10.1.1.0/24'] \\
+    ...     ['index'][1]
+    >>> path['next_hop'], path.get('localpref')
+    ('10.4.1.1', 100)
+
+Records are read-only mappings: they compare equal to the dicts they were
+made from and support [], get, in, keys, values and items. The other dicts
+stay dicts, with their keys shared. Lists stay lists, so a compact output
+still equals the output it came from. expand() gives back plain dicts, ex:
+to change the result or to dump it as json.
+
+schema_compiler.parse(parser, compact=True) validates the result, then
+returns its compact form.
+'''
+
+# python
+import math
+from collections.abc import Mapping
+
+# Metaparser
+from genie.metaparser.util.schemaengine import Any, Optional
+
+
+class _Layout(object):
+    '''Keys of the records of one shape, and their positions'''
+
+    __slots__ = ('keys', 'index')
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.index = {key: i for i, key in enumerate(keys)}
+
+    def __reduce__(self):
+        # pickled once for all the records sharing it
+        return (_Layout, (self.keys,))
+
+
+class Record(Mapping):
+    '''Read-only mapping of a leaf dict, its values stored in a tuple'''
+
+    __slots__ = ('_layout', '_values')
+
+    def __init__(self, data):
+        self._layout = _Layout(tuple(data))
+        self._values = tuple(data.values())
+
+    @classmethod
+    def _make(cls, layout, values):
+        record = cls.__new__(cls)
+        record._layout = layout
+        record._values = values
+        return record
+
+    def __reduce__(self):
+        return (Record._make, (self._layout, self._values))
+
+    def __getitem__(self, key):
+        return self._values[self._layout.index[key]]
+
+    def get(self, key, default=None):
+        position = self._layout.index.get(key)
+        return default if position is None else self._values[position]
+
+    def __contains__(self, key):
+        return key in self._layout.index
+
+    def __iter__(self):
+        return iter(self._layout.keys)
+
+    def __len__(self):
+        return len(self._values)
+
+    def keys(self):
+        return self._layout.keys
+
+    def values(self):
+        return self._values
+
+    def items(self):
+        return zip(self._layout.keys, self._values)
+
+    def __eq__(self, other):
+        if isinstance(other, Record) and self._layout is other._layout:
+            return self._values == other._values
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{c}({d!r})'.format(c=self.__class__.__name__,
+                                   d=dict(self.items()))
+
+    def to_dict(self):
+        '''Plain dict of the record'''
+        return dict(self.items())
+
+
+class _Interner(object):
+    '''One object per equal value, for the duration of a compaction'''
+
+    def __init__(self):
+        # by type, so True, 1 and 1.0 stay apart
+        self._seen = {str: {}, int: {}, float: {}}
+
+    def __call__(self, value):
+        kind = type(value)
+        seen = self._seen.get(kind)
+        if seen is None:
+            return value
+        if kind is float:
+            # 0.0 == -0.0, the sign of a zero is kept
+            return seen.setdefault((value, math.copysign(1, value)), value)
+        return seen.setdefault(value, value)
+
+
+class _Shape(object):
+    '''Dict of a schema: fixed when its keys are all literal'''
+
+    __slots__ = ('fixed', 'children', 'any')
+
+    def __init__(self, schema):
+        self.fixed = True
+        # literal key -> _Shape or None
+        self.children = {}
+        self.any = None
+        for key, value in schema.items():
+            if isinstance(key, Optional):
+                key = getattr(key, 'schema', key)
+            if isinstance(key, str):
+                self.children[key] = _shape(value)
+            else:
+                # Any(), or keys the shape does not know
+                self.fixed = False
+                if isinstance(key, Any):
+                    self.any = _shape(value)
+
+    def child(self, key):
+        shape = self.children.get(key)
+        return self.any if shape is None else shape
+
+
+def _shape(schema):
+    return _Shape(schema) if isinstance(schema, dict) else None
+
+
+def compact(parsed, schema=None):
+    '''Return the memory-compact form of a parsed output
+
+        Args:
+            parsed (`dict`): parsed output
+            schema (`dict`): schema of the parser. The dicts of the output
+                             whose schema only has literal keys become
+                             records, even holding other dicts; the dicts
+                             under Any() keys stay dicts. Without it, only
+                             the leaf dicts become records
+    '''
+    intern = _Interner()
+    # keys -> _Layout shared by the records of the output
+    layouts = {}
+
+    def convert(value, shape):
+        if isinstance(value, dict):
+            if shape is None:
+                items = [(intern(key), convert(item, None))
+                         for key, item in value.items()]
+                record = not any(isinstance(item, (dict, Record))
+                                 for _, item in items)
+            else:
+                items = [(intern(key), convert(item, shape.child(key)))
+                         for key, item in value.items()]
+                record = shape.fixed
+            if not record:
+                return dict(items)
+            keys = tuple(key for key, _ in items)
+            layout = layouts.get(keys)
+            if layout is None:
+                layout = layouts[keys] = _Layout(keys)
+            return Record._make(layout, tuple(item for _, item in items))
+        if isinstance(value, list):
+            return [convert(item, None) for item in value]
+        return intern(value)
+
+    return convert(parsed, _shape(schema))
+
+
+def expand(parsed):
+    '''Return a parsed output of plain dicts, from its compact form'''
+    if isinstance(parsed, Mapping):
+        return {key: expand(value) for key, value in parsed.items()}
+    if isinstance(parsed, list):
+        return [expand(value) for value in parsed]
+    return parsed
@@ -0,0 +1,213 @@
+'''Interface counters of high frequency polls
+
+Polling the counters of the interfaces every few seconds with show
+interfaces pays for parsing the mtu, encapsulation, queueing and all the
+other lines of each interface. The interface parsers with a `cli_counters`
+method only match the header and the counter and rate lines of the output,
+and return a CounterSample: one list of numbers per interface, instead of
+the nested dicts of the parsed output.
+
+    >>> sample = ShowInterfaces(device=dev).cli_counters()
+    >>> sample.get('GigabitEthernet1', 'in_octets')
+    3642296
+    >>> sample.to_dict('GigabitEthernet1')
+    {'in_pkts': 23376, ..., 'rate': {'load_interval': 300, ...}}
+
+to_dict gives the 'counters' of the interface in the parsed output of cli.
+
+The delta of two samples of the same device is the change of each counter
+and its rate per second between the polls:
+
+    >>> sample.delta(previous)['GigabitEthernet1']
+    {'interval': 30.0, 'cleared': False,
+     'delta': {'in_octets': 1500, ...}, 'rate': {'in_octets': 50.0, ...}}
+
+    * a counter lower than in the previous sample has wrapped, at 2^32 when
+      its previous value fits in 32 bits, at 2^64 otherwise
+    * counters cleared since the previous sample are told by the last clear
+      time of the interface: it shows a clear more recent than the previous
+      poll. Without it, more than one counter going down is a clear, a wrap
+      hits one counter at a time. The delta of a cleared counter is its
+      value
+'''
+
+# python
+import re
+import time as _time
+
+# 1d02h, 2w3d, 1y5w
+_ELAPSED = re.compile(r'(\d+)([ywdhms])')
+_UNITS = {'y': 365 * 86400, 'w': 7 * 86400, 'd': 86400, 'h': 3600,
+          'm': 60, 's': 1}
+
+
+def elapsed_seconds(text):
+    '''Seconds of a last clear time, ex: '00:15:42' or '1d02h'; None for
+       'never' or a time not understood'''
+    if not text or text == 'never':
+        return None
+    if ':' in text:
+        seconds = 0
+        for part in text.split(':'):
+            if not part.isdigit():
+                return None
+            seconds = seconds * 60 + int(part)
+        return seconds
+    parts = _ELAPSED.findall(text)
+    if not parts or ''.join(n + u for n, u in parts) != text:
+        return None
+    return sum(int(number) * _UNITS[unit] for number, unit in parts)
+
+
+class CounterSample(object):
+    '''Counters of the interfaces of one poll
+
+        Args:
+            time (`float`): time of the poll, now by default
+    '''
+
+    def __init__(self, time=None):
+        self.time = _time.time() if time is None else time
+        # Names of the counters, then of the rates, in the order of the
+        # values; a list of values may be shorter than the names
+        self.counters = []
+        self.rates = []
+        self._position = {}
+        self._rate_position = {}
+        # interface -> [counter values], [rate values]
+        self._values = {}
+        # interface -> last clear time, as in the output
+        self.last_clear = {}
+
+    @classmethod
+    def from_parsed(cls, parsed, time=None):
+        '''CounterSample of the 'counters' of the interfaces of a parsed
+           output'''
+        sample = cls(time=time)
+        for interface, intf_dict in parsed.items():
+            counters = intf_dict.get('counters')
+            if not counters:
+                continue
+            sample._values.setdefault(interface, ([], []))
+            for name, value in counters.items():
+                if name == 'rate':
+                    for rate, rate_value in value.items():
+                        sample.set_rate(interface, rate, rate_value)
+                elif name == 'last_clear':
+                    sample.last_clear[interface] = value
+                elif isinstance(value, int) and \
+                        not isinstance(value, bool):
+                    sample.set(interface, name, value)
+        return sample
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, interface):
+        return interface in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def _slot(self, names, positions, values, name):
+        position = positions.get(name)
+        if position is None:
+            position = positions[name] = len(names)
+            names.append(name)
+        if len(values) <= position:
+            values.extend([None] * (position + 1 - len(values)))
+        return position
+
+    def set(self, interface, name, value):
+        '''Set a counter of the interface'''
+        values = self._values.setdefault(interface, ([], []))[0]
+        values[self._slot(self.counters, self._position, values,
+                          name)] = value
+
+    def set_rate(self, interface, name, value):
+        '''Set a rate of the interface, ex: in_rate'''
+        values = self._values.setdefault(interface, ([], []))[1]
+        values[self._slot(self.rates, self._rate_position, values,
+                          name)] = value
+
+    def get(self, interface, name, default=None):
+        '''Value of a counter of the interface'''
+        position = self._position.get(name)
+        values = self._values.get(interface, ((), ()))[0]
+        if position is None or position >= len(values) or \
+                values[position] is None:
+            return default
+        return values[position]
+
+    def to_dict(self, interface):
+        '''The 'counters' of the interface, as in the parsed output'''
+        counters, rates = self._values[interface]
+        ret_dict = {name: value for name, value in zip(self.counters,
+                                                       counters)
+                    if value is not None}
+        rate_dict = {name: value for name, value in zip(self.rates, rates)
+                     if value is not None}
+        if rate_dict:
+            ret_dict['rate'] = rate_dict
+        if interface in self.last_clear:
+            ret_dict['last_clear'] = self.last_clear[interface]
+        return ret_dict
+
+    def cleared(self, previous, interface):
+        '''Whether the counters of the interface were cleared since the
+           previous sample, from its last clear time; None when it does not
+           tell'''
+        elapsed = elapsed_seconds(self.last_clear.get(interface))
+        if elapsed is None:
+            return None
+        before = elapsed_seconds(previous.last_clear.get(interface))
+        interval = self.time - previous.time
+        return before is None or elapsed < before or elapsed < interval
+
+    def delta(self, previous):
+        '''Change of the counters since the previous sample
+
+            Args:
+                previous (`CounterSample`): earlier sample of the device
+
+            Returns:
+                dict of interface -> {'interval': seconds between the
+                samples, 'cleared': bool, 'delta': {counter: change},
+                'rate': {counter: change per second}}, for the interfaces
+                of both samples
+        '''
+        interval = self.time - previous.time
+        ret_dict = {}
+        for interface, (values, _) in self._values.items():
+            if interface not in previous._values:
+                continue
+            pairs = []
+            for name, value in zip(self.counters, values):
+                before = previous.get(interface, name)
+                if value is not None and before is not None:
+                    pairs.append((name, value, before))
+
+            cleared = self.cleared(previous, interface)
+            if cleared is None:
+                # A wrap hits one counter at a time
+                cleared = sum(value < before
+                              for _, value, before in pairs) > 1
+
+            deltas = {}
+            for name, value, before in pairs:
+                if cleared:
+                    deltas[name] = value
+                elif value < before:
+                    deltas[name] = value + \
+                        (1 << (32 if before < 1 << 32 else 64)) - before
+                else:
+                    deltas[name] = value - before
+
+            intf_dict = ret_dict[interface] = {}
+            intf_dict['interval'] = interval
+            intf_dict['cleared'] = cleared
+            intf_dict['delta'] = deltas
+            if interval > 0:
+                intf_dict['rate'] = {name: delta / interval
+                                     for name, delta in deltas.items()}
+        return ret_dict
@@ -0,0 +1,213 @@
+'''Line dispatch engine for line oriented parsers
+
+Most cli parsers try a long list of regular expressions on every line of
+the output until one matches. For outputs with thousands of records most
+of those attempts fail, and compiling the patterns inside the loop adds a
+cache lookup for each of them.
+
+LineDispatcher compiles a table of patterns once, usually at class
+definition, and routes each line to the few patterns that can match it:
+
+    * The key of a line is its first word, the first run of letters in it:
+      'Hardware is Loopback' -> 'Hardware',
+      '0 packets input, 0 bytes' -> 'packets'.
+    * A pattern is keyed on the word(s) a matching line starts with. The key
+      is found from the leading literal of the regex when it is
+      unambiguous ('^Hardware +is' -> 'Hardware'), or given with `keys`.
+    * Patterns without a key (ex: lines starting with an interface name)
+      are tried on every line, optionally only when the line contains a
+      given literal.
+
+Patterns are tried in the order of the table and the first match wins, the
+same as a chain of `m = p.match(line); if m: ...; continue` blocks.
+
+example:
+
+    >>> patterns = LineDispatcher([
+    ...     # GigabitEthernet1 is up, line protocol is up
+    ...     LinePattern('p1', r'^(?P<interface>\\S+) +is +(?P<status>\\w+), '
+    ...                        r'+line +protocol', contains='protocol'),
+    ...     # Hardware is Loopback
+    ...     LinePattern('p2', r'^Hardware +is +(?P<type>.+)$'),
+    ...     # 0 packets input, 0 bytes
+    ...     LinePattern('p3', r'^(?P<in_pkts>\\d+) +packets +input',
+    ...                 keys='packets'),
+    ... ])
+    >>> name, m = patterns.match('Hardware is Loopback')
+    >>> name, m.groupdict()
+    ('p2', {'type': 'Loopback'})
+'''
+
+# python
+import re
+
+# First run of letters of a line
+_WORD = re.compile(r'[A-Za-z]+')
+
+# Literal prefix of a regex, after the optional '^' and leading spaces
+_PREFIX = re.compile(r'^\^?(?:\\s[*+]| [*+])?(?P<word>[A-Za-z]+)')
+
+# What may follow the leading word of a regex for the word to be complete:
+# a mandatory character which cannot be a letter
+_WORD_END = re.compile(r'(?:[ :,;=\-/"#<>@!%&~]|\\[sdW.\-/(),:"#\[\]]|\$)'
+                       r'(?![?*{])')
+
+
+def _leading_word(regex):
+    '''Return the word a line must start with to match the regex, or None
+       if it cannot be told from the regex source'''
+    if regex.flags & re.IGNORECASE:
+        return None
+
+    source = regex.pattern
+    if _top_level_branch(source):
+        return None
+
+    m = _PREFIX.match(source)
+    if not m:
+        return None
+    rest = source[m.end():]
+    if rest and not _WORD_END.match(rest):
+        return None
+    return m.group('word')
+
+
+def _top_level_branch(source):
+    '''True if the regex has an alternation outside of any group'''
+    depth = 0
+    escaped = False
+    in_class = False
+    for char in source:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            if char == ']':
+                in_class = False
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+    return False
+
+
+class LinePattern(object):
+    '''One named regex of a LineDispatcher
+
+        Args:
+            name (`str`): name returned on match, ex: 'p1'
+            regex (`str` or compiled regex): the pattern, applied with match()
+            keys (`str` or `list`): first word(s) of the lines the pattern
+                                    can match. Found from the regex when
+                                    not given; None when it cannot be, which
+                                    means the pattern is tried on all lines
+            contains (`str`): literal a line must contain to be tried,
+                              checked before running the regex
+            flags (`int`): re flags, when regex is a string
+    '''
+
+    __slots__ = ('name', 'regex', 'keys', 'contains')
+
+    def __init__(self, name, regex, keys=None, contains=None, flags=0):
+        self.name = name
+        if isinstance(regex, str):
+            regex = re.compile(regex, flags)
+        self.regex = regex
+
+        if keys is None:
+            word = _leading_word(regex)
+            keys = (word,) if word else None
+        elif isinstance(keys, str):
+            keys = (keys,)
+        else:
+            keys = tuple(keys)
+        self.keys = keys
+        self.contains = contains
+
+    def match(self, line):
+        if self.contains and self.contains not in line:
+            return None
+        return self.regex.match(line)
+
+    def __repr__(self):
+        return '{c}({n!r}, {r!r})'.format(c=type(self).__name__,
+                                          n=self.name,
+                                          r=self.regex.pattern)
+
+
+class LineDispatcher(object):
+    '''Table of LinePattern, routed by the first word of each line
+
+        Args:
+            patterns (`list`): LinePattern objects, in the order they must
+                               be tried
+    '''
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+
+        names = [pattern.name for pattern in self.patterns]
+        if len(names) != len(set(names)):
+            raise ValueError('Pattern names must be unique: {}'.format(names))
+
+        # Patterns which must be tried on every line
+        self._wildcards = tuple(pattern for pattern in self.patterns
+                                if pattern.keys is None)
+
+        # key -> patterns to try, in table order
+        self._routes = {}
+        for pattern in self.patterns:
+            for key in pattern.keys or ():
+                self._routes[key] = None
+        for key in self._routes:
+            self._routes[key] = tuple(
+                pattern for pattern in self.patterns
+                if pattern.keys is None or key in pattern.keys)
+
+    def __getitem__(self, name):
+        for pattern in self.patterns:
+            if pattern.name == name:
+                return pattern
+        raise KeyError(name)
+
+    def subset(self, names):
+        '''Return a LineDispatcher of the named patterns only, in table order
+
+            A line matched by a pattern left out is tried on the patterns
+            after it in the subset, the matches are those of the whole table
+            when no such line also matches one of them
+        '''
+        names = set(names)
+        return LineDispatcher(pattern for pattern in self.patterns
+                              if pattern.name in names)
+
+    def candidates(self, line):
+        '''Return the patterns which can match the line, in table order'''
+        m = _WORD.search(line)
+        if m:
+            return self._routes.get(m.group(), self._wildcards)
+        return self._wildcards
+
+    def match(self, line, skip=()):
+        '''Find the first pattern matching the line
+
+            Args:
+                line (`str`): line to match
+                skip (`container`): names of patterns not to try
+
+            Returns:
+                tuple of the pattern name and the match object,
+                (None, None) when nothing matches
+        '''
+        for pattern in self.candidates(line):
+            if skip and pattern.name in skip:
+                continue
+            m = pattern.match(line)
+            if m:
+                return pattern.name, m
+        return None, None
@@ -0,0 +1,132 @@
+'''Conversion of short interface names to full names
+
+Parsers convert interface names once per row: a table of 50k rows converts
+the same few thousand names over and over. The converters here keep the
+abbreviation table and the regexes compiled, and remember the last
+conversions in a bounded LRU cache.
+
+    >>> convert_intf_name('Gi1/0/1')
+    'GigabitEthernet1/0/1'
+    >>> convert_intf_names(['Te0/0/0/1', 'BE10'], os='iosxr')
+    ['TenGigE0/0/0/1', 'Bundle-Ether10']
+
+Without an os, the names are converted as Common.convert_intf_name always
+did. An os adds its own abbreviations on top of the common ones.
+'''
+
+# python
+import re
+from functools import lru_cache
+
+# Please add more when face other type of interface
+ABBREVIATIONS = {
+    'Eth': 'Ethernet',
+    'Lo': 'Loopback',
+    'Fa': 'FastEthernet',
+    'Fas': 'FastEthernet',
+    'Po': 'Port-channel',
+    'PO': 'Port-channel',
+    'Null': 'Null',
+    'Gi': 'GigabitEthernet',
+    'Gig': 'GigabitEthernet',
+    'GE': 'GigabitEthernet',
+    'Te': 'TenGigabitEthernet',
+    'mgmt': 'mgmt',
+    'Vl': 'Vlan',
+    'Tu': 'Tunnel',
+    'Fe': '',
+    'Hs': 'HSSI',
+    'AT': 'ATM',
+    'Et': 'Ethernet',
+    'BD': 'BridgeDomain',
+    'Se': 'Serial',
+    'Fo': 'FortyGigabitEthernet',
+    'Hu': 'HundredGigE',
+    'vl': 'vasileft',
+    'rl': 'vasiright',
+}
+
+# os -> abbreviations of the os, overriding the common ones
+OS_ABBREVIATIONS = {
+    'iosxr': {
+        'Te': 'TenGigE',
+        'Tf': 'TwentyFiveGigE',
+        'Fo': 'FortyGigE',
+        'BE': 'Bundle-Ether',
+        'Mg': 'MgmtEth',
+    },
+    'nxos': {
+        'Po': 'port-channel',
+        'Lo': 'loopback',
+    },
+}
+
+# Conversions remembered per converter
+CACHE_SIZE = 4096
+
+
+class InterfaceNameConverter(object):
+    '''Convert short interface names to full names
+
+        Args:
+            abbreviations (`dict`): short interface type -> full type
+            cache_size (`int`): conversions remembered
+    '''
+
+    TYPE = re.compile(r'[a-zA-Z]+')
+    PORT = re.compile(r'[\d\/\.]+')
+
+    def __init__(self, abbreviations=ABBREVIATIONS, cache_size=CACHE_SIZE):
+        self.abbreviations = dict(abbreviations)
+        self.convert = lru_cache(maxsize=cache_size)(self._convert)
+
+    def _convert(self, intf):
+        m = self.TYPE.search(intf)
+        m1 = self.PORT.search(intf)
+        if m is None or m1 is None:
+            return intf
+        full = self.abbreviations.get(m.group(0))
+        if full is not None:
+            return full + m1.group(0)
+        # Unifying interface names
+        return intf[0].capitalize() + \
+            intf[1:].replace(' ', '').replace('ethernet', 'Ethernet')
+
+    def convert_all(self, intfs):
+        '''Convert a list of names, return the list of full names'''
+        convert = self.convert
+        return [convert(intf) for intf in intfs]
+
+
+# os -> converter
+_converters = {}
+
+
+def get_converter(os=None):
+    '''Return the converter of the os, created on first use'''
+    converter = _converters.get(os)
+    if converter is None:
+        abbreviations = dict(ABBREVIATIONS)
+        abbreviations.update(OS_ABBREVIATIONS.get(os, {}))
+        converter = _converters[os] = InterfaceNameConverter(abbreviations)
+    return converter
+
+
+def convert_intf_name(intf, os=None):
+    '''Return the full name of the interface
+
+        Args:
+            intf (`str`): short version of the interface name
+            os (`str`): os of the device, for its own abbreviations
+
+        example:
+
+            >>> convert_intf_name('Eth2/1')
+            'Ethernet2/1'
+    '''
+    return get_converter(os).convert(intf)
+
+
+def convert_intf_names(intfs, os=None):
+    '''Return the full names of a list of interfaces'''
+    return get_converter(os).convert_all(intfs)
@@ -0,0 +1,292 @@
+'''Parse many commands on many devices concurrently
+
+Collecting a snapshot is mostly waiting: each command is a round-trip to a
+device. parse_devices runs the commands of all the devices at the same time,
+a bounded number per device, and parses the outputs as they arrive. Each
+device has its own queue of commands, served by `device_workers` threads of
+the pool at most, so a thread of the pool never waits for a device busy with
+other commands:
+
+    >>> results = parse_devices([dev1, dev2], ['show version',
+    ...                                        'show ip ospf interface'])
+    >>> results['dev1']['show version'].parsed
+    >>> results['dev2']['show ip ospf interface'].error
+
+The parser of a command is resolved once per device abstraction. The
+commands of a device share one CommandCache, so an auxiliary command used by
+several parsers runs once. Large outputs can be parsed in a process pool
+(`parse_processes`) instead of the threads waiting on the devices.
+
+Parsing never reaches the device: it runs offline on the outputs collected
+for the command. An auxiliary command is only run when the parser asks for
+its output, then the output is parsed again with it. The declared
+auxiliary commands (`auxiliary_commands` of the parser) a parser asked for
+once are run up front from then on, on every device; such a speculative
+run may fail, the parser then asks for the command as usual. A parser
+asking for a command it does not declare, ex: one per record of the
+output, is parsed once more in the thread, running the commands as it asks
+for them. Given a ResultCache, outputs already parsed are answered from
+it, the outputs of the commands not declared are never cached.
+'''
+
+# python
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# Genie
+from genie.libs import parser
+from genie.abstract import Lookup
+
+from .command_cache import CommandCache
+from .schema_compiler import FULL, parse
+
+# ((os, abstraction tokens), command) -> declared auxiliary commands its
+# parser asked for, on any device
+_needs = {}
+_needs_lock = threading.Lock()
+
+
+class ParseResult(object):
+    '''Outcome of one command on one device
+
+        Attributes:
+            device (`str`): name of the device
+            command (`str`): show command
+            parsed (`dict`): parsed output, None on error
+            error (`Exception`): exception raised while resolving the parser,
+                                 running the commands or parsing
+            outputs (`dict`): command -> output of the command and of the
+                              auxiliary commands read by its parser
+            execute_time (`float`): seconds spent running the commands
+            parse_time (`float`): seconds spent parsing
+    '''
+
+    def __init__(self, device, command):
+        self.device = device
+        self.command = command
+        self.parsed = None
+        self.error = None
+        self.outputs = {}
+        self.execute_time = 0.0
+        self.parse_time = 0.0
+
+    def __repr__(self):
+        return '<{c} {d!r} {cmd!r} {s}>'.format(
+            c=self.__class__.__name__, d=self.device, cmd=self.command,
+            s='error' if self.error else 'ok')
+
+
+class _MissingOutput(BaseException):
+    '''Raised to the parser asking for an output not collected yet. Not an
+       Exception, so the parsers catching their errors let it through'''
+
+    def __init__(self, command):
+        super().__init__(command)
+        self.command = command
+
+
+class _OfflineDevice(object):
+    '''Stand-in for a device when parsing collected outputs, answers
+       execute() from the outputs, or from fetch() adding the output to
+       them. Picklable without fetch, to be sent to a process'''
+
+    def __init__(self, name, os, outputs, fetch=None):
+        self.name = name
+        self.os = os
+        self.outputs = outputs
+        self.fetch = fetch
+
+    def execute(self, command, **kwargs):
+        try:
+            return self.outputs[command]
+        except KeyError:
+            if self.fetch is None:
+                raise _MissingOutput(command) from None
+        output = self.outputs[command] = self.fetch(command)
+        return output
+
+
+def _parse_offline(parser_cls, kwargs, name, os, command, outputs,
+                   validation, result_cache=None, fetch=None):
+    '''Parse the output of the command, return (parsed, seconds)
+
+        Raises:
+            _MissingOutput: the parser asked for an output not in outputs,
+                            without fetch
+    '''
+    start = time.perf_counter()
+    device = _OfflineDevice(name, os, outputs, fetch=fetch)
+    # The commands missing from the outputs reach the offline device
+    CommandCache.attach(device, outputs=outputs)
+    if result_cache is None:
+        parsed = parse(parser_cls(device=device), validation=validation,
+                       output=outputs[command], **kwargs)
+    else:
+        auxiliary = {aux: output for aux, output in outputs.items()
+                     if aux != command}
+        parsed = result_cache.parse(parser_cls(device=device),
+                                    output=outputs[command],
+                                    validation=validation,
+                                    auxiliary=auxiliary, **kwargs)
+    return parsed, time.perf_counter() - start
+
+
+def parse_devices(devices, commands, max_workers=32, device_workers=1,
+                  parse_processes=0, validation=FULL, result_cache=None):
+    '''Run and parse the commands on all the devices concurrently
+
+        Args:
+            devices (`list`): connected devices
+            commands (`list`): show commands, run on every device
+            max_workers (`int`): commands run at the same time, all devices
+                                 together
+            device_workers (`int`): commands run at the same time on one
+                                    device, 1 for devices with a single
+                                    session
+            parse_processes (`int`): processes to parse in, 0 to parse in
+                                     the threads running the commands
+            validation (`str`): validation of the results, FULL, SAMPLED
+                                or NONE, see schema_compiler
+            result_cache (`ResultCache`): results of the outputs parsed
+                                          before, see result_cache. The
+                                          processes share its directory
+
+        Returns:
+            dict of device name -> command -> ParseResult. An error on one
+            command never stops the others
+    '''
+    from .common import get_parser
+
+    results = {}
+    # device -> (cache, queue of (parser key, parser, result))
+    queues = []
+    parsers = {}
+    for device in devices:
+        lookup = Lookup.from_device(device, packages={'parser': parser})
+        abstraction = (device.os, tuple(lookup._tokens))
+        cache = CommandCache.from_device(device)
+        queue = deque()
+        for command in commands:
+            result = ParseResult(device.name, command)
+            results.setdefault(device.name, {})[command] = result
+            key = (abstraction, command)
+            if key not in parsers:
+                try:
+                    parsers[key] = get_parser(command, device)
+                except Exception as e:
+                    parsers[key] = e
+            if isinstance(parsers[key], Exception):
+                result.error = parsers[key]
+                continue
+            queue.append((key, parsers[key], result))
+        if queue:
+            queues.append((device, cache, queue))
+
+    # One worker per device first, then the second ones, ... so the devices
+    # are served together whatever max_workers is
+    workers = [(device, cache, queue)
+               for i in range(max(device_workers, 1))
+               for device, cache, queue in queues if i < len(queue)]
+
+    processes = ProcessPoolExecutor(parse_processes) \
+        if parse_processes else None
+    try:
+        with ThreadPoolExecutor(max_workers) as threads:
+            futures = [threads.submit(_serve, processes, validation,
+                                      result_cache, *worker)
+                       for worker in workers]
+            for future in futures:
+                future.result()
+    finally:
+        if processes is not None:
+            processes.shutdown()
+    return results
+
+
+def _serve(processes, validation, result_cache, device, cache, queue):
+    '''Run the commands of the device queue until it is empty'''
+    while True:
+        try:
+            key, parser, result = queue.popleft()
+        except IndexError:
+            return
+        _run(processes, validation, result_cache, device, cache, key, parser,
+             result)
+
+
+def _run(processes, validation, result_cache, device, cache, key, parser,
+         result):
+    '''Collect the output of the command and parse it, running the
+       auxiliary commands the parser asks for'''
+    parser_cls, kwargs = parser
+    declared = set(getattr(parser_cls, 'auxiliary_commands', None) or ())
+    with _needs_lock:
+        needs = sorted(_needs.get(key, ()))
+
+    start = time.perf_counter()
+    try:
+        result.outputs[result.command] = cache.execute(result.command)
+    except Exception as e:
+        result.error = e
+        return
+    finally:
+        result.execute_time += time.perf_counter() - start
+
+    # Asked for by this parser on another device, may fail on this one
+    start = time.perf_counter()
+    for command in needs:
+        try:
+            result.outputs[command] = cache.execute(command)
+        except Exception:
+            pass
+    result.execute_time += time.perf_counter() - start
+
+    while True:
+        args = (parser_cls, kwargs, result.device,
+                getattr(device, 'os', None), result.command,
+                dict(result.outputs), validation, result_cache)
+        try:
+            if processes is None:
+                result.parsed, result.parse_time = _parse_offline(*args)
+            else:
+                result.parsed, result.parse_time = \
+                    processes.submit(_parse_offline, *args).result()
+        except _MissingOutput as e:
+            if e.command not in declared:
+                break
+            with _needs_lock:
+                _needs.setdefault(key, set()).add(e.command)
+            start = time.perf_counter()
+            try:
+                result.outputs[e.command] = cache.execute(e.command)
+            except Exception as error:
+                result.error = error
+                return
+            finally:
+                result.execute_time += time.perf_counter() - start
+            continue
+        except Exception as e:
+            result.error = e
+        return
+
+    # A command per record of the output: parsed once more, running the
+    # commands as they are asked for
+    def fetch(command):
+        start = time.perf_counter()
+        try:
+            return cache.execute(command)
+        finally:
+            result.execute_time += time.perf_counter() - start
+
+    outputs = dict(result.outputs)
+    execute_time = result.execute_time
+    try:
+        result.parsed, parse_time = _parse_offline(
+            parser_cls, kwargs, result.device, getattr(device, 'os', None),
+            result.command, outputs, validation, fetch=fetch)
+        result.parse_time = parse_time - (result.execute_time - execute_time)
+    except Exception as e:
+        result.error = e
+    result.outputs.update(outputs)
@@ -0,0 +1,251 @@
+'''Parse huge record oriented outputs in a process pool
+
+Outputs like show interfaces or show bgp all neighbors are a list of
+independent records, each starting with a header line. parse_parallel cuts
+such an output into chunks of whole records, parses the chunks in a process
+pool and merges the results:
+
+    >>> parsed = parse_parallel(ShowInterfaces(device=dev), output=out)
+
+The result is the one of the parser on the whole output. Outputs smaller
+than `threshold` characters, and parsers without `record_split`, are parsed
+serially.
+
+A parser opts in by declaring how its output splits:
+
+    class ShowBgpNeighborSuperParser(MetaParser):
+        record_split = RecordSplit(header=(p2_1, p2_2, p2_3), context=p1)
+
+    * header: pattern(s) of the first line of a record. A header line right
+      after another one continues its record, ex: 'LS age' after 'Routing
+      Bit Set on this LSA'
+    * context: pattern(s) of the lines whose state carries over to the next
+      records, ex: 'For address family: X' or 'Router Link States (Area 0)'.
+      The last line matching each of them before a chunk is repeated at the
+      start of the chunk
+    * serial: outputs holding this text carry state from a record to the
+      next in other ways, and are parsed serially
+
+A parser may also have a `record_depends(lines)` method returning the
+(header line, needed header line) pairs of the records which must be
+parsed together, ex: an unnumbered interface and the interface it takes
+its address from. No chunk boundary falls between them.
+
+The partial results are merged in the order of the chunks: dicts are merged
+key by key, lists are concatenated, other values of a later chunk replace
+those of an earlier one, as a serial parse overwrites them.
+'''
+
+# python
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+# Genie
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from .schema_compiler import FULL, validate
+
+logger = logging.getLogger(__name__)
+
+# Outputs below this many characters are parsed serially, splitting them
+# costs more than it saves
+THRESHOLD = 1 << 20
+
+
+class RecordSplit(object):
+    '''How the output of a parser splits into records
+
+        Args:
+            header (`regex` or `tuple`): pattern(s) matching the first line
+                                         of a record, compiled regexes or
+                                         LinePattern
+            context (`regex` or `tuple`): pattern(s) of the lines whose state
+                                          carries over to the next records
+            strip (`bool`): match the lines stripped, as most parsers do;
+                            when False only the end of the lines is stripped
+            serial (`str`): text of the outputs to parse serially
+    '''
+
+    def __init__(self, header, context=(), strip=True, serial=None):
+        self.header = header if isinstance(header, tuple) else (header,)
+        self.context = context if isinstance(context, tuple) else (context,)
+        self.strip = strip
+        self.serial = serial
+
+    def _matches(self, patterns, line):
+        for pattern in patterns:
+            if pattern.match(line):
+                return True
+        return False
+
+    def scan(self, lines):
+        '''Find the records and context lines
+
+            Returns:
+                tuple of the first line of each record, and of the lists of
+                lines matching each context pattern
+        '''
+        starts = []
+        contexts = [[] for _ in self.context]
+        previous = None
+        for i, line in enumerate(lines):
+            line = line.strip() if self.strip else line.rstrip()
+            if not line:
+                continue
+            if self._matches(self.header, line):
+                if previous != 'header':
+                    starts.append(i)
+                previous = 'header'
+                continue
+            previous = None
+            for found, pattern in zip(contexts, self.context):
+                if pattern.match(line):
+                    found.append(i)
+        return starts, contexts
+
+    def chunks(self, lines, count, depends=()):
+        '''Cut the lines into at most count chunks of whole records
+
+            Args:
+                lines (`list`): lines of the output
+                count (`int`): number of chunks wanted
+                depends (`iterable`): (header line, needed header line)
+                                      pairs of records not to separate
+
+            Returns:
+                list of chunks, each a list of lines
+        '''
+        starts, contexts = self.scan(lines)
+        if len(starts) < 2 or count < 2:
+            return [lines]
+
+        # Record boundaries no chunk may start at
+        index = {start: i for i, start in enumerate(starts)}
+        joined = [0] * (len(starts) + 1)
+        for first, needed in depends:
+            if first in index and needed in index:
+                low, high = sorted((index[first], index[needed]))
+                joined[low + 1] += 1
+                joined[high + 1] -= 1
+
+        # Balance the chunks by their number of lines
+        size = len(lines) / count
+        cuts = [0]
+        open_links = 0
+        for i, start in enumerate(starts[1:], 1):
+            open_links += joined[i]
+            if open_links or start - cuts[-1] < size:
+                continue
+            cuts.append(start)
+        cuts.append(len(lines))
+
+        chunks = []
+        for first, last in zip(cuts, cuts[1:]):
+            # State of the lines before the chunk
+            context = sorted(found[_last_before(found, first)]
+                             for found in contexts
+                             if _last_before(found, first) is not None)
+            chunks.append([lines[i] for i in context] + lines[first:last])
+        return chunks
+
+
+def _last_before(found, position):
+    '''Index in the sorted list found of the last line before position'''
+    low, high = 0, len(found)
+    while low < high:
+        middle = (low + high) // 2
+        if found[middle] < position:
+            low = middle + 1
+        else:
+            high = middle
+    return low - 1 if low else None
+
+
+def merge_parsed(merged, parsed):
+    '''Merge the result of a later chunk into the result of the earlier ones
+
+        Returns:
+            merged, updated in place
+    '''
+    for key, value in parsed.items():
+        mine = merged.get(key)
+        if isinstance(mine, dict) and isinstance(value, dict):
+            merge_parsed(mine, value)
+        elif isinstance(mine, list) and isinstance(value, list):
+            mine.extend(value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _parse_chunk(parser_cls, kwargs, output):
+    '''Parse a chunk in a worker process'''
+    return parser_cls(device=None).cli(output=output, **kwargs)
+
+
+def parse_parallel(parser, output, validation=FULL, processes=None,
+                   threshold=THRESHOLD, executor=None, **kwargs):
+    '''Parse the output in chunks of records, in a process pool
+
+        Args:
+            parser (`MetaParser`): parser instance
+            output (`str`): output of the command
+            validation (`str`): validation of the result, FULL, SAMPLED or
+                                NONE, see schema_compiler
+            processes (`int`): processes to parse in, the number of cpus
+                               by default
+            threshold (`int`): outputs shorter than this are parsed serially
+            executor (`Executor`): pool to parse in instead of a new one
+            kwargs: arguments of the parser, ex: vrf
+
+        Returns:
+            parsed output, the same as parsing the whole output
+
+        Raises:
+            SchemaEmptyParserError: nothing was parsed
+            the error of the schema engine when the result is invalid
+    '''
+    split = getattr(type(parser), 'record_split', None)
+    processes = processes or os.cpu_count() or 1
+
+    chunks = None
+    if split is not None and len(output) >= threshold and processes > 1 \
+            and not (split.serial and split.serial in output):
+        lines = output.splitlines()
+        depends = parser.record_depends(lines) \
+            if hasattr(parser, 'record_depends') else ()
+        chunks = split.chunks(lines, processes, depends)
+
+    parsed = None
+    if chunks and len(chunks) > 1:
+        try:
+            parsed = _parse_chunks(parser, chunks, processes, executor,
+                                   kwargs)
+        except Exception:
+            # A chunk the parser does not take out of its output, the
+            # serial parse tells whether the output itself is wrong
+            logger.debug('Parsing %s in chunks failed, parsing serially',
+                         type(parser).__name__, exc_info=True)
+    if parsed is None:
+        parsed = parser.cli(output=output, **kwargs)
+
+    if not parsed:
+        raise SchemaEmptyParserError(parsed)
+    validate(type(parser), parsed, mode=validation)
+    return parsed
+
+
+def _parse_chunks(parser, chunks, processes, executor, kwargs):
+    outputs = ['\n'.join(chunk) for chunk in chunks]
+    pool = executor or ProcessPoolExecutor(min(processes, len(outputs)))
+    try:
+        futures = [pool.submit(_parse_chunk, type(parser), kwargs, output)
+                   for output in outputs]
+        merged = {}
+        for future in futures:
+            merge_parsed(merged, future.result())
+        return merged
+    finally:
+        if executor is None:
+            pool.shutdown()
@@ -0,0 +1,169 @@
+'''Selective parsing of record oriented outputs
+
+Outputs like show interfaces or show bgp neighbors are a list of records,
+one per interface or neighbor, each starting with a header line naming it.
+When only a few records are wanted, parsing the others is wasted: the
+parsers taking a `filter` argument cut the output into records by their
+header lines, drop the records not wanted before running their patterns,
+and prune the result.
+
+    >>> ShowInterfaces(device=dev).parse(filter=['Gi1/0/1', 'Loopback*'])
+    >>> ShowBgpAllNeighbors(device=dev).parse(filter=[('VRF1', '10.1.*')])
+
+A filter is a name or a list of names:
+
+    * a name, ex: 'GigabitEthernet1/0/1', matches the records of that name;
+      parsers of interfaces also accept short names, ex: 'Gi1/0/1'
+    * a glob, ex: 'Gi*' or '10.1.1.?', matches the names it covers
+    * a key path, tuple of names or globs, matches the whole path of the
+      record in the parsed output, ex: ('VRF1', '10.1.*') for the neighbors
+      10.1.* of vrf VRF1
+
+A record may need others to be parsed, ex: an unnumbered interface takes
+its address from another interface. Parsers list those dependencies and
+the records needed are kept, then pruned from the result. The result is
+the same as parsing everything and pruning it with RecordFilter.prune.
+'''
+
+# python
+import re
+import fnmatch
+
+# Characters making a name a glob
+_GLOB = re.compile(r'[*?\[]')
+
+# Level of RecordFilter.prune whose keys are not part of the record path
+ALL = '__all__'
+
+
+class RecordFilter(object):
+    '''Names of the records to parse
+
+        Args:
+            keys (`str`, `tuple` or `list`): names, globs or key paths
+            normalize (`callable`): turns a name into the form used in the
+                                    output, ex: convert_intf_name. Only
+                                    applied to names which are not globs
+    '''
+
+    def __init__(self, keys, normalize=None):
+        if isinstance(keys, (str, tuple)):
+            keys = [keys]
+        self.keys = list(keys)
+        self.names = set()
+        self.globs = []
+        self.paths = []
+        for key in self.keys:
+            if isinstance(key, tuple):
+                self.paths.append(tuple(
+                    re.compile(fnmatch.translate(str(part))) for part in key))
+            elif _GLOB.search(key):
+                self.globs.append(re.compile(fnmatch.translate(key)))
+            else:
+                self.names.add(key)
+                if normalize is not None:
+                    self.names.add(normalize(key))
+        # path -> matched or not
+        self._matched = {}
+
+    @classmethod
+    def build(cls, keys, normalize=None):
+        '''RecordFilter of the keys; None when keys is None, the same
+           object when it is a RecordFilter already'''
+        if keys is None or isinstance(keys, RecordFilter):
+            return keys
+        return cls(keys, normalize=normalize)
+
+    def match(self, path):
+        '''Whether the record of the path, tuple of the keys leading to it,
+           is wanted. Names and globs are matched on the last key'''
+        try:
+            return self._matched[path]
+        except KeyError:
+            pass
+        name = str(path[-1])
+        matched = name in self.names or \
+            any(glob.match(name) for glob in self.globs) or \
+            any(len(parts) == len(path) and
+                all(part.match(str(key)) for part, key in zip(parts, path))
+                for parts in self.paths)
+        self._matched[path] = matched
+        return matched
+
+    def select(self, lines, records, depends=()):
+        '''Drop the lines of the records not wanted
+
+            Args:
+                lines (`list`): lines of the output
+                records (`iterable`): (path, first, last) of each record,
+                                      lines[first:last] being the record
+                depends (`iterable`): (path, needed path) pairs, the first
+                                      record needs the second to be parsed
+
+            Returns:
+                the lines outside of any record and those of the records
+                wanted or needed by them, in order
+        '''
+        records = list(records)
+        kept = {path for path, _, _ in records if self.match(path)}
+
+        # Records needed by the kept ones, and by those in turn
+        needs = {}
+        for path, needed in depends:
+            needs.setdefault(path, set()).add(needed)
+        todo = list(kept)
+        while todo:
+            for needed in needs.get(todo.pop(), ()):
+                if needed not in kept:
+                    kept.add(needed)
+                    todo.append(needed)
+
+        selected = []
+        position = 0
+        for path, first, last in records:
+            selected.extend(lines[position:first])
+            if path in kept:
+                selected.extend(lines[first:last])
+            position = last
+        selected.extend(lines[position:])
+        return selected
+
+    def prune(self, parsed, levels):
+        '''Remove the records not wanted from a parsed output, in place
+
+            Args:
+                parsed (`dict`): parsed output
+                levels (`tuple`): keys leading to the records, None for the
+                                  levels whose keys are part of the record
+                                  path, ex: ('vrf', None, 'neighbor', None),
+                                  ALL for the levels whose keys are not
+
+            Returns:
+                parsed. Empty dicts on the way to the records are removed
+        '''
+        self._prune(parsed, levels, ())
+        return parsed
+
+    def _prune(self, data, levels, path):
+        level, rest = levels[0], levels[1:]
+        if level is not None and level is not ALL:
+            child = data.get(level)
+            if not isinstance(child, dict):
+                return
+            self._prune(child, rest, path)
+            if not child:
+                del data[level]
+            return
+
+        for key in list(data):
+            key_path = path if level is ALL else path + (key,)
+            if not rest:
+                if not self.match(key_path):
+                    del data[key]
+                continue
+            child = data[key]
+            if not isinstance(child, dict):
+                continue
+            self._prune(child, rest, key_path)
+            if not child:
+                del data[key]
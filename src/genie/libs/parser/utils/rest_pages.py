@@ -0,0 +1,79 @@
+'''Paginated fetching of REST collections
+
+A REST parser used to get a whole collection in one request, ex: every
+interface known to a DNA Center, then decode the body at once. For large
+inventories this is one long request, and the body and its decoded records
+are all in memory together.
+
+fetch_pages asks for the collection one page at a time with offset/limit
+query parameters, and yields the records of each page as soon as it is
+decoded. Once the first page comes back full, the next pages are fetched by
+a few threads at the same time, sharing the connection pool of the session
+of the device. Pages are yielded in order and at most `max_workers` of them
+are held at a time:
+
+    >>> for record in fetch_pages(device.get, '/dna/intent/api/v1/interface',
+    ...                           limit=500, max_workers=4):
+    ...     ...
+
+A page with less than `limit` records is the last one.
+'''
+
+# python
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+def page_url(url, offset, limit):
+    '''Url of the page starting at offset'''
+    return '{u}{s}offset={o}&limit={l}'.format(
+        u=url, s='&' if '?' in url else '?', o=offset, l=limit)
+
+
+def fetch_pages(get, url, limit=500, max_workers=4, offset=1,
+                key='response'):
+    '''Yield the records of a paginated collection, page after page
+
+        Args:
+            get (`callable`): get(url) -> response with a json() method, ex:
+                              device.get of a REST connection
+            url (`str`): url of the collection
+            limit (`int`): records per page
+            max_workers (`int`): pages fetched at the same time
+            offset (`int`): offset of the first record, 1 on DNA Center
+            key (`str`): key of the records in the body of a page
+    '''
+    def page(start):
+        return get(page_url(url, start, limit)).json()[key]
+
+    records = page(offset)
+    for record in records:
+        yield record
+    if len(records) < limit:
+        return
+
+    with ThreadPoolExecutor(max_workers) as pool:
+        # pages being fetched, in order
+        pending = deque()
+        next_offset = offset + limit
+        for _ in range(max_workers):
+            pending.append(pool.submit(page, next_offset))
+            next_offset += limit
+        try:
+            while pending:
+                records = pending.popleft().result()
+                if len(records) < limit:
+                    # last page, the pages after it are empty
+                    for future in pending:
+                        future.cancel()
+                    pending.clear()
+                else:
+                    pending.append(pool.submit(page, next_offset))
+                    next_offset += limit
+                for record in records:
+                    yield record
+                # let the page go before waiting for the next one
+                records = None
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,302 @@
+'''Cache of parsed outputs, keyed by the content of the outputs
+
+Many polled commands return the same output poll after poll: show version,
+show inventory, show vlan, ... Parsing it again runs the whole cascade of
+patterns and the validation for the result of the previous poll.
+
+ResultCache keys each result by the parser class, its arguments and a hash
+of the raw outputs it parsed, so an output seen before is answered without
+parsing:
+
+    >>> cache = ResultCache(max_entries=512)
+    >>> parsed = cache.parse(ShowVersion(device=dev), output=output)
+    >>> cache.stats
+    {'hits': 41, 'disk_hits': 0, 'misses': 3, 'entries': 3, 'bytes': 9210}
+
+Results are kept pickled. By default each hit returns a new copy, which the
+caller is free to change. With mode=VIEW a hit returns a read-only view of
+a result shared by all the hits, without copying it.
+
+The memory tier is bounded by entries and by bytes, the least recently used
+results are dropped first. Given a directory, results are also written
+there, one file per key, and read back on a memory miss: the processes
+parsing for parse_devices share their results through it. The directory is
+not bounded, `clear(disk=True)` empties it.
+
+Results are only cached for outputs given to the parser. An empty result
+is never cached.
+'''
+
+# python
+import os
+import pickle
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+
+# Parser
+from .. import __version__
+from .schema_compiler import FULL, NONE, MODES, SAMPLE, parse, validate
+
+# Modes of the results returned on a hit
+COPY = 'copy'
+VIEW = 'view'
+
+
+class ReadOnlyDict(Mapping):
+    '''Read-only view of a parsed output, nested dicts and lists are
+       viewed as they are read'''
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return _view(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return '{c}({d!r})'.format(c=self.__class__.__name__, d=self._data)
+
+    def copy(self):
+        '''Writable deep copy of the viewed output'''
+        return pickle.loads(pickle.dumps(self._data, pickle.HIGHEST_PROTOCOL))
+
+
+class ReadOnlyList(Sequence):
+    '''Read-only view of a list of a parsed output'''
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ReadOnlyList(self._data[index])
+        return _view(self._data[index])
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return '{c}({d!r})'.format(c=self.__class__.__name__, d=self._data)
+
+
+def _view(value):
+    if isinstance(value, dict):
+        return ReadOnlyDict(value)
+    if isinstance(value, list):
+        return ReadOnlyList(value)
+    return value
+
+
+class ResultCache(object):
+    '''Parsed outputs, keyed by parser, arguments and content of the outputs
+
+        Args:
+            max_entries (`int`): results kept in memory
+            max_bytes (`int`): pickled bytes kept in memory, None for no
+                               bound
+            directory (`str`): directory of the results shared with other
+                               processes, None to keep them in memory only
+            mode (`str`): COPY to return a copy of the result on each hit,
+                          VIEW to return a read-only view of a shared one
+    '''
+
+    def __init__(self, max_entries=256, max_bytes=None, directory=None,
+                 mode=COPY):
+        if mode not in (COPY, VIEW):
+            raise ValueError("Unknown mode '{m}', expected '{c}' or "
+                             "'{v}'".format(m=mode, c=COPY, v=VIEW))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.mode = mode
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._init_memory()
+
+    def _init_memory(self):
+        self._lock = threading.Lock()
+        # key -> [pickled result, validation mode, result for VIEW or None]
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        # Sent to another process: the results are shared through the
+        # directory, not copied with the cache
+        state = self.__dict__.copy()
+        for name in ('_lock', '_entries', '_bytes', 'hits', 'disk_hits',
+                     'misses'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_memory()
+
+    @staticmethod
+    def key(parser_cls, output, context='cli', auxiliary=None, **kwargs):
+        '''Key of a result: hash of the parser package version, parser
+           class, context, arguments and outputs
+
+            Args:
+                parser_cls (`type`): parser class
+                output (`str`): output parsed
+                auxiliary (`dict`): command -> output of the other commands
+                                    read by the parser, see CommandCache
+                kwargs: arguments of the parser
+        '''
+        digest = hashlib.blake2b(digest_size=20)
+        # results of another version of the parsers are not reused from
+        # the directory
+        digest.update(repr((__version__, parser_cls.__module__,
+                            parser_cls.__qualname__, context,
+                            sorted(kwargs.items()))).encode())
+        texts = [output]
+        for command, value in sorted((auxiliary or {}).items()):
+            texts += [command, value]
+        for text in texts:
+            text = text if isinstance(text, bytes) else str(text).encode()
+            # length first, outputs are not split the same way twice
+            digest.update(len(text).to_bytes(8, 'little'))
+            digest.update(text)
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def _load(self, key):
+        '''Entry of the key, from memory then from the directory'''
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+        if self.directory is not None:
+            try:
+                with open(self._path(key), 'rb') as f:
+                    validation, blob = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                pass
+            else:
+                entry = self._store(key, blob, validation)
+                with self._lock:
+                    self.disk_hits += 1
+                return entry
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _store(self, key, blob, validation):
+        entry = [blob, validation, None]
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous[0])
+            self._entries[key] = entry
+            self._bytes += len(blob)
+            while self._entries and (
+                    len(self._entries) > self.max_entries or
+                    (self.max_bytes is not None and
+                     self._bytes > self.max_bytes)):
+                _, dropped = self._entries.popitem(last=False)
+                self._bytes -= len(dropped[0])
+        return entry
+
+    def _save(self, key, blob, validation):
+        # Written to a temporary file then renamed, a reader never sees a
+        # partial result
+        fd, path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((validation, blob), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(path, self._path(key))
+        except OSError:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _result(self, entry):
+        if self.mode == COPY:
+            return pickle.loads(entry[0])
+        if entry[2] is None:
+            entry[2] = pickle.loads(entry[0])
+        return ReadOnlyDict(entry[2])
+
+    def parse(self, parser, output, validation=FULL, sample=SAMPLE,
+              context='cli', auxiliary=None, **kwargs):
+        '''Parse the output like schema_compiler.parse, or return the
+           result of the same output parsed before
+
+            Args:
+                parser (`MetaParser`): parser instance
+                output (`str`): output to parse
+                validation (`str`): FULL, SAMPLED or NONE
+                sample (`int`): entries validated per Any() dict in SAMPLED
+                                mode
+                context (`str`): cli, xml, yang, ...
+                auxiliary (`dict`): command -> output of the other commands
+                                    the parser reads, part of the key
+                kwargs: other arguments of the parser, ex: vrf
+        '''
+        if validation not in MODES:
+            raise ValueError("Unknown validation mode '{m}', expected one "
+                             "of {modes}".format(m=validation, modes=MODES))
+        key = self.key(type(parser), output, context=context,
+                       auxiliary=auxiliary, **kwargs)
+        entry = self._load(key)
+        if entry is not None:
+            # Validated with a weaker mode than asked for
+            if entry[1] != validation and entry[1] != FULL and \
+                    validation != NONE:
+                validate(type(parser), pickle.loads(entry[0]),
+                         mode=validation, sample=sample)
+                entry[1] = validation
+            return self._result(entry)
+
+        parsed = parse(parser, validation=validation, sample=sample,
+                       context=context, output=output, **kwargs)
+        blob = pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL)
+        entry = self._store(key, blob, validation)
+        if self.directory is not None:
+            self._save(key, blob, validation)
+        if self.mode == VIEW:
+            entry[2] = parsed
+            return ReadOnlyDict(parsed)
+        return parsed
+
+    @property
+    def stats(self):
+        '''hits, disk_hits, misses, entries and bytes of the memory tier'''
+        with self._lock:
+            return {'hits': self.hits, 'disk_hits': self.disk_hits,
+                    'misses': self.misses, 'entries': len(self._entries),
+                    'bytes': self._bytes}
+
+    def clear(self, disk=False):
+        '''Forget the results in memory, and in the directory with disk'''
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith('.pickle'):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
@@ -0,0 +1,247 @@
+'''Longest prefix match over parsed routing tables
+
+The routing parsers return their routes keyed by prefix string. Finding the
+route of an address means trying every prefix. RouteIndex builds a Patricia
+trie per vrf and address family over the prefixes of a parsed output; the
+trie holds references to the route entries of the output, nothing is copied.
+
+    >>> index = RouteIndex.from_parsed(ShowIpRoute(device=dev).parse())
+    >>> index.lookup('10.1.2.3')
+    ('10.1.0.0/16', {'route': '10.1.0.0/16', 'source_protocol': 'ospf', ...})
+    >>> index.covering('10.1.2.0/24', vrf='VRF1')
+    >>> index.covered('10.0.0.0/8')
+    >>> index.lookup_all(['10.1.2.3', '10.4.5.6'])
+
+Supported outputs:
+
+    * {'vrf': {vrf: {'address_family': {af: {'routes': {prefix: ...}}}}}},
+      ShowIpRoute of iosxe and nxos
+    * {'vrf': {vrf: {'address_family': {af: {'prefix': {prefix: ...}}}}}},
+      ShowIpCef of iosxe
+    * {'table_name': {table: {'routes': {prefix: ...}}}}, ShowRouteTable of
+      junos. inet.0 is the ipv4 table of the default vrf, VRF1.inet6.0 the
+      ipv6 table of VRF1; the other tables are indexed with their name as vrf
+'''
+
+# python
+import ipaddress
+
+WIDTH = {4: 32, 6: 128}
+
+
+class _Node(object):
+    '''Node of the trie: a prefix, the route of the prefix if any and the
+       two subtrees'''
+
+    __slots__ = ('bits', 'length', 'route', 'children')
+
+    def __init__(self, bits, length, route=None):
+        self.bits = bits
+        self.length = length
+        self.route = route
+        self.children = [None, None]
+
+
+class PrefixTrie(object):
+    '''Patricia trie of prefixes, one per ip version
+
+        A route is a (prefix, entry) tuple, entry being the value of the
+        prefix in the parsed output.
+    '''
+
+    def __init__(self):
+        self._roots = {4: _Node(0, 0), 6: _Node(0, 0)}
+        self.size = 0
+
+    @staticmethod
+    def _network(prefix):
+        network = ipaddress.ip_network(prefix, strict=False)
+        return network.version, int(network.network_address), \
+            network.prefixlen
+
+    @staticmethod
+    def _bit(bits, index, width):
+        return (bits >> (width - 1 - index)) & 1
+
+    @staticmethod
+    def _contains(node, bits, width):
+        return (node.bits ^ bits) >> (width - node.length) == 0
+
+    def insert(self, prefix, entry):
+        '''Add the prefix, ex: '10.1.1.0/24', and its entry'''
+        version, bits, length = self._network(prefix)
+        width = WIDTH[version]
+        route = (prefix, entry)
+        node = self._roots[version]
+        while True:
+            if node.length == length:
+                if node.route is None:
+                    self.size += 1
+                node.route = route
+                return
+            side = self._bit(bits, node.length, width)
+            child = node.children[side]
+            if child is None:
+                node.children[side] = _Node(bits, length, route)
+                self.size += 1
+                return
+
+            # Length of the prefix common to the child and the new prefix
+            common = min(child.length, length)
+            diff = (child.bits ^ bits) >> (width - common)
+            if diff:
+                common -= diff.bit_length()
+            if common == child.length:
+                node = child
+                continue
+
+            if common == length:
+                new = _Node(bits, length, route)
+            else:
+                mask = ((1 << common) - 1) << (width - common)
+                new = _Node(bits & mask, common)
+                new.children[self._bit(bits, common, width)] = \
+                    _Node(bits, length, route)
+            new.children[self._bit(child.bits, common, width)] = child
+            node.children[side] = new
+            self.size += 1
+            return
+
+    def _path(self, version, bits, length):
+        '''Nodes containing the prefix, shortest first'''
+        width = WIDTH[version]
+        node = self._roots[version]
+        while node is not None and node.length <= length and \
+                self._contains(node, bits, width):
+            yield node
+            if node.length == width or node.length == length:
+                return
+            node = node.children[self._bit(bits, node.length, width)]
+
+    def lookup(self, address):
+        '''Longest prefix containing the address, None if there is none'''
+        version, bits, length = self._network(address)
+        best = None
+        for node in self._path(version, bits, length):
+            if node.route is not None:
+                best = node.route
+        return best
+
+    def covering(self, prefix):
+        '''Routes containing the prefix, the prefix included, shortest
+           first'''
+        version, bits, length = self._network(prefix)
+        return [node.route for node in self._path(version, bits, length)
+                if node.route is not None]
+
+    def covered(self, prefix):
+        '''Routes contained in the prefix, the prefix included'''
+        version, bits, length = self._network(prefix)
+        width = WIDTH[version]
+        node = self._roots[version]
+        while node is not None and node.length < length:
+            if not self._contains(node, bits, width):
+                return []
+            node = node.children[self._bit(bits, node.length, width)]
+        if node is None or \
+                (node.bits ^ bits) >> (width - length) != 0:
+            return []
+
+        routes = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.route is not None:
+                routes.append(node.route)
+            stack.extend(child for child in reversed(node.children)
+                         if child is not None)
+        return routes
+
+
+class RouteIndex(object):
+    '''PrefixTries of a parsed routing output, per (vrf, address family)'''
+
+    def __init__(self):
+        self.tables = {}
+
+    @classmethod
+    def from_parsed(cls, parsed):
+        '''Index the routes of a parsed routing output'''
+        index = cls()
+        for vrf, vrf_dict in parsed.get('vrf', {}).items():
+            for af, af_dict in vrf_dict.get('address_family', {}).items():
+                routes = af_dict.get('routes', af_dict.get('prefix', {}))
+                index.add_routes(vrf, af, routes)
+        for table, table_dict in parsed.get('table_name', {}).items():
+            vrf, af = cls._junos_table(table)
+            index.add_routes(vrf, af, table_dict.get('routes', {}))
+        return index
+
+    @staticmethod
+    def _junos_table(table):
+        for suffix, af in (('inet.0', 'ipv4'), ('inet6.0', 'ipv6')):
+            if table == suffix:
+                return 'default', af
+            if table.endswith('.' + suffix):
+                return table[:-len(suffix) - 1], af
+        return table, None
+
+    def add_routes(self, vrf, af, routes):
+        '''Index the prefix -> entry dict of the vrf and address family.
+           Keys which are not prefixes are ignored'''
+        trie = self.tables.setdefault((vrf, af), PrefixTrie())
+        for prefix, entry in routes.items():
+            try:
+                trie.insert(prefix, entry)
+            except ValueError:
+                continue
+
+    def _tries(self, vrf, af):
+        if af is not None:
+            trie = self.tables.get((vrf, af))
+            return [trie] if trie is not None else []
+        return [trie for (table_vrf, _), trie in self.tables.items()
+                if table_vrf == vrf]
+
+    def lookup(self, address, vrf='default', af=None):
+        '''Longest prefix match of the address
+
+            Args:
+                address (`str`): ip address, or prefix
+                vrf (`str`): vrf to look into
+                af (`str`): address family, all of the vrf when not given
+
+            Returns:
+                (prefix, entry), None when no route contains the address
+        '''
+        best = None
+        for trie in self._tries(vrf, af):
+            route = trie.lookup(address)
+            if route is not None and (best is None or
+                                      _length(route) > _length(best)):
+                best = route
+        return best
+
+    def lookup_all(self, addresses, vrf='default', af=None):
+        '''Longest prefix match of each address, dict of address ->
+           (prefix, entry) or None'''
+        return {address: self.lookup(address, vrf=vrf, af=af)
+                for address in addresses}
+
+    def covering(self, prefix, vrf='default', af=None):
+        '''Routes containing the prefix, shortest first'''
+        routes = []
+        for trie in self._tries(vrf, af):
+            routes.extend(trie.covering(prefix))
+        return sorted(routes, key=_length)
+
+    def covered(self, prefix, vrf='default', af=None):
+        '''Routes contained in the prefix'''
+        routes = []
+        for trie in self._tries(vrf, af):
+            routes.extend(trie.covered(prefix))
+        return routes
+
+
+def _length(route):
+    return ipaddress.ip_network(route[0], strict=False).prefixlen
@@ -0,0 +1,177 @@
+'''Compiled validation of parser results against their schema
+
+MetaParser validates each result with the generic schema engine, walking
+the schema and the result together. For a result of 100k routes this walk
+costs as much as the parsing. compile_schema turns a schema into a tree of
+validators once; validating a result is then a walk of the result only.
+
+Validation modes, chosen per call:
+
+    * FULL: every entry is validated
+    * SAMPLED: under an Any() key only `sample` entries, spread over the
+      dict, are validated. The literal keys are always validated
+    * NONE: no validation
+
+    >>> parse(ShowIpRoute(device=dev), validation=SAMPLED)
+
+The compiled validators only say whether the result is valid. On an invalid
+result, the generic schema engine is run to raise its usual error. Parts of
+a schema the compiler does not know (Or, And, Use, ...) are validated by
+the generic schema engine.
+'''
+
+# python
+from itertools import islice
+
+# Metaparser
+from genie.metaparser.util.schemaengine import Schema, Any, Optional
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+# Parser
+from .compact import compact as _compact
+
+FULL = 'full'
+SAMPLED = 'sampled'
+NONE = 'none'
+
+MODES = (FULL, SAMPLED, NONE)
+
+# Entries validated per Any() dict in SAMPLED mode
+SAMPLE = 16
+
+# (parser class, mode) -> validator
+_validators = {}
+
+
+def compile_schema(schema, sample=None):
+    '''Return a function of the data, True when the data matches the schema
+
+        Args:
+            schema: parser schema
+            sample (`int`): entries to validate under each Any() key, all
+                            of them when not given
+    '''
+    if isinstance(schema, dict):
+        return _compile_dict(schema, sample)
+    if isinstance(schema, type):
+        return lambda data: isinstance(data, schema)
+    if isinstance(schema, Any):
+        return lambda data: True
+    return _compile_generic(schema)
+
+
+def _compile_generic(schema):
+    validator = Schema(schema)
+
+    def validate(data):
+        try:
+            validator.validate(data)
+        except Exception:
+            return False
+        return True
+    return validate
+
+
+def _is_any(key):
+    '''Any() or Optional(Any())'''
+    return isinstance(key, Any) or (isinstance(key, Optional) and
+                                    isinstance(getattr(key, 'schema', None),
+                                               Any))
+
+
+def _compile_dict(schema, sample):
+    required = {}
+    optional = {}
+    any_value = None
+    for key, value in schema.items():
+        if isinstance(key, str):
+            required[key] = compile_schema(value, sample)
+        elif isinstance(key, Optional) and \
+                isinstance(getattr(key, 'schema', None), str):
+            optional[key.schema] = compile_schema(value, sample)
+        elif _is_any(key) and any_value is None:
+            any_value = compile_schema(value, sample)
+        else:
+            return _compile_generic(schema)
+
+    keys = dict(optional)
+    keys.update(required)
+    required = set(required)
+
+    def validate(data):
+        if not isinstance(data, dict) or not required.issubset(data):
+            return False
+        if any_value is None:
+            for key, value in data.items():
+                check = keys.get(key)
+                if check is None or not check(value):
+                    return False
+            return True
+
+        items = data.items()
+        if sample is not None and len(data) > sample + len(keys):
+            for key, check in keys.items():
+                if key in data and not check(data[key]):
+                    return False
+            items = islice(items, 0, None, len(data) // sample)
+        for key, value in items:
+            if not keys.get(key, any_value)(value):
+                return False
+        return True
+    return validate
+
+
+def get_validator(parser_cls, mode=FULL, sample=SAMPLE):
+    '''Return the compiled validator of the parser class, compiled on first
+       use. None in NONE mode or when the parser has no schema'''
+    if mode not in MODES:
+        raise ValueError("Unknown validation mode '{m}', expected one of "
+                         "{modes}".format(m=mode, modes=MODES))
+    schema = getattr(parser_cls, 'schema', None)
+    if mode == NONE or not schema:
+        return None
+    key = (parser_cls, mode, sample if mode == SAMPLED else None)
+    if key not in _validators:
+        _validators[key] = compile_schema(
+            schema, sample=sample if mode == SAMPLED else None)
+    return _validators[key]
+
+
+def validate(parser_cls, data, mode=FULL, sample=SAMPLE):
+    '''Validate a result of the parser class
+
+        Raises:
+            the error of the schema engine when the result is invalid
+    '''
+    validator = get_validator(parser_cls, mode=mode, sample=sample)
+    if validator is not None and not validator(data):
+        Schema(parser_cls.schema).validate(data)
+
+
+def parse(parser, validation=FULL, sample=SAMPLE, context='cli',
+          compact=False, **kwargs):
+    '''Parse like MetaParser.parse, with the validation mode of the call
+
+        Args:
+            parser (`MetaParser`): parser instance
+            validation (`str`): FULL, SAMPLED or NONE
+            sample (`int`): entries validated per Any() dict in SAMPLED mode
+            context (`str`): cli, xml, yang, ...
+            compact (`bool`): return the memory-compact form of the parsed
+                              output, see genie.libs.parser.utils.compact
+            kwargs: arguments of the parser, ex: output, vrf
+
+        Returns:
+            parsed output
+
+        Raises:
+            SchemaEmptyParserError: nothing was parsed
+            the error of the schema engine when the result is invalid
+    '''
+    parsed = getattr(parser, context)(**kwargs)
+    if not parsed:
+        raise SchemaEmptyParserError(parsed)
+    validate(type(parser), parsed, mode=validation, sample=sample)
+    if compact:
+        return _compact(parsed, getattr(parser, 'schema', None))
+    return parsed
@@ -0,0 +1,188 @@
+'''Diff of parsed outputs taken before and after a change
+
+A parsed output is a tree of dicts. SnapshotDiff hashes each subtree once,
+leaving out the keys of the parser `exclude` list (up_time, expire, ...):
+two subtrees with the same hash are equal and skipped without walking them,
+so only the branches that changed are visited. The hash is a BLAKE2 digest
+of a canonical encoding of the subtree, two different subtrees never get
+the same one in practice. The encoding of a leaf holds its type, 1, 1.0,
+True and '1' are different values, and leaves are compared by value and
+type, not by hash.
+
+    >>> differ = SnapshotDiff.from_parser(ShowIpRoute)
+    >>> differ.diff(before, after)
+    [('~', ('vrf', 'default', ..., 'metric'), 20, 30),
+     ('+', ('vrf', 'default', ..., '10.1.1.0/24'), {...})]
+
+Each change is (op, path, before, after) with op one of:
+
+    * '+': path only in after, before is None
+    * '-': path only in before, after is None
+    * '~': value changed
+
+When snapshots are diffed one after the other (s1 with s2, then s2 with s3)
+`cache=True` keeps the hashes of the last snapshot so s2 is hashed once.
+The cached snapshot must not be modified.
+'''
+
+# python
+import re
+from hashlib import blake2b
+
+# Markers of a dict node in a hash tree: (DICT, digest, {key: node})
+DICT = 'dict'
+
+# Bytes of a digest
+_SIZE = 16
+
+
+def _leaf(data):
+    '''Digest of a leaf, its type and its repr'''
+    return blake2b(type(data).__qualname__.encode() + b'\0' +
+                   repr(data).encode(), digest_size=_SIZE).digest()
+
+
+class SnapshotDiff(object):
+    '''Diff two parsed outputs
+
+        Args:
+            exclude (`list`): keys to ignore, at any depth. Regexes matching
+                              the whole key, ex: 'up_time', '(Tunnel.*)'
+            cache (`bool`): keep the hashes of the last snapshot diffed
+    '''
+
+    def __init__(self, exclude=None, cache=False):
+        self.exclude = list(exclude or [])
+        self._exclude = re.compile('|'.join('(?:{})'.format(pattern)
+                                            for pattern in self.exclude)) \
+            if self.exclude else None
+        # key -> excluded or not
+        self._excluded = {}
+        self.cache = cache
+        self._last = None
+        # (type, value) -> digest of the leaves of the tree being hashed,
+        # most of them repeat
+        self._leaves = {}
+
+    @classmethod
+    def from_parser(cls, parser_cls, exclude=None, cache=False):
+        '''Differ ignoring the exclude list of the parser class, and the
+           extra keys given'''
+        return cls(list(getattr(parser_cls, 'exclude', None) or []) +
+                   list(exclude or []), cache=cache)
+
+    def excluded(self, key):
+        '''Whether the key is ignored'''
+        try:
+            return self._excluded[key]
+        except KeyError:
+            pass
+        excluded = self._exclude is not None and \
+            self._exclude.fullmatch(str(key)) is not None
+        self._excluded[key] = excluded
+        return excluded
+
+    def hash_tree(self, data):
+        '''Hashes of the data and of all its subtrees
+
+            Returns:
+                the digest of a leaf, (DICT, digest, {key: node}) for a dict
+        '''
+        if self.cache and self._last is not None and self._last[0] is data:
+            return self._last[1]
+        try:
+            return self._hash(data)
+        finally:
+            self._leaves.clear()
+
+    def _hash(self, data):
+        if isinstance(data, dict):
+            children = {key: self._hash(value)
+                        for key, value in data.items()
+                        if not self.excluded(key)}
+            # Sorted by the digests of the keys, the order of a dict is not
+            # part of its value. Digests have a fixed size, joined they
+            # are split back one way only
+            digest = blake2b(b'dict\0' + b''.join(sorted(
+                self._leaf(key) + (node[1] if type(node) is tuple else node)
+                for key, node in children.items())),
+                digest_size=_SIZE).digest()
+            return (DICT, digest, children)
+        if isinstance(data, (list, tuple)):
+            return blake2b(type(data).__name__.encode() + b'\0' + b''.join(
+                self._digest(item) for item in data),
+                digest_size=_SIZE).digest()
+        return self._leaf(data)
+
+    def _leaf(self, data):
+        key = (type(data), data)
+        try:
+            return self._leaves[key]
+        except KeyError:
+            digest = self._leaves[key] = _leaf(data)
+            return digest
+        except TypeError:
+            # Not hashable
+            return _leaf(data)
+
+    def _digest(self, data):
+        node = self._hash(data)
+        return node[1] if type(node) is tuple else node
+
+    def diff(self, before, after):
+        '''Return the list of changes from before to after'''
+        before_tree = self.hash_tree(before)
+        after_tree = self.hash_tree(after)
+        if self.cache:
+            self._last = (after, after_tree)
+        changes = []
+        self._diff((), before, before_tree, after, after_tree, changes)
+        return changes
+
+    def _diff(self, path, before, before_node, after, after_node, changes):
+        if type(before_node) is not tuple or type(after_node) is not tuple:
+            if type(before_node) is not type(after_node):
+                changed = True
+            elif isinstance(before, (list, tuple)):
+                # Lists are compared without their excluded keys
+                changed = before_node != after_node
+            else:
+                changed = type(before) is not type(after) or before != after
+            if changed:
+                changes.append(('~', path, before, after))
+            return
+        if before_node[1] == after_node[1]:
+            return
+
+        before_children = before_node[2]
+        after_children = after_node[2]
+        for key, node in before_children.items():
+            if key not in after_children:
+                changes.append(('-', path + (key,), before[key], None))
+                continue
+            other = after_children[key]
+            if type(node) is tuple and type(other) is tuple and \
+                    node[1] == other[1]:
+                continue
+            self._diff(path + (key,), before[key], node, after[key], other,
+                       changes)
+        for key in after_children:
+            if key not in before_children:
+                changes.append(('+', path + (key,), None, after[key]))
+
+
+def diff_snapshots(before, after, parser_cls=None, exclude=None):
+    '''Return the changes between two parsed outputs of a parser
+
+        Args:
+            before (`dict`): parsed output before
+            after (`dict`): parsed output after
+            parser_cls (`class`): parser of the outputs, its exclude list
+                                  is ignored
+            exclude (`list`): more keys to ignore
+
+        Returns:
+            list of (op, path, before, after), see SnapshotDiff
+    '''
+    return SnapshotDiff.from_parser(parser_cls, exclude=exclude).diff(
+        before, after)
@@ -0,0 +1,43 @@
+'''Record streams for parsers of very large outputs
+
+A parser building its whole result before returning holds the full output
+and the full nested dict in memory; for a full Internet BGP table this is
+gigabytes. A streaming parser instead reads an iterable of lines (a list,
+a file, a socket file object) and yields one record per entry as soon as
+the entry is complete.
+
+A record is a tuple (keys, values):
+
+    * keys (`tuple`): path of the entry in the parser result, ex:
+      ('vrf', 'default', 'address_family', 'ipv4 unicast',
+       'routes', '10.1.1.0/24', 'index', 1)
+    * values (`dict`): leaf values of the entry
+
+The usual dict result is the fold of the stream, see fold_records.
+
+example:
+
+    >>> with open('show_ip_bgp.txt') as f:
+    ...     for keys, values in ShowIpBgp(device=dev).iter_routes(f):
+    ...         consume(keys, values)
+'''
+
+
+def fold_records(records, ret_dict=None):
+    '''Merge a stream of (keys, values) records into a nested dict
+
+        Args:
+            records (`iterable`): (keys, values) records
+            ret_dict (`dict`): dict to merge into, a new one when not given
+
+        Returns:
+            the nested dict
+    '''
+    if ret_dict is None:
+        ret_dict = {}
+    for keys, values in records:
+        entry = ret_dict
+        for key in keys:
+            entry = entry.setdefault(key, {})
+        entry.update(values)
+    return ret_dict
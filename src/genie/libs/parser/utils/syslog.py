@@ -0,0 +1,135 @@
+'''Structured and incremental parsing of logging buffers
+
+The logging parsers return the lines of the buffer as they are. With
+structured=True they also split each syslog entry into its fields:
+
+    >>> parsed = ShowLogging(device=dev).parse(structured=True)
+    >>> parsed['entries'][1]
+    {'timestamp': 'Jun  5 05:09:30.838 EST', 'facility': 'IP',
+     'severity': 4, 'mnemonic': 'DUPADDR', 'message': 'Duplicate ...'}
+
+A poller reading the buffer again and again only wants the entries logged
+since its last poll. The parsed output of structured mode holds a cursor,
+the sequence number or timestamp of the last entry and a hash of its line.
+Given back to the next parse, only the lines after that entry are parsed
+and returned, with the cursor of the new last entry:
+
+    >>> parsed = ShowLogging(device=dev).parse(cursor=parsed['cursor'])
+
+The entry of the cursor is looked for by its sequence number when it has
+one, they are unique. Otherwise by its timestamp, and a message repeated
+within the same timestamp gives identical lines: the cursor also holds
+the occurrence of its line among them, counted from the first one. When
+the entry is no longer in the buffer, every line of the output is new.
+'''
+
+# python
+import re
+import hashlib
+
+
+def entry_hash(line):
+    '''Short hash of a stripped log line'''
+    return hashlib.sha1(line.encode()).hexdigest()[:16]
+
+
+def log_entry(m):
+    '''Fields of the syslog entry matched by m, None when the line matched
+       is not an entry
+
+        Args:
+            m (`re.Match`): match of the entry pattern of the parser, with
+                            the groups sequence, timestamp, hostname,
+                            facility, severity, mnemonic and message, the
+                            ones not in the format of the platform left out
+    '''
+    entry = {key: value for key, value in m.groupdict().items()
+             if value is not None}
+    if 'sequence' not in entry and 'timestamp' not in entry and \
+            'facility' not in entry:
+        return None
+    for key in ('sequence', 'severity'):
+        if key in entry:
+            entry[key] = int(entry[key])
+    entry.setdefault('message', '')
+    return entry
+
+
+def log_cursor(lines, pattern, output=None):
+    '''Cursor of the last entry of the stripped lines, None without any
+
+        Args:
+            lines (`list`): stripped lines
+            pattern (`re.Pattern`): entry pattern of the parser
+            output (`str`): whole output the lines are the end of, to
+                            count the lines identical to the last entry
+    '''
+    for line in reversed(lines):
+        m = pattern.match(line)
+        if not m:
+            continue
+        entry = log_entry(m)
+        if entry is None:
+            continue
+        cursor = {'hash': entry_hash(line)}
+        for key in ('sequence', 'timestamp'):
+            if key in entry:
+                cursor[key] = entry[key]
+        if 'sequence' not in cursor and 'timestamp' in cursor:
+            # No line identical to the last entry comes after it
+            matches = _lines(output if output is not None else
+                             '\n'.join(lines), cursor)
+            if len(matches) > 1:
+                cursor['occurrence'] = len(matches)
+        return cursor
+    return None
+
+
+def _lines(output, cursor):
+    '''(start, stop) of the lines of the output with the entry of the
+       cursor, in order'''
+    if 'sequence' in cursor:
+        token = str(cursor['sequence'])
+    else:
+        token = cursor.get('timestamp')
+    digest = cursor.get('hash')
+    if not token or not digest:
+        return []
+
+    matches = []
+    end = len(output)
+    while True:
+        position = output.rfind(token, 0, end)
+        if position < 0:
+            break
+        start = output.rfind('\n', 0, position) + 1
+        stop = output.find('\n', position)
+        if stop < 0:
+            stop = len(output)
+        line = output[start:stop].strip()
+        if 'sequence' in cursor:
+            # The line of the sequence number, it is unique
+            m = re.match(r'\d+', line)
+            if m and int(m.group()) == cursor['sequence']:
+                if entry_hash(line) == digest:
+                    matches.append((start, stop))
+                break
+        elif entry_hash(line) == digest:
+            matches.append((start, stop))
+        end = start
+    return matches[::-1]
+
+
+def after_cursor(output, cursor):
+    '''Offset in the output of the first line after the entry of the cursor,
+       0 when the entry is not in the output'''
+    matches = _lines(output, cursor)
+    if not matches:
+        return 0
+    # Fewer identical lines than when the cursor was taken, the buffer
+    # wrapped among them: start after the first one, entries may be
+    # returned again but none is lost
+    occurrence = cursor.get('occurrence', 1)
+    if occurrence > len(matches):
+        occurrence = 1
+    return matches[occurrence - 1][1]
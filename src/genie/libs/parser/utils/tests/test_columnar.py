@@ -0,0 +1,45 @@
+
+# Python
+import unittest
+
+# Parser
+from genie.libs.parser.utils.columnar import ColumnTable
+
+
+# ==========================================
+#  Unit test for ColumnTable
+# ==========================================
+
+class test_column_table(unittest.TestCase):
+
+    def setUp(self):
+        self.table = ColumnTable(('vlan', 'mac', 'interface'))
+        self.table.append('10', 'aaaa.bbbb.cccc', 'Ethernet1/1')
+        self.table.append('20', 'aaaa.bbbb.dddd', 'Ethernet1/2')
+        self.table.append('10', 'aaaa.bbbb.eeee', 'Ethernet1/3')
+
+    def test_columns(self):
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table['vlan'], ['10', '20', '10'])
+        self.assertEqual(list(self.table)[1],
+                         ('20', 'aaaa.bbbb.dddd', 'Ethernet1/2'))
+        self.assertEqual(self.table.row(2), {'vlan': '10',
+                                             'mac': 'aaaa.bbbb.eeee',
+                                             'interface': 'Ethernet1/3'})
+
+    def test_index(self):
+        index = self.table.index('vlan')
+        self.assertEqual(index, {'10': [0, 2], '20': [1]})
+        self.assertIs(self.table.index('vlan'), index)
+        # Rebuilt after a new row
+        self.table.append('20', 'aaaa.bbbb.ffff', 'Ethernet1/4')
+        self.assertEqual(self.table.index('vlan')['20'], [1, 3])
+
+    def test_empty(self):
+        table = ColumnTable(('vlan',))
+        self.assertEqual(len(table), 0)
+        self.assertEqual(list(table), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
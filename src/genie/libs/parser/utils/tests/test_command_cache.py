@@ -0,0 +1,171 @@
+
+# Python
+import time
+import unittest
+import threading
+from unittest.mock import Mock
+from concurrent.futures import ThreadPoolExecutor
+
+# ATS
+from ats.topology import Device
+
+# Parser
+from genie.libs.parser.utils.command_cache import CommandCache
+
+
+# ===================================
+#  Unit test for CommandCache
+# ===================================
+
+class test_command_cache(unittest.TestCase):
+
+    outputs = {
+        'show ip ospf virtual-links': 'Virtual Link OSPF_VL0 to router 10.100.5.5 is up',
+        'show running-config | section router ospf': 'router ospf 1\n'
+                                                     'router ospf 2 vrf VRF1',
+    }
+
+    def setUp(self):
+        self.device = Device(name='aDevice')
+        self.device.execute = Mock(side_effect=lambda cmd: self.outputs[cmd])
+        self.now = 0
+
+    def clock(self):
+        return self.now
+
+    def test_execute_once(self):
+        cache = CommandCache(self.device)
+        for _ in range(3):
+            self.assertEqual(cache.execute('show ip ospf virtual-links'),
+                             self.outputs['show ip ospf virtual-links'])
+        self.assertEqual(self.device.execute.call_count, 1)
+
+    def test_index(self):
+        builder = Mock(side_effect=lambda out: out.splitlines())
+        cache = CommandCache(self.device)
+        for _ in range(3):
+            lines = cache.index('show running-config | section router ospf',
+                                builder)
+        self.assertEqual(lines, ['router ospf 1', 'router ospf 2 vrf VRF1'])
+        self.assertEqual(builder.call_count, 1)
+        self.assertEqual(self.device.execute.call_count, 1)
+
+    def test_ttl(self):
+        builder = Mock(return_value={})
+        cache = CommandCache(self.device, ttl=30, clock=self.clock)
+        cache.index('show ip ospf virtual-links', builder)
+        self.now = 29
+        cache.index('show ip ospf virtual-links', builder)
+        self.assertEqual(self.device.execute.call_count, 1)
+        self.assertEqual(builder.call_count, 1)
+
+        # Expired, the output and its index are rebuilt
+        self.now = 30
+        cache.index('show ip ospf virtual-links', builder)
+        self.assertEqual(self.device.execute.call_count, 2)
+        self.assertEqual(builder.call_count, 2)
+
+    def test_clear(self):
+        cache = CommandCache(self.device)
+        cache.execute('show ip ospf virtual-links')
+        cache.clear()
+        cache.execute('show ip ospf virtual-links')
+        self.assertEqual(self.device.execute.call_count, 2)
+
+    def test_get(self):
+        self.device.get = Mock(return_value='reply')
+        cache = CommandCache(self.device, ttl=30, clock=self.clock)
+        for _ in range(3):
+            self.assertEqual(cache.get('<bgp/>'), 'reply')
+        self.device.get.assert_called_once_with(('subtree', '<bgp/>'))
+        self.assertTrue(cache.cached(('subtree', '<bgp/>')))
+        self.assertFalse(cache.cached(('subtree', '<bgp><global/></bgp>')))
+        self.now = 30
+        self.assertFalse(cache.cached(('subtree', '<bgp/>')))
+
+    def test_invalidate(self):
+        cache = CommandCache(self.device)
+        cache.execute('show ip ospf virtual-links')
+        cache.execute('show running-config | section router ospf')
+        cache.invalidate('show ip ospf virtual-links', 'show vrf')
+        self.assertEqual(list(cache.outputs),
+                         ['show running-config | section router ospf'])
+        cache.execute('show ip ospf virtual-links')
+        self.assertEqual(self.device.execute.call_count, 3)
+
+    def test_from_device(self):
+        # No cache attached, a new one per parse
+        self.assertIsNot(CommandCache.from_device(self.device),
+                         CommandCache.from_device(self.device))
+
+        cache = CommandCache.attach(self.device, ttl=60)
+        self.assertIs(CommandCache.from_device(self.device), cache)
+        self.assertEqual(cache.ttl, 60)
+
+        CommandCache.detach(self.device)
+        self.assertIsNot(CommandCache.from_device(self.device), cache)
+
+    def test_from_mock_device(self):
+        # Attributes of a Mock are Mocks, not a cache
+        device = Mock()
+        self.assertIsInstance(CommandCache.from_device(device), CommandCache)
+
+    def test_given_outputs(self):
+        cache = CommandCache(self.device, ttl=30, clock=self.clock,
+                             outputs={'show vrf': 'given'})
+        self.now = 100
+        self.assertEqual(cache.execute('show vrf'), 'given')
+        cache.execute('show ip ospf virtual-links')
+        self.assertEqual(self.device.execute.call_count, 1)
+        self.assertEqual(sorted(cache.outputs),
+                         ['show ip ospf virtual-links', 'show vrf'])
+
+    def test_threads(self):
+        def execute(command):
+            time.sleep(0.05)
+            return self.outputs[command]
+        self.device.execute = Mock(side_effect=execute)
+        cache = CommandCache(self.device)
+        with ThreadPoolExecutor(4) as pool:
+            outputs = list(pool.map(cache.execute,
+                                    ['show ip ospf virtual-links'] * 4))
+        # Run once, the other threads wait for its output
+        self.assertEqual(outputs,
+                         [self.outputs['show ip ospf virtual-links']] * 4)
+        self.assertEqual(self.device.execute.call_count, 1)
+
+    def test_threads_error(self):
+        started = threading.Event()
+
+        def execute(command):
+            started.set()
+            time.sleep(0.05)
+            raise ConnectionError(command)
+        self.device.execute = Mock(side_effect=execute)
+        cache = CommandCache(self.device)
+        with ThreadPoolExecutor(2) as pool:
+            first = pool.submit(cache.execute, 'show vrf')
+            started.wait()
+            second = pool.submit(cache.execute, 'show vrf')
+            for future in (first, second):
+                with self.assertRaises(ConnectionError):
+                    future.result()
+        self.assertEqual(self.device.execute.call_count, 1)
+        # Not cached, run again on the next call
+        with self.assertRaises(ConnectionError):
+            cache.execute('show vrf')
+        self.assertEqual(self.device.execute.call_count, 2)
+
+    def test_offline(self):
+        cache = CommandCache.attach(self.device, offline=True,
+                                    outputs={'show vrf': 'given'})
+        self.assertIs(CommandCache.from_device(self.device), cache)
+        self.assertEqual(cache.execute('show vrf'), 'given')
+        with self.assertRaises(KeyError):
+            cache.execute('show ip ospf virtual-links')
+        self.assertFalse(self.device.execute.called)
+        CommandCache.detach(self.device)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+
+# Python
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Parser
+from genie.libs.parser.utils.common import parser_data
+from genie.libs.parser.utils.command_index import CommandIndex
+
+
+# ====================================
+#  Unit test for CommandIndex lookups
+# ====================================
+
+class test_command_index(unittest.TestCase):
+
+    data = {
+        'tokens': ['iosxe', 'nxos', 'asr1k'],
+        'show bgp {address_family}': {
+            'iosxe': {'module_name': 'show_bgp', 'class': 'ShowBgp'}},
+        'show bgp vrf {vrf} {address_family}': {
+            'iosxe': {'module_name': 'show_bgp', 'class': 'ShowBgpVrf'},
+            'nxos': {'module_name': 'show_bgp', 'class': 'ShowBgpVrfNx'}},
+        'show bgp vrf {vrf} {address_family} summary': {
+            'nxos': {'module_name': 'show_bgp', 'class': 'ShowBgpVrfSum'}},
+        'show interfaces {interface}': {
+            'iosxe': {'module_name': 'show_interface',
+                      'class': 'ShowInterfaces',
+                      'asr1k': {'module_name': 'show_interface',
+                                'class': 'ShowInterfacesAsr1k'}}},
+        'show running-config | section {word}': {
+            'iosxe': {'module_name': 'show_run', 'class': 'ShowRunSection'}},
+    }
+
+    def test_longest_literal_match(self):
+        index = CommandIndex(self.data)
+        data, kwargs = index.lookup('show bgp vrf VRF1 ipv4 unicast',
+                                    'iosxe', ['iosxe'])
+        self.assertEqual(data['class'], 'ShowBgpVrf')
+        self.assertEqual(kwargs, {'vrf': 'VRF1',
+                                  'address_family': 'ipv4 unicast'})
+
+        data, kwargs = index.lookup('show bgp vrf VRF1 ipv4 unicast summary',
+                                    'nxos', ['nxos'])
+        self.assertEqual(data['class'], 'ShowBgpVrfSum')
+        self.assertEqual(kwargs, {'vrf': 'VRF1',
+                                  'address_family': 'ipv4 unicast'})
+
+    def test_os_filter(self):
+        index = CommandIndex(self.data)
+        # Summary is nxos only, the less specific one is used for iosxe
+        data, kwargs = index.lookup('show bgp vrf VRF1 ipv4 summary',
+                                    'iosxe', ['iosxe'])
+        self.assertEqual(data['class'], 'ShowBgpVrf')
+        self.assertEqual(kwargs, {'vrf': 'VRF1',
+                                  'address_family': 'ipv4 summary'})
+
+        with self.assertRaises(SyntaxError):
+            index.lookup('show interfaces Gi1', 'nxos', ['nxos'])
+
+    def test_tokens(self):
+        index = CommandIndex(self.data)
+        data, kwargs = index.lookup('show interfaces Gi1', 'iosxe',
+                                    ['iosxe', 'asr1k'])
+        self.assertEqual(data['class'], 'ShowInterfacesAsr1k')
+        self.assertEqual(kwargs, {'interface': 'Gi1'})
+
+        data, kwargs = index.lookup('show interfaces Gi1', 'iosxe',
+                                    ['iosxe'])
+        self.assertEqual(data['class'], 'ShowInterfaces')
+
+    def test_pipe(self):
+        index = CommandIndex(self.data)
+        data, kwargs = index.lookup('show running-config | section bgp',
+                                    'iosxe', ['iosxe'])
+        self.assertEqual(data['class'], 'ShowRunSection')
+        self.assertEqual(kwargs, {'word': 'bgp'})
+
+    def test_no_match(self):
+        index = CommandIndex(self.data)
+        with self.assertRaises(SyntaxError):
+            index.lookup('show version', 'iosxe', ['iosxe'])
+        # Cached misses raise as well
+        with self.assertRaises(SyntaxError):
+            index.lookup('show version', 'iosxe', ['iosxe'])
+
+    def test_cache(self):
+        index = CommandIndex(self.data, cache_size=1)
+        _, kwargs = index.lookup('show interfaces Gi1', 'iosxe', ['iosxe'])
+        kwargs['interface'] = 'modified'
+        _, kwargs = index.lookup('show interfaces Gi1', 'iosxe', ['iosxe'])
+        self.assertEqual(kwargs, {'interface': 'Gi1'})
+
+        index.lookup('show interfaces Gi2', 'iosxe', ['iosxe'])
+        self.assertEqual(len(index._cache), 1)
+
+    def test_threads(self):
+        # Lookups from many threads, evicting each other's results
+        index = CommandIndex(self.data, cache_size=2)
+        commands = ['show bgp vrf VRF{} ipv4 unicast'.format(i)
+                    for i in range(8)]
+
+        def lookup(i):
+            for _ in range(200):
+                for command in commands[i:] + commands[:i]:
+                    data, kwargs = index.lookup(command, 'iosxe', ['iosxe'])
+                    self.assertEqual(kwargs['vrf'], command.split()[3])
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lookup, range(8)))
+        self.assertEqual(len(index._cache), 2)
+
+    def test_parser_data(self):
+        # Every templated command of the package can be resolved back
+        index = CommandIndex(parser_data)
+        for template in index.templates:
+            command = template.command.replace('{vrf}', 'VRF1')
+            for os in template.data:
+                data, kwargs = index.lookup(command, os, [os])
+                self.assertIn('class', data)
+
+
+if __name__ == '__main__':
+    unittest.main()
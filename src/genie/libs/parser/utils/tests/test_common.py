@@ -0,0 +1,109 @@
+
+# Python
+import unittest
+from unittest.mock import Mock, patch
+
+# ATS
+from ats.topology import Device
+
+# Metaparser
+from genie.metaparser import MetaParser
+
+# Parser
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import parser_data, get_parser_docs,\
+                                           _strip_parser_data, parse_output,\
+                                           prefetch_outputs,\
+                                           get_parser_auxiliary_commands
+from genie.libs.parser.utils.command_cache import CommandCache
+
+
+# ==========================================
+#  Unit test for the parser data and index
+# ==========================================
+
+class test_parser_data(unittest.TestCase):
+
+    def test_index_is_slim(self):
+        for command, values in parser_data.items():
+            if command == 'tokens':
+                continue
+            for os, data in values.items():
+                self.assertNotIn('doc', data)
+                self.assertNotIn('schema', data)
+
+    def test_docs_loaded_on_demand(self):
+        docs = get_parser_docs()
+        self.assertIs(docs, get_parser_docs())
+        self.assertIs(docs, common._parser_doc_data)
+        self.assertIn('show version', docs)
+        self.assertIn('schema', docs['show version']['iosxe'])
+
+    def test_index_matches_docs(self):
+        self.assertEqual(_strip_parser_data(get_parser_docs()), parser_data)
+
+
+class ShowDummy(MetaParser):
+
+    cli_command = 'show dummy'
+    auxiliary_commands = ['show dummy vrf']
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+        cache = CommandCache.from_device(self.device)
+        return {'dummy': output, 'vrf': cache.execute('show dummy vrf')}
+
+
+# ==========================================
+#  Unit test for the auxiliary commands
+# ==========================================
+
+class test_auxiliary_commands(unittest.TestCase):
+
+    outputs = {'show dummy': 'dummy output',
+               'show dummy vrf': 'vrf output'}
+
+    def setUp(self):
+        self.device = Device(name='aDevice', os='iosxe')
+        self.device.execute = Mock(side_effect=lambda cmd: self.outputs[cmd])
+        patcher = patch.object(common, 'get_parser',
+                               return_value=(ShowDummy, {}))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_parser_auxiliary_commands(self):
+        self.assertEqual(get_parser_auxiliary_commands('show dummy',
+                                                       self.device),
+                         ['show dummy vrf'])
+
+    def test_get_parser_auxiliary_commands_no_parser(self):
+        with patch.object(common, 'get_parser',
+                          side_effect=Exception('Could not find parser')):
+            self.assertEqual(get_parser_auxiliary_commands('show unknown',
+                                                           self.device),
+                             [])
+
+    def test_prefetch_outputs(self):
+        outputs = prefetch_outputs(['show dummy'], self.device)
+        self.assertEqual(outputs, self.outputs)
+        self.assertEqual(self.device.execute.call_count, 2)
+
+    def test_parse_output(self):
+        self.device.execute = Mock(side_effect=Exception('not connected'))
+        parsed = parse_output('show dummy', self.device, self.outputs)
+        self.assertEqual(parsed, {'dummy': 'dummy output',
+                                  'vrf': 'vrf output'})
+        self.assertFalse(self.device.execute.called)
+        # The offline cache is removed from the device
+        self.assertNotIsInstance(
+            getattr(self.device, CommandCache.ATTRIBUTE, None), CommandCache)
+
+    def test_parse_output_missing(self):
+        with self.assertRaises(KeyError):
+            parse_output('show dummy', self.device,
+                         {'show dummy': 'dummy output'})
+
+
+if __name__ == '__main__':
+    unittest.main()
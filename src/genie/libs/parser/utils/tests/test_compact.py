@@ -0,0 +1,150 @@
+
+# Python
+import json
+import pickle
+import unittest
+from unittest.mock import Mock
+
+# Metaparser
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Any, Optional
+
+# Parser
+from genie.libs.parser.utils.compact import Record, compact, expand
+from genie.libs.parser.utils.schema_compiler import parse
+
+
+class ShowDummySchema(MetaParser):
+
+    schema = {
+        'vrf':
+            {Any():
+                {'router_id': str,
+                Optional('routes'):
+                    {Any():
+                        {'metric': int,
+                        'protocol': str,
+                        Optional('next_hop'):
+                            {'address': str,
+                            'interface': str,
+                            },
+                        Optional('tags'): list,
+                        },
+                    },
+                },
+            },
+        }
+
+
+class ShowDummy(ShowDummySchema):
+
+    cli_command = 'show dummy'
+
+    def cli(self, output=None):
+        return output
+
+
+def routes(count):
+    return {'10.0.{}.0/24'.format(i):
+            {'metric': i % 3,
+             'protocol': ''.join(['o', 'spf']),
+             'next_hop': {'address': '10.1.1.{}'.format(i % 2),
+                          'interface': 'GigabitEthernet1'},
+             'tags': [1, 2]}
+            for i in range(count)}
+
+
+# ==========================================
+#  Unit test for compact parsed outputs
+# ==========================================
+
+class test_compact(unittest.TestCase):
+
+    parsed = {'vrf': {'default': {'router_id': '10.4.1.1',
+                                  'routes': routes(4)},
+                      'VRF1': {'router_id': '10.4.1.1'}}}
+
+    def test_equal(self):
+        parsed = compact(self.parsed, ShowDummy.schema)
+        self.assertEqual(parsed, self.parsed)
+        self.assertEqual(expand(parsed), self.parsed)
+        self.assertEqual(json.loads(json.dumps(expand(parsed))), self.parsed)
+
+    def test_record(self):
+        parsed = compact(self.parsed, ShowDummy.schema)
+        route = parsed['vrf']['default']['routes']['10.0.1.0/24']
+        self.assertIsInstance(route, Record)
+        self.assertEqual(route['metric'], 1)
+        self.assertEqual(route.get('metric'), 1)
+        self.assertIsNone(route.get('distance'))
+        self.assertEqual(route.get('distance', 110), 110)
+        self.assertIn('next_hop', route)
+        self.assertNotIn('distance', route)
+        self.assertEqual(list(route),
+                         ['metric', 'protocol', 'next_hop', 'tags'])
+        self.assertEqual(len(route), 4)
+        self.assertEqual(dict(route.items())['tags'], [1, 2])
+        self.assertEqual(route.to_dict()['next_hop'],
+                         {'address': '10.1.1.1',
+                          'interface': 'GigabitEthernet1'})
+        with self.assertRaises(KeyError):
+            route['distance']
+        with self.assertRaises(TypeError):
+            route['metric'] = 2
+        with self.assertRaises(TypeError):
+            hash(route)
+        with self.assertRaises(AttributeError):
+            route.metric = 2
+
+    def test_schema(self):
+        parsed = compact(self.parsed, ShowDummy.schema)
+        # the dicts under Any() stay dicts, the others become records
+        self.assertIs(type(parsed), Record)
+        self.assertIs(type(parsed['vrf']), dict)
+        self.assertIs(type(parsed['vrf']['default']), Record)
+        self.assertIs(type(parsed['vrf']['default']['routes']), dict)
+
+    def test_leaves(self):
+        parsed = compact(self.parsed)
+        self.assertIs(type(parsed), dict)
+        self.assertIs(type(parsed['vrf']['default']), dict)
+        route = parsed['vrf']['default']['routes']['10.0.1.0/24']
+        self.assertIs(type(route), dict)
+        self.assertIs(type(route['next_hop']), Record)
+        self.assertEqual(parsed, self.parsed)
+
+    def test_shared(self):
+        parsed = compact(self.parsed, ShowDummy.schema)
+        routes = parsed['vrf']['default']['routes']
+        first, second = routes['10.0.0.0/24'], routes['10.0.1.0/24']
+        self.assertIs(first._layout, second._layout)
+        self.assertIs(first['protocol'], second['protocol'])
+        self.assertIs(first['next_hop']['interface'],
+                      second['next_hop']['interface'])
+        self.assertIs(parsed['vrf']['default']['router_id'],
+                      parsed['vrf']['VRF1']['router_id'])
+        # equal values of different types stay apart
+        self.assertIs(compact({'a': {'b': 1, 'c': True}})['a']['c'], True)
+        # and so do the zeros of different signs
+        zeros = compact({'a': {'b': 0.0, 'c': -0.0}})['a']
+        self.assertEqual(str(zeros['c']), '-0.0')
+        self.assertEqual(str(zeros['b']), '0.0')
+
+    def test_pickle(self):
+        parsed = compact(self.parsed, ShowDummy.schema)
+        loaded = pickle.loads(pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(loaded, self.parsed)
+        routes = loaded['vrf']['default']['routes']
+        self.assertIs(routes['10.0.0.0/24']._layout,
+                      routes['10.0.3.0/24']._layout)
+
+    def test_parse(self):
+        obj = ShowDummy(device=Mock())
+        parsed = parse(obj, compact=True, output=self.parsed)
+        self.assertIs(type(parsed), Record)
+        self.assertEqual(parsed, self.parsed)
+        self.assertIs(type(parse(obj, output=self.parsed)), dict)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+
+# Python
+import unittest
+
+# Parser
+from genie.libs.parser.utils.counters import CounterSample, elapsed_seconds
+
+
+# ==========================================
+#  Unit test for interface counter samples
+# ==========================================
+
+class test_counters(unittest.TestCase):
+
+    parsed = {
+        'GigabitEthernet1': {
+            'enabled': True,
+            'counters': {
+                'in_pkts': 100,
+                'in_octets': 4294967000,
+                'out_pkts': 50,
+                'rate': {'load_interval': 300, 'in_rate': 2000},
+                'last_clear': '1d02h',
+                'rx': True,
+            },
+        },
+        'Loopback0': {'enabled': True},
+    }
+
+    def sample(self, time, in_pkts, in_octets, out_pkts, last_clear='1d02h'):
+        return CounterSample.from_parsed({'GigabitEthernet1': {'counters': {
+            'in_pkts': in_pkts, 'in_octets': in_octets, 'out_pkts': out_pkts,
+            'last_clear': last_clear}}}, time=time)
+
+    def test_elapsed_seconds(self):
+        self.assertEqual(elapsed_seconds('00:15:42'), 942)
+        self.assertEqual(elapsed_seconds('1d02h'), 93600)
+        self.assertEqual(elapsed_seconds('2w3d'), 17 * 86400)
+        self.assertIsNone(elapsed_seconds('never'))
+        self.assertIsNone(elapsed_seconds('Unknown'))
+
+    def test_from_parsed(self):
+        sample = CounterSample.from_parsed(self.parsed, time=10)
+        self.assertEqual(list(sample), ['GigabitEthernet1'])
+        self.assertEqual(sample.get('GigabitEthernet1', 'in_pkts'), 100)
+        self.assertIsNone(sample.get('GigabitEthernet1', 'in_errors'))
+        self.assertIsNone(sample.get('Loopback0', 'in_pkts'))
+        counters = dict(self.parsed['GigabitEthernet1']['counters'])
+        del counters['rx']
+        self.assertEqual(sample.to_dict('GigabitEthernet1'), counters)
+
+    def test_delta(self):
+        previous = self.sample(0, 100, 1000, 50)
+        delta = self.sample(30, 130, 4000, 50).delta(previous)
+        self.assertEqual(delta, {'GigabitEthernet1': {
+            'interval': 30,
+            'cleared': False,
+            'delta': {'in_pkts': 30, 'in_octets': 3000, 'out_pkts': 0},
+            'rate': {'in_pkts': 1.0, 'in_octets': 100.0, 'out_pkts': 0.0}}})
+
+    def test_wrap(self):
+        # 32 bits counter
+        previous = self.sample(0, 100, (1 << 32) - 1000, 50)
+        delta = self.sample(30, 130, 2000, 50, '1d03h').delta(previous)
+        self.assertFalse(delta['GigabitEthernet1']['cleared'])
+        self.assertEqual(delta['GigabitEthernet1']['delta']['in_octets'],
+                         3000)
+        # 64 bits counter
+        previous = self.sample(0, 100, (1 << 40), 50, 'never')
+        delta = self.sample(30, 130, 2000, 50, 'never').delta(previous)
+        self.assertEqual(delta['GigabitEthernet1']['delta']['in_octets'],
+                         (1 << 64) - (1 << 40) + 2000)
+
+    def test_clear(self):
+        # Told by the last clear time
+        previous = self.sample(0, 100, 1000, 50, 'never')
+        delta = self.sample(30, 110, 1200, 60, '00:00:10').delta(previous)
+        self.assertTrue(delta['GigabitEthernet1']['cleared'])
+        self.assertEqual(delta['GigabitEthernet1']['delta'],
+                         {'in_pkts': 110, 'in_octets': 1200, 'out_pkts': 60})
+        previous = self.sample(0, 100, 1000, 50, '00:10:00')
+        delta = self.sample(30, 10, 100, 60, '00:00:20').delta(previous)
+        self.assertTrue(delta['GigabitEthernet1']['cleared'])
+
+        # Several counters went down
+        previous = self.sample(0, 100, 1000, 50, 'never')
+        delta = self.sample(30, 10, 100, 60, 'never').delta(previous)
+        self.assertTrue(delta['GigabitEthernet1']['cleared'])
+        self.assertEqual(delta['GigabitEthernet1']['delta']['in_pkts'], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
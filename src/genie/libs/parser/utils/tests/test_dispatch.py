@@ -0,0 +1,129 @@
+
+# Python
+import re
+import unittest
+
+# Parser
+from genie.libs.parser.utils.dispatch import LineDispatcher, LinePattern
+
+
+# =====================================
+#  Unit test for LineDispatcher routing
+# =====================================
+
+class test_line_pattern(unittest.TestCase):
+
+    def test_leading_word(self):
+        self.assertEqual(LinePattern('p', r'^Hardware +is').keys,
+                         ('Hardware',))
+        self.assertEqual(LinePattern('p', r'^\s*Description: *(?P<d>.*)$').keys,
+                         ('Description',))
+        self.assertEqual(LinePattern('p', r'^No\. +of +members').keys,
+                         ('No',))
+        self.assertEqual(LinePattern('p', r'Hardware +is').keys,
+                         ('Hardware',))
+
+    def test_no_leading_word(self):
+        # Starts with a group
+        self.assertIsNone(LinePattern('p', r'^(?P<intf>\S+) +is').keys)
+        # Word can run into the next one
+        self.assertIsNone(LinePattern('p', r'^\s*MTU *(?P<mtu>\d+)').keys)
+        self.assertIsNone(LinePattern('p', r'^Inter\w+').keys)
+        # Alternation at top level
+        self.assertIsNone(LinePattern('p', r'^Vlan +ID|foo').keys)
+        # Case insensitive
+        self.assertIsNone(LinePattern('p', r'^Hardware +is', flags=re.I).keys)
+
+    def test_explicit_keys(self):
+        pattern = LinePattern('p', r'^(?P<pkts>\d+) +packets +input',
+                              keys='packets')
+        self.assertEqual(pattern.keys, ('packets',))
+        pattern = LinePattern('p', r'^\d+ +(minute|second) +input',
+                              keys=['minute', 'second'])
+        self.assertEqual(pattern.keys, ('minute', 'second'))
+
+    def test_contains(self):
+        pattern = LinePattern('p', r'^(?P<intf>\S+) +is +up', contains='up')
+        self.assertTrue(pattern.match('Gi1 is up'))
+        self.assertIsNone(pattern.match('Gi1 is down'))
+
+
+class test_line_dispatcher(unittest.TestCase):
+
+    patterns = LineDispatcher([
+        LinePattern('p1', r'^(?P<intf>\S+) +is +(?P<status>\w+), +line +'
+                           r'protocol +is +(?P<protocol>\w+)$',
+                    contains='protocol'),
+        LinePattern('p2', r'^Hardware +is +(?P<type>.+)$'),
+        LinePattern('p3', r'^(?P<in_pkts>\d+) +packets +input$',
+                    keys='packets'),
+        LinePattern('p4', r'^(?P<out_pkts>\d+) +packets +output$',
+                    keys='packets'),
+        LinePattern('p5', r'^(?P<count>\d+) +packets +\w+$',
+                    keys='packets'),
+    ])
+
+    def test_match(self):
+        name, m = self.patterns.match('Gi1 is up, line protocol is up')
+        self.assertEqual(name, 'p1')
+        self.assertEqual(m.groupdict()['intf'], 'Gi1')
+
+        name, m = self.patterns.match('Hardware is Loopback')
+        self.assertEqual(name, 'p2')
+        self.assertEqual(m.groupdict(), {'type': 'Loopback'})
+
+        name, m = self.patterns.match('10 packets output')
+        self.assertEqual(name, 'p4')
+
+    def test_first_match_wins(self):
+        # p5 also matches, p3 is first in the table
+        name, m = self.patterns.match('10 packets input')
+        self.assertEqual(name, 'p3')
+        name, m = self.patterns.match('10 packets dropped')
+        self.assertEqual(name, 'p5')
+
+    def test_wildcards_on_keyed_lines(self):
+        # An interface named like a key is still tried against p1
+        name, m = self.patterns.match('Hardware is up, line protocol is up')
+        self.assertEqual(name, 'p1')
+
+    def test_candidates(self):
+        self.assertEqual(
+            [p.name for p in self.patterns.candidates('0 packets input')],
+            ['p1', 'p3', 'p4', 'p5'])
+        self.assertEqual(
+            [p.name for p in self.patterns.candidates('Gi1 is up')],
+            ['p1'])
+        self.assertEqual(
+            [p.name for p in self.patterns.candidates('')], ['p1'])
+
+    def test_skip(self):
+        name, m = self.patterns.match('10 packets input', skip={'p3'})
+        self.assertEqual(name, 'p5')
+
+    def test_subset(self):
+        patterns = self.patterns.subset(['p5', 'p1'])
+        self.assertEqual([p.name for p in patterns.patterns], ['p1', 'p5'])
+        self.assertEqual(patterns.match('Hardware is Loopback'),
+                         (None, None))
+        # p3 left out
+        name, m = patterns.match('10 packets input')
+        self.assertEqual(name, 'p5')
+
+    def test_no_match(self):
+        self.assertEqual(self.patterns.match('Description: foo'),
+                         (None, None))
+
+    def test_getitem(self):
+        self.assertEqual(self.patterns['p2'].keys, ('Hardware',))
+        with self.assertRaises(KeyError):
+            self.patterns['p6']
+
+    def test_unique_names(self):
+        with self.assertRaises(ValueError):
+            LineDispatcher([LinePattern('p1', r'^a'),
+                            LinePattern('p1', r'^b')])
+
+
+if __name__ == '__main__':
+    unittest.main()
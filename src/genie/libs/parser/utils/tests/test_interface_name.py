@@ -0,0 +1,65 @@
+
+# Python
+import unittest
+
+# Parser
+from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.interface_name import InterfaceNameConverter, \
+    convert_intf_name, convert_intf_names, get_converter
+
+
+# ==========================================
+#  Unit test for the interface name converter
+# ==========================================
+
+class test_interface_name(unittest.TestCase):
+
+    names = {
+        'Eth2/1': 'Ethernet2/1',
+        'Gi1/0/1.100': 'GigabitEthernet1/0/1.100',
+        'Te0/0/0/1': 'TenGigabitEthernet0/0/0/1',
+        'Po10': 'Port-channel10',
+        'Lo0': 'Loopback0',
+        'Fe0/1': '0/1',
+        'GigabitEthernet1': 'GigabitEthernet1',
+        'port-channel 10': 'Port-channel10',
+        'ethernet1/1': 'Ethernet1/1',
+        'Null0': 'Null0',
+        'mgmt0': 'mgmt0',
+        'Vlan': 'Vlan',
+        'inside': 'inside',
+    }
+
+    def test_convert(self):
+        for intf, full in self.names.items():
+            self.assertEqual(convert_intf_name(intf), full)
+            self.assertEqual(Common.convert_intf_name(intf=intf), full)
+
+    def test_convert_all(self):
+        self.assertEqual(convert_intf_names(list(self.names)),
+                         list(self.names.values()))
+
+    def test_os(self):
+        self.assertEqual(convert_intf_names(['Te0/0/0/1', 'BE10', 'Gi0/0/0/0'],
+                                            os='iosxr'),
+                         ['TenGigE0/0/0/1', 'Bundle-Ether10',
+                          'GigabitEthernet0/0/0/0'])
+        self.assertEqual(convert_intf_name('Po10', os='nxos'),
+                         'port-channel10')
+        # Unknown os, common abbreviations only
+        self.assertEqual(get_converter('junos').abbreviations['Te'],
+                         'TenGigabitEthernet')
+        self.assertIs(get_converter('iosxr'), get_converter('iosxr'))
+
+    def test_cache(self):
+        converter = InterfaceNameConverter({'Gi': 'GigabitEthernet'},
+                                           cache_size=2)
+        converter.convert_all(['Gi1', 'Gi1', 'Gi2', 'Gi3', 'Gi1'])
+        info = converter.convert.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 4)
+        self.assertEqual(info.currsize, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
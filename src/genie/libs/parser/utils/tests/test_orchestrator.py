@@ -0,0 +1,266 @@
+
+# Python
+import time
+import unittest
+import threading
+from unittest.mock import Mock, patch
+
+# ATS
+from ats.topology import Device
+
+# Metaparser
+from genie.metaparser import MetaParser
+
+# Parser
+from genie.libs.parser.utils import common, orchestrator
+from genie.libs.parser.utils.orchestrator import parse_devices
+from genie.libs.parser.utils.command_cache import CommandCache
+from genie.libs.parser.utils.result_cache import ResultCache
+
+
+class ShowDummy(MetaParser):
+
+    cli_command = 'show dummy'
+    auxiliary_commands = ['show dummy vrf', 'show dummy links']
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+        cache = CommandCache.from_device(self.device)
+        parsed = {'dummy': output, 'vrf': cache.execute('show dummy vrf')}
+        # Only read for the outputs with links
+        if 'link' in output:
+            parsed['links'] = cache.execute('show dummy links')
+        return parsed
+
+
+class ShowDummyDetail(ShowDummy):
+
+    cli_command = 'show dummy detail'
+
+
+class ShowDummyRecords(MetaParser):
+
+    cli_command = 'show dummy records'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+        cache = CommandCache.from_device(self.device)
+        # One command per record, not declared
+        return {name: cache.execute('show record {}'.format(name))
+                for name in output.split()[1:]}
+
+
+# ==========================================
+#  Unit test for parse_devices
+# ==========================================
+
+class test_parse_devices(unittest.TestCase):
+
+    outputs = {
+        'R1': {'show dummy': 'R1 dummy',
+               'show dummy detail': 'R1 detail',
+               'show dummy vrf': 'R1 vrf',
+               'show dummy records': 'R1 a b',
+               'show record a': 'R1 a',
+               'show record b': 'R1 b'},
+        'R2': {'show dummy': 'R2 dummy',
+               'show dummy vrf': 'R2 vrf',
+               'show dummy records': 'R2 c',
+               'show record c': 'R2 c'},
+    }
+
+    def setUp(self):
+        self.devices = []
+        for name, outputs in self.outputs.items():
+            device = Device(name=name, os='iosxe')
+            device.execute = Mock(side_effect=outputs.__getitem__)
+            self.devices.append(device)
+
+        self.parsers = {'show dummy': (ShowDummy, {}),
+                        'show dummy detail': (ShowDummyDetail, {}),
+                        'show dummy records': (ShowDummyRecords, {})}
+        patcher = patch.object(common, 'get_parser',
+                               side_effect=self.get_parser)
+        self.get_parser = patcher.start()
+        self.addCleanup(patcher.stop)
+        # Auxiliary commands learned by the other tests
+        patcher = patch.dict(orchestrator._needs, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_parser(self, command, device):
+        try:
+            return self.parsers[command]
+        except KeyError:
+            raise Exception("Could not find parser for "
+                            "'{c}'".format(c=command)) from None
+
+    def test_parse(self):
+        results = parse_devices(self.devices, ['show dummy',
+                                               'show dummy detail'])
+        self.assertEqual(results['R1']['show dummy'].parsed,
+                         {'dummy': 'R1 dummy', 'vrf': 'R1 vrf'})
+        self.assertEqual(results['R1']['show dummy detail'].parsed,
+                         {'dummy': 'R1 detail', 'vrf': 'R1 vrf'})
+        self.assertEqual(results['R2']['show dummy'].parsed,
+                         {'dummy': 'R2 dummy', 'vrf': 'R2 vrf'})
+        self.assertIsNone(results['R1']['show dummy'].error)
+        self.assertGreaterEqual(results['R1']['show dummy'].execute_time, 0)
+        self.assertGreater(results['R1']['show dummy'].parse_time, 0)
+
+        # The auxiliary command is run once per device, the one the parser
+        # does not ask for never
+        self.assertEqual(self.devices[0].execute.call_count, 3)
+        self.assertNotIn('show dummy links', results['R1']['show dummy']
+                         .outputs)
+
+    def test_auxiliary_asked(self):
+        self.outputs['R1']['show dummy detail'] = 'R1 link'
+        self.outputs['R1']['show dummy links'] = 'R1 links'
+        self.addCleanup(self.outputs['R1'].update,
+                        {'show dummy detail': 'R1 detail'})
+        self.addCleanup(self.outputs['R1'].pop, 'show dummy links')
+        results = parse_devices(self.devices, ['show dummy',
+                                               'show dummy detail'],
+                                device_workers=1)
+        self.assertEqual(results['R1']['show dummy detail'].parsed,
+                         {'dummy': 'R1 link', 'vrf': 'R1 vrf',
+                          'links': 'R1 links'})
+        self.assertEqual(sorted(self.devices[0].execute.call_args_list),
+                         sorted([((command,),) for command in
+                                 ['show dummy', 'show dummy detail',
+                                  'show dummy vrf', 'show dummy links']]))
+        # Asked for once, run up front from then on
+        self.assertEqual([needs for (_, command), needs
+                          in orchestrator._needs.items()
+                          if command == 'show dummy detail'],
+                         [{'show dummy vrf', 'show dummy links'}])
+
+    def test_speculative_failure(self):
+        self.outputs['R1']['show dummy'] = 'R1 link'
+        self.outputs['R1']['show dummy links'] = 'R1 links'
+        self.addCleanup(self.outputs['R1'].update,
+                        {'show dummy': 'R1 dummy'})
+        self.addCleanup(self.outputs['R1'].pop, 'show dummy links')
+        parse_devices(self.devices[:1], ['show dummy'])
+
+        # Run up front on R2 too, where it fails without failing the parse
+        results = parse_devices(self.devices[1:], ['show dummy'])
+        self.devices[1].execute.assert_any_call('show dummy links')
+        self.assertIsNone(results['R2']['show dummy'].error)
+        self.assertEqual(results['R2']['show dummy'].parsed,
+                         {'dummy': 'R2 dummy', 'vrf': 'R2 vrf'})
+
+    def test_record_commands(self):
+        for _ in range(2):
+            results = parse_devices(self.devices, ['show dummy records'])
+            self.assertEqual(results['R1']['show dummy records'].parsed,
+                             {'a': 'R1 a', 'b': 'R1 b'})
+            self.assertEqual(results['R2']['show dummy records'].parsed,
+                             {'c': 'R2 c'})
+        self.assertEqual(results['R1']['show dummy records'].outputs,
+                         {'show dummy records': 'R1 a b',
+                          'show record a': 'R1 a',
+                          'show record b': 'R1 b'})
+        # The commands of the records of R1 are never run on R2
+        self.assertEqual(sorted(self.devices[1].execute.call_args_list),
+                         [(('show dummy records',),)] * 2 +
+                         [(('show record c',),)] * 2)
+        self.assertEqual(orchestrator._needs, {})
+
+    def test_scheduling(self):
+        running = {}
+        peak = {}
+        lock = threading.Lock()
+
+        def execute(device, command):
+            with lock:
+                running[device] = running.get(device, 0) + 1
+                peak[device] = max(peak.get(device, 0), running[device])
+            time.sleep(0.02)
+            with lock:
+                running[device] -= 1
+            return '{} {}'.format(device, command)
+
+        devices = []
+        for i in range(8):
+            device = Device(name='R{}'.format(i), os='iosxe')
+            device.execute = Mock(side_effect=lambda command, name=device.name:
+                                  execute(name, command))
+            devices.append(device)
+        commands = ['show dummy {}'.format(i) for i in range(8)]
+        self.parsers = {command: (ShowDummy, {}) for command in commands}
+
+        start = time.perf_counter()
+        results = parse_devices(devices, commands, max_workers=8)
+        elapsed = time.perf_counter() - start
+        self.assertTrue(all(result.parsed for commands in results.values()
+                            for result in commands.values()))
+        # One command at a time per device, all the devices at once: 9
+        # commands per device, about 0.18 s
+        self.assertEqual(set(peak.values()), {1})
+        self.assertLess(elapsed, 0.6)
+
+        peak.clear()
+        parse_devices(devices[:2], commands, max_workers=8,
+                      device_workers=4)
+        self.assertEqual(set(peak.values()), {4})
+
+    def test_parsers_resolved_once(self):
+        parse_devices(self.devices, ['show dummy', 'show dummy detail'])
+        self.assertEqual(self.get_parser.call_count, 2)
+
+    def test_errors(self):
+        results = parse_devices(self.devices, ['show dummy detail',
+                                               'show unknown'])
+        # Output missing on R2
+        self.assertIsInstance(results['R2']['show dummy detail'].error,
+                              KeyError)
+        self.assertIsNone(results['R2']['show dummy detail'].parsed)
+        # No parser
+        self.assertIn('Could not find parser',
+                      str(results['R1']['show unknown'].error))
+        self.assertFalse(results['R1']['show unknown'].outputs)
+        # Other commands are not affected
+        self.assertEqual(results['R1']['show dummy detail'].parsed,
+                         {'dummy': 'R1 detail', 'vrf': 'R1 vrf'})
+
+    def test_parse_processes(self):
+        results = parse_devices(self.devices, ['show dummy'],
+                                parse_processes=2)
+        self.assertEqual(results['R2']['show dummy'].parsed,
+                         {'dummy': 'R2 dummy', 'vrf': 'R2 vrf'})
+
+    def test_result_cache(self):
+        cache = ResultCache()
+        # The first run also misses on the tries without the auxiliary
+        # outputs the parser asks for
+        parse_devices(self.devices, ['show dummy'], result_cache=cache)
+        misses = cache.stats['misses']
+        results = parse_devices(self.devices, ['show dummy'],
+                                result_cache=cache)
+        self.assertEqual(results['R1']['show dummy'].parsed,
+                         {'dummy': 'R1 dummy', 'vrf': 'R1 vrf'})
+        self.assertEqual(cache.stats['misses'], misses)
+        self.assertEqual(cache.stats['hits'], 2)
+
+        # The outputs of the auxiliary commands are part of the key
+        self.outputs['R1']['show dummy vrf'] = 'R1 vrf2'
+        results = parse_devices(self.devices, ['show dummy'],
+                                result_cache=cache)
+        self.assertEqual(results['R1']['show dummy'].parsed,
+                         {'dummy': 'R1 dummy', 'vrf': 'R1 vrf2'})
+        self.assertEqual(cache.stats['misses'], misses + 1)
+        self.outputs['R1']['show dummy vrf'] = 'R1 vrf'
+
+    def test_devices_untouched(self):
+        parse_devices(self.devices, ['show dummy'])
+        for device in self.devices:
+            self.assertNotIsInstance(
+                getattr(device, CommandCache.ATTRIBUTE, None), CommandCache)
+
+
+if __name__ == '__main__':
+    unittest.main()
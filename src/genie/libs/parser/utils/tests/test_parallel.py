@@ -0,0 +1,171 @@
+
+# Python
+import re
+import unittest
+from unittest.mock import Mock
+from concurrent.futures import ThreadPoolExecutor
+
+# Metaparser
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Any, Optional
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+# Parser
+from genie.libs.parser.utils.parallel import RecordSplit, merge_parsed, \
+    parse_parallel
+
+
+class ShowDummySchema(MetaParser):
+
+    schema = {
+        'area':
+            {Any():
+                {'neighbor':
+                    {Any():
+                        {'state': str,
+                        Optional('address'): str,
+                        },
+                    },
+                },
+            },
+        Optional('list_of_neighbors'): list,
+        }
+
+
+class ShowDummy(ShowDummySchema):
+
+    cli_command = 'show dummy'
+
+    # Area 0
+    p1 = re.compile(r'^Area +(?P<area>\S+)$')
+
+    # Neighbor R1
+    p2 = re.compile(r'^Neighbor +(?P<neighbor>\S+)$')
+
+    record_split = RecordSplit(header=p2, context=p1)
+
+    def record_depends(self, lines):
+        # Neighbors using the address of another one
+        headers = {}
+        depends = []
+        for i, line in enumerate(lines):
+            m = self.p2.match(line.strip())
+            if m:
+                headers[m.groupdict()['neighbor']] = header = i
+            elif 'address of' in line:
+                depends.append((header, line.split()[-1]))
+        return [(header, headers[needed]) for header, needed in depends]
+
+    def cli(self, output=None):
+        ret_dict = {}
+        borrowed = {}
+        for line in output.splitlines():
+            line = line.strip()
+
+            m = self.p1.match(line)
+            if m:
+                area_dict = ret_dict.setdefault('area', {}).\
+                    setdefault(m.groupdict()['area'], {})
+                continue
+
+            m = self.p2.match(line)
+            if m:
+                neighbor = m.groupdict()['neighbor']
+                nbr_dict = area_dict.setdefault('neighbor', {}).\
+                    setdefault(neighbor, {})
+                ret_dict.setdefault('list_of_neighbors', []).append(neighbor)
+                continue
+
+            if line.startswith('State'):
+                nbr_dict['state'] = line.split()[-1]
+            elif line.startswith('Address is'):
+                nbr_dict['address'] = line.split()[-1]
+            elif line.startswith('Using address of'):
+                borrowed[neighbor] = (nbr_dict, line.split()[-1])
+
+        # Addresses of the other neighbors
+        for nbr_dict, other in borrowed.values():
+            for area_dict in ret_dict['area'].values():
+                if other in area_dict.get('neighbor', {}):
+                    nbr_dict['address'] = \
+                        area_dict['neighbor'][other]['address']
+        return ret_dict
+
+
+# ==========================================
+#  Unit test for record split parallel parsing
+# ==========================================
+
+class test_parallel(unittest.TestCase):
+
+    output = '''
+        R1#show dummy
+        Area 0
+        Neighbor R2
+          State up
+          Address is 10.1.1.2
+        Neighbor R3
+          State up
+          Using address of R5
+        Neighbor R4
+          State down
+        Area 1
+        Neighbor R5
+          State up
+          Address is 10.1.1.5
+        Neighbor R6
+          State init
+    '''
+
+    def test_chunks(self):
+        lines = self.output.splitlines()
+        chunks = ShowDummy.record_split.chunks(lines, 10)
+        self.assertEqual(len(chunks), 5)
+        # The area carries over
+        self.assertEqual([chunk[0].strip() for chunk in chunks],
+                         ['', 'Area 0', 'Area 0', 'Area 1', 'Area 1'])
+        self.assertEqual(chunks[4][1:], lines[15:])
+
+        # R3 needs R5
+        parser = ShowDummy(device=Mock())
+        chunks = ShowDummy.record_split.chunks(
+            lines, 10, parser.record_depends(lines))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(chunks[1][1:], lines[6:15])
+
+    def test_continued_header(self):
+        split = RecordSplit(header=(re.compile('^Routing Bit'),
+                                    re.compile('^LS age')))
+        lines = ['Routing Bit', 'LS age: 1', ' Link 1',
+                 'LS age: 2', ' Link 2']
+        self.assertEqual(split.scan(lines), ([0, 3], []))
+
+    def test_merge(self):
+        merged = {'a': {'b': 1, 'c': [1]}, 'd': 1}
+        merge_parsed(merged, {'a': {'c': [2], 'e': 3}, 'd': 2})
+        self.assertEqual(merged, {'a': {'b': 1, 'c': [1, 2], 'e': 3}, 'd': 2})
+
+    def test_parse_parallel(self):
+        parser = ShowDummy(device=Mock())
+        serial = parser.parse(output=self.output)
+        self.assertEqual(serial['area']['0']['neighbor']['R3']['address'],
+                         '10.1.1.5')
+        with ThreadPoolExecutor(4) as executor:
+            parsed = parse_parallel(parser, self.output, processes=4,
+                                    threshold=0, executor=executor)
+        self.assertEqual(parsed, serial)
+        self.assertEqual(parsed['list_of_neighbors'],
+                         ['R2', 'R3', 'R4', 'R5', 'R6'])
+
+    def test_serial(self):
+        parser = ShowDummy(device=Mock())
+        parser.cli = Mock(wraps=parser.cli)
+        # Below the threshold, a single call on the whole output
+        parse_parallel(parser, self.output, processes=4)
+        parser.cli.assert_called_once_with(output=self.output)
+        with self.assertRaises(SchemaEmptyParserError):
+            parse_parallel(parser, '', processes=4, threshold=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+
+# Python
+import unittest
+
+# Parser
+from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.record_filter import RecordFilter, ALL
+
+
+# ==========================================
+#  Unit test for the record filter
+# ==========================================
+
+class test_record_filter(unittest.TestCase):
+
+    lines = [
+        'R1#show interfaces',
+        'GigabitEthernet1 is up',
+        '  Internet address is 10.1.1.1/24',
+        'GigabitEthernet2 is up',
+        '  Interface is unnumbered. Using address of Loopback0',
+        'Loopback0 is up',
+        '  Internet address is 10.4.1.1/32',
+        'R1#',
+    ]
+    records = [(('GigabitEthernet1',), 1, 3),
+               (('GigabitEthernet2',), 3, 5),
+               (('Loopback0',), 5, 7)]
+
+    def test_match(self):
+        select = RecordFilter(['Gi1', 'Loop*', ('VRF1', '10.1.*')],
+                              normalize=Common.convert_intf_name)
+        self.assertTrue(select.match(('GigabitEthernet1',)))
+        self.assertTrue(select.match(('Gi1',)))
+        self.assertFalse(select.match(('GigabitEthernet2',)))
+        self.assertTrue(select.match(('Loopback0',)))
+        self.assertTrue(select.match(('VRF1', '10.1.1.1')))
+        self.assertFalse(select.match(('VRF2', '10.1.1.1')))
+        self.assertFalse(select.match(('10.1.1.1',)))
+
+    def test_build(self):
+        self.assertIsNone(RecordFilter.build(None))
+        select = RecordFilter('Gi1')
+        self.assertIs(RecordFilter.build(select), select)
+        self.assertEqual(RecordFilter.build('Gi1').keys, ['Gi1'])
+        self.assertEqual(RecordFilter.build(('VRF1', '*')).keys,
+                         [('VRF1', '*')])
+
+    def test_select(self):
+        select = RecordFilter('GigabitEthernet1')
+        self.assertEqual(select.select(self.lines, self.records), [
+            'R1#show interfaces',
+            'GigabitEthernet1 is up',
+            '  Internet address is 10.1.1.1/24',
+            'R1#'])
+
+    def test_select_depends(self):
+        select = RecordFilter('GigabitEthernet2')
+        depends = [(('GigabitEthernet2',), ('Loopback0',))]
+        self.assertEqual(select.select(self.lines, self.records, depends),
+                         self.lines[:1] + self.lines[3:])
+        # Nothing wanted, nothing needed
+        self.assertEqual(RecordFilter([]).select(self.lines, self.records,
+                                                 depends),
+                         [self.lines[0], self.lines[-1]])
+
+    def test_prune(self):
+        parsed = {
+            'vrf': {
+                'default': {'neighbor': {'10.1.1.1': {'up': True},
+                                         '10.2.2.2': {'up': False}}},
+                'VRF1': {'neighbor': {'10.1.1.2': {'up': True}}},
+            },
+        }
+        select = RecordFilter([('default', '*'), '10.1.1.2'])
+        self.assertIs(select.prune(parsed, ('vrf', None, 'neighbor', None)),
+                      parsed)
+        # Nothing left out
+        self.assertEqual(len(parsed['vrf']['default']['neighbor']), 2)
+        self.assertEqual(len(parsed['vrf']['VRF1']['neighbor']), 1)
+
+        select = RecordFilter('10.1.1.1')
+        select.prune(parsed, ('vrf', None, 'neighbor', None))
+        # VRF1 is left empty and removed
+        self.assertEqual(parsed, {'vrf': {'default': {'neighbor': {
+            '10.1.1.1': {'up': True}}}}})
+
+    def test_prune_all(self):
+        parsed = {'instance': {'1': {'lsas': {'10.1.1.1 10.1.1.1': {},
+                                              '10.2.2.2 10.1.1.1': {}}},
+                               '2': {'lsas': {'10.3.3.3 10.3.3.3': {}}}}}
+        select = RecordFilter('* 10.1.1.1')
+        select.prune(parsed, ('instance', ALL, 'lsas', None))
+        self.assertEqual(parsed, {'instance': {'1': {'lsas': {
+            '10.1.1.1 10.1.1.1': {}, '10.2.2.2 10.1.1.1': {}}}}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+
+# Python
+import json
+import threading
+import unittest
+from urllib.parse import urlparse, parse_qs
+from urllib.request import urlopen
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+# Parser
+from genie.libs.parser.utils.rest_pages import fetch_pages, page_url
+
+
+class _Handler(BaseHTTPRequestHandler):
+    '''Collection of 1234 interfaces, paginated with offset/limit from 1'''
+
+    records = [{'portName': 'GigabitEthernet{}'.format(i)}
+               for i in range(1234)]
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        offset = int(query['offset'][0])
+        limit = int(query['limit'][0])
+        self.server.requests.append((offset, limit))
+        body = json.dumps({'response': self.records[offset - 1:
+                                                    offset - 1 + limit]})
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+class _Response(object):
+
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body)
+
+
+# ==========================================
+#  Unit test for paginated REST fetching
+# ==========================================
+
+class test_rest_pages(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(('127.0.0.1', 0), _Handler)
+        cls.server.requests = []
+        cls.thread = threading.Thread(target=cls.server.serve_forever,
+                                      daemon=True)
+        cls.thread.start()
+        cls.base = 'http://127.0.0.1:{}'.format(cls.server.server_port)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests.clear()
+
+    def get(self, url):
+        with urlopen(self.base + url) as response:
+            return _Response(response.read())
+
+    def test_page_url(self):
+        self.assertEqual(page_url('/interface', 1, 500),
+                         '/interface?offset=1&limit=500')
+        self.assertEqual(page_url('/interface?family=x', 501, 500),
+                         '/interface?family=x&offset=501&limit=500')
+
+    def test_pages(self):
+        records = list(fetch_pages(self.get, '/dna/intent/api/v1/interface',
+                                   limit=100, max_workers=4))
+        self.assertEqual(records, _Handler.records)
+        # 13 pages, and the pages in flight once the last one came back
+        offsets = sorted(offset for offset, _ in self.server.requests)
+        self.assertEqual(offsets[:13], list(range(1, 1234, 100)))
+        self.assertLessEqual(len(offsets), 13 + 4)
+
+    def test_single_page(self):
+        records = list(fetch_pages(self.get, '/dna/intent/api/v1/interface',
+                                   limit=2000))
+        self.assertEqual(len(records), 1234)
+        self.assertEqual(self.server.requests, [(1, 2000)])
+
+    def test_sequential(self):
+        records = list(fetch_pages(self.get, '/dna/intent/api/v1/interface',
+                                   limit=617, max_workers=1))
+        self.assertEqual(records, _Handler.records)
+        self.assertEqual(self.server.requests,
+                         [(1, 617), (618, 617), (1235, 617)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+
+# Python
+import pickle
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+# Metaparser
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Any
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+# Parser
+from genie.libs.parser.utils import result_cache
+from genie.libs.parser.utils.result_cache import ResultCache, COPY, VIEW
+from genie.libs.parser.utils.schema_compiler import SAMPLED
+
+
+class ShowVlan(MetaParser):
+
+    schema = {'vlans': {Any(): {'name': str, 'ports': list}}}
+
+    calls = 0
+
+    def cli(self, output=None, vrf=None):
+        ShowVlan.calls += 1
+        ret_dict = {}
+        for line in output.splitlines():
+            vlan, name, *ports = line.split()
+            ret_dict.setdefault('vlans', {})[vlan] = {'name': name,
+                                                     'ports': ports}
+        return ret_dict
+
+
+# ==========================================
+#  Unit test for the cache of parsed outputs
+# ==========================================
+
+class test_result_cache(unittest.TestCase):
+
+    output = '1 default Gi1/0/1 Gi1/0/2\n10 users Gi1/0/3'
+
+    def setUp(self):
+        ShowVlan.calls = 0
+
+    def parser(self):
+        return ShowVlan(device=Mock())
+
+    def test_hit(self):
+        cache = ResultCache()
+        first = cache.parse(self.parser(), output=self.output)
+        second = cache.parse(self.parser(), output=self.output)
+        self.assertEqual(first, second)
+        self.assertEqual(ShowVlan.calls, 1)
+        self.assertEqual(cache.stats['hits'], 1)
+        self.assertEqual(cache.stats['misses'], 1)
+        self.assertEqual(cache.stats['entries'], 1)
+
+        # A copy per hit
+        second['vlans']['1']['ports'].append('Gi1/0/9')
+        third = cache.parse(self.parser(), output=self.output)
+        self.assertEqual(third['vlans']['1']['ports'], ['Gi1/0/1', 'Gi1/0/2'])
+
+    def test_key(self):
+        cache = ResultCache()
+        cache.parse(self.parser(), output=self.output)
+        cache.parse(self.parser(), output=self.output + ' Gi1/0/4')
+        cache.parse(self.parser(), output=self.output, vrf='VRF1')
+        cache.parse(self.parser(), output=self.output,
+                    auxiliary={'show vrf': 'VRF1'})
+        self.assertEqual(ShowVlan.calls, 4)
+        self.assertNotEqual(
+            ResultCache.key(ShowVlan, 'ab', auxiliary={'x': 'c'}),
+            ResultCache.key(ShowVlan, 'a', auxiliary={'x': 'bc'}))
+        # the output of one command is not the output of another
+        self.assertNotEqual(
+            ResultCache.key(ShowVlan, 'a', auxiliary={'x': 'b'}),
+            ResultCache.key(ShowVlan, 'a', auxiliary={'y': 'b'}))
+        # nor a result of another version of the parsers
+        key = ResultCache.key(ShowVlan, 'a')
+        with patch.object(result_cache, '__version__', '0.0'):
+            self.assertNotEqual(ResultCache.key(ShowVlan, 'a'), key)
+
+    def test_view(self):
+        cache = ResultCache(mode=VIEW)
+        cache.parse(self.parser(), output=self.output)
+        view = cache.parse(self.parser(), output=self.output)
+        self.assertEqual(view['vlans']['10']['ports'][0], 'Gi1/0/3')
+        self.assertEqual(list(view['vlans']), ['1', '10'])
+        with self.assertRaises(TypeError):
+            view['vlans']['10']['name'] = 'other'
+        with self.assertRaises(AttributeError):
+            view['vlans']['10']['ports'].append('Gi1/0/4')
+        self.assertIs(cache.parse(self.parser(), output=self.output)._data,
+                      view._data)
+        copy = view.copy()
+        copy['vlans']['10']['name'] = 'other'
+        self.assertEqual(view['vlans']['10']['name'], 'users')
+
+    def test_lru(self):
+        cache = ResultCache(max_entries=2)
+        outputs = ['{} vlan{}'.format(i, i) for i in range(3)]
+        for output in outputs:
+            cache.parse(self.parser(), output=output)
+        cache.parse(self.parser(), output=outputs[2])
+        self.assertEqual(ShowVlan.calls, 3)
+        # The least recently used one was dropped
+        cache.parse(self.parser(), output=outputs[0])
+        self.assertEqual(ShowVlan.calls, 4)
+        self.assertEqual(cache.stats['entries'], 2)
+
+        cache = ResultCache(max_bytes=1)
+        cache.parse(self.parser(), output=outputs[0])
+        self.assertEqual(cache.stats['entries'], 0)
+
+    def test_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(directory=directory)
+            cache.parse(self.parser(), output=self.output)
+            # Another process, through pickle
+            other = pickle.loads(pickle.dumps(cache))
+            self.assertEqual(other.stats['entries'], 0)
+            parsed = other.parse(self.parser(), output=self.output)
+            self.assertEqual(parsed['vlans']['10']['name'], 'users')
+            self.assertEqual(ShowVlan.calls, 1)
+            self.assertEqual(other.stats['disk_hits'], 1)
+
+            other.clear(disk=True)
+            other.parse(self.parser(), output=self.output)
+            self.assertEqual(ShowVlan.calls, 2)
+
+    def test_validation(self):
+        cache = ResultCache()
+        cache.parse(self.parser(), output=self.output, validation=SAMPLED)
+        cache.parse(self.parser(), output=self.output)
+        self.assertEqual(ShowVlan.calls, 1)
+        with self.assertRaises(ValueError):
+            cache.parse(self.parser(), output=self.output, validation='all')
+
+    def test_empty(self):
+        cache = ResultCache()
+        for _ in range(2):
+            with self.assertRaises(SchemaEmptyParserError):
+                cache.parse(self.parser(), output='')
+        self.assertEqual(ShowVlan.calls, 2)
+        self.assertEqual(cache.stats['entries'], 0)
+
+    def test_mode(self):
+        with self.assertRaises(ValueError):
+            ResultCache(mode='shared')
+        self.assertEqual(ResultCache().mode, COPY)
+
+
+if __name__ == '__main__':
+    unittest.main()
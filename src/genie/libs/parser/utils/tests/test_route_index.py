@@ -0,0 +1,155 @@
+
+# Python
+import random
+import ipaddress
+import unittest
+
+# Parser
+from genie.libs.parser.utils.route_index import RouteIndex, PrefixTrie
+
+
+# ==========================================
+#  Unit test for the route index
+# ==========================================
+
+class test_prefix_trie(unittest.TestCase):
+
+    def test_against_scan(self):
+        rand = random.Random(1)
+        prefixes = {'0.0.0.0/0'}
+        for _ in range(2000):
+            length = rand.choice([8, 12, 16, 20, 24, 25, 30, 32])
+            network = ipaddress.ip_network(
+                (rand.getrandbits(32) >> (32 - length) << (32 - length),
+                 length))
+            prefixes.add(str(network))
+        trie = PrefixTrie()
+        for prefix in prefixes:
+            trie.insert(prefix, {'route': prefix})
+        self.assertEqual(trie.size, len(prefixes))
+        networks = [ipaddress.ip_network(p) for p in prefixes]
+
+        for _ in range(200):
+            address = ipaddress.ip_address(rand.getrandbits(32))
+            best = max((n for n in networks if address in n),
+                       key=lambda n: n.prefixlen)
+            prefix, entry = trie.lookup(str(address))
+            self.assertEqual(prefix, str(best))
+            self.assertEqual(entry, {'route': prefix})
+
+        for network in networks[:50]:
+            self.assertEqual(
+                [p for p, _ in trie.covering(str(network))],
+                [str(n) for n in sorted(
+                    (n for n in networks if network.subnet_of(n)),
+                    key=lambda n: n.prefixlen)])
+            self.assertEqual(
+                sorted(p for p, _ in trie.covered(str(network))),
+                sorted(str(n) for n in networks if n.subnet_of(network)))
+
+    def test_ipv6(self):
+        trie = PrefixTrie()
+        trie.insert('2001:db8::/32', 'a')
+        trie.insert('2001:db8:1::/48', 'b')
+        trie.insert('10.0.0.0/8', 'c')
+        self.assertEqual(trie.lookup('2001:db8:1::1'), ('2001:db8:1::/48', 'b'))
+        self.assertEqual(trie.lookup('2001:db8:2::1'), ('2001:db8::/32', 'a'))
+        self.assertIsNone(trie.lookup('2001:db9::1'))
+        self.assertEqual(trie.lookup('10.1.1.1'), ('10.0.0.0/8', 'c'))
+
+
+class test_route_index(unittest.TestCase):
+
+    show_ip_route = {
+        'vrf': {
+            'default': {
+                'address_family': {
+                    'ipv4': {
+                        'routes': {
+                            '0.0.0.0/0': {'route': '0.0.0.0/0'},
+                            '10.1.0.0/16': {'route': '10.1.0.0/16'},
+                            '10.1.2.0/24': {'route': '10.1.2.0/24'},
+                        },
+                    },
+                    'ipv6': {
+                        'routes': {
+                            '2001:db8::/32': {'route': '2001:db8::/32'},
+                        },
+                    },
+                },
+            },
+            'VRF1': {
+                'address_family': {
+                    'ipv4': {
+                        'routes': {
+                            '10.0.0.0/8': {'route': '10.0.0.0/8'},
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+    show_ip_cef = {
+        'vrf': {
+            'default': {
+                'address_family': {
+                    'ipv4': {
+                        'prefix': {
+                            '10.1.2.0/24': {'nexthop': {}},
+                            'drop': {'nexthop': {}},
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+    show_route_table = {
+        'table_name': {
+            'inet.0': {'routes': {'10.1.0.0/16': {'metric': '1'}}},
+            'VRF1.inet6.0': {'routes': {'2001:db8::/32': {'metric': '2'}}},
+            'mpls.0': {'routes': {'299776': {'metric': '0'}}},
+        },
+    }
+
+    def test_show_ip_route(self):
+        index = RouteIndex.from_parsed(self.show_ip_route)
+        prefix, entry = index.lookup('10.1.2.3')
+        self.assertEqual(prefix, '10.1.2.0/24')
+        # The entry of the parsed output, not a copy
+        self.assertIs(entry, self.show_ip_route['vrf']['default']
+                      ['address_family']['ipv4']['routes']['10.1.2.0/24'])
+        self.assertEqual(index.lookup('10.2.0.1')[0], '0.0.0.0/0')
+        self.assertEqual(index.lookup('10.2.0.1', vrf='VRF1')[0], '10.0.0.0/8')
+        self.assertIsNone(index.lookup('11.0.0.1', vrf='VRF1'))
+        self.assertEqual(index.lookup('2001:db8::1', af='ipv6')[0],
+                         '2001:db8::/32')
+        self.assertIsNone(index.lookup('10.1.2.3', af='ipv6'))
+
+        self.assertEqual([p for p, _ in index.covering('10.1.2.0/24')],
+                         ['0.0.0.0/0', '10.1.0.0/16', '10.1.2.0/24'])
+        self.assertEqual(sorted(p for p, _ in index.covered('10.0.0.0/8')),
+                         ['10.1.0.0/16', '10.1.2.0/24'])
+        self.assertEqual(
+            {a: r[0] for a, r in index.lookup_all(['10.1.2.3',
+                                                   '10.1.3.3']).items()},
+            {'10.1.2.3': '10.1.2.0/24', '10.1.3.3': '10.1.0.0/16'})
+
+    def test_show_ip_cef(self):
+        index = RouteIndex.from_parsed(self.show_ip_cef)
+        self.assertEqual(index.lookup('10.1.2.3')[0], '10.1.2.0/24')
+        self.assertEqual(index.tables['default', 'ipv4'].size, 1)
+
+    def test_show_route_table(self):
+        index = RouteIndex.from_parsed(self.show_route_table)
+        self.assertEqual(sorted(index.tables),
+                         [('VRF1', 'ipv6'), ('default', 'ipv4'),
+                          ('mpls.0', None)])
+        self.assertEqual(index.lookup('10.1.1.1')[1], {'metric': '1'})
+        self.assertEqual(index.lookup('2001:db8::1', vrf='VRF1')[1],
+                         {'metric': '2'})
+
+
+if __name__ == '__main__':
+    unittest.main()
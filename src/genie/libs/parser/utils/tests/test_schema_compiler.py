@@ -0,0 +1,117 @@
+
+# Python
+import unittest
+from unittest.mock import Mock, patch
+
+# Metaparser
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Any, Optional, Or
+from genie.metaparser.util.exceptions import SchemaEmptyParserError, \
+                                             SchemaMissingKeyError
+
+# Parser
+from genie.libs.parser.utils import schema_compiler
+from genie.libs.parser.utils.schema_compiler import compile_schema, \
+    get_validator, validate, parse, FULL, SAMPLED, NONE
+
+
+class ShowDummySchema(MetaParser):
+
+    schema = {
+        'vrf':
+            {Any():
+                {'router_id': str,
+                Optional('as_number'): Or(int, str),
+                Optional('routes'):
+                    {Optional(Any()):
+                        {'metric': int,
+                        Optional('next_hop'): str,
+                        },
+                    },
+                },
+            },
+        }
+
+
+class ShowDummy(ShowDummySchema):
+
+    cli_command = 'show dummy'
+
+    def cli(self, output=None):
+        return output
+
+
+def routes(count):
+    return {'10.0.{}.0/24'.format(i): {'metric': i} for i in range(count)}
+
+
+# ==========================================
+#  Unit test for the schema compiler
+# ==========================================
+
+class test_schema_compiler(unittest.TestCase):
+
+    valid = {'vrf': {'default': {'router_id': '10.1.1.1',
+                                 'as_number': 100,
+                                 'routes': routes(3)},
+                     'VRF1': {'router_id': '10.2.2.2'}}}
+
+    def test_valid(self):
+        validator = compile_schema(ShowDummy.schema)
+        self.assertTrue(validator(self.valid))
+
+    def test_invalid(self):
+        validator = compile_schema(ShowDummy.schema)
+        # Missing key
+        self.assertFalse(validator({'vrf': {'default': {}}}))
+        # Unsupported key
+        self.assertFalse(validator({'vrf': {'default': {
+            'router_id': '10.1.1.1', 'area': '0'}}}))
+        # Wrong type
+        self.assertFalse(validator({'vrf': {'default': {
+            'router_id': '10.1.1.1', 'routes': {'10.0.0.0/24':
+                                                {'metric': '1'}}}}}))
+        # Generic part of the schema
+        self.assertFalse(validator({'vrf': {'default': {
+            'router_id': '10.1.1.1', 'as_number': 1.5}}}))
+
+    def test_sampled(self):
+        data = {'vrf': {'default': {'router_id': '10.1.1.1',
+                                    'routes': routes(1000)}}}
+        data['vrf']['default']['routes']['10.0.1.0/24']['metric'] = 'bad'
+        self.assertFalse(compile_schema(ShowDummy.schema)(data))
+        # Only some of the routes are looked at
+        self.assertTrue(compile_schema(ShowDummy.schema, sample=10)(data))
+        # The literal keys are always validated
+        del data['vrf']['default']['router_id']
+        self.assertFalse(compile_schema(ShowDummy.schema, sample=10)(data))
+
+    def test_validator_cached(self):
+        schema_compiler._validators.clear()
+        with patch.object(schema_compiler, 'compile_schema',
+                          wraps=compile_schema) as compiler:
+            validator = get_validator(ShowDummy, FULL)
+            calls = compiler.call_count
+            self.assertIs(get_validator(ShowDummy, FULL), validator)
+            self.assertEqual(compiler.call_count, calls)
+        self.assertIsNot(get_validator(ShowDummy, SAMPLED), validator)
+        self.assertIsNone(get_validator(ShowDummy, NONE))
+        with self.assertRaises(ValueError):
+            get_validator(ShowDummy, 'partial')
+
+    def test_validate_raises_engine_error(self):
+        with self.assertRaises(SchemaMissingKeyError):
+            validate(ShowDummy, {'vrf': {'default': {}}})
+        validate(ShowDummy, {'vrf': {'default': {}}}, mode=NONE)
+
+    def test_parse(self):
+        obj = ShowDummy(device=Mock())
+        self.assertEqual(parse(obj, output=self.valid), self.valid)
+        self.assertEqual(parse(obj, validation=NONE, output={'vrf': {}}),
+                         {'vrf': {}})
+        with self.assertRaises(SchemaEmptyParserError):
+            parse(obj, output={})
+
+
+if __name__ == '__main__':
+    unittest.main()
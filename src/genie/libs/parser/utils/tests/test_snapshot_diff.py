@@ -0,0 +1,122 @@
+
+# Python
+import copy
+import unittest
+from unittest.mock import patch
+
+# Metaparser
+from genie.metaparser import MetaParser
+
+# Parser
+from genie.libs.parser.utils.snapshot_diff import SnapshotDiff, \
+                                                  diff_snapshots
+
+
+class ShowDummy(MetaParser):
+
+    exclude = ['up_time', '(Tunnel.*)']
+
+
+# ==========================================
+#  Unit test for the snapshot diff
+# ==========================================
+
+class test_snapshot_diff(unittest.TestCase):
+
+    before = {
+        'vrf': {
+            'default': {
+                'up_time': '00:01:00',
+                'interfaces': {
+                    'GigabitEthernet1': {'metric': 10, 'up_time': '1d'},
+                    'Tunnel1': {'metric': 1},
+                },
+                'routes': {'10.0.{}.0/24'.format(i): {'metric': i,
+                                                      'tags': [i, -1]}
+                           for i in range(100)},
+            },
+            'VRF1': {'router_id': '10.1.1.1'},
+        },
+    }
+
+    def test_no_change(self):
+        after = copy.deepcopy(self.before)
+        after['vrf']['default']['up_time'] = '00:02:00'
+        after['vrf']['default']['interfaces']['Tunnel1']['metric'] = 2
+        after['vrf']['default']['interfaces']['Tunnel2'] = {}
+        self.assertEqual(diff_snapshots(self.before, after,
+                                        parser_cls=ShowDummy), [])
+        # Without the exclude list
+        self.assertEqual(len(diff_snapshots(self.before, after)), 3)
+
+    def test_changes(self):
+        after = copy.deepcopy(self.before)
+        routes = after['vrf']['default']['routes']
+        routes['10.0.1.0/24']['metric'] = 5
+        routes['10.0.2.0/24']['tags'] = [2, -2]
+        del routes['10.0.3.0/24']
+        routes['10.1.0.0/16'] = {'metric': 0}
+        after['vrf']['VRF1'] = 'gone'
+
+        path = ('vrf', 'default', 'routes')
+        self.assertEqual(
+            sorted(diff_snapshots(self.before, after, parser_cls=ShowDummy)),
+            sorted([
+                ('~', path + ('10.0.1.0/24', 'metric'), 1, 5),
+                ('~', path + ('10.0.2.0/24', 'tags'), [2, -1], [2, -2]),
+                ('-', path + ('10.0.3.0/24',), {'metric': 3, 'tags': [3, -1]},
+                 None),
+                ('+', path + ('10.1.0.0/16',), None, {'metric': 0}),
+                ('~', ('vrf', 'VRF1'), {'router_id': '10.1.1.1'}, 'gone'),
+            ]))
+
+    def test_type_changes(self):
+        for before, after in [(1, True), (0, False), (1.0, 1), (-1, '-1'),
+                              (-1, -2), ([1], [True]), ('1', 1)]:
+            self.assertEqual(diff_snapshots({'x': before}, {'x': after}),
+                             [('~', ('x',), before, after)])
+            self.assertEqual(
+                diff_snapshots({'a': {'x': before}}, {'a': {'x': after}}),
+                [('~', ('a', 'x'), before, after)])
+
+    def test_hash_collisions(self):
+        # Equal hash() in CPython, different values
+        for before, after in [(0, 2 ** 61 - 1), (1, 2 ** 61), (-1, -2),
+                              ((1, 2), (2, 1))]:
+            self.assertEqual(
+                diff_snapshots({'a': {'x': before}}, {'a': {'x': after}}),
+                [('~', ('a', 'x'), before, after)])
+            self.assertEqual(
+                diff_snapshots({'a': {'x': [before]}}, {'a': {'x': [after]}}),
+                [('~', ('a', 'x'), [before], [after])])
+        # Keys and values swapped
+        self.assertEqual(
+            len(diff_snapshots({'a': {'x': 'y', 'y': 'x'}},
+                               {'a': {'x': 'x', 'y': 'y'}})), 2)
+
+    def test_unchanged_subtrees_skipped(self):
+        after = copy.deepcopy(self.before)
+        after['vrf']['VRF1']['router_id'] = '10.2.2.2'
+        differ = SnapshotDiff.from_parser(ShowDummy)
+        with patch.object(differ, '_diff', wraps=differ._diff) as walk:
+            differ.diff(self.before, after)
+        # root, vrf, VRF1 and router_id; the routes are not walked
+        self.assertEqual(walk.call_count, 4)
+
+    def test_cache(self):
+        s1 = self.before
+        s2 = copy.deepcopy(s1)
+        s2['vrf']['VRF1']['router_id'] = '10.2.2.2'
+        s3 = copy.deepcopy(s2)
+        differ = SnapshotDiff(cache=True)
+        differ.diff(s1, s2)
+        with patch.object(differ, '_hash', wraps=differ._hash) as hasher:
+            self.assertEqual(differ.diff(s2, s3), [])
+        # Only s3 is hashed
+        self.assertIs(hasher.call_args_list[0][0][0], s3)
+        self.assertFalse(any(call[0][0] is s2
+                             for call in hasher.call_args_list))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+
+# Python
+import re
+import unittest
+
+# Parser
+from genie.libs.parser.utils.syslog import entry_hash, log_entry, \
+    log_cursor, after_cursor
+
+
+# ==========================================
+#  Unit test for incremental syslog parsing
+# ==========================================
+
+class test_syslog(unittest.TestCase):
+
+    pattern = re.compile(r'^(?:(?P<sequence>\d+): +)?'
+                         r'(?:(?P<timestamp>\d+:\d+:\d+): +)?'
+                         r'(?:%(?P<facility>[A-Z]+)-(?P<severity>\d)-'
+                         r'(?P<mnemonic>[A-Z_]+): *)?(?P<message>.*)$')
+
+    output = '\n'.join([
+        'Log Buffer (4096 bytes):',
+        '000001: 10:00:00: %SYS-5-RESTART: System restarted',
+        '000002: 10:00:01: %LINK-3-UPDOWN: Interface Gi1, changed state to up',
+        ' traceback 0x1234',
+        '000003: 10:00:01: %LINK-3-UPDOWN: Interface Gi2, changed state to up',
+    ])
+
+    def test_log_entry(self):
+        self.assertIsNone(log_entry(self.pattern.match(' traceback 0x1234')))
+        self.assertEqual(log_entry(self.pattern.match(
+            '000002: 10:00:01: %LINK-3-UPDOWN: Interface Gi1')), {
+                'sequence': 2, 'timestamp': '10:00:01', 'facility': 'LINK',
+                'severity': 3, 'mnemonic': 'UPDOWN',
+                'message': 'Interface Gi1'})
+
+    def test_log_cursor(self):
+        lines = self.output.splitlines()
+        self.assertEqual(log_cursor(lines[:4], self.pattern), {
+            'sequence': 2, 'timestamp': '10:00:01',
+            'hash': entry_hash(lines[2])})
+        self.assertIsNone(log_cursor(lines[:1], self.pattern))
+
+    def test_after_cursor(self):
+        lines = self.output.splitlines()
+        # Same timestamp as the last entry, found by its hash
+        cursor = log_cursor(lines[:4], self.pattern)
+        self.assertEqual(self.output[after_cursor(self.output, cursor):],
+                         '\n'.join([''] + lines[3:]))
+        # By sequence number
+        del cursor['timestamp']
+        self.assertEqual(self.output[after_cursor(self.output, cursor):],
+                         '\n'.join([''] + lines[3:]))
+        # Gone from the buffer
+        cursor['hash'] = entry_hash('000002: 09:59:59: %SYS-5-RESTART')
+        self.assertEqual(after_cursor(self.output, cursor), 0)
+
+    def test_sequence(self):
+        lines = self.output.splitlines()
+        cursor = log_cursor(lines[:3], self.pattern)
+        # Anchored on the sequence number, not on the timestamp shared
+        # with entry 3
+        self.assertEqual(self.output[after_cursor(self.output, cursor):],
+                         '\n'.join([''] + lines[3:]))
+        # Sequence number reused after a reload
+        output = self.output.replace('000002: 10:00:01', '000002: 11:00:00')
+        self.assertEqual(after_cursor(output, cursor), 0)
+
+    def test_duplicates(self):
+        # The same message twice in the same second
+        lines = ['10:00:00: %SYS-5-RESTART: System restarted',
+                 '10:00:01: %LINK-3-UPDOWN: Interface Gi1, changed state to up',
+                 '10:00:01: %LINK-3-UPDOWN: Interface Gi1, changed state to up',
+                 '10:00:02: %SYS-5-CONFIG_I: Configured']
+        output = '\n'.join(lines[:2])
+        cursor = log_cursor(lines[:2], self.pattern, output=output)
+        self.assertNotIn('occurrence', cursor)
+        output = '\n'.join(lines)
+        self.assertEqual(output[after_cursor(output, cursor):],
+                         '\n'.join([''] + lines[2:]))
+
+        output = '\n'.join(lines[:3])
+        cursor = log_cursor(lines[2:3], self.pattern, output=output)
+        self.assertEqual(cursor['occurrence'], 2)
+        output = '\n'.join(lines)
+        self.assertEqual(output[after_cursor(output, cursor):],
+                         '\n'.join([''] + lines[3:]))
+        # Wrapped among the identical lines, returned again rather than lost
+        output = '\n'.join(lines[2:])
+        self.assertEqual(output[after_cursor(output, cursor):],
+                         '\n'.join([''] + lines[3:]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+
+# Python
+import unittest
+import xml.etree.ElementTree as ET
+
+# Parser
+from genie.libs.parser.utils.xml_stream import XmlStream, local_name
+
+
+# ==========================================
+#  Unit test for streaming xml outputs
+# ==========================================
+
+class test_xml_stream(unittest.TestCase):
+
+    output = '''<?xml version="1.0" encoding="ISO-8859-1"?>
+        <nf:rpc-reply xmlns="http://www.cisco.com/nxos:1.0:bgp" xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+         <nf:data>
+          <show>
+           <bgp>
+            <vrf>
+             <__XML__PARAM__vrf-name>
+              <__XML__value>all</__XML__value>
+              <all>
+               <dampening>
+                <__readonly__>
+                 <TABLE_vrf>
+                  <ROW_vrf>
+                   <vrf-name-out>default</vrf-name-out>
+                   <TABLE_rd>
+                    <ROW_rd><rd_val>1:100</rd_val></ROW_rd>
+                    <ROW_rd><rd_val>2:100</rd_val></ROW_rd>
+                    <ROW_rd><rd_val>3:100</rd_val></ROW_rd>
+                   </TABLE_rd>
+                  </ROW_vrf>
+                  <ROW_vrf>
+                   <vrf-name-out>VRF1</vrf-name-out>
+                  </ROW_vrf>
+                 </TABLE_vrf>
+                </__readonly__>
+               </dampening>
+              </all>
+             </__XML__PARAM__vrf-name>
+            </vrf>
+           </bgp>
+          </show>
+         </nf:data>
+        </nf:rpc-reply>
+        ]]>]]>'''
+
+    namespace = '{http://www.cisco.com/nxos:1.0:bgp}'
+
+    def test_local_name(self):
+        self.assertEqual(local_name(self.namespace + 'ROW_vrf'), 'ROW_vrf')
+        self.assertEqual(local_name('ROW_vrf'), 'ROW_vrf')
+
+    def test_rows(self):
+        stream = XmlStream(self.output, rows=('ROW_vrf', 'ROW_rd'),
+                           command='show bgp vrf all all dampening',
+                           chunk_size=64)
+        rows = []
+        for row in stream:
+            name = row.find('{}rd_val'.format(stream.namespace))
+            if name is not None:
+                # The vrf of the row is open, with its leaves
+                vrf = stream.ancestor('ROW_vrf')
+                rows.append((vrf.find('{}vrf-name-out'.format(
+                    stream.namespace)).text, name.text))
+                # Rows already read are gone from the tree
+                self.assertIs(stream.ancestor('TABLE_rd')[0], row)
+            else:
+                rows.append((row.find('{}vrf-name-out'.format(
+                    stream.namespace)).text, None))
+                # Only the leaves and empty tables are left
+                self.assertTrue(all(len(child) == 0 for child in row))
+        self.assertEqual(stream.namespace, self.namespace)
+        self.assertEqual(rows, [('default', '1:100'), ('default', '2:100'),
+                                ('default', '3:100'), ('default', None),
+                                ('VRF1', None)])
+
+    def test_command(self):
+        stream = XmlStream(self.output, rows='ROW_vrf',
+                           command='show bgp vrf VRF1 all dampening')
+        with self.assertRaises(AssertionError):
+            list(stream)
+        # Not checked
+        self.assertEqual(len(list(XmlStream(self.output, rows='ROW_vrf'))), 2)
+
+    def test_malformed(self):
+        with self.assertRaises(ET.ParseError):
+            list(XmlStream(self.output[:500], rows='ROW_vrf'))
+
+
+if __name__ == '__main__':
+    unittest.main()
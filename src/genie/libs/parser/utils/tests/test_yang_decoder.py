@@ -0,0 +1,117 @@
+
+# Python
+import unittest
+import xml.etree.ElementTree as ET
+
+# Parser
+from genie.libs.parser.utils.yang_decoder import YangDecoder, boolean
+
+
+# ==========================================
+#  Unit test for decoding yang replies
+# ==========================================
+
+class test_yang_decoder(unittest.TestCase):
+
+    output = '''<?xml version="1.0" encoding="UTF-8"?>
+        <rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101">
+         <data>
+          <bgp xmlns="http://openconfig.net/yang/bgp">
+           <global>
+            <state>
+             <as>100</as>
+             <router-id>10.4.1.1</router-id>
+            </state>
+            <config><as>200</as></config>
+           </global>
+           <neighbors>
+            <neighbor>
+             <neighbor-address>10.1.1.1</neighbor-address>
+             <state>
+              <peer-as>200</peer-as>
+              <description/>
+              <enabled>true</enabled>
+             </state>
+             <afi-safis>
+              <afi-safi>
+               <afi-safi-name>IPV4_UNICAST</afi-safi-name>
+               <state><active>false</active></state>
+              </afi-safi>
+              <afi-safi>
+               <afi-safi-name>NONE</afi-safi-name>
+               <state><active>true</active></state>
+              </afi-safi>
+             </afi-safis>
+            </neighbor>
+            <neighbor>
+             <neighbor-address>10.2.2.2</neighbor-address>
+             <state>
+              <peer-as>none</peer-as>
+              <description>peer</description>
+              <enabled>unknown</enabled>
+             </state>
+            </neighbor>
+           </neighbors>
+          </bgp>
+         </data>
+        </rpc-reply>'''
+
+    parsed = {
+        'bgp_pid': 100,
+        'router_id': '10.4.1.1',
+        'neighbor': {
+            '10.1.1.1': {
+                'remote_as': 200,
+                'description': 'None',
+                'enabled': True,
+                'address_family': {'ipv4 unicast': {'active': False}}},
+            '10.2.2.2': {
+                'description': 'peer'}}}
+
+    decoder = YangDecoder(
+        leaves={
+            'bgp/global/state/as': ('bgp_pid', int),
+            'bgp/global/state/router-id': ('router_id', str),
+            'bgp/neighbors/neighbor/state/peer-as':
+                ('neighbor/{neighbor}/remote_as',
+                 lambda text: None if text == 'none' else int(text)),
+            'bgp/neighbors/neighbor/state/description':
+                ('neighbor/{neighbor}/description', str, 'None'),
+            'bgp/neighbors/neighbor/state/enabled':
+                ('neighbor/{neighbor}/enabled', boolean),
+            'bgp/neighbors/neighbor/afi-safis/afi-safi/state/active':
+                ('neighbor/{neighbor}/address_family/{afi-safi}/active',
+                 boolean),
+        },
+        keys={
+            'bgp/neighbors/neighbor': ('neighbor-address', str),
+            'bgp/neighbors/neighbor/afi-safis/afi-safi':
+                ('afi-safi-name', lambda text: None if text == 'NONE'
+                 else text.lower().replace('_', ' ')),
+        },
+        # several chunks per element
+        chunk_size=64)
+
+    def test_boolean(self):
+        self.assertIs(boolean('true'), True)
+        self.assertIs(boolean('false'), False)
+        self.assertIsNone(boolean('unknown'))
+
+    def test_decode(self):
+        data = ET.fromstring(self.output)[0]
+        self.assertEqual(self.decoder.decode(data), self.parsed)
+
+    def test_decode_string(self):
+        self.assertEqual(self.decoder.decode_string(self.output),
+                         self.parsed)
+
+    def test_ret_dict(self):
+        ret_dict = {'bgp_pid': 1, 'total_paths': 2}
+        self.assertIs(self.decoder.decode_string(self.output, ret_dict),
+                      ret_dict)
+        self.assertEqual(ret_dict['bgp_pid'], 100)
+        self.assertEqual(ret_dict['total_paths'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+'''Streaming parsing of NX-OS xml outputs
+
+The xml methods of the NX-OS parsers used to build the element tree of the
+whole reply with ET.fromstring, then walk it: for a large BGP table the
+reply string and its tree are both in memory. XmlStream feeds the reply to
+an incremental parser in chunks and yields the row elements asked for, ex:
+ROW_prefix, as soon as each one is complete. Once the caller is done with
+a row it is cleared and removed from its parent, so the tree never holds
+more than the rows of the chunk being read and the leaves of their
+ancestors.
+
+    >>> stream = XmlStream(out, rows=('ROW_rd', 'ROW_prefix'),
+    ...                    command='show bgp all dampening flap-statistics')
+    >>> for row in stream:
+    ...     vrf = stream.ancestor('ROW_vrf').find(
+    ...         '{}vrf-name-out'.format(stream.namespace)).text
+
+A row is yielded after the rows it contains, which are gone by then: it
+only holds its own leaves and empty tables. The ancestors of a row are
+still open when it is yielded, with the leaves seen so far; NX-OS puts the
+leaves of a row before its tables, so its keys are there.
+
+The command is composed from the tags before __readonly__ the way
+Common.compose_compare_command does, and checked against the expected one
+before the first row is yielded.
+'''
+
+# python
+import warnings
+import xml.etree.ElementTree as ET
+
+# '{namespace}name' -> 'name', for every tag met
+_LOCAL_NAMES = {}
+
+
+def local_name(tag):
+    '''Tag without its namespace'''
+    try:
+        return _LOCAL_NAMES[tag]
+    except KeyError:
+        name = _LOCAL_NAMES[tag] = tag[tag.find('}') + 1:]
+        return name
+
+
+class XmlStream(object):
+    '''Row elements of an NX-OS xml output, as they are parsed
+
+        Args:
+            output (`str`): xml output of the device
+            rows (`str` or `tuple`): names of the row elements to yield,
+                                     without namespace, ex: 'ROW_vrf'
+            command (`str`): expected command, not checked when None
+            chunk_size (`int`): characters fed to the parser at a time
+
+        Raises:
+            AssertionError: command of the xml tags is not the expected one
+            ET.ParseError: output is not well formed xml
+    '''
+
+    def __init__(self, output, rows, command=None, chunk_size=65536):
+        # Remove junk characters returned by the device
+        self.output = output.replace("]]>]]>", "").lstrip()
+        self.rows = {rows} if isinstance(rows, str) else set(rows)
+        self.command = command
+        self.chunk_size = chunk_size
+        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}, once <show> is met
+        self.namespace = None
+        # Elements open at the current event
+        self._stack = []
+        # Words of the command, None once composed
+        self._cli = []
+
+    def ancestor(self, name):
+        '''Innermost open element with the name, None without any'''
+        for elem in reversed(self._stack):
+            if local_name(elem.tag) == name:
+                return elem
+        return None
+
+    def _compose(self, event, elem, name):
+        # <__XML__PARAM__vrf-name>
+        #  <__XML__value>VRF1</__XML__value>
+        # </__XML__PARAM__vrf-name>
+        if event == 'end':
+            if '__XML__value' in name:
+                self._cli.append(elem.text or '')
+            return
+
+        if name == 'show' and self.namespace is None:
+            self.namespace = elem.tag[:elem.tag.find('}') + 1]
+        if self.namespace is None:
+            return
+
+        # __readonly__ is the end of the command
+        if '__readonly__' in name:
+            self._check()
+        elif 'TABLE' in name:
+            # if there is no __readonly__ but the command has outputs
+            warnings.warn('Tag "__readonly__" should exsist in output when '
+                          'there are actual values in output')
+            self._check()
+        elif '__XML__PARAM__' not in name and '__XML__value' not in name:
+            self._cli.append(name)
+
+    def _check(self):
+        cli = ' '.join(self._cli)
+        self._cli = None
+        if self.command is None:
+            return
+        assert cli == self.command, \
+            'Cli created from XML tags does not match the actual cli:\n'\
+            'XML Tags cli: {c}\nCli command: {e}'.format(c=cli,
+                                                         e=self.command)
+
+    def _events(self):
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        output = self.output
+        for start in range(0, len(output), self.chunk_size):
+            parser.feed(output[start:start + self.chunk_size])
+            for item in parser.read_events():
+                yield item
+        parser.close()
+        for item in parser.read_events():
+            yield item
+
+    def __iter__(self):
+        stack = self._stack
+        rows = self.rows
+        for event, elem in self._events():
+            name = local_name(elem.tag)
+            if self._cli is not None:
+                self._compose(event, elem, name)
+
+            if event == 'start':
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            if name not in rows:
+                continue
+            yield elem
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+        if self._cli is not None and self.namespace is not None:
+            self._check()
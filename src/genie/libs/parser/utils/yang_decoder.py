@@ -0,0 +1,205 @@
+'''Declarative decoding of NETCONF/YANG replies
+
+The yang methods of the parsers walked the reply tree by hand, one for
+loop and one tag comparison per level of the model. A YangDecoder is
+declared instead with the paths of the leaves it reads, each mapped to a
+key path of the parsed output and a converter:
+
+    >>> decoder = YangDecoder(
+    ...     leaves={
+    ...         'bgp/global/state/as': ('bgp_pid', int),
+    ...         'bgp/neighbors/neighbor/state/peer-as':
+    ...             ('vrf/default/neighbor/{neighbor}/remote_as', int),
+    ...     },
+    ...     keys={'bgp/neighbors/neighbor': ('neighbor-address', str)})
+    >>> decoder.decode(reply.data_ele)
+    {'bgp_pid': 100, 'vrf': {'default': {'neighbor': {'10.1.1.1': ...}}}}
+
+Paths are the local names of the elements, without namespace, from the
+children of the element decoded. A {list} placeholder in a key path is the
+key of the innermost entry of that list, read from its key leaf: NETCONF
+puts the keys of an entry before its other children.
+
+The paths are compiled once into a tree of dicts; decoding is one pass
+over the reply where each element costs one dict lookup, and the subtrees
+not declared are skipped. decode_string parses the raw reply text
+incrementally instead, dropping each element once decoded, so memory stays
+flat on large replies.
+
+A leaf without text is skipped, unless a default is declared after its
+converter, and so is a leaf whose converter returns None. An entry whose
+key converter returns None is skipped with all its leaves.
+'''
+
+# python
+import xml.etree.ElementTree as ET
+
+# parser
+from genie.libs.parser.utils.xml_stream import local_name
+
+# default of the leaves declared without one
+_SKIP = object()
+
+
+def boolean(text):
+    '''True for 'true', False for 'false', None otherwise'''
+    return {'true': True, 'false': False}.get(text)
+
+
+class _Node(object):
+    '''Element of the compiled paths'''
+
+    __slots__ = ('children', 'leaf', 'key', 'name')
+
+    def __init__(self, name):
+        self.name = name
+        # local name -> _Node
+        self.children = {}
+        # (key path, converter, default) of a leaf
+        self.leaf = None
+        # (local name of the key leaf, converter) of a list
+        self.key = None
+
+
+class YangDecoder(object):
+    '''Decoder of the replies of a YANG model
+
+        Args:
+            leaves (`dict`): path of a leaf -> (key path in the parsed
+                             output, converter of its text[, value of
+                             the leaf without text])
+            keys (`dict`): path of a list -> (local name of its key leaf,
+                           converter of the key)
+            chunk_size (`int`): characters fed to the parser at a time by
+                                decode_string
+    '''
+
+    def __init__(self, leaves, keys=None, chunk_size=65536):
+        self.chunk_size = chunk_size
+        self.root = _Node(None)
+        for path, (target, converter, *default) in leaves.items():
+            node = self._node(path)
+            # key path components, a (list name,) tuple for a placeholder
+            components = tuple(
+                (part[1:-1],) if part.startswith('{') else part
+                for part in target.split('/'))
+            node.leaf = (components, converter,
+                         default[0] if default else _SKIP)
+        for path, key in (keys or {}).items():
+            self._node(path).key = key
+            self._node('{}/{}'.format(path, key[0]))
+
+    def _node(self, path):
+        node = self.root
+        for name in path.split('/'):
+            if name not in node.children:
+                node.children[name] = _Node(name)
+            node = node.children[name]
+        return node
+
+    @staticmethod
+    def _set(ret_dict, components, entry_keys, value):
+        entry = ret_dict
+        last = len(components) - 1
+        for position, component in enumerate(components):
+            if isinstance(component, tuple):
+                component = entry_keys.get(component[0])
+                if component is None:
+                    return
+            if position == last:
+                entry[component] = value
+            else:
+                entry = entry.setdefault(component, {})
+
+    def _leaf(self, ret_dict, node, text, entry_keys):
+        components, converter, default = node.leaf
+        if text is not None:
+            value = converter(text)
+        elif default is not _SKIP:
+            value = default
+        else:
+            return
+        if value is not None:
+            self._set(ret_dict, components, entry_keys, value)
+
+    def _entry_key(self, node, elem):
+        name, converter = node.key
+        for child in elem:
+            if isinstance(child.tag, str) and local_name(child.tag) == name:
+                return None if child.text is None else converter(child.text)
+        return None
+
+    def _walk(self, ret_dict, node, elem, entry_keys):
+        for child in elem:
+            tag = child.tag
+            # comments and processing instructions of lxml trees
+            if not isinstance(tag, str):
+                continue
+            child_node = node.children.get(local_name(tag))
+            if child_node is None:
+                continue
+            keys = entry_keys
+            if child_node.key is not None:
+                key = self._entry_key(child_node, child)
+                if key is None:
+                    continue
+                keys = dict(entry_keys)
+                keys[child_node.name] = key
+            if child_node.leaf is not None:
+                self._leaf(ret_dict, child_node, child.text, keys)
+            if child_node.children:
+                self._walk(ret_dict, child_node, child, keys)
+
+    def decode(self, elem, ret_dict=None):
+        '''Parsed output of the children of an element of the reply, ex:
+           the data element of a get reply'''
+        if ret_dict is None:
+            ret_dict = {}
+        self._walk(ret_dict, self.root, elem, {})
+        return ret_dict
+
+    def decode_string(self, output, ret_dict=None):
+        '''Parsed output of the raw xml text of a reply, the paths starting
+           under its <data> element'''
+        if ret_dict is None:
+            ret_dict = {}
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        # (node, entry keys, element) of the open elements under <data>,
+        # node is None in the subtrees not declared
+        stack = []
+        for start in range(0, len(output), self.chunk_size):
+            parser.feed(output[start:start + self.chunk_size])
+            for event, elem in parser.read_events():
+                name = local_name(elem.tag)
+                if not stack:
+                    if event == 'start' and name == 'data':
+                        stack.append((self.root, {}, elem))
+                    continue
+
+                if event == 'start':
+                    node, keys, _ = stack[-1]
+                    if node is not None:
+                        node = node.children.get(name)
+                    if node is not None and node.key is not None:
+                        # key of the entry, set when its key leaf ends
+                        keys = dict(keys)
+                    stack.append((node, keys, elem))
+                    continue
+
+                node, keys, _ = stack.pop()
+                if not stack:
+                    continue
+                parent, parent_keys, parent_elem = stack[-1]
+                if node is not None:
+                    if parent.key is not None and parent.key[0] == name \
+                            and elem.text is not None:
+                        key = parent.key[1](elem.text)
+                        if key is not None:
+                            parent_keys[parent.name] = key
+                    if node.leaf is not None:
+                        self._leaf(ret_dict, node, elem.text, keys)
+                # decoded, the tree only holds the open elements
+                elem.clear()
+                parent_elem.remove(elem)
+        parser.close()
+        return ret_dict
@@ -13,6 +13,7 @@ from genie.metaparser.util.exceptions import SchemaEmptyParserError
 
 # YANG Parser
 from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
+from genie.libs.parser.utils.command_cache import CommandCache
 
 
 # =======================================
@@ -331,6 +332,61 @@ class test_yang_bgp_iosxr(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output,self.golden_parsed_output)
 
+    def test_bgp_openconfig_yang_iosxr_cache(self):
+        self.maxDiff = None
+        self.device = Device(name='aDevice')
+        self.device.get = Mock(return_value=self.yang_output)
+        CommandCache.attach(self.device, ttl=60)
+        try:
+            for _ in range(2):
+                parsed_output = BgpOpenconfigYang(
+                    device=self.device, context='yang').parse()
+            self.assertEqual(parsed_output, self.golden_parsed_output)
+            # Narrower filters are answered from the reply of the model
+            parsed_output = BgpOpenconfigYang(
+                device=self.device, context='yang').parse(
+                    neighbor='10.16.2.2')
+            self.assertEqual(list(parsed_output['vrf']['default']['neighbor']),
+                             ['10.16.2.2'])
+            self.assertEqual(self.device.get.call_count, 1)
+        finally:
+            CommandCache.detach(self.device)
+
+    def test_bgp_openconfig_yang_iosxr_cache_subtree(self):
+        self.device = Device(name='aDevice')
+        self.device.get = Mock(return_value=self.yang_output)
+        CommandCache.attach(self.device, ttl=60)
+        try:
+            BgpOpenconfigYang(device=self.device, context='yang').parse()
+            # The subtrees are pruned from the reply of the model
+            parsed_output = BgpOpenconfigYang(
+                device=self.device, context='yang').parse(subtree='global')
+            self.assertEqual(parsed_output['bgp_pid'], 100)
+            self.assertNotIn('neighbor', parsed_output['vrf']['default'])
+            parsed_output = BgpOpenconfigYang(
+                device=self.device, context='yang').parse(subtree='neighbors')
+            self.assertEqual(
+                parsed_output['vrf']['default']['neighbor'],
+                self.golden_parsed_output['vrf']['default']['neighbor'])
+            self.assertNotIn('bgp_pid', parsed_output)
+            self.assertEqual(self.device.get.call_count, 1)
+            # The cached reply is not changed
+            parsed_output = BgpOpenconfigYang(
+                device=self.device, context='yang').parse()
+            self.assertEqual(parsed_output, self.golden_parsed_output)
+        finally:
+            CommandCache.detach(self.device)
+
+    def test_bgp_openconfig_yang_iosxr_subtree(self):
+        self.device = Mock()
+        self.device.get = Mock(return_value=self.yang_output)
+        obj = BgpOpenconfigYang(device=self.device, context='yang')
+        obj.parse(subtree='neighbors')
+        self.device.get.assert_called_once_with(
+            ('subtree', BgpOpenconfigYang.FILTERS['neighbors']))
+        with self.assertRaises(ValueError):
+            obj.parse(subtree='vrf')
+
 
 # ======================================
 #  Unit test for 'GET' operation on NXOS